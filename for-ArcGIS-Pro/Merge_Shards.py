@@ -0,0 +1,311 @@
+"""Class to merge the outputs of the street data processing tools run on separate shards of a dataset.
+
+   Copyright 2025 Esri
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+       http://www.apache.org/licenses/LICENSE-2.0
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.'''
+"""
+import os
+import re
+import json
+import pandas as pd
+import numpy as np
+try:
+    import arcpy
+except ImportError:
+    arcpy = None  # Only the merging of the tables through a LocalTableIO can run without arcpy
+from helpers import timed_exec, hash_rows, combine_child_hashes, insert_with_children, StageCheckpoint, TableIO, \
+    ArcpyTableIO, DataProductType, summarize_ids
+
+STREETS = os.path.join("Routing", "Streets")
+SIGNPOSTS = os.path.join("Routing", "Signposts")
+SIGNPOSTS_STREETS = "Signposts_Streets"
+NETWORK = os.path.join("Routing", "Routing_ND")
+# Tables written by the tools, relative to the output gdb, in the order they're merged. The Streets come first since
+# the other tables reference them. Signposts_Streets is merged along with Signposts.
+MERGED_TABLES = [
+    STREETS,
+    os.path.join("Routing", "RestrictedTurns"),
+    "Streets_RoadSplits",
+    SIGNPOSTS,
+    "Patterns",
+    "Streets_Patterns",
+    "DailyProfiles",
+    "Streets_DailyProfiles",
+    "Streets_TMC",
+    "TimeZones"
+]
+FEATURE_CLASSES = [STREETS, os.path.join("Routing", "RestrictedTurns"), SIGNPOSTS]
+# Fields with the ID of each profile in the historical traffic profiles tables, which must be unique
+PROFILE_ID_FIELDS = {"Patterns": "PatternID", "DailyProfiles": "ProfileID"}
+# Fields referencing the ObjectID and dataset ID of a street, like Edge1FID, EdgeFID, Branch0FID, and EdgeFCID
+EDGE_FID_PATTERN = re.compile(r"(EDGE|BRANCH)\d*FID", re.IGNORECASE)
+EDGE_FCID_PATTERN = re.compile(r"(EDGE|BRANCH)\d*FCID", re.IGNORECASE)
+# Settings that don't have to match for shards to be merged
+IGNORED_SETTINGS = ("setting build_network", "setting previous_gdb")
+
+
+class ShardMerger:
+    """Merge the output geodatabases of runs on separate shards of a dataset into a single geodatabase.
+
+    A dataset too large to process at once can be split into shards, like the tiles vendors deliver their data in, that
+    are processed independently by the Process tools, on separate machines if needed, and merged afterwards. Tiles
+    include the links crossing their boundaries, so the shards overlap along their boundaries. Turns, road forks, and
+    signposts near a boundary are complete in at least one of the shards, and those produced by more than one shard are
+    identical once their street references are translated.
+
+    The output of the first shard is copied, and the other shards are appended to it in order, so the result only
+    depends on the order of the shards. Streets whose ID is already in the merged Streets are dropped, the Edge#FID
+    fields of the other tables are translated to the ObjectIDs of the merged Streets, and rows identical to a row
+    already merged are dropped.
+    """
+
+    def __init__(
+        self, shard_gdbs: list, out_folder: str, gdb_name: str, build_network: bool = True, table_io: TableIO = None
+    ):
+        """Initialize a class to merge the outputs of runs on shards of a dataset."""
+        self.shard_gdbs = shard_gdbs
+        self.out_folder = out_folder
+        self.gdb_name = gdb_name
+        if not self.gdb_name.endswith(".gdb"):
+            self.gdb_name += ".gdb"
+        self.out_gdb = os.path.join(self.out_folder, self.gdb_name)
+        self.network = os.path.join(self.out_gdb, NETWORK)
+        self.build_network = build_network
+        # TableIO used for all reads and writes of the tables being merged
+        self.table_io = table_io or ArcpyTableIO()
+        self.streets_id_field_name = None  # ID or LINK_ID, depending on the data product of the shards
+        self.fc_id = None  # Dataset ID of the merged Streets used in Edge#FCID fields
+        self.row_counts = {}  # {table: number of rows appended from the shards after the first}
+
+    @timed_exec
+    def merge_shards(self):
+        """Merge the outputs of the shards into a single geodatabase and build its network dataset."""
+        # Set the progressor so the user is informed of progress
+        arcpy.SetProgressor("default")
+
+        if not self._validate_shards():
+            return
+
+        # Start with a copy of the output of the first shard
+        arcpy.AddMessage(f"Copying {self.shard_gdbs[0]} to {self.out_gdb}...")
+        arcpy.management.Copy(self.shard_gdbs[0], self.out_gdb)
+        self.fc_id = arcpy.Describe(os.path.join(self.out_gdb, STREETS)).DSID
+        tables = [table for table in MERGED_TABLES if arcpy.Exists(os.path.join(self.out_gdb, table))]
+
+        # Append the other shards in order. Edits to feature classes in a network dataset need an edit session.
+        for shard_gdb in self.shard_gdbs[1:]:
+            arcpy.AddMessage(f"Appending {shard_gdb}...")
+            self._match_turn_edges(shard_gdb)
+            with self.table_io.edit_session(self.out_gdb):
+                self._append_shard(shard_gdb, tables)
+        # Finish writing the merged tables, which for a LocalTableIO compacts the rows appended from each shard
+        self.table_io.close([
+            os.path.join(self.out_gdb, table)
+            for table in tables + ([SIGNPOSTS_STREETS] if SIGNPOSTS in tables else [])
+        ])
+        arcpy.AddMessage("Rows appended from the other shards:\n" + "\n".join(
+            f"{os.path.basename(table)}: {count}" for table, count in self.row_counts.items()))
+        self._check_profile_ids(tables)
+
+        # Build the network dataset with the merged sources
+        if self.build_network and arcpy.Exists(self.network):
+            arcpy.AddMessage("Building network dataset...")
+            arcpy.nax.BuildNetwork(self.network)
+            warnings = arcpy.GetMessages(1).splitlines()
+            for warning in warnings:
+                arcpy.AddWarning(warning)
+        else:
+            arcpy.AddMessage((
+                "Skipping building the network dataset. You must run the Build Network tool on the network dataset "
+                "before it can be used for analysis."
+            ))
+
+    def _validate_shards(self):
+        """Validate that the shard outputs are complete and were processed with the same settings."""
+        arcpy.AddMessage("Validating inputs...")
+        if not self.shard_gdbs:
+            arcpy.AddError("No shard geodatabases were specified.")
+            return False
+        if not os.path.exists(self.out_folder):
+            arcpy.AddError(f"Output folder {self.out_folder} does not exist.")
+            return False
+        if os.path.exists(self.out_gdb):
+            arcpy.AddError(f"Output geodatabase {self.out_gdb} already exists.")
+            return False
+
+        settings = None
+        for shard_gdb in self.shard_gdbs:
+            if not arcpy.Exists(os.path.join(shard_gdb, STREETS)):
+                arcpy.AddError(f"{shard_gdb} does not have a Routing\\Streets feature class.")
+                return False
+            # The checkpoint manifest written next to each output gdb records its settings and completed stages
+            manifest_file = os.path.splitext(shard_gdb)[0] + "_checkpoint.json"
+            if not os.path.exists(manifest_file):
+                arcpy.AddError(
+                    f"The checkpoint manifest {manifest_file} of the run that created {shard_gdb} does not exist.")
+                return False
+            with open(manifest_file, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            if manifest.get("version") != StageCheckpoint.version:
+                arcpy.AddError(f"{manifest_file} was written by a different version of this tool.")
+                return False
+            # The network dataset is created in the last stage
+            if "network" not in manifest.get("stages", {}):
+                arcpy.AddError(f"The run that created {shard_gdb} did not complete.")
+                return False
+            shard_settings = {
+                key: value for key, value in manifest.get("fingerprint", {}).items()
+                if key.startswith("setting ") and key not in IGNORED_SETTINGS
+            }
+            if settings is None:
+                settings = shard_settings
+                continue
+            changed = [
+                key[len("setting "):] for key in sorted(set(settings) | set(shard_settings))
+                if settings.get(key) != shard_settings.get(key)
+            ]
+            if changed:
+                arcpy.AddError((
+                    f"{shard_gdb} was processed with different settings than {self.shard_gdbs[0]}: "
+                    f"{', '.join(changed)}"))
+                return False
+
+        if settings.get("setting data_product") == DataProductType.TomTomMultinet.name:
+            self.streets_id_field_name = "ID"
+        else:
+            self.streets_id_field_name = "LINK_ID"
+        arcpy.AddMessage("Inputs validated successfully.")
+        return True
+
+    def _match_turn_edges(self, shard_gdb):
+        """Make room in the merged turns for turns with more edges than the turns merged so far."""
+        turns = os.path.join(self.out_gdb, "Routing", "RestrictedTurns")
+        shard_turns = os.path.join(shard_gdb, "Routing", "RestrictedTurns")
+        if not arcpy.Exists(turns) or not arcpy.Exists(shard_turns):
+            return
+        num_edges = len(arcpy.ListFields(shard_turns, "Edge*FCID"))
+        if num_edges > len(arcpy.ListFields(turns, "Edge*FCID")):
+            arcpy.na.IncreaseMaximumEdges(turns, num_edges)
+
+    def _append_shard(self, shard_gdb, tables):
+        """Append the rows of a shard's tables that aren't already in the merged tables.
+
+        Args:
+            shard_gdb: Output gdb of the shard
+            tables: Tables to merge, relative to the gdb
+        """
+        oid_map = self._append_streets(shard_gdb)
+        for table in tables:
+            if table == STREETS:
+                continue
+            child = SIGNPOSTS_STREETS if table == SIGNPOSTS else None
+            self._append_rows(shard_gdb, table, oid_map, child)
+
+    def _append_streets(self, shard_gdb):
+        """Append the streets of a shard whose IDs aren't in the merged Streets yet.
+
+        Returns:
+            pandas Series of the ObjectIDs in the merged Streets indexed by the ObjectIDs of the shard's streets
+        """
+        streets = os.path.join(self.out_gdb, STREETS)
+        shard_streets = os.path.join(shard_gdb, STREETS)
+        fields = self.table_io.list_fields(shard_streets)
+        shard_df = self.table_io.read_columns(shard_streets, ["OID@", "SHAPE@WKB"] + fields)
+        shard_ids = shard_df[self.streets_id_field_name].astype(np.int64)
+        merged_ids = self.table_io.read_columns(streets, [self.streets_id_field_name])[self.streets_id_field_name]
+        # Links along the shard boundaries are in more than one shard. Keep the first copy.
+        new = ~shard_ids.isin(merged_ids.astype(np.int64)) & ~shard_ids.duplicated()
+        self._record_rows(streets, self.table_io.insert_rows(streets, shard_df[new], ["SHAPE@WKB"] + fields))
+
+        # Translate the ObjectIDs of the shard's streets to those of the merged streets with the same ID
+        merged_df = self.table_io.read_columns(streets, ["OID@", self.streets_id_field_name])
+        merged_oids = pd.Series(
+            merged_df["OID@"].to_numpy(), index=merged_df[self.streets_id_field_name].astype(np.int64).to_numpy())
+        merged_oids = merged_oids[~merged_oids.index.duplicated()]
+        return pd.Series(merged_oids.reindex(shard_ids.to_numpy()).to_numpy(), index=shard_df["OID@"].to_numpy())
+
+    def _translate_street_references(self, df, oid_map):
+        """Translate the Edge#FID and Edge#FCID fields of a dataframe of a shard's rows to the merged Streets."""
+        for field in df.columns:
+            if EDGE_FID_PATTERN.fullmatch(field):
+                df[field] = pd.array(df[field].map(oid_map), dtype="Int64")
+            elif EDGE_FCID_PATTERN.fullmatch(field):
+                df[field] = pd.array(df[field].where(df[field].isna(), self.fc_id), dtype="Int64")
+        return df
+
+    def _read_rows(self, gdb, table, fields, oid_map=None):
+        """Read the designated fields of a table in a gdb, translating the street references of a shard's rows."""
+        df = self.table_io.read_columns(os.path.join(gdb, table), ["OID@"] + fields)
+        if oid_map is not None:
+            df = self._translate_street_references(df, oid_map)
+        return df
+
+    def _append_rows(self, shard_gdb, table, oid_map, child=None):
+        """Append the rows of a shard's table that aren't in the merged table yet.
+
+        Args:
+            shard_gdb: Output gdb of the shard
+            table: Table to merge, relative to the gdb
+            oid_map: pandas Series of the ObjectIDs in the merged Streets indexed by those of the shard's streets
+            child: Optional child table, relative to the gdb, whose rows belong to a row of the table. Rows are
+                compared along with their child rows and appended with them.
+        """
+        # Rows are compared by all editable fields but the geometry, which is derived from the streets they reference.
+        # The merged table has all the fields of the shard's table, and maybe extra Edge# fields for turns with more
+        # edges. Read-only fields like Shape_Length and GlobalID are neither compared nor inserted.
+        fields = self.table_io.list_fields(os.path.join(shard_gdb, table))
+        compare_fields = self.table_io.list_fields(os.path.join(self.out_gdb, table))
+        read_fields = ["SHAPE@WKB"] + fields if table in FEATURE_CLASSES else fields
+        shard_df = self._read_rows(shard_gdb, table, read_fields, oid_map)
+        merged_df = self._read_rows(self.out_gdb, table, compare_fields)
+        shard_hashes = hash_rows(shard_df.reindex(columns=compare_fields))
+        merged_hashes = hash_rows(merged_df[compare_fields])
+
+        if child is not None:
+            child_fields = self.table_io.list_fields(os.path.join(shard_gdb, child))
+            child_compare_fields = [field for field in child_fields if field != "SignpostID"]
+            shard_child_df = self._read_rows(shard_gdb, child, child_fields, oid_map)
+            merged_child_df = self._read_rows(self.out_gdb, child, child_fields)
+            shard_hashes = combine_child_hashes(
+                shard_hashes, shard_df["OID@"], hash_rows(shard_child_df[child_compare_fields]),
+                shard_child_df["SignpostID"])
+            merged_hashes = combine_child_hashes(
+                merged_hashes, merged_df["OID@"], hash_rows(merged_child_df[child_compare_fields]),
+                merged_child_df["SignpostID"])
+
+        # Rows produced by more than one shard are identical. Keep the first copy.
+        new = ~np.isin(shard_hashes, merged_hashes) & ~pd.Series(shard_hashes).duplicated().to_numpy()
+        new_df = shard_df[new]
+        out_table = os.path.join(self.out_gdb, table)
+        if child is None:
+            self._record_rows(out_table, self.table_io.insert_rows(out_table, new_df, read_fields))
+            return
+        new_child_df = shard_child_df[shard_child_df["SignpostID"].isin(new_df["OID@"])]
+        insert_with_children(
+            self.table_io, out_table, read_fields, new_df, new_df["OID@"], os.path.join(self.out_gdb, child),
+            child_fields, new_child_df, "SignpostID")
+        self._record_rows(out_table, len(new_df))
+        self._record_rows(os.path.join(self.out_gdb, child), len(new_child_df))
+
+    def _record_rows(self, table, num_rows):
+        """Add to the number of rows appended to a merged table."""
+        self.row_counts[table] = self.row_counts.get(table, 0) + num_rows
+
+    def _check_profile_ids(self, tables):
+        """Warn about profiles with the same ID but different speeds in different shards."""
+        for table, id_field in PROFILE_ID_FIELDS.items():
+            if table not in tables:
+                continue
+            ids = self.table_io.read_columns(os.path.join(self.out_gdb, table), [id_field])[id_field]
+            duplicate_ids = ids[ids.duplicated()].unique()
+            if len(duplicate_ids):
+                arcpy.AddWarning((
+                    f"The {table} table has profiles with the same {id_field} but different speeds in different "
+                    f"shards, which historical traffic can't tell apart: {summarize_ids(duplicate_ids)}"))
@@ -13,11 +13,20 @@
 """
 import os
 import datetime
+import threading
 import uuid
+import numpy as np
 import pandas as pd
 from enum import Enum
-import arcpy
-from helpers import CURDIR, timed_exec, TimeZoneType, UnitType, DataProductType, StreetInputData, StreetDataProcessor
+try:
+    import arcpy
+except ImportError:
+    arcpy = None  # Only the pure pandas and numpy calculations can run without arcpy, for example in the benchmarks
+from helpers import CURDIR, timed_exec, profiled_run, to_object_array, partition_groups, \
+    map_partitions, isin_sorted, compact_df, SortedSpillStore, PROFILER, TABLE_CACHE_SIZE_GB, TimeZoneType, UnitType, \
+    DataProductType, StreetInputData, StreetDataProcessor, TableIO, GroupedIndex, summarize_ids, road_forks_df, \
+    pivot_sign_text, SignpostWriter
+from geometry import build_turn_vertices, build_signpost_vertices, vertices_to_wkb
 
 
 LNG_CODES = {
@@ -153,6 +162,7 @@ LNG_CODES = {
 AR_FLD_SUFS = ["AUTO", "BUS", "TAXIS", "CARPOOL", "PEDSTRN", "TRUCKS", "THRUTR", "DELIVER", "EMERVEH", "MOTOR"]
 AR_FLDS = [f"AR_{suf}" for suf in AR_FLD_SUFS]
 DAY_FIELDS = ["U", "M", "T", "W", "R", "F", "S"]
+TRAFFIC_CHUNK_SIZE = 100000  # Number of historical traffic records to read and process at a time
 
 
 class HistoricalTrafficConfigType(Enum):
@@ -306,7 +316,10 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
     def __init__(
         self, out_folder: str, gdb_name: str, in_here: HereNavstreetsShpInputData, unit_type: UnitType,
         time_zone_type: TimeZoneType, time_zone_name: str = "", in_time_zone_table=None,
-        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True
+        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True,
+        num_workers: int = 1, resume: bool = False, table_cache_folder: str = None,
+        table_cache_size_gb: float = TABLE_CACHE_SIZE_GB, memory_budget_gb: float = None, profile: bool = False,
+        table_io: TableIO = None, previous_gdb: str = None
     ):
         """Initialize a class to process HERE data into a network dataset."""
         self.historical_traffic_type = in_here.historical_traffic_type
@@ -316,12 +329,18 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
             DataProductType.HereNavStreetsShp, out_folder, gdb_name, in_here, unit_type,
             in_here.include_historical_traffic,
             time_zone_type, time_zone_name, in_time_zone_table, time_zone_ft_field,
-            time_zone_tf_field, build_network)
+            time_zone_tf_field, build_network, num_workers, resume, table_cache_folder, table_cache_size_gb,
+            memory_budget_gb, profile, table_io, previous_gdb)
 
         # Initialized shared dataframes that will be populated later
+        self.cdms_dfs = None  # Cdms records used by each stage, by the name of the stage, read once for all of them
+        self.cdms_lock = threading.Lock()  # The cdms table is read by whichever prefetch thread needs it first
+        self.rdms_df = None  # Rdms records kept after reading the turn tables to be used again by the road forks
         self.grouped_rdms_df = None  # Stores turn manuevers
+        self.signs_df = None  # Stores records from the Signs table
         self.spd_df = None  # Stores traffic profiles from the SPD table
-        self.traff_df = None  # Processed historical traffic data from link reference files or TMC files
+        self.traff_store = None  # Processed historical traffic data from link reference files or TMC files, by LINK_ID
+        self.traff_speeds_df = None  # AverageSpeed of each street in each direction from the historical traffic data
         self.cndmod_df = None  # Stores records from the combined US and non-US CndMod table for restrictions
         self.preferred_dir_df = None  # Stores records describing preferred restrictions
         self.prohib_dir_df = None  # Stores records describing prohibited restrictions
@@ -394,21 +413,44 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
                 ["AllTransportProhibited", "TEXT", "", 1]
             ]
 
+    @profiled_run
     def process_here_data(self):
         """Process HERE NAVSTREETS shapefile data into a network dataset."""
         # Set the progressor so the user is informed of progress
         arcpy.SetProgressor("default")
 
-        # Validate the input data
+        # Validate the input data and load the checkpoint of the previous run if resuming
         if not self._validate_inputs():
             return
+        # In a delta run, find the streets that changed since the previous run, whose output is updated in place
+        if self.previous_gdb:
+            self._prepare_delta_run()
+
+        # Start reading the tables used to populate the Streets fields. They're read at the same time on background
+        # threads while the output is created, the streets are copied, and the historical traffic is processed.
+        if self._stage_pending("populate_streets"):
+            for read_func in self._streets_fields_read_funcs():
+                self._prefetch(read_func)
+        if self.use_transport_fields and self._stage_pending("populate_streets", "turns"):
+            self._prefetch(self._read_and_process_cndmod_tables)
 
         # Create the output location
-        self._create_feature_dataset()
+        if self._begin_stage("create_output", [os.path.join(self.out_folder, self.gdb_name)]):
+            self._create_feature_dataset()
+            self._complete_stage("create_output")
 
         # Create the output Streets feature class
-        self._copy_streets()
-        self._detect_and_delete_duplicate_streets("LINK_ID")
+        if self._begin_stage("copy_streets", [self.streets]):
+            if self.streets_delta is not None:
+                self._apply_streets_delta()
+            else:
+                self._copy_streets()
+            self._complete_stage("copy_streets", [self.streets])
+        else:
+            self._describe_streets()
+        if self._begin_stage("dedupe_streets"):
+            self._detect_and_delete_duplicate_streets("LINK_ID")
+            self._complete_stage("dedupe_streets", [self.streets])
 
         # Partially create and populate historical traffic tables
         # Some traffic-related tables must be read early because the information is used in populating Streets feature
@@ -416,33 +458,55 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         # Streets feature class is needed for that. (A bit of a chicken-and-egg problem here.)
         if self.include_historical_traffic:
             # Create the Profiles table and populate the spd_df dataframe that is used later
-            self._create_profiles_table()
-            self._populate_profiles_table()
-            # Create and populate the traff_df dataframe used later
-            self._read_and_process_historical_traffic_tables()
+            if self._begin_stage("profiles", [self.profiles]):
+                self._create_profiles_table()
+                self._populate_profiles_table()
+                self._complete_stage("profiles", [self.profiles])
+            elif self._stage_pending("populate_streets", "streets_patterns"):
+                # The Profiles table is already complete, but the spd_df dataframe is still needed
+                self._populate_profiles_table(populate_table=False)
+            # Process the historical traffic records used later
+            if self._stage_pending("populate_streets", "streets_patterns"):
+                self._read_and_process_historical_traffic_tables()
 
         # Populate Streets feature class fields with info from other tables
-        if self.use_transport_fields:
-            self.cndmod_df, self.preferred_dir_df, self.prohib_dir_df = self._read_and_process_cndmod_tables()
-        self._populate_streets_fields()
+        if self.use_transport_fields and self._stage_pending("populate_streets", "turns"):
+            self.cndmod_df, self.preferred_dir_df, self.prohib_dir_df = \
+                self.prefetcher.result(self._read_and_process_cndmod_tables)
+        if self._begin_stage("populate_streets"):
+            self._populate_streets_fields()
+            self._complete_stage("populate_streets", [self.streets])
 
         # Read in output streets for future look-ups
-        self._read_and_index_streets()
+        if self._stage_pending("streets_patterns", "turns", "road_forks", "streets_tmc", "signposts"):
+            self._read_and_index_streets()
 
         # Create and populate the Streets_Patterns historical traffic table.  Other historical traffic
         # was handled earlier, but this table requires the Streets feature class to be fully populated first.
-        if self.include_historical_traffic:
+        if self.include_historical_traffic and self._begin_stage("streets_patterns", [self.streets_profiles]):
             self._create_and_populate_streets_patterns_table()
-        # Clean up memory
-        del self.traff_df
-        self.traff_df = None
+            self._complete_stage("streets_patterns", [self.streets_profiles])
+        # Clean up memory and temporary files
+        if self.traff_store is not None:
+            self.traff_store.close()
+            self.traff_store = None
+        self.traff_speeds_df = None
         del self.spd_df
         self.spd_df = None
 
+        # Read the turn and signs tables and prefetch the geometry of all streets they reference
+        if self._stage_pending("turns", "road_forks"):
+            self._read_and_index_turn_tables()
+        if self._stage_pending("signposts"):
+            self._read_signs_table()
+        if self._stage_pending("turns", "signposts"):
+            self._prefetch_turn_and_signpost_geometry()
+
         # Create and populate the turn feature class
-        self._read_and_index_turn_tables()
-        self._create_turn_fc(self.turn_restr_fields, self.addl_turn_field_defs)
-        self._generate_turn_features()
+        if self._begin_stage("turns", [self.turns]):
+            self._create_turn_fc(self.turn_restr_fields, self.addl_turn_field_defs)
+            self._generate_turn_features()
+            self._complete_stage("turns", [self.turns])
         # We're now done with the restrictions tables, so clear the variable to free up memory
         del self.cndmod_df
         del self.preferred_dir_df
@@ -452,33 +516,80 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         self.prohib_dir_df = None
 
         # Create and populate the road forks table
-        self._create_and_populate_road_forks()
+        if self._begin_stage("road_forks", [self.road_splits]):
+            self._create_and_populate_road_forks()
+            self._complete_stage("road_forks", [self.road_splits])
 
         # Create and populate live traffic table
-        if self.include_live_traffic:
+        if self.include_live_traffic and self._begin_stage("streets_tmc", [self.streets_tmc]):
             self._create_and_populate_streets_tmc_table()
+            self._complete_stage("streets_tmc", [self.streets_tmc])
 
         # Create and populate Signposts and Signposts_Streets
-        self._create_signposts_fc()
-        self._create_signposts_streets_table()
-        self._populate_signposts_and_signposts_streets()
+        if self._begin_stage("signposts", [self.signposts, self.signposts_streets]):
+            self._create_signposts_fc()
+            self._create_signposts_streets_table()
+            self._populate_signposts_and_signposts_streets()
+            self._complete_stage("signposts", [self.signposts, self.signposts_streets])
 
         # Clean up memory
         del self.streets_df
         self.streets_df = None
+        self.signs_df = None
+        self.street_geometries = None
+        self.streets_index = None
+        self.streets_topology = None
 
         # Handle time zone table if needed
-        if self.time_zone_type != TimeZoneType.NoTimeZone:
+        if self.time_zone_type != TimeZoneType.NoTimeZone and \
+                self._begin_stage("time_zone", [self.time_zone_table]):
             self._handle_time_zone()
+            self._complete_stage("time_zone", [self.time_zone_table])
 
         # Add attribute indices
-        self._add_attribute_indices()
+        if self._begin_stage("attribute_indices"):
+            self._add_attribute_indices()
+            self._complete_stage("attribute_indices")
 
-        # Clean up intermediate data
+        # Clean up intermediate data and stop the threads used to prefetch tables
         self._delete_intermediate_outputs()
+        self.prefetcher.shutdown()
 
         # Create the network dataset from a template and build it
-        self._create_and_build_nd()
+        if self._begin_stage("network", [self.network]):
+            self._create_and_build_nd()
+            self._complete_stage("network")
+
+        # Report the changes made to the previous output in a delta run
+        self._report_delta()
+
+    def _pipeline_stages(self):
+        """Return the names of the checkpointed stages of the processing run in the order they run."""
+        stages = ["create_output", "copy_streets", "dedupe_streets"]
+        if self.include_historical_traffic:
+            stages.append("profiles")
+        stages.append("populate_streets")
+        if self.include_historical_traffic:
+            stages.append("streets_patterns")
+        stages += ["turns", "road_forks"]
+        if self.include_live_traffic:
+            stages.append("streets_tmc")
+        stages.append("signposts")
+        if self.time_zone_type != TimeZoneType.NoTimeZone:
+            stages.append("time_zone")
+        stages += ["attribute_indices", "network"]
+        return stages
+
+    def _checkpoint_settings(self):
+        """Return the settings that affect the output. A run can't be resumed with different settings."""
+        settings = super()._checkpoint_settings()
+        settings["historical_traffic_type"] = self.historical_traffic_type.name
+        settings["include_live_traffic"] = bool(self.include_live_traffic)
+        return settings
+
+    def _input_streets(self):
+        """Return the input streets feature class and a where clause selecting the streets copied to the output."""
+        return self.in_data_object.streets, None
 
     @timed_exec
     def _copy_streets(self):
@@ -551,20 +662,19 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
             self.in_data_object.streets, self.feature_dataset, os.path.basename(self.streets), field_mapping=field_mappings)
 
         # Update the fc_id that will be used to relate back to this Streets feature class in Edge#FCID fields
-        desc = arcpy.Describe(self.streets)
-        self.fc_id = desc.DSID
-        self.streets_oid_field = desc.oidFieldName
+        self._describe_streets()
 
     @timed_exec
     def _read_and_index_streets(self):
         """Read in the streets table and index it for quick lookups."""
         self._add_message("Reading and indexing Streets table...")
         # Store street info in a dataframe for quick lookups
-        with arcpy.da.SearchCursor(self.streets, ["LINK_ID", "OID@", "Meters", "REF_IN_ID", "NREF_IN_ID"]) as cur:
-            self.streets_df = pd.DataFrame(cur, columns=["LINK_ID", "OID", "Meters", "REF_IN_ID", "NREF_IN_ID"])
+        fields = ["LINK_ID", "OID@", "Meters", "REF_IN_ID", "NREF_IN_ID"]
+        self._check_memory_budget(self.streets, fields)
+        self.streets_df = self.table_io.read_columns(self.streets, fields).rename(columns={"OID@": "OID"})
+        PROFILER.add_rows(rows_read=len(self.streets_df))
         self.streets_df.set_index("LINK_ID", inplace=True)
-        # Add an empty field to store street geometries.  They'll be filled only as needed to conserve memory
-        self.streets_df["SHAPE"] = None
+        self.streets_df = compact_df(self.streets_df, name="Streets")
 
     @timed_exec
     def _read_and_index_alt_streets(self):
@@ -572,8 +682,7 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         where = "EXPLICATBL = 'Y'"
         fields = ["LINK_ID", "ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT", "ST_NAME", "ST_LANGCD", "ST_NM_PREF",
                   "ST_NM_SUFF", "DIRONSIGN"]
-        with arcpy.da.SearchCursor(self.in_data_object.alt_streets, fields, where) as cur:
-            alt_streets_df = pd.DataFrame(cur, columns=fields)
+        alt_streets_df = self._read_input_table(self.in_data_object.alt_streets, fields, where)
         alt_streets_df.drop_duplicates(inplace=True)
         # Index the dataframe by LINK_ID for quick retrieval later
         alt_streets_df.set_index("LINK_ID", inplace=True)
@@ -584,8 +693,7 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         """Read in the z-levels table and index it for quick lookups."""
         where = "INTRSECT = 'Y'"
         fields = ["LINK_ID", "POINT_NUM", "Z_LEVEL"]
-        with arcpy.da.SearchCursor(self.in_data_object.z_levels, fields, where) as cur:
-            z_levels_df = pd.DataFrame(cur, columns=fields)
+        z_levels_df = self._read_input_table(self.in_data_object.z_levels, fields, where)
         z_levels_df = z_levels_df.sort_values(["LINK_ID", "POINT_NUM"])
         z_levels_df.drop(columns=["POINT_NUM"], inplace=True)
         # Find the first and last Z_LEVEL entry for each LINK_ID and log these as F_ZLEV and T_ZLEV
@@ -596,33 +704,88 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         del f_zlev_df
         return z_levels_df
 
+    def _cdms_consumers(self):
+        """Return the condition types and fields of the cdms records used by each stage that still has to run.
+
+        Returns:
+            Dictionary of {consumer name: (list of COND_TYPE values, list of fields)}
+        """
+        consumers = {}
+        if self._stage_pending("populate_streets"):
+            consumers["construction"] = ([3], ["LINK_ID"])
+            consumers["usage_fee"] = ([12], ["LINK_ID"] + AR_FLDS)
+        if self.use_transport_fields and self._stage_pending("populate_streets", "turns"):
+            consumers["cndmod"] = ([23, 25, 27], ["LINK_ID", "COND_ID"])
+        if self._stage_pending("turns", "road_forks"):
+            turn_cond_types = [4, 7, 26] if self.use_transport_fields else [4, 7]
+            consumers["turns"] = (turn_cond_types, ["COND_ID", "COND_TYPE", "END_OF_LK"] + AR_FLDS)
+        if self._stage_pending("road_forks"):
+            consumers["road_forks"] = ([9], ["COND_ID"])
+        return consumers
+
+    @timed_exec
+    def _read_and_partition_cdms_table(self):
+        """Read the cdms records used by all the stages that still have to run in a single pass over the table.
+
+        The union of the fields and condition types needed by the stages is read once, and the records are split into a
+        compact dataframe for each stage holding only its condition types and fields, in the original table order.
+
+        Returns:
+            Dictionary of {consumer name: dataframe of cdms records}
+        """
+        consumers = self._cdms_consumers()
+        if not consumers:
+            return {}
+        cond_types = sorted({cond_type for cond_types, _ in consumers.values() for cond_type in cond_types})
+        fields = list(dict.fromkeys(["COND_TYPE"] + [field for _, flds in consumers.values() for field in flds]))
+        where = f"COND_TYPE IN ({', '.join(str(cond_type) for cond_type in cond_types)})"
+        cdms_df = self._read_input_table(self.in_data_object.cdms, fields, where)
+        cdms_dfs = {}
+        for consumer, (consumer_cond_types, consumer_fields) in consumers.items():
+            consumer_df = cdms_df.loc[cdms_df["COND_TYPE"].isin(consumer_cond_types), consumer_fields]
+            cdms_dfs[consumer] = consumer_df.reset_index(drop=True)
+        return cdms_dfs
+
+    def _cdms_records(self, consumer):
+        """Return the cdms records used by the designated stage, reading the cdms table for all stages if needed.
+
+        Each stage's records are handed out once and then released, so the memory is freed as soon as the last stage
+        using the cdms table has its records.
+        """
+        with self.cdms_lock:
+            if self.cdms_dfs is None:
+                self.cdms_dfs = self._read_and_partition_cdms_table()
+            return self.cdms_dfs.pop(consumer)
+
+    def _rdms_records(self):
+        """Return the rdms records, reading the table the first time and keeping it if road forks still have to run."""
+        rdms_df = self.rdms_df
+        if rdms_df is None:
+            fields = ["LINK_ID", "MAN_LINKID", "COND_ID", "SEQ_NUMBER"]
+            rdms_df = self._read_input_table(self.in_data_object.rdms, fields)
+            if self._stage_pending("road_forks"):
+                self.rdms_df = rdms_df
+        return rdms_df
+
     @timed_exec
     def _read_cdms_construction_links(self):
-        """Read in the csms table to create a list of roads closed for construction."""
-        where = "COND_TYPE = 3"
-        cmds_links = set()
-        for row in arcpy.da.SearchCursor(self.in_data_object.cdms, ["LINK_ID"], where):
-            cmds_links.add(row[0])
+        """Create a set of the roads closed for construction from the cdms records."""
+        cmds_links = set(self._cdms_records("construction")["LINK_ID"].tolist())
         return cmds_links
 
     @timed_exec
     def _read_cdms_usage_fee_links(self):
-        """Read in the cdms table to create a dataframe of usage fee restrictions and index it for quick lookups."""
-        where = "COND_TYPE = 12"
-        fields = ["LINK_ID"] + AR_FLDS
-        with arcpy.da.SearchCursor(self.in_data_object.cdms, fields, where) as cur:
-            ufr_df = pd.DataFrame(cur, columns=fields)
+        """Create a dataframe of usage fee restrictions from the cdms records and index it for quick lookups."""
+        ufr_df = self._cdms_records("usage_fee")
         # Index the dataframe by LINK_ID for quick retrieval later
         ufr_df.set_index("LINK_ID", inplace=True)
         return ufr_df
 
-    @staticmethod
-    def _read_cndmod_table(cndmod_table):
+    def _read_cndmod_table(self, cndmod_table):
         """Read the designated cndmod table and convert it to a dataframe."""
         where = "MOD_TYPE IN (38, 39, 41, 42, 43, 44, 45, 46, 48, 49, 60, 75, 81)"
         fields = ["MOD_TYPE", "MOD_VAL", "COND_ID"]
-        with arcpy.da.SearchCursor(cndmod_table, fields, where) as cur:
-            cndmod_df = pd.DataFrame(cur, columns=fields)
+        cndmod_df = self._read_input_table(cndmod_table, fields, where)
         # The MOD_VAL column is text in the original input, but the only values we'll be working with are integers, and,
         # for some rows, we will need to modify them to match the desired units of measurement, which means making them
         # floats.
@@ -680,14 +843,12 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         cndmod_df = cndmod_df[~cndmod_df["MOD_TYPE"].isin([60, 38])]
 
         # Join LINK_ID from cdms table
-        where = "COND_TYPE IN (23, 25, 27)"
-        fields = ["LINK_ID", "COND_ID"]
-        with arcpy.da.SearchCursor(self.in_data_object.cdms, fields, where) as cur:
-            cdms_df = pd.DataFrame(cur, columns=fields)
+        cdms_df = self._cdms_records("cndmod")
         cdms_df.set_index("COND_ID", inplace=True)
         cndmod_df = cndmod_df.join(cdms_df, "COND_ID", how="inner")
         # Index by LINK_ID for quick lookups
         cndmod_df.set_index("LINK_ID", inplace=True)
+        cndmod_df = compact_df(cndmod_df, ["MOD_VAL"], "CndMod")
 
         # Return three dataframes that will all be used for lookups when populating restriction fields in Streets
         return cndmod_df, preferred_dir_df, prohib_dir_df
@@ -697,334 +858,259 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         """Populate the fields in the streets table."""
         self._add_message("Populating Streets fields...")
         if self.include_historical_traffic:
-            assert self.traff_df is not None
-            self.traff_df.set_index("LINK_ID", inplace=True)
+            assert self.traff_speeds_df is not None
 
         # Calculate the Meters field using geodesic distance
-        arcpy.management.CalculateGeometryAttributes(self.streets, "Meters LENGTH_GEODESIC", "METERS")
-
-        # Read some additional tables
-        alt_streets_df = self._read_and_index_alt_streets()
-        z_levels_df = self._read_and_index_z_levels()
-        construction_links = self._read_cdms_construction_links()
-        ufr_df = self._read_cdms_usage_fee_links()
-
-        def calc_kph(contr_acc, speed_cat):
-            """Calculate the KPH field value based on the CONTRACC and SPEED_CAT fields."""
-            speed_cat_to_kph = {
-                "1": 112,
-                "2": 92,
-                "3": 76,
-                "4": 64,
-                "5": 48,
-                "6": 32,
-                "7": 16,
-                "8": 4
-            }
-            kph = speed_cat_to_kph.get(speed_cat, 1)
-            if contr_acc == "Y":
-                kph = kph * 1.2
-            return kph
-
-        def calc_traffic_based_speed_and_minutes(link_id, row, kph_val):
-            """Populate AverageSpeed and Minutes fields based on traffic table info."""
-            # CalculatefAverageSpeed field from matching traffic records
-            try:
-                # Retrieve the relevant traffic records for this LINK_ID
-                traff_records = self.traff_df.loc[link_id]
-                if isinstance(traff_records, pd.Series):
-                    if traff_records["EdgeFrmPos"] == 0:
-                        row[fname_idx["FT_AverageSpeed"]] = traff_records["AverageSpeed"]
-                    elif traff_records["EdgeFrmPos"] == 1:
-                        row[fname_idx["TF_AverageSpeed"]] = traff_records["AverageSpeed"]
-                else:
-                    for _, traff_record in traff_records.iterrows():
-                        if traff_record["EdgeFrmPos"] == 0:
-                            row[fname_idx["FT_AverageSpeed"]] = traff_record["AverageSpeed"]
-                        elif traff_record["EdgeFrmPos"] == 1:
-                            row[fname_idx["TF_AverageSpeed"]] = traff_record["AverageSpeed"]
-            except KeyError:
-                # There were no traffic records for this LINK_ID. Just skip it and move on.
-                pass
-
-            # Populate Minutes fields based on Meters and AverageSpeed
-            meters = row[fname_idx["Meters"]]
-            ft_speed = row[fname_idx["FT_AverageSpeed"]]
-            if ft_speed is None:
-                ft_speed = kph_val
-            row[fname_idx["FT_Minutes"]] = meters * 0.06 / ft_speed
-            tf_speed = row[fname_idx["TF_AverageSpeed"]]
-            if tf_speed is None:
-                tf_speed = kph_val
-            row[fname_idx["TF_Minutes"]] = meters * 0.06 / tf_speed
-
-            return row
-
-        def calc_directional_condmod_fields(row, field_suffix, cond_id, value_to_set, is_preferred):
-            """For a given field and restriction condition, get the direction and update appropriate fields."""
-            # Figure out which direction this record is for and update appropriate fields in row
-            try:
-                # Retrieve the restriction records for this ID from the correct reference dataframe
-                if is_preferred:
-                    subset_df = self.preferred_dir_df.loc[cond_id]
-                else:
-                    subset_df = self.prohib_dir_df.loc[cond_id]
-                if isinstance(subset_df, pd.DataFrame):
-                    subset_df = subset_df.iloc[0]
-            except KeyError:
-                # There was no indication of the directionality of this record, so it's not usable.
-                # Return row unchanged.
-                return row
-            # Calculate directional fields
-            direction = subset_df["Direction"]
-            if direction in ["FT", "B"]:
-                row[fname_idx[f"FT_{field_suffix}"]] = value_to_set
-            if direction in ["TF", "B"]:
-                row[fname_idx[f"TF_{field_suffix}"]] = value_to_set
-            return row
-
-        def calc_cndmod_fields(row, cndmod_record):
-            """Calculate restriction field values from data in the cndmod tables."""
-            mod_type = cndmod_record["MOD_TYPE"]
-            mod_val = cndmod_record["MOD_VAL"]
-            cond_id = cndmod_record["COND_ID"]
-
-            # Calculate value for a preferred restriction or TruckFCOverride field
-            if mod_type == 49:
-                if mod_val == "15":
-                    row[fname_idx["TruckFCOverride"]] = 1
-                elif mod_val == "16":
-                    row[fname_idx["TruckFCOverride"]] = 2
-                else:
-                    # Figure out which prefer restriction this record is for
-                    prefer_suffix = self.prefer_suffixes.get(mod_val)
-                    if prefer_suffix:
-                        row = calc_directional_condmod_fields(row, prefer_suffix, cond_id, "Y", is_preferred=True)
-
-            # Calculate a value for a prohibit restriction
-            elif mod_type == 39:
-                # Figure out which prohibit restriction this is for
-                prohib_suffix = self.prohib_suffixes.get(mod_val)
-                if not prohib_suffix:
-                    # Invalid or irrelevant record.  Return row unchanged.
-                    return row
-                row = calc_directional_condmod_fields(row, prohib_suffix, cond_id, "Y", is_preferred=False)
-
-            # Calculate a value for a limit restriction field
-            elif mod_type in self.limit_suffixes.keys():
-                mod_val = cndmod_record["MOD_VAL_U"]
-                limit_suffix = self.limit_suffixes[mod_type]
-                row = calc_directional_condmod_fields(row, limit_suffix, cond_id, mod_val, is_preferred=False)
-
-            # Handle a couple of specific restriction cases
-            elif mod_type == 46:
-                if mod_val in ('1', '2', '3'):
-                    row = calc_directional_condmod_fields(
-                        row, "MaxTrailersAllowedOnTruck", cond_id, int(mod_val), is_preferred=False)
-                elif mod_val == "4":
-                    row = calc_directional_condmod_fields(
-                        row, "SemiOrTractorWOneOrMoreTrailersProhibited", cond_id, "Y", is_preferred=False)
-            elif mod_type == 75:
-                if mod_val in ('1', '2', '3', '4', '5'):
-                    row = calc_directional_condmod_fields(
-                        row, "MaxAxlesAllowed", cond_id, int(mod_val), is_preferred=False)
-                elif mod_val == '6':
-                    row = calc_directional_condmod_fields(row, "SingleAxleProhibited", cond_id, "Y", is_preferred=False)
-                elif mod_val == '7':
-                    row = calc_directional_condmod_fields(row, "TandemAxleProhibited", cond_id, "Y", is_preferred=False)
-            elif mod_type == 48:
-                mod_val = cndmod_record["MOD_VAL_U"]
-                row = calc_directional_condmod_fields(row, "TruckKPH", cond_id, mod_val, is_preferred=True)
-
-            return row
-
-        def calc_additional_transport_fields(row, field_suffix, other_field_suffixes):
-            """Calculate additional restriction fields based on the values of other restrictions already set."""
-            for prefix in ["FT_", "TF_"]:
-                is_restricted = False
-                for other_suffix in other_field_suffixes:
-                    if row[fname_idx[f"{prefix}{other_suffix}"]] == "Y":
-                        is_restricted = True
-                if is_restricted:
-                    row[fname_idx[f"{prefix}{field_suffix}"]] = "Y"
-            return row
+        # In a delta run, only the streets added by the run need it
+        arcpy.management.CalculateGeometryAttributes(
+            self._streets_added_in_run(), "Meters LENGTH_GEODESIC", "METERS")
+
+        # Read some additional tables, or wait for them if they're being read ahead of time
+        alt_streets_df, z_levels_df, construction_links, ufr_df = [
+            self.prefetcher.result(read_func) for read_func in self._streets_fields_read_funcs()]
+
+        # Read the street attributes needed to calculate the values of other fields
+        in_fields = [
+            "LINK_ID", "CONTRACC", "SPEED_CAT", "ST_LANGCD", "ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT", "Meters"
+        ]
+        self._check_memory_budget(self.streets, in_fields)
+        streets_df = self.table_io.read_columns(self.streets, in_fields)
+        PROFILER.add_rows(rows_read=len(streets_df))
+        streets_df.set_index("LINK_ID", inplace=True)
+
+        # Calculate the values of all updated fields for all streets up front
+        out_df = self._calculate_streets_fields(streets_df, alt_streets_df, z_levels_df, construction_links, ufr_df)
+        del streets_df
+        del alt_streets_df
+        del z_levels_df
+        del construction_links
+        del ufr_df
 
-        # Iterate through the streets table and populate update fields
+        # Copy the precalculated values into the Streets table
+        self.table_io.update_rows(self.streets, "LINK_ID", out_df, progressor_label="Populating Streets fields...")
+
+    def _streets_fields_read_funcs(self):
+        """Return the functions reading the extra tables used by _calculate_streets_fields, in argument order."""
+        return [
+            self._read_and_index_alt_streets, self._read_and_index_z_levels, self._read_cdms_construction_links,
+            self._read_cdms_usage_fee_links
+        ]
+
+    def _calculate_streets_fields(self, streets_df, alt_streets_df, z_levels_df, construction_links, ufr_df):
+        """Calculate the values of the updated Streets fields for all streets at once.
+
+        Args:
+            streets_df: Dataframe of input street attributes indexed by LINK_ID
+            alt_streets_df: Dataframe of explicatable alt streets records indexed by LINK_ID
+            z_levels_df: Dataframe of F_ZLEV and T_ZLEV values indexed by LINK_ID
+            construction_links: Set of LINK_IDs closed for construction
+            ufr_df: Dataframe of usage fee restriction records indexed by LINK_ID
+
+        Returns:
+            Dataframe of updated field values indexed by LINK_ID in the same order as streets_df
+        """
+        out_df = pd.DataFrame(index=streets_df.index)
+
+        # Populate the alt streets fields
+        # The *_Alt fields in Streets are to contain an alternate name for each street (when there is one).
+        # The primary name is already on the raw Streets feature class, while the alternate names (which there can be
+        # many) are provided in the raw AltStreets feature class.  However, not all names are useful for including in
+        # the driving directions text (most names are only useful for geocoding). The ones that are suitable for
+        # driving directions are those that have an EXPLICATBL value of Y. Also, many alternate names are very similar
+        # to the primary name (which isn't useful due to redundancy), so we only care about names that are different
+        # enough.  Despite all the filtering, there still can be multiple alternate names – at that point, we don't
+        # really care which one we use, and tool does not try to populate multiple alternate names.  The older ArcMap
+        # version of the tool always used the last one with differences, so that's what we do here.
         alt_street_fields = [
             "ST_NAME_Alt", "ST_LANGCD_Alt", "ST_NM_PREF_Alt", "ST_TYP_BEF_Alt", "ST_NM_BASE_Alt", "ST_NM_SUFF_Alt",
             "ST_TYP_AFT_Alt", "DIRONSIGN_Alt"]
-        ufr_fields = [f"UFR_{ufr_suff}" for ufr_suff in AR_FLD_SUFS]
-        fields = [
-            "LINK_ID",
-            "F_ZLEV", "T_ZLEV",
-            "KPH", "CONTRACC", "SPEED_CAT",
-            "Language", "Language_Alt", "ST_LANGCD",
-            "ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT",
-            "ClosedForConstruction",
-            "Meters"
-        ] + alt_street_fields + ufr_fields
+        alt_df = alt_streets_df[alt_streets_df.index.isin(streets_df.index)].reset_index()
+        # Line up the primary names with the alt streets records. Reindexing by LINK_ID preserves the original order of
+        # the alt streets records.
+        primary_df = streets_df[["ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT"]].reindex(alt_df["LINK_ID"])
+        is_different = np.zeros(len(alt_df), dtype=bool)
+        for field in ["ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT"]:
+            # Compare as object arrays so missing values compare equal to each other
+            is_different |= to_object_array(alt_df[field]) != to_object_array(primary_df[field])
+        alt_df = alt_df[is_different].drop_duplicates("LINK_ID", keep="last").set_index("LINK_ID")
+        for field in alt_street_fields:
+            out_df[field] = alt_df[field.removesuffix("_Alt")].reindex(out_df.index)
+        del alt_df
+        del primary_df
+
+        # Populate the zlev fields
+        out_df = out_df.join(z_levels_df[["F_ZLEV", "T_ZLEV"]])
+
+        # Populate the KPH field based on the CONTRACC and SPEED_CAT fields
+        speed_cat_to_kph = {
+            "1": 112,
+            "2": 92,
+            "3": 76,
+            "4": 64,
+            "5": 48,
+            "6": 32,
+            "7": 16,
+            "8": 4
+        }
+        kph = streets_df["SPEED_CAT"].map(speed_cat_to_kph).fillna(1).to_numpy(dtype=float)
+        kph = np.where(streets_df["CONTRACC"].to_numpy(dtype=object) == "Y", kph * 1.2, kph)
+        out_df["KPH"] = kph
+
+        meters = streets_df["Meters"].to_numpy(dtype=float)
         if not self.include_historical_traffic:
-            fields += ["Minutes"]
+            # Populate the Minutes field based on speed categories if there's no historical traffic
+            out_df["Minutes"] = meters * 0.06 / kph
         else:
-            fields += ["FT_AverageSpeed", "TF_AverageSpeed", "FT_Minutes", "TF_Minutes"]
+            # Populate AverageSpeed fields from the traffic table. If there are multiple traffic records for the same
+            # LINK_ID and direction, the last one wins, which was already handled when reading the traffic tables.
+            for prefix, edge_frm_pos in [("FT_", 0), ("TF_", 1)]:
+                dir_traff_df = self.traff_speeds_df.loc[
+                    self.traff_speeds_df["EdgeFrmPos"] == edge_frm_pos, "AverageSpeed"]
+                out_df[f"{prefix}AverageSpeed"] = dir_traff_df.reindex(out_df.index)
+                # Populate Minutes fields based on Meters and AverageSpeed, falling back to KPH when there's no traffic
+                has_traffic = out_df.index.isin(dir_traff_df.index)
+                speed = np.where(has_traffic, out_df[f"{prefix}AverageSpeed"].to_numpy(dtype=float), kph)
+                out_df[f"{prefix}Minutes"] = meters * 0.06 / speed
+
+        # Populate the Language fields
+        out_df["Language"] = streets_df["ST_LANGCD"].map(LNG_CODES).fillna("")
+        out_df["Language_Alt"] = out_df["ST_LANGCD_Alt"].map(LNG_CODES).fillna("").where(
+            out_df["ST_LANGCD_Alt"].notna())
+
+        # Populate roads closed for construction
+        out_df["ClosedForConstruction"] = np.where(out_df.index.isin(list(construction_links)), "Y", None)
+
+        # Populate the usage fee restriction fields
+        # There are several reasons why a link can have multiple entries with COND_TYPE = 12, for example,
+        # time-dependent tolling, different tolling methods or agencies, etc. The UFR fields are meant to capture
+        # whether a road is subject to a toll at any time, so we would want to capture if there are any records for
+        # that link with COND_TYPE = 12 in the Cdms table with a value of Y for each AR field. Consequently, if there
+        # are multiple records, use a value of Y if any row has a value of Y; otherwise, arbitrarily use the value of
+        # the first returned record.
+        first_ufr_df = ufr_df.loc[~ufr_df.index.duplicated(keep="first"), AR_FLDS]
+        any_y_df = ufr_df[AR_FLDS].isin(["Y"]).groupby(level=0).any()
+        first_ufr_df = first_ufr_df.astype(object).mask(any_y_df.reindex(first_ufr_df.index), "Y")
+        first_ufr_df.columns = [f"UFR_{ufr_suff}" for ufr_suff in AR_FLD_SUFS]
+        out_df = out_df.join(first_ufr_df)
+        del first_ufr_df
+        del any_y_df
+
+        # Populate the restriction fields associated with the transport condition modifier table
         if self.cndmod_df is not None:
-            fields += self.prefer_restr_fields
-            fields += self.prohib_restr_fields
-            fields += self.limit_restr_fields
-            fields += [
-                "FT_MaxTrailersAllowedOnTruck", "TF_MaxTrailersAllowedOnTruck",
-                "FT_SemiOrTractorWOneOrMoreTrailersProhibited", "TF_SemiOrTractorWOneOrMoreTrailersProhibited",
-                "FT_MaxAxlesAllowed", "TF_MaxAxlesAllowed",
-                "FT_SingleAxleProhibited", "TF_SingleAxleProhibited",
-                "FT_TandemAxleProhibited", "TF_TandemAxleProhibited",
-                "FT_TruckKPH", "TF_TruckKPH",
-                "TruckFCOverride"
-            ]
-        fname_idx = {f: i for i, f in enumerate(fields)}  # {Field name: index in cursor row}
-        # Set up progressor
-        num_rows = int(arcpy.management.GetCount(self.streets).getOutput(0))
-        current_row_num = 0
-        arcpy.SetProgressor("step", "Populating Streets fields...", 0, num_rows, 1)
-        with arcpy.da.UpdateCursor(self.streets, fields) as cur:
-            for row in cur:
-                current_row_num += 1
-                arcpy.SetProgressorPosition(current_row_num)
-
-                # Initialize the new row to be the same as the original
-                updated_row = list(row)
-
-                link_id = row[0]
-
-                # Populate the alt streets fields
-                try:
-                    # Retrieve the alt streets records for this LINK_ID
-                    # The *_Alt fields in Streets are to contain an alternate name for each street (when there is one).
-                    # The primary name is already on the raw Streets feature class, while the alternate names (which
-                    # there can be many) are provided in the raw AltStreets feature class.  However, not all names are
-                    # useful for including in the driving directions text (most names are only useful for geocoding).
-                    # The ones that are suitable for driving directions are those that have an EXPLICATBL value of Y.
-                    # Also, many alternate names are very similar to the primary name (which isn't useful due to
-                    # redundancy), so we only care about names that are different enough.  Despite all the filtering,
-                    # there still can be multiple alternate names – at that point, we don't really care which one we
-                    # use, and tool does not try to populate multiple alternate names.  The older ArcMap version of the
-                    # tool always used the last one, so that's what we do here.
-                    alt_streets_records = alt_streets_df.loc[link_id]
-                    if isinstance(alt_streets_records, pd.Series):
-                        if (
-                            alt_streets_records["ST_TYP_BEF"] != updated_row[fname_idx["ST_TYP_BEF"]] or
-                            alt_streets_records["ST_NM_BASE"] != updated_row[fname_idx["ST_NM_BASE"]] or
-                            alt_streets_records["ST_TYP_AFT"] != updated_row[fname_idx["ST_TYP_AFT"]]
-                        ):
-                            for field in alt_street_fields:
-                                updated_row[fname_idx[field]] = alt_streets_records[field.rstrip("_Alt")]
-                    else:
-                        # If more than one matching record was returned, find the last record with differences and use
-                        # that, which matches the ArcMap tool's behavior. (iterating in backwards order)
-                        for _, alt_streets_record in alt_streets_records.iloc[::-1].iterrows():
-                            if (
-                                alt_streets_record["ST_TYP_BEF"] != updated_row[fname_idx["ST_TYP_BEF"]] or
-                                alt_streets_record["ST_NM_BASE"] != updated_row[fname_idx["ST_NM_BASE"]] or
-                                alt_streets_record["ST_TYP_AFT"] != updated_row[fname_idx["ST_TYP_AFT"]]
-                            ):
-                                for field in alt_street_fields:
-                                    updated_row[fname_idx[field]] = alt_streets_record[field.rstrip("_Alt")]
-                                break
-                except KeyError:
-                    # There were no alt streets records for this LINK_ID. Just skip it and move on.
-                    pass
-
-                # Populate the zlev fields
-                try:
-                    # Retrieve the zlev record for this LINK_ID
-                    zlev_record = z_levels_df.loc[link_id]
-                    updated_row[fname_idx["F_ZLEV"]] = zlev_record["F_ZLEV"]
-                    updated_row[fname_idx["T_ZLEV"]] = zlev_record["T_ZLEV"]
-                except KeyError:
-                    # There were no zlev records for this LINK_ID. Just skip it and move on.
-                    pass
-
-                # Populate the KPH field
-                kph_val = calc_kph(
-                    updated_row[fname_idx["CONTRACC"]], updated_row[fname_idx["SPEED_CAT"]])
-                updated_row[fname_idx["KPH"]] = kph_val
-
-                if not self.include_historical_traffic:
-                    # Populate the Minutes field based on speed categories if there's no historical traffic
-                    updated_row[fname_idx["Minutes"]] = updated_row[fname_idx["Meters"]] * 0.06 / kph_val
-                else:
-                    # Populate Minutes and AverageSpeed fields from traffic tables
-                    updated_row = calc_traffic_based_speed_and_minutes(link_id, updated_row, kph_val)
-
-                # Populate the Language field
-                updated_row[fname_idx["Language"]] = LNG_CODES.get(updated_row[fname_idx["ST_LANGCD"]], "")
-                in_alt_lng = updated_row[fname_idx["ST_LANGCD_Alt"]]
-                if in_alt_lng is not None:
-                    updated_row[fname_idx["Language_Alt"]] = LNG_CODES.get(in_alt_lng, "")
-
-                # Populate roads closed for construction
-                if link_id in construction_links:
-                    updated_row[fname_idx["ClosedForConstruction"]] = "Y"
-
-                # Populate the usage fee restriction fields
-                try:
-                    # Retrieve the relevant cdms records for this LINK_ID
-                    ufr_record = ufr_df.loc[link_id]
-                    if isinstance(ufr_record, pd.DataFrame):
-                        # There were multiple records associated with this LINK_ID.
-                        # There are several reasons why a link can have multiple entries with COND_TYPE = 12,
-                        # for example, time-dependent tolling, different tolling methods or agencies, etc.
-                        # The UFR fields are meant to capture whether a road is subject to a toll at any time,
-                        # so we would want to capture if there are any records for that link with COND_TYPE = 12
-                        # in the Cdms table with a value of Y for each AR field. Consequently, if there are
-                        # multiple records, use a value of Y if any row has a value of Y; otherwise, arbitrarily
-                        # use the value of the first returned record.
-                        ufr_record = ufr_record.iloc[0].mask(ufr_record.isin(["Y"]).any(), "Y")
-                    for ufr_suff in AR_FLD_SUFS:
-                        updated_row[fname_idx[f"UFR_{ufr_suff}"]] = ufr_record[f"AR_{ufr_suff}"]
-                except KeyError:
-                    # There were no UFR records for this LINK_ID. Just skip it and move on.
-                    pass
-
-                # Populate the restriction fields associated with the transport condition modifier table
-                if self.cndmod_df is not None:
-                    try:
-                        # Retrieve the restriction records for this ID
-                        subset_df = self.cndmod_df.loc[link_id]
-                        # Loop through the transport condition modifier records and update the appropriate rows
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            updated_row = calc_cndmod_fields(updated_row, subset_df)
-                        else:
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                updated_row = calc_cndmod_fields(updated_row, record)
-
-                        # Update additional restrictions based on the values of the other cndmod restrictions
-                        updated_row = calc_additional_transport_fields(
-                            updated_row,
-                            "PreferredTruckRoute",
-                            ["STAAPreferred", "TruckDesignatedPreferred", "LocallyPreferred"]
-                        )
-
-                    except KeyError:
-                        # There were no cndmod restriction records for this ID. Just skip it and move on.
-                        pass
-
-                # Update the row in the Streets table
-                cur.updateRow(updated_row)
-
-        # Clean up and free up memory
-        arcpy.ResetProgressor()
-        del alt_streets_df
-        del z_levels_df
-        del construction_links
+            out_df = out_df.join(self._calculate_cndmod_fields())
+
+        return out_df
+
+    def _calculate_cndmod_fields(self):
+        """Calculate restriction field values for all streets from data in the cndmod tables.
+
+        The cndmod records are converted to a long table of (LINK_ID, field, value) updates, which is then pivoted to
+        one column per restriction field. When multiple records for a LINK_ID update the same field, the last one wins.
+
+        Returns:
+            Dataframe of restriction field values indexed by LINK_ID for streets having cndmod records
+        """
+        assert self.cndmod_df is not None
+        cndmod_df = self.cndmod_df.reset_index()
+        cndmod_df["Order"] = np.arange(len(cndmod_df))
+        mod_type = cndmod_df["MOD_TYPE"]
+        mod_val = cndmod_df["MOD_VAL"]
+
+        # Figure out which restriction each record is for and the value to set
+        updates = []
+
+        def add_updates(mask, suffix, value, is_preferred):
+            """Add the updates for the records matching the mask."""
+            update_df = cndmod_df.loc[mask, ["Order", "LINK_ID", "COND_ID"]]
+            update_df = update_df.assign(Suffix=suffix, Value=value, IsPreferred=is_preferred)
+            updates.append(update_df[["Order", "LINK_ID", "COND_ID", "Suffix", "Value", "IsPreferred"]])
+
+        # Preferred restrictions and the TruckFCOverride field
+        is_49 = mod_type == 49
+        add_updates(is_49 & (mod_val == "15"), "TruckFCOverride", 1, None)
+        add_updates(is_49 & (mod_val == "16"), "TruckFCOverride", 2, None)
+        add_updates(
+            is_49 & mod_val.isin(list(self.prefer_suffixes.keys())), mod_val.map(self.prefer_suffixes), "Y", True)
+        # Prohibited restrictions
+        add_updates(
+            (mod_type == 39) & mod_val.isin(list(self.prohib_suffixes.keys())), mod_val.map(self.prohib_suffixes), "Y",
+            False)
+        # Limit restrictions
+        add_updates(
+            mod_type.isin(list(self.limit_suffixes.keys())), mod_type.map(self.limit_suffixes),
+            cndmod_df["MOD_VAL_U"], False)
+        # A couple of specific restriction cases
+        is_46 = mod_type == 46
+        is_trailer_count = is_46 & mod_val.isin(["1", "2", "3"])
+        add_updates(
+            is_trailer_count, "MaxTrailersAllowedOnTruck", mod_val[is_trailer_count].astype(int).astype(object), False)
+        add_updates(is_46 & (mod_val == "4"), "SemiOrTractorWOneOrMoreTrailersProhibited", "Y", False)
+        is_75 = mod_type == 75
+        is_axle_count = is_75 & mod_val.isin(["1", "2", "3", "4", "5"])
+        add_updates(is_axle_count, "MaxAxlesAllowed", mod_val[is_axle_count].astype(int).astype(object), False)
+        add_updates(is_75 & (mod_val == "6"), "SingleAxleProhibited", "Y", False)
+        add_updates(is_75 & (mod_val == "7"), "TandemAxleProhibited", "Y", False)
+        add_updates(mod_type == 48, "TruckKPH", cndmod_df["MOD_VAL_U"], True)
+        updates_df = pd.concat(updates, ignore_index=True)
+        updates_df["Value"] = updates_df["Value"].astype(object)
+
+        # Figure out which direction each record is for using the first direction record for its COND_ID.  Records with
+        # no indication of their directionality are not usable.
+        preferred_dir = self.preferred_dir_df.loc[~self.preferred_dir_df.index.duplicated(keep="first"), "Direction"]
+        prohib_dir = self.prohib_dir_df.loc[~self.prohib_dir_df.index.duplicated(keep="first"), "Direction"]
+        direction = np.where(
+            updates_df["IsPreferred"] == True,  # noqa: E712
+            updates_df["COND_ID"].map(preferred_dir),
+            updates_df["COND_ID"].map(prohib_dir)
+        )
+        is_non_directional = updates_df["IsPreferred"].isna().to_numpy()
+        non_dir_df = updates_df[is_non_directional].assign(Field=updates_df["Suffix"])
+        ft_df = updates_df[np.isin(direction, ["FT", "B"]) & ~is_non_directional]
+        ft_df = ft_df.assign(Field="FT_" + ft_df["Suffix"])
+        tf_df = updates_df[np.isin(direction, ["TF", "B"]) & ~is_non_directional]
+        tf_df = tf_df.assign(Field="TF_" + tf_df["Suffix"])
+        updates_df = pd.concat([non_dir_df, ft_df, tf_df])
+        del non_dir_df
+        del ft_df
+        del tf_df
+
+        # Apply the updates in the original record order so the last record updating a field wins
+        updates_df = updates_df.sort_values("Order", kind="stable").drop_duplicates(["LINK_ID", "Field"], keep="last")
+        restr_fields = self.prefer_restr_fields + self.prohib_restr_fields + self.limit_restr_fields + [
+            "FT_MaxTrailersAllowedOnTruck", "TF_MaxTrailersAllowedOnTruck",
+            "FT_SemiOrTractorWOneOrMoreTrailersProhibited", "TF_SemiOrTractorWOneOrMoreTrailersProhibited",
+            "FT_MaxAxlesAllowed", "TF_MaxAxlesAllowed",
+            "FT_SingleAxleProhibited", "TF_SingleAxleProhibited",
+            "FT_TandemAxleProhibited", "TF_TandemAxleProhibited",
+            "FT_TruckKPH", "TF_TruckKPH",
+            "TruckFCOverride"
+        ]
+        restr_df = updates_df.pivot(index="LINK_ID", columns="Field", values="Value")
+        restr_df = restr_df.reindex(columns=restr_fields).astype(object)
+        del updates_df
+
+        # Update additional restrictions based on the values of the other cndmod restrictions
+        for prefix in ["FT_", "TF_"]:
+            is_preferred_route = restr_df[[
+                f"{prefix}{suffix}" for suffix in ["STAAPreferred", "TruckDesignatedPreferred", "LocallyPreferred"]
+            ]].eq("Y").any(axis=1)
+            restr_df.loc[is_preferred_route, f"{prefix}PreferredTruckRoute"] = "Y"
+
+        return restr_df
 
     @timed_exec
-    def _populate_profiles_table(self):
-        """Populate the traffic profiles (Patterns) table."""
+    def _populate_profiles_table(self, populate_table=True):
+        """Populate the traffic profiles (Patterns) table and prepare the speed profiles for later use.
+
+        If populate_table is False, the table is assumed to have been populated already by a previous run, and only the
+        spd_df dataframe is rebuilt.
+        """
         if not self.include_historical_traffic:
             return
-        self._add_message(f"Populating the {os.path.basename(self.profiles)} table...")
+        if populate_table:
+            self._add_message(f"Populating the {os.path.basename(self.profiles)} table...")
+        else:
+            self._add_message("Reading speed profiles...")
 
         # Get the list of all the fields to populate in the Patterns table
         profiles_oid = arcpy.Describe(self.profiles).oidFieldName
@@ -1042,54 +1128,89 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         # at full freeflow.
         h_fields = [f.split("SpeedFactor_")[1] for f in profiles_fields if f.startswith("SpeedFactor_")]
         h_fields = [f"H{f[0:2]}_{f[2:4]}" for f in h_fields]
-        spd_cols = ["PATTERN_ID"] + h_fields
-        self.spd_df = pd.read_csv(self.in_data_object.historical_speed_profiles_table, usecols=spd_cols)
-        self.spd_df["BaseSpeed"] = self.spd_df["H00_00"]
-        self.spd_df["AverageSpeed"] = sum(1/self.spd_df[h] for h in h_fields) / sum(1/(self.spd_df[h]**2) for h in h_fields)
-        for col in self.spd_df.columns:
-            if col == "H00_00" or not col.startswith("H"):
-                continue
-            self.spd_df[col] = self.spd_df[col] / self.spd_df["H00_00"]
-        self.spd_df["H00_00"] = 1.0
+        spd_df = self._read_speed_profiles(h_fields)
 
         # Insert the rows
-        fields = ["PatternID"] + [f for f in profiles_fields if f.startswith("SpeedFactor_")] + \
-            ["BaseSpeed", "AverageSpeed"]
-        with arcpy.da.InsertCursor(self.profiles, fields) as cur:
-            # Loop through the records in the SPD table and populate the Patterns table with the values
-            for _, row in self.spd_df.iterrows():
-                cur.insertRow(row.to_list())
+        if populate_table:
+            fields = ["PatternID"] + [f for f in profiles_fields if f.startswith("SpeedFactor_")] + \
+                ["BaseSpeed", "AverageSpeed"]
+            self.table_io.insert_rows(
+                self.profiles, spd_df, fields, ["PATTERN_ID"] + h_fields + ["BaseSpeed", "AverageSpeed"])
+
+        self.spd_df = self._index_speed_profiles(spd_df, h_fields)
+
+    def _read_speed_profiles(self, h_fields):
+        """Read the SPD table and calculate the BaseSpeed, AverageSpeed, and relative speeds of each speed profile.
+
+        Args:
+            h_fields: List of the H**_** time slice fields to read
+
+        Returns:
+            Dataframe of PATTERN_ID, the relative speed of each time slice, BaseSpeed, AverageSpeed, and IsConst, which
+            indicates whether the speed is the same in all time slices
+        """
+        spd_df = pd.read_csv(
+            self.in_data_object.historical_speed_profiles_table, usecols=["PATTERN_ID"] + h_fields,
+            dtype={h: np.float32 for h in h_fields}
+        )
+        # Calculate everything in one pass over a 2D array of the speeds with a row for each profile and a column for
+        # each time slice. Global SPD files have hundreds of thousands of profiles, so float32 halves the memory used.
+        speeds = spd_df[h_fields].to_numpy(dtype=np.float32)
+        pattern_ids = spd_df["PATTERN_ID"].to_numpy()
+        del spd_df
+        base_idx = h_fields.index("H00_00")
+        base_speed = speeds[:, base_idx].copy()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inv_speeds = np.reciprocal(speeds)
+            # Accumulate the sums in float64 so the 96 time slices don't lose precision
+            average_speed = inv_speeds.sum(axis=1, dtype=np.float64) / \
+                np.square(inv_speeds).sum(axis=1, dtype=np.float64)
+            del inv_speeds
+            speeds /= base_speed[:, np.newaxis]
+        speeds[:, base_idx] = 1.0
+        # Check for constant speed patterns where all H**_** fields are the same across the day
+        is_const = (speeds == speeds[:, :1]).all(axis=1)
 
+        out_df = pd.DataFrame(speeds, columns=h_fields)
+        out_df.insert(0, "PATTERN_ID", pattern_ids)
+        out_df["BaseSpeed"] = base_speed
+        out_df["AverageSpeed"] = average_speed
+        out_df["IsConst"] = is_const
+        return out_df
+
+    @staticmethod
+    def _index_speed_profiles(spd_df, h_fields):
+        """Index the speed profiles by PATTERN_ID for looking up their Patterns OID, speeds, and constancy later."""
         # Add a field to represent the OID that will be used for the final table, which will be referenced later
-        self.spd_df["OID"] = range(1, len(self.spd_df) + 1)
+        spd_df["OID"] = range(1, len(spd_df) + 1)
         # Set index to prepare for future use
-        self.spd_df.set_index("PATTERN_ID", inplace=True)
-        # Check for constant speed patterns where all H**_** fields are the same across the day
-        self.spd_df["IsConst"] = self.spd_df[h_fields].eq(self.spd_df[h_fields].iloc[:, 0], axis=0).all(axis=1)
+        spd_df.set_index("PATTERN_ID", inplace=True)
         # Drop H**_** fields, which are no longer needed
-        self.spd_df.drop(columns=h_fields, inplace=True)
+        spd_df.drop(columns=h_fields, inplace=True)
+        return compact_df(spd_df, name="SPD")
 
-    @timed_exec
-    def _read_link_ref_files(self):
-        """Read in the link reference tables and use them to populate the Streets_Patterns table."""
-        assert self.spd_df is not None
+    def _read_link_ref_files(self, streets_ids):
+        """Read in the link reference tables in chunks and yield the relevant records of each chunk.
+
+        Args:
+            streets_ids: Sorted array of the unique LINK_IDs of the streets, used for filtering out irrelevant traffic
+                records
 
-        # Make a list of street link IDs to use for filtering out irrelevant traffic records
-        streets_ids = []
-        for row in arcpy.da.SearchCursor(self.streets, ["LINK_ID"]):
-            streets_ids.append(row[0])
+        Yields:
+            Dataframes of processed link reference records, functional class 1-4 records first and then functional
+            class 5 records, each in the original table order
+        """
+        assert self.spd_df is not None
 
-        # The traffic tables can sometimes be huge, so read them in and process them in chunks to reduce
-        # memory consumption
-        chunk_size = 100000
+        # Read the link reference table covering functional class 1-4
+        for lr_df in pd.read_csv(self.in_data_object.link_ref_table_1_4, chunksize=TRAFFIC_CHUNK_SIZE):
+            lr_df = lr_df[isin_sorted(lr_df["LINK_PVID"].to_numpy(), streets_ids)]
+            yield self._standardize_link_ref_chunk(lr_df)
 
         # Read the link reference table covering functional class 5 and remove records that are constant across all
         # times of day and days of week
-        lr5_df_chunks = []
-        num_chunks = 0
-        for lr5_df in pd.read_csv(self.in_data_object.link_ref_table_5, chunksize=chunk_size):
-            num_chunks += 1
-            lr5_df = lr5_df[lr5_df["LINK_PVID"].isin(streets_ids)]
+        for lr5_df in pd.read_csv(self.in_data_object.link_ref_table_5, chunksize=TRAFFIC_CHUNK_SIZE):
+            lr5_df = lr5_df[isin_sorted(lr5_df["LINK_PVID"].to_numpy(), streets_ids)]
             # Preserve original table order for proper sorting
             lr5_df["sort_order"] = lr5_df.index
             lr5_df = lr5_df.join(self.spd_df["IsConst"], "U")
@@ -1103,44 +1224,24 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
             lr5_df["IsConst2"] = lr5_df[DAY_FIELDS].eq(lr5_df[DAY_FIELDS].iloc[:, 0], axis=0).all(axis=1)
             lr5_df = lr5_df.loc[~(lr5_df["IsConst"] & lr5_df["IsConst2"])]
             lr5_df.drop(columns=["IsConst", "IsConst2"], inplace=True)
-            # Calculate from and to pos based on travel direction
-            lr5_df["EdgeFrmPos"] = lr5_df["TRAVEL_DIRECTION"] == "T"
-            lr5_df["EdgeToPos"] = lr5_df["TRAVEL_DIRECTION"] == "F"
-            lr5_df["EdgeFrmPos"] = lr5_df["EdgeFrmPos"].astype(int)
-            lr5_df["EdgeToPos"] = lr5_df["EdgeToPos"].astype(int)
-            lr5_df.drop(columns=["TRAVEL_DIRECTION"], inplace=True)
-            lr5_df_chunks.append(lr5_df)
-        lr5_df = pd.concat(lr5_df_chunks)
-        del lr5_df_chunks
-
-        # Read the link reference table covering functional class 1-4 and combine it with the processed functional
-        # class 5 table
-        lr_df_chunks = []
-        num_chunks = 0
-        for lr_df in pd.read_csv(self.in_data_object.link_ref_table_1_4, chunksize=chunk_size):
-            num_chunks += 1
-            lr_df = lr_df[lr_df["LINK_PVID"].isin(streets_ids)]
-            # Calculate from and to pos based on travel direction
-            lr_df["EdgeFrmPos"] = lr_df["TRAVEL_DIRECTION"] == "T"
-            lr_df["EdgeToPos"] = lr_df["TRAVEL_DIRECTION"] == "F"
-            lr_df["EdgeFrmPos"] = lr_df["EdgeFrmPos"].astype(int)
-            lr_df["EdgeToPos"] = lr_df["EdgeToPos"].astype(int)
-            lr_df.drop(columns=["TRAVEL_DIRECTION"], inplace=True)
-            lr_df_chunks.append(lr_df)
-        lr_df = pd.concat(lr_df_chunks + [lr5_df])
-        del lr_df_chunks
-        del lr5_df
-
-        # Standardize schema
-        lr_df.rename(columns={"LINK_PVID": "LINK_ID"}, inplace=True)
+            yield self._standardize_link_ref_chunk(lr5_df)
 
+    @staticmethod
+    def _standardize_link_ref_chunk(lr_df):
+        """Calculate the Edge*Pos fields for a chunk of link reference records and standardize its schema."""
+        lr_df = lr_df.copy()
+        # Calculate from and to pos based on travel direction
+        lr_df["EdgeFrmPos"] = (lr_df["TRAVEL_DIRECTION"] == "T").astype(int)
+        lr_df["EdgeToPos"] = (lr_df["TRAVEL_DIRECTION"] == "F").astype(int)
+        lr_df.drop(columns=["TRAVEL_DIRECTION"], inplace=True)
+        lr_df.rename(columns={"LINK_PVID": "LINK_ID"}, inplace=True)
         return lr_df
 
     @timed_exec
     def _read_tmc_traffic_table(self):
         """Read the TMC Traffic table and calculate the Edge*Pos fields."""
-        with arcpy.da.SearchCursor(self.in_data_object.traffic_table, ["LINK_ID", "TRAFFIC_CD"]) as cur:
-            traff_df = pd.DataFrame(cur, columns=["LINK_ID", "TMC"])
+        traff_df = self._read_input_table(self.in_data_object.traffic_table, ["LINK_ID", "TRAFFIC_CD"])
+        traff_df.rename(columns={"TRAFFIC_CD": "TMC"}, inplace=True)
         # Calculate from and to pos based on TRAFFIC_CD prefix
         traff_df["EdgeFrmPos"] = traff_df["TMC"].str.startswith("-")
         traff_df["EdgeToPos"] = ~traff_df["EdgeFrmPos"]
@@ -1171,7 +1272,13 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
 
     @timed_exec
     def _read_and_process_historical_traffic_tables(self):
-        """Read the relevant historical traffic tables based on the provided inputs and do some calculations."""
+        """Read the relevant historical traffic tables based on the provided inputs and do some calculations.
+
+        The traffic tables can sometimes be huge, so they are read and processed in chunks, and the results are spilled
+        to a temporary store sorted by LINK_ID that is used later to populate the Streets_Patterns table one range of
+        streets at a time. Only the AverageSpeed for each street and direction, which is needed for populating the
+        Streets fields, is kept in memory.
+        """
         if not self.include_historical_traffic:
             return
         assert self.spd_df is not None
@@ -1179,17 +1286,50 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         # Read and process the appropriate input tables
         if self.historical_traffic_type is HistoricalTrafficConfigType.LinkReferenceFiles:
             self._add_message("Populating Streets_Patterns table from link reference tables...")
-            self.traff_df = self._read_link_ref_files()
+            # Make a sorted array of street link IDs to use for filtering out irrelevant traffic records
+            streets_ids = np.unique(self.table_io.read_columns(self.streets, ["LINK_ID"])["LINK_ID"].to_numpy(
+                dtype=np.int64))
+            traff_chunks = self._read_link_ref_files(streets_ids)
         elif self.historical_traffic_type is HistoricalTrafficConfigType.TMCReferenceFiles:
             self._add_message("Populating Streets_Patterns table from TMC traffic tables...")
-            self.traff_df = self._read_tmc_files()
+            tmc_traff_df = self._read_tmc_files()
+            traff_chunks = (
+                tmc_traff_df.iloc[start:start + TRAFFIC_CHUNK_SIZE]
+                for start in range(0, len(tmc_traff_df), TRAFFIC_CHUNK_SIZE)
+            )
         else:
             raise NotImplementedError(f"Unknown historical traffic config type: {self.historical_traffic_type}")
 
+        self._spill_traffic_chunks(traff_chunks, arcpy.env.scratchFolder)
+
+    def _spill_traffic_chunks(self, traff_chunks, spill_folder):
+        """Calculate the speeds of each chunk of historical traffic records and spill the results to a sorted store.
+
+        Sets traff_store to a SortedSpillStore of the processed records in spill_folder and traff_speeds_df to the
+        AverageSpeed of each street and direction.
+        """
+        self.traff_store = SortedSpillStore("LINK_ID", spill_folder)
+        speeds_dfs = []
+        for traff_df in traff_chunks:
+            traff_df = compact_df(self._calculate_traffic_speeds(traff_df))
+            self.traff_store.append(traff_df)
+            speeds_dfs.append(traff_df[["LINK_ID", "EdgeFrmPos", "AverageSpeed"]])
+
+        # Keep only the last record for each LINK_ID and direction and index by LINK_ID for joining with Streets
+        if speeds_dfs:
+            speeds_df = pd.concat(speeds_dfs, ignore_index=True)
+        else:
+            speeds_df = pd.DataFrame({"LINK_ID": [], "EdgeFrmPos": [], "AverageSpeed": []})
+        del speeds_dfs
+        speeds_df.drop_duplicates(["LINK_ID", "EdgeFrmPos"], keep="last", inplace=True)
+        self.traff_speeds_df = compact_df(speeds_df.set_index("LINK_ID"), name="Traffic speeds")
+
+    def _calculate_traffic_speeds(self, traff_df):
+        """Calculate AverageSpeed and BaseSpeed for a chunk of historical traffic records."""
         # Calculate AverageSpeed and BaseSpeed for each weekday based on info in the Patterns table
         for day in DAY_FIELDS:
-            self.traff_df = self.traff_df.join(self.spd_df[["AverageSpeed", "BaseSpeed", "OID"]], day)
-            self.traff_df.rename(
+            traff_df = traff_df.join(self.spd_df[["AverageSpeed", "BaseSpeed", "OID"]], day)
+            traff_df.rename(
                 columns={
                     "AverageSpeed": f"AverageSpeed_{day}",
                     "BaseSpeed": f"BaseSpeed_{day}"
@@ -1197,24 +1337,25 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
                 inplace=True
             )
             # Update day field to reference the Patterns OIDs instead of PatternID.
-            self.traff_df[day] = self.traff_df["OID"]
-            self.traff_df.drop(columns=["OID"], inplace=True)
+            traff_df[day] = traff_df["OID"]
+            traff_df.drop(columns=["OID"], inplace=True)
 
         # Calculate overall AverageSpeed and BaseSpeed
         # To get the freeflow speed, use the weighted harmonic mean of these seven speeds as follows:
         # vAvg = ( (1/v1)+(1/v2)+(1/v3)+(1/v4)+(1/v5)+(1/v6)+(1/v7) ) /
         #        ( (1/v1^2)+(1/v2^2)+(1/v3^2)+(1/v4^2)+(1/v5^2)+(1/v6^2)+(1/v7^2) )
-        self.traff_df["AverageSpeed"] = sum(1/self.traff_df[f"AverageSpeed_{day}"] for day in DAY_FIELDS) / \
-            sum(1/(self.traff_df[f"AverageSpeed_{day}"]**2) for day in DAY_FIELDS)
-        self.traff_df["BaseSpeed"] = sum(1/self.traff_df[f"BaseSpeed_{day}"] for day in DAY_FIELDS) / \
-            sum(1/(self.traff_df[f"BaseSpeed_{day}"]**2) for day in DAY_FIELDS)
+        traff_df["AverageSpeed"] = sum(1/traff_df[f"AverageSpeed_{day}"] for day in DAY_FIELDS) / \
+            sum(1/(traff_df[f"AverageSpeed_{day}"]**2) for day in DAY_FIELDS)
+        traff_df["BaseSpeed"] = sum(1/traff_df[f"BaseSpeed_{day}"] for day in DAY_FIELDS) / \
+            sum(1/(traff_df[f"BaseSpeed_{day}"]**2) for day in DAY_FIELDS)
 
         # Drop temporary fields
-        self.traff_df.drop(
+        traff_df.drop(
             columns=[f"AverageSpeed_{day}" for day in DAY_FIELDS] + \
                 [f"BaseSpeed_{day}" for day in DAY_FIELDS],
             inplace=True
         )
+        return traff_df
 
     @timed_exec
     def _create_and_populate_streets_patterns_table(self):
@@ -1223,14 +1364,10 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
             return
         self._add_message("Creating and populating Streets_Patterns table...")
         assert self.spd_df is not None
-        assert self.traff_df is not None
+        assert self.traff_store is not None
         assert self.streets_df is not None
 
-        # Create the table with desired schema
-        arcpy.management.CreateTable(
-            os.path.dirname(self.streets_profiles),
-            os.path.basename(self.streets_profiles)
-        )
+        # Create the table with desired schema, unless it's updated in place in a delta run
         field_defs = [["LINK_ID", "LONG"]]
         if self.historical_traffic_type is HistoricalTrafficConfigType.TMCReferenceFiles:
             field_defs.append(["TMC", "TEXT", "", 9])
@@ -1243,29 +1380,36 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
             ["AverageSpeed", "FLOAT"],
             ["BaseSpeed", "FLOAT"]
         ]
-        arcpy.management.AddFields(self.streets_profiles, field_defs)
-
-        # Join info from the Streets dataframe (both are indexed by LINK_ID at this point)
-        self.traff_df = self.traff_df.join(self.streets_df[["Meters", "OID"]])
-        self.traff_df.rename(columns={"OID": "EdgeFID"}, inplace=True)
-        self.traff_df.reset_index(inplace=True)
-
-        # For consistency, sort the dataframe before writing out the records
-        self.traff_df.sort_values(["LINK_ID", "EdgeFrmPos"], inplace=True)
+        if not self._reuse_previous_output(self.streets_profiles):
+            arcpy.management.CreateTable(
+                os.path.dirname(self.streets_profiles),
+                os.path.basename(self.streets_profiles)
+            )
+            arcpy.management.AddFields(self.streets_profiles, field_defs)
 
-        # Write the records to the Streets_Patterns table
         out_fields = [
             "EdgeFCID",
             "AverageSpeed", "BaseSpeed",
             "EdgeFrmPos", "EdgeToPos", "EdgeFID",
             "LINK_ID"
         ] + DAY_FIELDS
-        if "TMC" in self.traff_df.columns:
+        if self.historical_traffic_type is HistoricalTrafficConfigType.TMCReferenceFiles:
             out_fields.append("TMC")
-        with arcpy.da.InsertCursor(self.streets_profiles, out_fields) as cur:
-            for _, traff_record in self.traff_df.iterrows():
-                new_row = [self.fc_id] + [traff_record[f] for f in out_fields[1:]]
-                cur.insertRow(new_row)
+
+        # Process the traffic records one range of LINK_IDs at a time. Each range holds the records for about half a
+        # chunk's worth of streets, since most streets have a record in each direction.
+        streets_ids = np.unique(self.streets_df.index.to_numpy())
+        boundaries = streets_ids[TRAFFIC_CHUNK_SIZE // 2::TRAFFIC_CHUNK_SIZE // 2]
+        for traff_df in self.traff_store.partitions(boundaries):
+            # Join info from the Streets dataframe
+            traff_df = traff_df.join(self.streets_df[["OID"]], "LINK_ID")
+            traff_df.rename(columns={"OID": "EdgeFID"}, inplace=True)
+            # For consistency, sort the records before writing them out. The ranges are in LINK_ID order, so this
+            # sorts the whole table.
+            traff_df.sort_values(["LINK_ID", "EdgeFrmPos"], inplace=True)
+            # Write the records to the Streets_Patterns table
+            traff_df["EdgeFCID"] = self.fc_id
+            self.table_io.insert_rows(self.streets_profiles, traff_df, out_fields)
 
     @timed_exec
     def _create_and_populate_streets_tmc_table(self):
@@ -1284,29 +1428,18 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         traff_df = traff_df.join(self.streets_df[["OID"]], "LINK_ID")
         traff_df.rename(columns={"OID": "EdgeFID"}, inplace=True)
 
-        field_names = ["EdgeFCID"] + [f for f in field_names if f != "EdgeFCID"]
-        with arcpy.da.InsertCursor(self.streets_tmc, field_names) as cur:
-            for _, traff_record in traff_df.iterrows():
-                new_row = [self.fc_id] + [traff_record[f] for f in field_names[1:]]
-                cur.insertRow(new_row)
+        traff_df["EdgeFCID"] = self.fc_id
+        self.table_io.insert_rows(self.streets_tmc, traff_df, field_names)
 
     @timed_exec
     def _read_and_index_turn_tables(self):
         """Read and index turn tables."""
         self._add_message("Reading and indexing restricted turn tables...")
-        fields = ["LINK_ID", "MAN_LINKID", "COND_ID", "SEQ_NUMBER"]
-        with arcpy.da.SearchCursor(self.in_data_object.rdms, fields) as cur:
-            rdms_df = pd.DataFrame(cur, columns=fields)
-        rdms_df.set_index("COND_ID", inplace=True)
+        # The rdms table is shared with the road forks, so it's not modified in place
+        rdms_df = self._rdms_records().set_index("COND_ID")
 
-        # Read cdms table again to retrieve turn restrictions
-        if self.use_transport_fields:
-            where = "COND_TYPE IN (4, 7, 26)"
-        else:
-            where = "COND_TYPE IN (4, 7)"
-        fields = ["COND_ID", "COND_TYPE", "END_OF_LK"] + ["AR_" + suf for suf in AR_FLD_SUFS]
-        with arcpy.da.SearchCursor(self.in_data_object.cdms, fields, where) as cur:
-            cdms_df = pd.DataFrame(cur, columns=fields)
+        # Get the cdms records of the turn restrictions
+        cdms_df = self._cdms_records("turns")
         cdms_df.set_index("COND_ID", inplace=True)
 
         # Join the cdms table to the rdms table to transfer END_OF_LK and to drop rows that don't match the COND_TYPE
@@ -1316,10 +1449,29 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         # Determine the max number of edges participating in a turn. This will be used when creating the turn feature
         # class to initialize the proper number of fields.
         self.max_turn_edges = int(rdms_df["SEQ_NUMBER"].max()) + 1
+        rdms_df = self._limit_to_changed_streets(rdms_df, "COND_ID", ["LINK_ID", "MAN_LINKID"])
 
         # Group by LINK_ID to ensure that turn maneuver records are grouped together
         self.grouped_rdms_df = rdms_df.groupby(["COND_ID", "LINK_ID"])
 
+    @timed_exec
+    def _read_signs_table(self):
+        """Read the signs table."""
+        fields = ["SEQ_NUM", "EXIT_NUM", "SRC_LINKID", "DST_LINKID", "LANG_CODE", "BR_RTEID", "BR_RTEDIR", "SIGN_TEXT",
+                  "SIGN_TXTTP", "TOW_RTEID", "SIGN_ID"]
+        signs_df = self._read_input_table(self.in_data_object.signs, fields)
+        self.signs_df = self._limit_to_changed_streets(signs_df, None, ["SRC_LINKID", "DST_LINKID"])
+
+    def _prefetch_turn_and_signpost_geometry(self):
+        """Prefetch the geometry of all streets used by turns and signposts."""
+        # When resuming a previous run, only the tables needed by the stages that still have to run are read.
+        street_ids = []
+        if self.grouped_rdms_df is not None:
+            street_ids += [self.grouped_rdms_df.obj["LINK_ID"], self.grouped_rdms_df.obj["MAN_LINKID"]]
+        if self.signs_df is not None:
+            street_ids += [self.signs_df["SRC_LINKID"], self.signs_df["DST_LINKID"]]
+        self._prefetch_street_geometry(pd.concat(street_ids).unique())
+
     @timed_exec
     def _generate_turn_features(self):
         """Generate the turn features and insert them into the turn feature class."""
@@ -1328,174 +1480,233 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         assert self.grouped_rdms_df is not None
         assert self.max_turn_edges is not None
 
-        def calc_cndmod_fields(row, cndmod_record):
-            """Calculate restriction field values from data in the cndmod tables."""
-            mod_type = cndmod_record["MOD_TYPE"]
-            mod_val = cndmod_record["MOD_VAL"]
-
-            # Calculate a value for a prohibit restriction
-            if mod_type == 39:
-                # Figure out which prohibit restriction this is for
-                prohib_field = self.prohib_suffixes.get(mod_val)
-                if not prohib_field:
-                    # Invalid or irrelevant record.  Return row unchanged.
-                    return row
-                row[cndmod_turn_fname_idx[prohib_field]] = "Y"
-
-            # Calculate a value for a limit restriction field
-            elif mod_type in self.limit_suffixes.keys():
-                mod_val = cndmod_record["MOD_VAL_U"]
-                limit_field = self.limit_suffixes[mod_type]
-                row[cndmod_turn_fname_idx[limit_field]] = mod_val
-
-            # Handle a couple of specific restriction cases
-            elif mod_type == 46:
-                if mod_val in ('1', '2', '3'):
-                    row[cndmod_turn_fname_idx["MaxTrailersAllowedOnTruck"]] = int(mod_val)
-                elif mod_val == "4":
-                    row[cndmod_turn_fname_idx["SemiOrTractorWOneOrMoreTrailersProhibited"]] = "Y"
-            elif mod_type == 75:
-                if mod_val in ('1', '2', '3', '4', '5'):
-                    row[cndmod_turn_fname_idx["MaxAxlesAllowed"]] = int(mod_val)
-                elif mod_val == '6':
-                    row[cndmod_turn_fname_idx["SingleAxleProhibited"]] = "Y"
-                elif mod_val == '7':
-                    row[cndmod_turn_fname_idx["TandemAxleProhibited"]] = "Y"
-
-            return row
+        context, partitions = self._turn_worker_inputs()
+        turn_fields = self._turn_fields(context)
+
+        # Build the turn rows in worker processes (or serially if there is only one worker) and write them here
+        with self.table_io.insert_cursor(self.turns, turn_fields) as cur_t:
+            # Set up progressor
+            arcpy.SetProgressor("step", "Populating turn feature class...", 0, len(self.grouped_rdms_df), 1)
+            for turn_oid, turn_row in self._emit_worker_results(
+                map_partitions(self._build_turn_rows, context, partitions, self.num_workers), self.turns
+            ):
+                arcpy.SetProgressorPosition(turn_oid)
+                turn_row[0] = vertices_to_wkb(turn_row[0])
+                cur_t.insertRow(turn_row)
+
+        arcpy.ResetProgressor()
 
+    def _turn_fields(self, context):
+        """Return the turn feature class fields populated with the turn rows built by the workers from the context."""
         # Create a list of turn fields based on the max turn edges and standard turn feature class schema
-        turn_fields = ["SHAPE@", "COND_ID", "COND_TYPE", "Edge1End"]
+        turn_fields = ["SHAPE@WKB", "COND_ID", "COND_TYPE", "Edge1End"]
         for idx in range(1, self.max_turn_edges + 1):
             turn_fields += [f"Edge{idx}FCID", f"Edge{idx}FID", f"Edge{idx}Pos"]
         # Add restriction fields
         turn_fields += AR_FLDS
-        cndmod_turn_fname_idx = None
-        if self.cndmod_df is not None:
+        if context["cndmod_index"] is not None:
             # Add more restriction fields
+            turn_fields += list(context["cndmod_turn_fname_idx"])
+        return turn_fields
+
+    def _turn_worker_inputs(self):
+        """Return the shared context and the partitions of the rdms table used by the workers building turns.
+
+        Each partition has whole groups of records for each turn.
+        """
+        rdms_df = self.grouped_rdms_df.obj
+        context = self._worker_context()
+        context["cndmod_index"] = None
+        if self.cndmod_df is not None:
             added_turn_restr_fields = list(self.prohib_suffixes.values()) + [f[0] for f in self.addl_turn_field_defs]
-            cndmod_turn_fname_idx = {f: i for i, f in enumerate(added_turn_restr_fields)}  # {Field name: index}
-            turn_fields += added_turn_restr_fields
-            # Update index of cndmod_df to COND_ID for quick lookups for turn records
-            self.cndmod_df.reset_index(inplace=True)
-            self.cndmod_df.set_index("COND_ID", inplace=True)
+            # Index cndmod_df by COND_ID for quick lookups for turn records. Only the records for turns are needed.
+            cndmod_df = self.cndmod_df[self.cndmod_df["COND_ID"].isin(rdms_df["COND_ID"])]
+            context["cndmod_index"] = GroupedIndex.from_df(cndmod_df, "COND_ID", ["MOD_TYPE", "MOD_VAL", "MOD_VAL_U"])
+            context["cndmod_turn_fname_idx"] = {f: i for i, f in enumerate(added_turn_restr_fields)}  # {Field: index}
+            context["prohib_suffixes"] = self.prohib_suffixes
+            context["limit_suffixes"] = self.limit_suffixes
+        return context, partition_groups(rdms_df, ["COND_ID", "LINK_ID"], self.num_workers)
 
-        # Open an insert cursor so we can add entries to the turn feature class. We will build the rows below.
-        with arcpy.da.InsertCursor(self.turns, turn_fields) as cur_t:
+    @staticmethod
+    def _build_turn_rows(context, rdms_df):
+        """Build the turn feature rows for a partition of the rdms table.
+
+        This may run in a worker process, so it only uses the data passed in with the partition and the shared context.
+
+        Returns:
+            A list with a (row, warnings) tuple for each turn. The first value of the row is an (N, 2) array of the
+            turn's vertices, and the row is None if the turn is skipped.
+        """
+        # Work out the direction each edge is traversed for all the turns in the partition at once from the nodes at
+        # the ends of the streets. The first edge of each turn is the LINK_ID field for the group, and subsequent
+        # edges are in the MAN_LINKID field in the rdms rows in SEQ_NUMBER order.
+        topology = context["streets_topology"]
+        rdms_df = rdms_df.sort_values(["COND_ID", "LINK_ID", "SEQ_NUMBER"], kind="stable")
+        keys = rdms_df[["COND_ID", "LINK_ID"]].to_numpy()
+        starts = np.flatnonzero(np.concatenate(([True], (keys[1:] != keys[:-1]).any(axis=1))))
+        turn_edges = np.column_stack((
+            topology.edges(keys[starts, 1]),
+            topology.sequence_edges(rdms_df["MAN_LINKID"].to_numpy(), starts, np.append(starts[1:], len(rdms_df)))
+        ))
+        # An END_OF_LK value of N means the first edge is traversed in its digitized direction, and R means it's
+        # traversed against it. Otherwise, the direction of the first edge is determined from the second edge.
+        end_of_lk = rdms_df["END_OF_LK"].to_numpy()[starts]
+        reverse_first = np.select([end_of_lk == "N", end_of_lk == "R"], [0, 1], -1)
+        reversed_edges, connected = topology.traverse(turn_edges, reverse_first)
+
+        results = []
+        for idx, (cond_link_id, group) in enumerate(rdms_df.groupby(["COND_ID", "LINK_ID"])):
+            warnings = []
+            turn_row = HereNavstreetsShpProcessor._build_turn_row(
+                context, cond_link_id, group, reversed_edges[idx], connected[idx], warnings)
+            results.append((turn_row, warnings))
+        return results
 
-            # For each LINK_ID in the input rdms table, grab the records and build the geometry
-            # Set up progressor
-            arcpy.SetProgressor("step", "Populating turn feature class...", 0, len(self.grouped_rdms_df), 1)
-            turn_oid = 1
-            for cond_link_id, group in self.grouped_rdms_df:
-                arcpy.SetProgressorPosition(turn_oid)
-                cond_id, link_id = cond_link_id
-
-                # Generate the values for the turn edge fields and create the turn geometry
-                edge_fields = []  # Store the Edge#FCID, Edge#FID, Edge#Pos fields to insert
-                edge_geom = []  # Store the polyline geometry of the edges participating in the turn
-
-                # Loop through all manuever records associated with this LINK_ID and generate the edge fields
-                # Also query the streets table to get the edge geometry to build the geometry for the turn
-                # First, identify a list of link IDs associated with the turn maneuver.  The first edge is always the
-                # LINK_ID field for the group, and subsequent edges are in the MAN_LINKID field in the rdms rows.
-                group.sort_values("SEQ_NUMBER", inplace=True)
-                if len(group) > len(group["SEQ_NUMBER"].unique()):
-                    arcpy.AddWarning((
-                        f"Duplicate SEQ_NUMBER values detected for the turn feature described by LINK_ID {link_id} "
-                        f"and COND_ID {cond_id} (output turn ObjectID {turn_oid}). This likely indicates and input "
-                        " data error and may result in an invalid output turn feature."
-                    ))
-                first_row = group.iloc[0]
-                turn_link_ids = [link_id] + group["MAN_LINKID"].to_list()
-                num_edges = len(turn_link_ids)  # Count the number of edges participating
-                if num_edges > self.max_turn_edges:
-                    # This should technically never happen because the turn feature class is explicitly created to
-                    # allow the maximum number of edges found in the input data. However, check just to be safe.
-                    arcpy.AddWarning((
-                        f"The turn with {link_id} in the rdms table has more associated edges than the "
-                        f"maximum allowed edges for a turn ({self.max_turn_edges}) and will be truncated."
-                    ))
-                    continue
-
-                # Figure out the Edge1End value
-                end_of_lk_val = first_row["END_OF_LK"]
-                if end_of_lk_val == "N":
-                    edge1_end = "Y"
-                elif end_of_lk_val == "R":
-                    edge1_end = "N"
-                else:
-                    edge1_end = "?"
-
-                valid = True
-                for turn_link_id in turn_link_ids:
-                    # Retrieve the street record
-                    try:
-                        # Find the street record associated with this edge in the turn manuever path
-                        street = self.streets_df.loc[turn_link_id]
-                    except KeyError:
-                        arcpy.AddWarning((
-                            f"The Streets table is missing an entry with LINK_ID {turn_link_id}, which is used in the "
-                            "rdms table."))
-                        valid = False
+    @staticmethod
+    def _calc_turn_cndmod_fields(context, row, mod_type, mod_val, mod_val_u):
+        """Calculate turn restriction field values from the values of a record in the cndmod tables."""
+        cndmod_turn_fname_idx = context["cndmod_turn_fname_idx"]
+        limit_suffixes = context["limit_suffixes"]
+
+        # Calculate a value for a prohibit restriction
+        if mod_type == 39:
+            # Figure out which prohibit restriction this is for
+            prohib_field = context["prohib_suffixes"].get(mod_val)
+            if not prohib_field:
+                # Invalid or irrelevant record.  Return row unchanged.
+                return row
+            row[cndmod_turn_fname_idx[prohib_field]] = "Y"
+
+        # Calculate a value for a limit restriction field
+        elif mod_type in limit_suffixes.keys():
+            limit_field = limit_suffixes[mod_type]
+            row[cndmod_turn_fname_idx[limit_field]] = mod_val_u
+
+        # Handle a couple of specific restriction cases
+        elif mod_type == 46:
+            if mod_val in ('1', '2', '3'):
+                row[cndmod_turn_fname_idx["MaxTrailersAllowedOnTruck"]] = int(mod_val)
+            elif mod_val == "4":
+                row[cndmod_turn_fname_idx["SemiOrTractorWOneOrMoreTrailersProhibited"]] = "Y"
+        elif mod_type == 75:
+            if mod_val in ('1', '2', '3', '4', '5'):
+                row[cndmod_turn_fname_idx["MaxAxlesAllowed"]] = int(mod_val)
+            elif mod_val == '6':
+                row[cndmod_turn_fname_idx["SingleAxleProhibited"]] = "Y"
+            elif mod_val == '7':
+                row[cndmod_turn_fname_idx["TandemAxleProhibited"]] = "Y"
+
+        return row
+
+    @staticmethod
+    def _build_turn_row(context, cond_link_id, group, reversed_edges, connected, warnings):
+        """Build the turn feature row for a group of rdms records describing a turn sorted by SEQ_NUMBER.
+
+        reversed_edges indicates which edges of the turn are traversed against their digitized direction, and connected
+        indicates whether adjacent edges share a node.
+        """
+        streets_index = context["streets_index"]
+        max_turn_edges = context["max_turn_edges"]
+        cndmod_index = context["cndmod_index"]
+        cond_id, link_id = cond_link_id
+
+        # Generate the values for the turn edge fields and create the turn geometry
+        edge_fields = []  # Store the Edge#FCID, Edge#FID, Edge#Pos fields to insert
+        edge_geom = []  # Store the vertices of the edges participating in the turn
+
+        # Loop through all manuever records associated with this LINK_ID and generate the edge fields
+        # Also look up the street geometry to build the geometry for the turn
+        # First, identify a list of link IDs associated with the turn maneuver.  The first edge is always the
+        # LINK_ID field for the group, and subsequent edges are in the MAN_LINKID field in the rdms rows, which are
+        # already sorted by SEQ_NUMBER.
+        if len(group) > len(group["SEQ_NUMBER"].unique()):
+            warnings.append((
+                f"Duplicate SEQ_NUMBER values detected for the turn feature described by LINK_ID {link_id} "
+                f"and COND_ID {cond_id} (output turn ObjectID {{oid}}). This likely indicates and input "
+                " data error and may result in an invalid output turn feature."
+            ))
+        first_row = group.iloc[0]
+        turn_link_ids = [link_id] + group["MAN_LINKID"].to_list()
+        num_edges = len(turn_link_ids)  # Count the number of edges participating
+        if num_edges > max_turn_edges:
+            # This should technically never happen because the turn feature class is explicitly created to
+            # allow the maximum number of edges found in the input data. However, check just to be safe.
+            warnings.append((
+                f"The turn with {link_id} in the rdms table has more associated edges than the "
+                f"maximum allowed edges for a turn ({max_turn_edges}) and will be truncated."
+            ))
+            return None
+
+        # Figure out the Edge1End value
+        end_of_lk_val = first_row["END_OF_LK"]
+        if end_of_lk_val == "N":
+            edge1_end = "Y"
+        elif end_of_lk_val == "R":
+            edge1_end = "N"
+        else:
+            edge1_end = "?"
+
+        for turn_link_id in turn_link_ids:
+            # Retrieve the street record
+            try:
+                # Find the street record associated with this edge in the turn manuever path
+                street = streets_index.first(turn_link_id)
+            except KeyError:
+                warnings.append((
+                    f"The Streets table is missing an entry with LINK_ID {turn_link_id}, which is used in the "
+                    "rdms table."))
+                return None
+            # Store the geometry for this segment
+            vertices = HereNavstreetsShpProcessor._get_street_vertices(context, street["OID"], warnings)
+            if vertices is None:
+                return None
+            edge_geom.append(vertices)
+            # Construct the edge fields for this segment
+            edge_fields += [context["fc_id"], street["OID"], context["edge_pos"]]
+
+        # Add empty records for the remaining turn edge fields if this turn doesn't use the max available
+        for _ in range(max_turn_edges - num_edges):
+            edge_fields += [None, None, None]
+
+        # Build turn geometry
+        turn_vertices = build_turn_vertices(edge_geom, reversed_edges)
+        if not connected:
+            warnings.append((
+                "Turn geometry may be incorrect for turn ObjectID {oid} because adjacent street segments used to "
+                "build the turn geometry do not share a node."
+            ))
+
+        # Generate the values for the standard restriction fields
+        restriction_values = []
+        for restr_fld in AR_FLDS:
+            restriction_values.append(first_row[restr_fld])
+
+        # Populate the restriction fields associated with the transport condition modifier table
+        cndmod_restr_values = []
+        if cndmod_index is not None:
+            cndmod_turn_fname_idx = context["cndmod_turn_fname_idx"]
+            # Initialize transport restriction field values to None.
+            cndmod_restr_values = [None] * len(cndmod_turn_fname_idx)
+            # Retrieve the restriction records for this ID, if there are any, and loop through them to update the
+            # appropriate rows
+            records = cndmod_index.rows(cond_id)
+            for mod_type, mod_val, mod_val_u in zip(records["MOD_TYPE"], records["MOD_VAL"], records["MOD_VAL_U"]):
+                cndmod_restr_values = HereNavstreetsShpProcessor._calc_turn_cndmod_fields(
+                    context, cndmod_restr_values, mod_type, mod_val, mod_val_u)
+
+            # Populate AllTransportProhibited restriction field
+            if first_row["COND_TYPE"] == 26:
+                is_restricted = True
+                for restr_value in cndmod_restr_values:
+                    if restr_value is not None:
+                        is_restricted = False
                         break
-                    # Construct the edge fields for this segment
-                    edge_fields += [self.fc_id, street["OID"], self.edge_pos]
-                    # Store the geometry for this segment
-                    edge_geom.append(self._get_street_geometry(turn_link_id, street["OID"]))
-
-                if not valid:
-                    # Something went wrong in constructing the turn. Skip it and move on.
-                    continue
-                # Add empty records for the remaining turn edge fields if this turn doesn't use the max available
-                for _ in range(self.max_turn_edges - num_edges):
-                    edge_fields += [None, None, None]
-
-                # Build turn geometry
-                turn_geom = self._build_turn_geometry(edge_geom, edge1_end, turn_oid)
-
-                # Generate the values for the standard restriction fields
-                restriction_values = []
-                for restr_fld in AR_FLDS:
-                    restriction_values.append(first_row[restr_fld])
-
-                # Populate the restriction fields associated with the transport condition modifier table
-                cndmod_restr_values = []
-                if self.cndmod_df is not None:
-                    # Initialize transport restriction field values to None.
-                    cndmod_restr_values = [None] * len(cndmod_turn_fname_idx)
-                    try:
-                        # Retrieve the restriction records for this ID
-                        subset_df = self.cndmod_df.loc[cond_id]
-                        # Loop through the transport condition modifier records and update the appropriate rows
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            cndmod_restr_values = calc_cndmod_fields(cndmod_restr_values, subset_df)
-                        else:
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                cndmod_restr_values = calc_cndmod_fields(cndmod_restr_values, record)
-                    except KeyError:
-                        # There were no cndmod restriction records for this ID. Just skip it and move on.
-                        pass
-
-                    # Populate AllTransportProhibited restriction field
-                    if first_row["COND_TYPE"] == 26:
-                        is_restricted = True
-                        for restr_value in cndmod_restr_values:
-                            if restr_value is not None:
-                                is_restricted = False
-                                break
-                        if is_restricted:
-                            cndmod_restr_values[cndmod_turn_fname_idx["AllTransportProhibited"]] = "Y"
-
-                # Construct the final row and insert it
-                turn_row = [turn_geom, cond_id, first_row["COND_TYPE"], edge1_end] + \
-                    edge_fields + restriction_values + cndmod_restr_values
-                cur_t.insertRow(turn_row)
-                turn_oid += 1
+                if is_restricted:
+                    cndmod_restr_values[cndmod_turn_fname_idx["AllTransportProhibited"]] = "Y"
 
-        arcpy.ResetProgressor()
+        # Construct the final row
+        return [turn_vertices, cond_id, first_row["COND_TYPE"], edge1_end] + \
+            edge_fields + restriction_values + cndmod_restr_values
 
     @timed_exec
     def _create_and_populate_road_forks(self):
@@ -1506,334 +1717,320 @@ class HereNavstreetsShpProcessor(StreetDataProcessor):
         # Create the table
         self._create_road_forks_table()
 
-        # Read rdms table again to handle road forks
-        fields = ["LINK_ID", "MAN_LINKID", "COND_ID"]
-        with arcpy.da.SearchCursor(self.in_data_object.rdms, fields) as cur:
-            rdms_df = pd.DataFrame(cur, columns=fields)
+        # Set up output fields in an order that is easy to work with
+        field_prefixes = ["Edge", "Branch0", "Branch1", "Branch2"]
+        fields = []
+        for pref in field_prefixes:
+            fields += [f"{pref}FCID", f"{pref}FID"]
+        for pref in field_prefixes:
+            fields += [f"{pref}FrmPos", f"{pref}ToPos"]
+
+        # Build all the road fork rows at once and write them
+        forks_df, warnings = self._build_road_forks(self._road_fork_records())
+        for warning in warnings:
+            arcpy.AddWarning(warning)
+        self.table_io.insert_rows(self.road_splits, forks_df, fields)
+
+    def _road_fork_records(self):
+        """Return the rdms records for the cdms conditions for road forks in their original order."""
+        # Get the rdms records, which were usually already read for the turns, and release them
+        rdms_df = self._rdms_records()[["LINK_ID", "MAN_LINKID", "COND_ID"]]
+        self.rdms_df = None
         # Preserve original table order for proper sorting later
         rdms_df["sort_order"] = rdms_df.index
         rdms_df.set_index("COND_ID", inplace=True)
 
-        # Read cdms table again to select rows representing road forks
-        where = "COND_TYPE = 9"
-        fields = ["COND_ID"]  # ["COND_ID", "END_OF_LK"]
-        with arcpy.da.SearchCursor(self.in_data_object.cdms, fields, where) as cur:
-            cdms_df = pd.DataFrame(cur, columns=fields)
+        # Get the cdms records representing road forks
+        cdms_df = self._cdms_records("road_forks")
         cdms_df.set_index("COND_ID", inplace=True)
 
         # Join the cdms table to the rdms table to transfer END_OF_LK and to drop rows that don't match the COND_TYPE
         rdms_df = rdms_df.join(cdms_df, how="inner")
         rdms_df.reset_index(inplace=True)
+        # Each road fork is described by the records with the same LINK_ID
+        rdms_df = self._limit_to_changed_streets(rdms_df, "LINK_ID", ["LINK_ID", "MAN_LINKID"])
 
         # Sort the table by the original rmds order. This shouldn't be strictly necessary because the join should
         # preserve the index order of the table, but a bug in older versions of pandas included in versions of Pro prior
         # to 3.5 caused the order to get jumbled.  Since the ordering of this table explicitly matters for what we're
         # doing here, manually sort it just to be sure.
         rdms_df.sort_values("sort_order", inplace=True)
-
-        # Group by LINK_ID to ensure that road fork records are grouped together
-        rf_grouped_rdms_df = rdms_df.groupby(["LINK_ID"])
-
-        # Set up output fields in an order that is easy to work with
-        field_prefixes = ["Edge", "Branch0", "Branch1", "Branch2"]
-        fields = []
-        for pref in field_prefixes:
-            fields += [f"{pref}FCID", f"{pref}FID"]
-        for pref in field_prefixes:
-            fields += [f"{pref}FrmPos", f"{pref}ToPos"]
-        # Open an insert cursor so we can add entries to the turn feature class. We will build the rows below.
-        with arcpy.da.InsertCursor(self.road_splits, fields) as cur:
-
-            # For each LINK_ID in the input rdms table, grab the records and build the sequence of edge IDs
-            for link_id, group in rf_grouped_rdms_df:
-                if isinstance(link_id, tuple):
-                    # In newer versions of pandas, groupby keys come back as tuples, so just get the first item
-                    # in the tuple
-                    link_id = link_id[0]
-
-                # Generate the values for the road for edge IDs
-                edge_fields = []  # Store the Edge#FCID, Edge#FID, Branch#FCID... fields to insert
-
-                # Loop through all manuever records associated with this LINK_ID and generate the edge fields
-                # First, identify a list of link IDs associated with the road fork.  The first edge is always the
-                # LINK_ID field for the group, and subsequent edges are in the MAN_LINKID field in the rdms rows.
-                rf_link_ids = [link_id] + group["MAN_LINKID"].to_list()
-                num_edges = len(rf_link_ids)  # Count the number of edges participating
-                if num_edges > self.max_road_splits:
-                    # There are more than four parts to the fork. These entries should be ignored, as we don't support
-                    # reporting 4-way (or more) forks. Truncate the road fork record and throw a warning.  This should
-                    # be rare or should never happen.
-                    arcpy.AddWarning((
-                        f"The road fork starting with LINK_ID {link_id}, has more than {self.max_road_splits} parts. "
-                        f"Because the network dataset does not support more than {self.max_road_splits} parts, the "
-                        "road fork record will be truncated."
-                    ))
-                    rf_link_ids = rf_link_ids[:self.max_road_splits]
-                    num_edges = len(rf_link_ids)
-                # Check that the fork had enough edges to be valid
-                if num_edges < 3:
-                    arcpy.AddWarning(f"The road fork starting with LINK_ID {link_id} has too few maneuvers.")
-                    continue
-
-                valid = True
-                ref_ids = []
-                for rf_link_id in rf_link_ids:
-                    # Retrieve the street record
-                    try:
-                        # Find the street record associated with this edge in the road fork
-                        street = self.streets_df.loc[rf_link_id]
-                    except KeyError:
-                        arcpy.AddWarning((
-                            f"The Streets table is missing an entry with LINK_ID {rf_link_id}, which is used in the "
-                            "rdms table."))
-                        valid = False
-                        break
-                    # Store REF_IN_ID and NREF_IN_ID for each segment so we can determine directionality after we
-                    # retrieve them all
-                    ref_ids.append((street["REF_IN_ID"], street["NREF_IN_ID"]))
-
-                    # Construct the edge fields for this segment
-                    edge_fields += [self.fc_id, street["OID"]]
-
-                if not valid:
-                    # Something went wrong in constructing the road fork. Skip it and move on.
-                    continue
-
-                # Add empty records for the remaining road fork edge fields if this the max available aren't used
-                for _ in range(self.max_road_splits - num_edges):
-                    edge_fields += [None, None]
-
-                # The REF_IN_ID is the ID for the "from" endpoint of the street, while the NREF_IN_ID is the ID for
-                # the "to" end of the street. Determine the directionality of the road fork segments by matching up
-                # the IDs of the endpoints of adjacent segments
-                edge_pos_fields = []
-                # Specially handle the first edge
-                if ref_ids[0][0] == ref_ids[1][0] or ref_ids[0][0] == ref_ids[1][1]:
-                    # First edge is against the direction of digitization
-                    edge_pos_fields += [1, 0]
-                    prev_end_id = ref_ids[0][0]
-                else:
-                    # First edge is in the direction of digitization
-                    edge_pos_fields += [0, 1]
-                    prev_end_id = ref_ids[0][1]
-                for ref_id in ref_ids[1:]:
-                    if ref_id[0] == prev_end_id:
-                        # Edge is in the direction of digitization
-                        edge_pos_fields += [0, 1]
-                        prev_end_id = ref_id[1]
-                    else:
-                        # Edge is against the direction of digitization
-                        edge_pos_fields += [1, 0]
-                        prev_end_id = ref_id[0]
-
-                # Add empty records for the remaining road fork edge fields if this the max available aren't used
-                for _ in range(self.max_road_splits - num_edges):
-                    edge_pos_fields += [None, None]
-
-                # Insert the road fork row
-                new_row = edge_fields + edge_pos_fields
-                cur.insertRow(new_row)
+        return rdms_df
+
+    def _build_road_forks(self, rdms_df):
+        """Build the road forks table rows for all the road forks described by the rdms records for road forks.
+
+        Each group of records with the same LINK_ID describes a road fork. Its first edge is the LINK_ID, and the other
+        edges are the MAN_LINKID values of the records in order. The road forks are built all at once with array
+        operations rather than one at a time.
+
+        Returns:
+            A tuple of a dataframe of the road forks table rows in LINK_ID order and a list of warnings about the road
+            forks that were truncated or skipped
+        """
+        max_road_splits = self.max_road_splits
+        warnings = []
+
+        # Explode the groups of records into a (fork, part, link) row for each edge of each road fork, with the parts
+        # numbered in order starting from 0 for the LINK_ID of the group
+        rdms_df = rdms_df.dropna(subset=["LINK_ID"]).sort_values("LINK_ID", kind="stable")
+        record_link_ids = rdms_df["LINK_ID"].to_numpy()
+        starts = np.flatnonzero(np.concatenate(([True], record_link_ids[1:] != record_link_ids[:-1]))) \
+            if len(record_link_ids) else np.array([], dtype=np.int64)
+        link_ids = record_link_ids[starts]
+        num_parts = np.diff(np.append(starts, len(record_link_ids))) + 1
+        record_forks = np.repeat(np.arange(len(starts)), num_parts - 1)
+        record_parts = np.arange(len(record_forks)) - starts[record_forks] + 1
+        parts_df = pd.DataFrame({
+            "fork": np.concatenate((np.arange(len(starts)), record_forks)),
+            "part": np.concatenate((np.zeros(len(starts), dtype=np.int64), record_parts)),
+            "link": np.concatenate((link_ids, rdms_df["MAN_LINKID"].to_numpy()))
+        })
+
+        # There are more than four parts to some forks. These entries should be ignored, as we don't support reporting
+        # 4-way (or more) forks. Truncate the road fork records and throw a warning.  This should be rare or should
+        # never happen.
+        too_many = num_parts > max_road_splits
+        if too_many.any():
+            warnings.append((
+                f"{too_many.sum()} road forks have more than {max_road_splits} parts. Because the network dataset does "
+                f"not support more than {max_road_splits} parts, the road fork records will be truncated. Road forks "
+                f"starting with LINK_ID: {summarize_ids(link_ids[too_many])}"
+            ))
+        num_edges = np.minimum(num_parts, max_road_splits)
+        parts_df = parts_df[parts_df["part"] < max_road_splits]
+        # Check that the forks had enough edges to be valid
+        too_few = num_edges < 3
+        if too_few.any():
+            warnings.append((
+                f"{too_few.sum()} road forks have too few maneuvers and were skipped. Road forks starting with "
+                f"LINK_ID: {summarize_ids(link_ids[too_few])}"
+            ))
+
+        # Look up the ObjectID, REF_IN_ID, and NREF_IN_ID of the street of every edge in one join, and spread them
+        # into 2D arrays with a row for each road fork and a column for each part
+        streets_df = self.streets_df[~self.streets_df.index.duplicated()]
+        parts_df = parts_df.join(streets_df[["OID", "REF_IN_ID", "NREF_IN_ID"]], "link")
+        fork_idxs = parts_df["fork"].to_numpy()
+        part_idxs = parts_df["part"].to_numpy()
+        shape = (len(link_ids), max_road_splits)
+        oids, ref_ids, nref_ids = [np.full(shape, np.nan) for _ in range(3)]
+        for array, column in [(oids, "OID"), (ref_ids, "REF_IN_ID"), (nref_ids, "NREF_IN_ID")]:
+            array[fork_idxs, part_idxs] = parts_df[column].to_numpy(dtype=float)
+
+        # Skip the road forks with edges missing from the Streets table
+        is_missing = parts_df["OID"].isna().to_numpy() & ~too_few[fork_idxs]
+        missing = np.zeros(len(link_ids), dtype=bool)
+        missing[fork_idxs[is_missing]] = True
+        if missing.any():
+            missing_link_ids = np.unique(parts_df.loc[is_missing, "link"].to_numpy())
+            warnings.append((
+                f"The Streets table is missing entries for {len(missing_link_ids)} LINK_IDs, which are used in the "
+                f"rdms table, so {missing.sum()} road forks were skipped. Missing LINK_ID: "
+                f"{summarize_ids(missing_link_ids)}"
+            ))
+
+        # The REF_IN_ID is the ID for the "from" endpoint of the street, while the NREF_IN_ID is the ID for
+        # the "to" end of the street. Determine the directionality of the road fork segments by matching up
+        # the IDs of the endpoints of adjacent segments. An EdgeFrmPos of 1 means the edge is against the direction of
+        # digitization.
+        frm_pos = np.zeros(shape)
+        # Specially handle the first edge
+        against = (ref_ids[:, 0] == ref_ids[:, 1]) | (ref_ids[:, 0] == nref_ids[:, 1])
+        frm_pos[:, 0] = against
+        prev_end_ids = np.where(against, ref_ids[:, 0], nref_ids[:, 0])
+        for part in range(1, max_road_splits):
+            along = ref_ids[:, part] == prev_end_ids
+            frm_pos[:, part] = ~along
+            prev_end_ids = np.where(along, nref_ids[:, part], ref_ids[:, part])
+
+        valid = ~too_few & ~missing
+        return road_forks_df(self.fc_id, oids[valid], frm_pos[valid], num_edges[valid]), warnings
 
     @timed_exec
     def _populate_signposts_and_signposts_streets(self):
         "Populate the Signposts feature class and Signposts_Streets table."
         self._add_message("Populating the Signposts feature class and Signposts_Streets table...")
         assert self.streets_df is not None
-        # Read the signs table
-        fields = ["SEQ_NUM", "EXIT_NUM", "SRC_LINKID", "DST_LINKID", "LANG_CODE", "BR_RTEID", "BR_RTEDIR", "SIGN_TEXT",
-                  "SIGN_TXTTP", "TOW_RTEID", "SIGN_ID"]
-        with arcpy.da.SearchCursor(self.in_data_object.signs, fields) as cur:
-            signs_df = pd.DataFrame(cur, columns=fields)
-        grouped_signs_df = signs_df.groupby(["SRC_LINKID", "DST_LINKID"], sort=True)
+        assert self.signs_df is not None
+
+        # Build the text fields of all signposts at once, and build the geometry and Signposts_Streets rows in worker
+        # processes (or serially if there is only one worker) from partitions of the signposts in the signs table
+        context, partitions, sign_text, truncated_df = self._signpost_worker_inputs()
+        signpost_oids = np.zeros(len(sign_text), dtype=np.int64)
+
+        # Write the finished rows as they come back from the workers. The writer collects them and writes them in
+        # chunks, each in its own edit session because we're writing to more than one gdb item at once. If anything
+        # fails, the edits of the chunk being written are abandoned.
+        with SignpostWriter(
+            self.table_io, os.path.join(self.out_folder, self.gdb_name), self.signposts, self.signposts_streets,
+            self.max_signpost_branches
+        ) as writer:
+            for signpost_oid, (signpost_row, signposts_streets_rows) in self._emit_worker_results(
+                map_partitions(self._build_signpost_rows, context, partitions, self.num_workers), self.signposts
+            ):
+                signpost_vertices, signpost_num = signpost_row
+                writer.add(signpost_oid, signpost_vertices, sign_text[signpost_num].tolist(), signposts_streets_rows)
+                signpost_oids[signpost_num] = signpost_oid
+
+        self._warn_truncated_signposts(
+            truncated_df, signpost_oids,
+            "There were too many records in the input Signs table for {count} signposts, so they were truncated. "
+            "SIGN_ID (signpost OID):"
+        )
+
+    def _signpost_worker_inputs(self):
+        """Return the shared context and partitions used by the workers building signposts and the signpost text.
+
+        Returns:
+            A tuple of the shared context, the partitions of the signposts with a row for each source and destination
+            link, and the signpost text and truncated signposts as returned by _build_sign_text
+        """
+        keys = ["SRC_LINKID", "DST_LINKID"]
+        # Number the signposts in the order they're built. Records with a missing link ID are numbered -1 and dropped.
+        signs_df = self.signs_df.assign(Signpost=self.signs_df.groupby(keys, sort=True).ngroup())
+        signs_df = signs_df[signs_df["Signpost"] >= 0]
+        sign_text, truncated_df = self._build_sign_text(signs_df)
+        # The workers only need the link IDs of each signpost
+        signposts_df = signs_df.drop_duplicates("Signpost")[keys + ["Signpost"]]
+        return self._worker_context(), partition_groups(signposts_df, keys, self.num_workers), sign_text, truncated_df
+
+    def _build_sign_text(self, signs_df):
+        """Build the ExitName, Branch*, and Toward* fields of all signposts from the signs records.
+
+        Args:
+            signs_df: Dataframe of the signs records with a Signpost column numbering the signposts from 0
+
+        Returns:
+            A tuple of a 2D object array with a row for each signpost and a column for each Signposts field after the
+            shape, and a dataframe of the truncated signposts with Signpost and ID columns, where ID is the SIGN_ID
+        """
+        signs_df = signs_df.sort_values(["Signpost", "SEQ_NUM"], kind="stable")
+        num_signposts = int(signs_df["Signpost"].max()) + 1 if len(signs_df) else 0
+        # Exit name should be the same for all records of a signpost, so use the last one
+        exit_names = signs_df.drop_duplicates("Signpost", keep="last")["EXIT_NUM"].to_numpy(dtype=object)
+
+        # Each record can have a branch from BR_RTEID, a branch or toward from SIGN_TEXT depending on SIGN_TXTTP
+        # ("B" for a branch and "T" for a toward), and a toward from TOW_RTEID, in that order
+        signposts = signs_df["Signpost"].to_numpy()
+        branch_dirs = signs_df["BR_RTEDIR"].to_numpy(dtype=object)
+        langs = to_object_array(signs_df["LANG_CODE"].map(LNG_CODES))
+        sign_types = signs_df["SIGN_TXTTP"].to_numpy(dtype=object)
+        texts = {
+            field: signs_df[field].fillna("").astype(str).str.strip().to_numpy(dtype=object)
+            for field in ["BR_RTEID", "SIGN_TEXT", "TOW_RTEID"]
+        }
+        entries = [
+            ("BR_RTEID", True, texts["BR_RTEID"] != ""),
+            ("SIGN_TEXT", True, (texts["SIGN_TEXT"] != "") & (sign_types == "B")),
+            ("SIGN_TEXT", False, (texts["SIGN_TEXT"] != "") & (sign_types == "T")),
+            ("TOW_RTEID", False, texts["TOW_RTEID"] != "")
+        ]
+        record_order = np.arange(len(signs_df)) * len(entries)
+        entries_df = pd.concat([
+            pd.DataFrame({
+                "Order": record_order[mask] + entry_num,
+                "Signpost": signposts[mask],
+                "IsBranch": is_branch,
+                "Text": texts[field][mask],
+                "Dir": branch_dirs[mask],
+                "Lng": langs[mask]
+            }) for entry_num, (field, is_branch, mask) in enumerate(entries)
+        ]).sort_values("Order")
+        text, truncated = pivot_sign_text(entries_df, num_signposts, self.max_signpost_branches)
+
+        # Report truncated signposts by the SIGN_ID of their first record
+        sign_ids = signs_df.drop_duplicates("Signpost")["SIGN_ID"].to_numpy()
+        truncated_df = pd.DataFrame({"Signpost": np.flatnonzero(truncated), "ID": sign_ids[truncated]})
+        return np.column_stack([exit_names, text]), truncated_df
+
+    @staticmethod
+    def _build_signpost_rows(context, signposts_df):
+        """Build the signpost geometry and Signposts_Streets rows for a partition of the signposts.
+
+        This may run in a worker process, so it only uses the data passed in with the partition and the shared context.
+
+        Returns:
+            A list with a (row, warnings) tuple for each signpost. The row is a tuple of a list of an (N, 2) array of
+            the signpost's vertices and the signpost's number, and the list of Signposts_Streets rows without their
+            SignpostID value. The row is None if the signpost is skipped.
+        """
+        # The REF_IN_ID is the ID for the "from" endpoint of the street, while the NREF_IN_ID is the ID
+        # for the "to" end of the street. Determine the directionality of the signposts segments by
+        # matching up the IDs of the endpoints of adjacent segments for all the signposts in the partition at once.
+        # Note: HERE only provides the first and last edges of the sequence.  If the edge sequence
+        # consists of more than two edges, then the signpost geometries can end up as a multipart line
+        # feature consisting of two disjoint road segments.  In this case, the ID fields won't match up, so
+        # just insert the geometry segments as is without reversing them.
+        topology = context["streets_topology"]
+        reversed_edges, _ = topology.traverse(np.column_stack((
+            topology.edges(signposts_df["SRC_LINKID"].to_numpy()), topology.edges(signposts_df["DST_LINKID"].to_numpy())
+        )))
+
+        results = []
+        for link_id_src, link_id_dst, signpost_num, (reverse_first, reverse_second) in zip(
+            signposts_df["SRC_LINKID"], signposts_df["DST_LINKID"], signposts_df["Signpost"], reversed_edges
+        ):
+            warnings = []
+            signpost_rows = HereNavstreetsShpProcessor._build_signpost_row(
+                context, link_id_src, link_id_dst, signpost_num, reverse_first, reverse_second, warnings)
+            results.append((signpost_rows, warnings))
+        return results
+
+    @staticmethod
+    def _build_signpost_row(context, link_id_src, link_id_dst, signpost_num, reverse_first, reverse_second, warnings):
+        """Build the signpost geometry and Signposts_Streets rows for a signpost's source and destination links.
 
+        reverse_first and reverse_second indicate whether the first and second edges are traversed against their
+        digitized direction.
+        """
+        streets_index = context["streets_index"]
+
+        # Retrieve associated streets records
+        try:
+            first_street = streets_index.first(link_id_src)
+        except KeyError:
+            warnings.append((
+                f"The Streets table is missing an entry with ID {link_id_src}, which is used in the "
+                "signpost table."))
+            # Something went wrong in constructing the signpost. Skip it and move on.
+            return None
         try:
-            # Must open an edit session because we're writing to more than one gdb item at once.
-            edit = arcpy.da.Editor(os.path.join(self.out_folder, self.gdb_name))
-            # Set with_undo=False to enhance performance
-            # Set multiuser_mode=False to make it work on SDE (unversioned only)
-            edit.startEditing(with_undo=False, multiuser_mode=False)
-            edit.startOperation()
-
-            # Create a list of signposts fields
-            signpost_fields = ["SHAPE@", "ExitName"]
-            for i in range(self.max_signpost_branches):
-                signpost_fields += [f"Branch{i}", f"Branch{i}Dir", f"Branch{i}Lng"]
-            for i in range(self.max_signpost_branches):
-                signpost_fields += [f"Toward{i}", f"Toward{i}Lng"]
-            # Open an insert cursor so we can add entries to the signposts feature class. We will build the rows below.
-            with arcpy.da.InsertCursor(self.signposts, signpost_fields) as cur_sp:
-
-                # Open an insert cursor so we can add entries to the signposts_streets table. We will generate entries
-                # while building the signpost geometry from the streets based on records in the input signposts table.
-                si_fields = ["SignpostID", "Sequence", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"]
-                with arcpy.da.InsertCursor(self.signposts_streets, si_fields) as cur_si:
-
-                    # For each item in the signs table, grab the records and build the sigposts and signposts_streets
-                    # records
-                    signpost_oid = 1
-                    for link_ids, group in grouped_signs_df:
-
-                        # First, build the signpost_streets records and the signpost geometry
-
-                        # Retrieve associated streets records
-                        link_id_src, link_id_dst = link_ids
-                        try:
-                            first_street = self.streets_df.loc[link_id_src]
-                        except KeyError:
-                            arcpy.AddWarning((
-                                f"The Streets table is missing an entry with ID {link_id_src}, which is used in the "
-                                "signpost table."))
-                            # Something went wrong in constructing the signpost. Skip it and move on.
-                            continue
-                        try:
-                            second_street = self.streets_df.loc[link_id_dst]
-                        except KeyError:
-                            arcpy.AddWarning((
-                                f"The Streets table is missing an entry with ID {link_id_dst}, which is used in the "
-                                "signpost table."))
-                            # Something went wrong in constructing the signpost. Skip it and move on.
-                            continue
-
-                        # The REF_IN_ID is the ID for the "from" endpoint of the street, while the NREF_IN_ID is the ID
-                        # for the "to" end of the street. Determine the directionality of the signposts segments by
-                        # matching up the IDs of the endpoints of adjacent segments.
-                        # Note: HERE only provides the first and last edges of the sequence.  If the edge sequence
-                        # consists of more than two edges, then the signpost geometries can end up as a multipart line
-                        # feature consisting of two disjoint road segments.  In this case, the ID fields below won't
-                        # match up, so just insert the geometry segments as is without reversing them.
-                        reverse_first = False
-                        reverse_second = False
-                        is_disjoint = True
-                        if first_street["REF_IN_ID"] == second_street["REF_IN_ID"]:
-                            # First edge is against the direction of digitization
-                            # Second edge is in the direction of digitization
-                            reverse_first = True
-                            is_disjoint = False
-                        elif first_street["REF_IN_ID"] == second_street["NREF_IN_ID"]:
-                            # First edge is against the direction of digitization
-                            # Second edge is against the direction of digitization
-                            reverse_first = True
-                            reverse_second = True
-                            is_disjoint = False
-                        elif first_street["NREF_IN_ID"] == second_street["NREF_IN_ID"]:
-                            # First edge is in the direction of digitization
-                            # Second edge is against the direction of digitization
-                            reverse_second = True
-                            is_disjoint = False
-                        elif first_street["NREF_IN_ID"] == second_street["REF_IN_ID"]:
-                            # First edge is in the direction of digitization
-                            # Second edge is in the direction of digitization
-                            is_disjoint = False
-
-                        # Trim the first edge to the last 25% of the street feature and reverse if needed
-                        # Also set the appropriate values for the EdgeFrmPos and EdgeToPos fields
-                        first_edge = self._get_street_geometry(link_id_src, first_street["OID"])
-                        if reverse_first:
-                            signpost_vertices_1 = self._reverse_polyline(
-                                first_edge.segmentAlongLine(0, 0.25, use_percentage=True))
-                            pos_fields_1 = [1, 0]
-                        else:
-                            signpost_vertices_1 = self._polyline_to_points(
-                                first_edge.segmentAlongLine(0.75, 1, use_percentage=True))
-                            pos_fields_1 = [0, 1]
-                        # Trim the second edge to the first 25% of the street feature and reverse if needed
-                        # Also set the appropriate values for the EdgeFrmPos and EdgeToPos fields
-                        second_edge = self._get_street_geometry(link_id_dst, second_street["OID"])
-                        if reverse_second:
-                            signpost_vertices_2 = self._reverse_polyline(
-                                second_edge.segmentAlongLine(0.75, 1, use_percentage=True))
-                            pos_fields_2 = [1, 0]
-                        else:
-                            signpost_vertices_2 = self._polyline_to_points(
-                                second_edge.segmentAlongLine(0, 0.25, use_percentage=True))
-                            pos_fields_2 = [0, 1]
-
-                        # Construct the signpost geometry by combining the updated geometry for the first and second
-                        # edge segments. Note: If the edge segments are disjoint, it is possible to create a multipart
-                        # feature that contains only the segment geometry like this:
-                        # vertex_array = arcpy.Array([signpost_vertices_1, signpost_vertices_2])
-                        # However, we decided to connect the disjoint segments with a straight line, so just use the
-                        # vertices all in one part.  The code above still identifies disjoint segments in case we want
-                        # to change this in the future.
-                        vertex_array = arcpy.Array(signpost_vertices_1 + signpost_vertices_2)
-                        signpost_geom = arcpy.Polyline(vertex_array, self.in_data_object.sr)
-
-                        # Add the records to the Signposts_Streets table
-                        # ["SignpostID", "Sequence", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"]
-                        # The first edge is always Sequence = 1, and the last edge is Sequence = 0 if the exact edge
-                        # sequence is not known, as is the case here. I'm not sure why it was designed this way, but
-                        # this 1-0 sequene is intentional.
-                        cur_si.insertRow([signpost_oid, 1, self.fc_id, first_street["OID"]] + pos_fields_1)
-                        cur_si.insertRow([signpost_oid, 0, self.fc_id, second_street["OID"]] + pos_fields_2)
-
-                        # Loop through the Signs records in this group to construct the branch and toward fields
-                        branch_fields = []
-                        toward_fields = []
-                        group.sort_values("SEQ_NUM", inplace=True)
-                        for _, record in group.iterrows():
-                            # Exit name should be the same for all rows but retrieve it for each anyway
-                            exit_name = record["EXIT_NUM"]
-                            # Shared values for branch and toward records
-                            lang = LNG_CODES[record["LANG_CODE"]]
-                            branch_dir = record["BR_RTEDIR"]
-                            # Construct the first set of Branch* fields from BR_RTEID and BR_RTEDIR
-                            branch_text = record["BR_RTEID"].strip()
-                            if branch_text:
-                                branch_fields += [branch_text, branch_dir, lang]
-                            # Construct additional Branch* or Toward* fields from the SIGN_TEXT field
-                            # if SIGN_TXTTP == "B", populate a branch
-                            # SIGN_TXTTP == "T", populate a toward
-                            sign_text = record["SIGN_TEXT"].strip()
-                            if sign_text:
-                                sign_type = record["SIGN_TXTTP"]
-                                if sign_type == "B":
-                                    branch_fields += [sign_text, branch_dir, lang]
-                                elif sign_type == "T":
-                                    toward_fields += [sign_text, lang]
-                            # Construct the final set of Toward* fields from the TOW_RTEID field
-                            toward_text = record["TOW_RTEID"].strip()
-                            if toward_text:
-                                toward_fields += [toward_text, lang]
-
-                        # Truncate the record if we have too many branch and toward fields
-                        truncate = False
-                        if len(branch_fields) > 3 * self.max_signpost_branches:
-                            truncate = True
-                            branch_fields = branch_fields[:3 * self.max_signpost_branches]
-                        if len(toward_fields) > 2 * self.max_signpost_branches:
-                            truncate = True
-                            toward_fields = toward_fields[:2 * self.max_signpost_branches]
-                        if truncate:
-                            sign_id = group.iloc[0]['SIGN_ID']
-                            arcpy.AddWarning((
-                                "There were too many records in the input Signs table for SIGN_ID "
-                                f"{sign_id}. The signpost (OID {signpost_oid}) will be truncated."
-                            ))
-
-                        # Fill in remaining branch and toward fields with None if the record doesn't use all of them
-                        for _ in range(3 * self.max_signpost_branches - len(branch_fields)):
-                            branch_fields.append(None)
-                        for _ in range(2 * self.max_signpost_branches - len(toward_fields)):
-                            toward_fields.append(None)
-
-                        # Construct the final signpost row and insert it
-                        signpost_row = [signpost_geom, exit_name] + branch_fields + toward_fields
-                        cur_sp.insertRow(signpost_row)
-                        signpost_oid += 1
-
-            # Stop the editing operation and save edits
-            edit.stopOperation()
-            edit.stopEditing(True)
-
-        # Deal with terrible problems
-        except Exception as ex:  # pylint:disable=broad-except
-            # Stop the editing operation and abandon changes
-            if 'edit' in locals():
-                if edit.isEditing:
-                    edit.stopOperation()
-                    edit.stopEditing(False)
-            # Then pass through the raised exception
-            raise ex
+            second_street = streets_index.first(link_id_dst)
+        except KeyError:
+            warnings.append((
+                f"The Streets table is missing an entry with ID {link_id_dst}, which is used in the "
+                "signpost table."))
+            # Something went wrong in constructing the signpost. Skip it and move on.
+            return None
+
+        first_vertices = HereNavstreetsShpProcessor._get_street_vertices(context, first_street["OID"], warnings)
+        second_vertices = HereNavstreetsShpProcessor._get_street_vertices(context, second_street["OID"], warnings)
+        if first_vertices is None or second_vertices is None:
+            return None
+
+        # Construct the signpost geometry from the last 25% of the first edge and the first 25% of the second edge,
+        # reversing them if needed. Note: If the edge segments are disjoint, it is possible to create a multipart
+        # feature that contains only the segment geometry. However, we decided to connect the disjoint segments with a
+        # straight line, so just use the vertices all in one part.
+        signpost_vertices = build_signpost_vertices([first_vertices, second_vertices], [reverse_first, reverse_second])
+        # Set the appropriate values for the EdgeFrmPos and EdgeToPos fields
+        pos_fields_1 = [1, 0] if reverse_first else [0, 1]
+        pos_fields_2 = [1, 0] if reverse_second else [0, 1]
+
+        # Construct the records for the Signposts_Streets table
+        # ["SignpostID", "Sequence", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"]
+        # The first edge is always Sequence = 1, and the last edge is Sequence = 0 if the exact edge
+        # sequence is not known, as is the case here. I'm not sure why it was designed this way, but
+        # this 1-0 sequene is intentional. The SignpostID is filled in when the rows are written.
+        signposts_streets_rows = [
+            [1, context["fc_id"], first_street["OID"]] + pos_fields_1,
+            [0, context["fc_id"], second_street["OID"]] + pos_fields_2
+        ]
+
+        # The text fields were built for all signposts up front, so just identify the signpost for them
+        signpost_row = [signpost_vertices, signpost_num]
+        return signpost_row, signposts_streets_rows
 
     @timed_exec
     def _create_and_build_nd(self):
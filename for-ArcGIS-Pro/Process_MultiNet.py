@@ -16,8 +16,15 @@ import numpy as np
 import os
 import uuid
 from lxml import etree
-import arcpy
-from helpers import CURDIR, timed_exec, TimeZoneType, UnitType, DataProductType, StreetInputData, StreetDataProcessor
+try:
+    import arcpy
+except ImportError:
+    arcpy = None  # Only the pure pandas and numpy calculations can run without arcpy, for example in the benchmarks
+from helpers import CURDIR, timed_exec, profiled_run, partition_rows, partition_groups, \
+    map_partitions, compact_df, PROFILER, TABLE_CACHE_SIZE_GB, TimeZoneType, UnitType, DataProductType, \
+    StreetInputData, StreetDataProcessor, TableIO, GroupedIndex, summarize_ids, road_forks_df, pivot_sign_text, \
+    SignpostWriter
+from geometry import build_turn_vertices, build_signpost_vertices, vertices_to_wkb
 
 
 LNG_CODES = {
@@ -257,7 +264,10 @@ class MultiNetProcessor(StreetDataProcessor):
     def __init__(
         self, out_folder: str, gdb_name: str, in_multinet: MultiNetInputData, unit_type: UnitType,
         time_zone_type: TimeZoneType, time_zone_name: str = "", in_time_zone_table=None,
-        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True
+        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True,
+        num_workers: int = 1, resume: bool = False, table_cache_folder: str = None,
+        table_cache_size_gb: float = TABLE_CACHE_SIZE_GB, memory_budget_gb: float = None, profile: bool = False,
+        table_io: TableIO = None, previous_gdb: str = None
     ):
         """Initialize a class to process MultiNet data into a network dataset."""
         self.include_logistics = in_multinet.include_logistics
@@ -265,7 +275,8 @@ class MultiNetProcessor(StreetDataProcessor):
             DataProductType.TomTomMultinet, out_folder, gdb_name, in_multinet, unit_type,
             in_multinet.include_historical_traffic,
             time_zone_type, time_zone_name, in_time_zone_table, time_zone_ft_field,
-            time_zone_tf_field, build_network)
+            time_zone_tf_field, build_network, num_workers, resume, table_cache_folder, table_cache_size_gb,
+            memory_budget_gb, profile, table_io, previous_gdb)
 
         # Maps VT field codes to restriction names
         self.vt_field_map = {
@@ -286,78 +297,165 @@ class MultiNetProcessor(StreetDataProcessor):
 
         # Global dataframes and variables used by multiple processes and initialized later
         self.r_df = None  # Restrictions table indexed by ID for quick lookups
-        self.mp_df = None  # Maneuver paths table indexed by ID for quick lookups
+        self.mp_index = None  # GroupedIndex of the maneuver paths table by ID for quick lookups
+        self.sp_df = None  # Sign paths table
         self.lrs_df = None  # Dataframe of logistics LRS table
         self.unique_lrs_df = None  # Dataframe holding unique combinations of logistics restriction data
 
+    @profiled_run
     def process_multinet_data(self):
         """Process multinet data into a network dataset."""
         # Set the progressor so the user is informed of progress
         arcpy.SetProgressor("default")
 
-        # Validate the input data
+        # Validate the input data and load the checkpoint of the previous run if resuming
         if not self._validate_inputs():
             return
+        # In a delta run, find the streets that changed since the previous run, whose output is updated in place
+        if self.previous_gdb:
+            self._prepare_delta_run()
+
+        # Start reading some tables we're going to need to reference later in multiple places. They're read at the same
+        # time on background threads while the output is created and the streets are copied. When resuming, only the
+        # ones needed by the stages that still have to run are read.
+        if self._stage_pending("populate_streets", "turns"):
+            self._prefetch(self._read_and_index_restrictions)
+        if self._stage_pending("turns", "road_forks"):
+            self._prefetch(self._read_and_index_maneuver_paths)
+        if self._stage_pending("copy_streets", "populate_streets", "network"):
+            self._prefetch(self._read_and_index_logistics_tables)
 
         # Create the output location
-        self._create_feature_dataset()
+        if self._begin_stage("create_output", [os.path.join(self.out_folder, self.gdb_name)]):
+            self._create_feature_dataset()
+            self._complete_stage("create_output")
 
-        # Read in some tables we're going to need to reference later in multiple places
-        self._read_and_index_restrictions()
-        self._read_and_index_maneuver_paths()
-        self._read_and_index_logistics_tables()
+        # The logistics tables determine some of the fields of the output Streets
+        if self._stage_pending("copy_streets", "populate_streets", "network"):
+            self.prefetcher.result(self._read_and_index_logistics_tables)
 
         # Create the output Streets feature class and populate it
-        self._copy_streets()
-        self._detect_and_delete_duplicate_streets("ID")
-        self._populate_streets_fields()
+        if self._begin_stage("copy_streets", [self.streets]):
+            if self.streets_delta is not None:
+                self._apply_streets_delta()
+            else:
+                self._copy_streets()
+            self._complete_stage("copy_streets", [self.streets])
+        else:
+            self._describe_streets()
+        if self._begin_stage("dedupe_streets"):
+            self._detect_and_delete_duplicate_streets("ID")
+            self._complete_stage("dedupe_streets", [self.streets])
+        if self._stage_pending("populate_streets", "turns"):
+            self.prefetcher.result(self._read_and_index_restrictions)
+        if self._begin_stage("populate_streets"):
+            self._populate_streets_fields()
+            self._complete_stage("populate_streets", [self.streets])
         # We're now done with the Logistics restrictions table, so clear the variable to free up memory
         del self.lrs_df
         self.lrs_df = None
 
         # Read in output streets for future look-ups
-        self._read_and_index_streets()
+        if self._stage_pending("turns", "road_forks", "signposts", "historical_traffic"):
+            self._read_and_index_streets()
+
+        # Read the sign paths table and prefetch the geometry of all streets used by turns and signposts
+        if self._stage_pending("turns", "road_forks"):
+            self.prefetcher.result(self._read_and_index_maneuver_paths)
+        if self._stage_pending("signposts"):
+            self._read_sign_paths_table()
+        if self._stage_pending("turns", "signposts"):
+            self._prefetch_turn_and_signpost_geometry()
 
         # Create and populate the turn feature class
-        self._create_turn_fc(self.restriction_field_names)
-        self._generate_turn_features()
+        if self._begin_stage("turns", [self.turns]):
+            self._create_turn_fc(self.restriction_field_names)
+            self._generate_turn_features()
+            self._complete_stage("turns", [self.turns])
         # We're now done with the restrictions table, so clear the variable to free up memory
         del self.r_df
         self.r_df = None
 
         # Create and populate the road forks table
-        self._create_and_populate_road_forks()
+        if self._begin_stage("road_forks", [self.road_splits]):
+            self._create_and_populate_road_forks()
+            self._complete_stage("road_forks", [self.road_splits])
         # We're now done with the maneuver path table, so clear the variable to free up memory
-        del self.mp_df
-        self.mp_df = None
+        del self.mp_index
+        self.mp_index = None
 
         # Create and populate Signposts and Signposts_Streets
-        self._create_signposts_fc()
-        self._create_signposts_streets_table()
-        self._populate_signposts_and_signposts_streets()
+        if self._begin_stage("signposts", [self.signposts, self.signposts_streets]):
+            self._create_signposts_fc()
+            self._create_signposts_streets_table()
+            self._populate_signposts_and_signposts_streets()
+            self._complete_stage("signposts", [self.signposts, self.signposts_streets])
+        # We're now done with the sign paths table, so clear the variable to free up memory
+        del self.sp_df
+        self.sp_df = None
 
         # Create and populate historical traffic tables
-        if self.include_historical_traffic:
+        traffic_tables = [self.streets_profiles, self.profiles]
+        if self.in_data_object.rd:
+            traffic_tables.append(self.streets_tmc)
+        if self.include_historical_traffic and self._begin_stage("historical_traffic", traffic_tables):
             self._create_and_populate_streets_profiles_table()
             self._create_profiles_table()
             self._populate_profiles_table()
             self._create_and_populate_streets_tmc_table()
+            self._complete_stage("historical_traffic", traffic_tables)
         # We're done with the streets table, so clear the variable to free up memory
         del self.streets_df
         self.streets_df = None
+        self.street_geometries = None
+        self.streets_index = None
+        self.streets_topology = None
 
         # Handle time zone table if needed
-        if self.time_zone_type != TimeZoneType.NoTimeZone:
+        if self.time_zone_type != TimeZoneType.NoTimeZone and \
+                self._begin_stage("time_zone", [self.time_zone_table]):
             self._handle_time_zone()
+            self._complete_stage("time_zone", [self.time_zone_table])
 
         # Add attribute indices
-        self._add_attribute_indices()
+        if self._begin_stage("attribute_indices"):
+            self._add_attribute_indices()
+            self._complete_stage("attribute_indices")
 
-        # Clean up intermediate data
+        # Clean up intermediate data and stop the threads used to prefetch tables
         self._delete_intermediate_outputs()
+        self.prefetcher.shutdown()
 
         # Create the network dataset from a template and build it
-        self._create_and_build_nd()
+        if self._begin_stage("network", [self.network]):
+            self._create_and_build_nd()
+            self._complete_stage("network")
+
+        # Report the changes made to the previous output in a delta run
+        self._report_delta()
+
+    def _pipeline_stages(self):
+        """Return the names of the checkpointed stages of the processing run in the order they run."""
+        stages = [
+            "create_output", "copy_streets", "dedupe_streets", "populate_streets", "turns", "road_forks", "signposts"
+        ]
+        if self.include_historical_traffic:
+            stages.append("historical_traffic")
+        if self.time_zone_type != TimeZoneType.NoTimeZone:
+            stages.append("time_zone")
+        stages += ["attribute_indices", "network"]
+        return stages
+
+    def _checkpoint_settings(self):
+        """Return the settings that affect the output. A run can't be resumed with different settings."""
+        settings = super()._checkpoint_settings()
+        settings["include_logistics"] = bool(self.include_logistics)
+        return settings
+
+    def _input_streets(self):
+        """Return the input streets feature class and a where clause selecting the streets copied to the output."""
+        # Address area boundary elements are filtered out
+        return self.in_data_object.nw, "FEATTYP <> 4165"
 
     @timed_exec
     def _copy_streets(self):
@@ -403,9 +501,7 @@ class MultiNetProcessor(StreetDataProcessor):
             nw_layer, self.feature_dataset, os.path.basename(self.streets), field_mapping=field_mappings)
 
         # Update the fc_id that will be used to relate back to this Streets feature class in Edge#FCID fields
-        desc = arcpy.Describe(self.streets)
-        self.fc_id = desc.DSID
-        self.streets_oid_field = desc.oidFieldName
+        self._describe_streets()
 
     @timed_exec
     def _create_and_populate_streets_profiles_table(self):
@@ -415,58 +511,43 @@ class MultiNetProcessor(StreetDataProcessor):
         self._add_message("Creating and populating Streets_DailyProfiles table...")
         assert self.streets_df is not None  # Confidence check
 
-        # Create the table with desired schema
-        arcpy.management.CreateTable(
-            os.path.dirname(self.streets_profiles),
-            os.path.basename(self.streets_profiles),
-            self.in_data_object.hsnp  # Template table used to define schema
-        )
+        # Create the table with desired schema, unless it's updated in place in a delta run
         field_defs = [
             ["EdgeFCID", "LONG"],
             ["EdgeFID", "LONG"],
             ["EdgeFrmPos", "DOUBLE"],
             ["EdgeToPos", "DOUBLE"]
         ]
-        arcpy.management.AddFields(self.streets_profiles, field_defs)
-
-        # Insert rows
+        if not self._reuse_previous_output(self.streets_profiles):
+            arcpy.management.CreateTable(
+                os.path.dirname(self.streets_profiles),
+                os.path.basename(self.streets_profiles),
+                self.in_data_object.hsnp  # Template table used to define schema
+            )
+            arcpy.management.AddFields(self.streets_profiles, field_defs)
+
+        # Read the relevant historical traffic records
         desc = arcpy.Describe(self.in_data_object.hsnp)
         input_fields = [f.name for f in desc.fields if f.name != desc.OIDFieldName]
         output_fields = input_fields + [f[0] for f in field_defs]
-        network_id_idx = input_fields.index("NETWORK_ID")
-        val_dir_idx = input_fields.index("VAL_DIR")
-        with arcpy.da.InsertCursor(self.streets_profiles, output_fields) as cur:
-            for row in arcpy.da.SearchCursor(
-                self.in_data_object.hsnp, input_fields, "SPFREEFLOW > 0 And VAL_DIR IN (2, 3)"
-            ):
-                # Initialize the row to insert with all the values from the original table
-                new_row = [val for val in row]
-
-                # Calculate the additional, new fields: EdgeFCID, EdgeFID, EdgeFrmPos, EdgeToPos
-                street_id = np.int64(row[network_id_idx])
-                try:
-                    # Find the street record associated with this street profile record
-                    edge_fid = self.streets_df.loc[street_id]["OID"]
-                except KeyError:
-                    arcpy.AddWarning((
-                        f"The Streets table is missing an entry with ID {row[network_id_idx]}, which is used in the "
-                        "network profile link historical traffic table."))
-                    # Just skip this row and don't add it
-                    continue
-                val_dir = row[val_dir_idx]
-                if val_dir == 2:
-                    edge_from_pos = 0
-                    edge_to_pos = 1
-                elif val_dir == 3:
-                    edge_from_pos = 1
-                    edge_to_pos = 0
-                else:
-                    # This should never happen because of our where clause, but check just in case
-                    continue
-                new_row += [self.fc_id, edge_fid, edge_from_pos, edge_to_pos]
+        hsnp_df = self._read_input_table(
+            self.in_data_object.hsnp, input_fields, "SPFREEFLOW > 0 And VAL_DIR IN (2, 3)")
+
+        # Calculate the additional, new fields: EdgeFCID, EdgeFID, EdgeFrmPos, EdgeToPos
+        # Find the street record associated with each street profile record
+        hsnp_df["EdgeFID"] = hsnp_df["NETWORK_ID"].astype(np.int64).map(self.streets_df["OID"])
+        for network_id in hsnp_df.loc[hsnp_df["EdgeFID"].isna(), "NETWORK_ID"]:
+            arcpy.AddWarning((
+                f"The Streets table is missing an entry with ID {network_id}, which is used in the "
+                "network profile link historical traffic table."))
+        # Just skip these rows and don't add them
+        hsnp_df = hsnp_df[hsnp_df["EdgeFID"].notna()].astype({"EdgeFID": np.int64})
+        hsnp_df["EdgeFCID"] = self.fc_id
+        hsnp_df["EdgeFrmPos"] = np.where(hsnp_df["VAL_DIR"] == 3, 1, 0)
+        hsnp_df["EdgeToPos"] = 1 - hsnp_df["EdgeFrmPos"]
 
-                # Insert the row
-                cur.insertRow(new_row)
+        # Insert the rows
+        self.table_io.insert_rows(self.streets_profiles, hsnp_df, output_fields)
 
     @timed_exec
     def _populate_profiles_table(self):
@@ -475,48 +556,38 @@ class MultiNetProcessor(StreetDataProcessor):
             return
         self._add_message("Populating DailyProfiles table...")
 
-        # Read the Historical Speed Profiles table into a temporary dataframe so we can quickly sort it. Normally we
-        # could sort it using the da.SearchCursor's sql clause, but the ORDER BY option doesn't work with shapefile
-        # tables.
         fields = ["PROFILE_ID", "TIME_SLOT", "REL_SP"]
-        with arcpy.da.SearchCursor(self.in_data_object.hspr, fields) as cur:
-            hspr_df = pd.DataFrame(cur, columns=fields)
-        hspr_df = hspr_df.sort_values("PROFILE_ID").groupby(["PROFILE_ID"])
+        hspr_df = self._read_input_table(self.in_data_object.hspr, fields)
 
-        # Insert the rows
+        # Build the rows
         desc = arcpy.Describe(self.profiles)
         output_fields = [f.name for f in desc.fields if f.name != desc.oidFieldName]
-        with arcpy.da.InsertCursor(self.profiles, output_fields) as cur:
-            # Loop through the records in the HSPR table and calculate the SpeedFactor fields accordingly
-            for profile_id, group in hspr_df:
-                if isinstance(profile_id, (tuple, list)):
-                    # In newer versions of pandas, groupby keys come back as tuples, so just get the first item
-                    # in the tuple
-                    profile_id = profile_id[0]
-
-                # Initialize a new row with the ProfileID and defaulting all the SpeedFactor fields to None.
-                new_row = [profile_id] + [None] * (len(output_fields) - 1)
-
-                # Iterate through the records in this group and populate the SpeedFactor fields
-                for _, record in group.iterrows():
-                    # Figure out which SpeedFactor field this record is for based on the TIME_SLOT field value
-                    # The TIME_SLOT field indicates the time of day as measured in seconds since midnight.  Since the
-                    # granularity is 5 minutes, the TIME_SLOT values are all multiples of 300 (e.g., TIME_SLOT=0
-                    # represents 12:00am, TIME_SLOT=300 represents 12:05am, TIME_SLOT=600 represents 12:10am, etc.).
-                    # Add 1 to the index because ProfileID is the first field in the row
-                    time_slot_index = int((record['TIME_SLOT'] / 300)) + 1
-                    new_row[time_slot_index] = record["REL_SP"] / 100
-
-                # Check if the row is missing any values, and if so, default them to 1 and add a warning.
-                if None in new_row:
-                    arcpy.AddWarning((
-                        "The Historical Speed Profiles table has incomplete TIME_SLOT records for PROFILE_ID "
-                        f"{profile_id}. The missing values have been filled in with a value of 1."
-                    ))
-                    new_row = [val if val is not None else 1 for val in new_row]
-
-                # Finally, insert the row
-                cur.insertRow(new_row)
+        # Pivot the HSPR records into a 2D array of SpeedFactor values with a row for each profile, sorted by
+        # PROFILE_ID, and a column for each SpeedFactor field, and scatter all the records into it at once.
+        # The TIME_SLOT field indicates the time of day as measured in seconds since midnight.  Since the granularity is
+        # 5 minutes, the TIME_SLOT values are all multiples of 300 (e.g., TIME_SLOT=0 represents 12:00am, TIME_SLOT=300
+        # represents 12:05am, TIME_SLOT=600 represents 12:10am, etc.), so TIME_SLOT / 300 is the column of the record.
+        profile_ids, rows = np.unique(hspr_df["PROFILE_ID"].to_numpy(), return_inverse=True)
+        columns = (hspr_df["TIME_SLOT"].to_numpy(dtype=float) / 300).astype(np.int64)
+        speed_factors = np.ones((len(profile_ids), len(output_fields) - 1), dtype=np.float32)
+        speed_factors[rows, columns] = hspr_df["REL_SP"].to_numpy(dtype=np.float32) / 100
+        has_value = np.zeros(speed_factors.shape, dtype=bool)
+        has_value[rows, columns] = True
+        del hspr_df, rows, columns
+
+        # Profiles missing any values keep the default of 1 for them. Add one warning listing them.
+        incomplete_ids = profile_ids[~has_value.all(axis=1)]
+        if len(incomplete_ids):
+            arcpy.AddWarning((
+                f"The Historical Speed Profiles table has incomplete TIME_SLOT records for {len(incomplete_ids)} "
+                "PROFILE_IDs. The missing values have been filled in with a value of 1. Incomplete PROFILE_IDs: "
+                f"{summarize_ids(incomplete_ids)}"
+            ))
+
+        # Insert the rows
+        profiles_df = pd.DataFrame(speed_factors, columns=output_fields[1:])
+        profiles_df.insert(0, output_fields[0], profile_ids)
+        self.table_io.insert_rows(self.profiles, profiles_df, output_fields)
 
     @timed_exec
     def _create_and_populate_streets_tmc_table(self):
@@ -526,35 +597,35 @@ class MultiNetProcessor(StreetDataProcessor):
         assert self.streets_df is not None  # Confidence check
         field_names = self._create_streets_tmc_table()
 
-        with arcpy.da.InsertCursor(self.streets_tmc, field_names) as cur:
-            for row in arcpy.da.SearchCursor(self.in_data_object.rd, ["ID", "RDSTMC"]):
-                id = row[0]
-                # The TMC field value comes from the last 9 characters of the RDSTMC field of the RD table.
-                rdstmc = row[1]
-                tmc = rdstmc[-9:]
-                try:
-                    # Find the street record associated with this street profile record
-                    edge_fid = self.streets_df.loc[np.int64(row[0])]["OID"]
-                except KeyError:
-                    arcpy.AddWarning((
-                        f"The Streets table is missing an entry with ID {id}, which is used in the RDS-TMC Information "
-                        "(RD) historical traffic table."))
-                    # Just skip this row and don't add it
-                    continue
-                if rdstmc[0] == "+":
-                    edge_from_pos = 0
-                    edge_to_pos = 1
-                elif rdstmc[0] == "-":
-                    edge_from_pos = 1
-                    edge_to_pos = 0
-                else:
-                    arcpy.AddWarning((
-                        "The RDS-TMC Information (RD) historical traffic table has an invalid RDSTMC field value for "
-                        f"ID {id}."
-                    ))
-                    continue
+        # Read the RD table
+        rd_df = self._read_input_table(self.in_data_object.rd, ["ID", "RDSTMC"])
+        # The TMC field value comes from the last 9 characters of the RDSTMC field of the RD table.
+        rd_df["TMC"] = rd_df["RDSTMC"].str[-9:]
+        # Find the street record associated with each record
+        rd_df["EdgeFID"] = rd_df["ID"].astype(np.int64).map(self.streets_df["OID"])
+        # Determine the direction from the first character of RDSTMC
+        direction = rd_df["RDSTMC"].str[0]
+        is_missing = rd_df["EdgeFID"].isna()
+        is_invalid = ~is_missing & ~direction.isin(["+", "-"])
+        for id, missing, invalid in zip(rd_df["ID"].tolist(), is_missing.tolist(), is_invalid.tolist()):
+            if missing:
+                arcpy.AddWarning((
+                    f"The Streets table is missing an entry with ID {id}, which is used in the RDS-TMC Information "
+                    "(RD) historical traffic table."))
+            elif invalid:
+                arcpy.AddWarning((
+                    "The RDS-TMC Information (RD) historical traffic table has an invalid RDSTMC field value for "
+                    f"ID {id}."
+                ))
+        # Just skip these rows and don't add them
+        rd_df = rd_df[~is_missing & ~is_invalid].astype({"EdgeFID": np.int64})
+        rd_df["EdgeFCID"] = self.fc_id
+        rd_df["EdgeFrmPos"] = np.where(direction[rd_df.index] == "-", 1, 0)
+        rd_df["EdgeToPos"] = 1 - rd_df["EdgeFrmPos"]
 
-                cur.insertRow([id, tmc, self.fc_id, edge_fid, edge_from_pos, edge_to_pos])
+        # Insert the rows
+        self.table_io.insert_rows(
+            self.streets_tmc, rd_df, field_names, ["ID", "TMC", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"])
 
     @timed_exec
     def _read_and_index_restrictions(self):
@@ -562,28 +633,68 @@ class MultiNetProcessor(StreetDataProcessor):
         self._add_message("Reading and grouping restrictions table...")
         where = f"VT IN ({', '.join([str(vt) for vt in self.vt_field_map])})"
         fields = ["ID", "FEATTYP", "VT", "DIR_POS", "RESTRTYP"]
-        with arcpy.da.SearchCursor(self.in_data_object.rs, fields, where) as cur:
-            self.r_df = pd.DataFrame(cur, columns=fields)
+        self.r_df = self._read_input_table(self.in_data_object.rs, fields, where)
         # Cast the ID column from its original double to an explicit int64 so we can use it for indexing and lookups
         self.r_df = self.r_df.astype({"ID": np.int64})
         # Index the dataframe by ID for quick retrieval later, and sort the index to make those lookups even faster
         self.r_df.set_index("ID", inplace=True)
         self.r_df.sort_index(inplace=True)
+        self.r_df = compact_df(self.r_df, ["RESTRTYP"], "RS")
 
     @timed_exec
     def _read_and_index_maneuver_paths(self):
         """Read in the maneuver paths table and index it for quick lookups."""
         self._add_message("Reading and grouping maneuver paths table...")
         fields = ["ID", "TRPELID", "SEQNR"]
-        with arcpy.da.SearchCursor(self.in_data_object.mp, fields) as cur:
-            # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
-            self.mp_df = pd.DataFrame(cur, columns=fields, dtype=np.int64)
-        # Index the dataframe by ID for quick retrieval later, and sort the index to make those lookups even faster
-        self.mp_df.set_index("ID", inplace=True)
-        self.mp_df.sort_index(inplace=True)
+        # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
+        mp_df = self._read_input_table(self.in_data_object.mp, fields, dtype=np.int64)
+        mp_df = compact_df(mp_df, name="MP")
+        # Index the records by ID for quick retrieval later, with the records for each ID sorted by sequence
+        self.mp_index = GroupedIndex.from_df(mp_df, "ID", sort_by=["SEQNR"])
         # Determine the max number of edges participating in a turn. This will be used when creating the turn feature
         # class to initialize the proper number of fields.
-        self.max_turn_edges = int(self.mp_df["SEQNR"].max())
+        self.max_turn_edges = int(mp_df["SEQNR"].max())
+
+    @timed_exec
+    def _read_sign_paths_table(self):
+        """Read in the sign paths table."""
+        fields = ["ID", "TRPELID", "SEQNR"]
+        # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
+        self.sp_df = self._read_input_table(self.in_data_object.sp, fields, dtype=np.int64)
+        self.sp_df = compact_df(self._limit_to_changed_streets(self.sp_df, "ID", ["TRPELID"]), name="SP")
+
+    def _prefetch_turn_and_signpost_geometry(self):
+        """Prefetch the geometry of all streets used by turns and signposts."""
+        # When resuming a previous run, only the tables needed by the stages that still have to run are read.
+        # The maneuver paths table also includes road forks, which don't need geometry, but there are few enough of them
+        # that it isn't worth filtering them out.
+        street_ids = []
+        if self.mp_index is not None:
+            maneuver_ids = self._rebuilt_maneuver_ids()
+            if maneuver_ids is None:
+                street_ids.append(self.mp_index["TRPELID"])
+            else:
+                street_ids.append(self.mp_index["TRPELID"][np.isin(self.mp_index.row_keys(), maneuver_ids)])
+        if self.sp_df is not None:
+            street_ids.append(self.sp_df["TRPELID"].to_numpy())
+        self._prefetch_street_geometry(np.unique(np.concatenate(street_ids)))
+
+    def _rebuilt_maneuver_ids(self):
+        """Return the IDs of the maneuvers in the maneuver path table rebuilt in this run, or None if all are.
+
+        In a delta run limited to the turns and road forks referencing a changed street, those are the maneuvers with a
+        path record for a changed street.
+        """
+        if self.rebuilt_street_ids is None:
+            return None
+        return np.unique(self.mp_index.row_keys()[np.isin(self.mp_index["TRPELID"], self.rebuilt_street_ids)])
+
+    def _limit_to_rebuilt_maneuvers(self, mn_df):
+        """Return the records of the maneuver geometry table whose maneuvers are rebuilt in this run."""
+        maneuver_ids = self._rebuilt_maneuver_ids()
+        if maneuver_ids is None:
+            return mn_df
+        return mn_df[mn_df["ID"].isin(maneuver_ids).to_numpy()]
 
     @timed_exec
     def _read_and_index_historical_traffic(self):
@@ -592,9 +703,8 @@ class MultiNetProcessor(StreetDataProcessor):
             # Confidence check
             return None
         fields = ["NETWORK_ID", "VAL_DIR", "SPWEEKDAY", "SPWEEKEND", "SPWEEK"]
-        with arcpy.da.SearchCursor(self.in_data_object.hsnp, fields, "VAL_DIR IN (2, 3)") as cur:
-            # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
-            hsnp_df = pd.DataFrame(cur, columns=fields, dtype=np.int64)
+        # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
+        hsnp_df = self._read_input_table(self.in_data_object.hsnp, fields, "VAL_DIR IN (2, 3)", np.int64)
         # Index the dataframe by NETWORK_ID for quick retrieval later,
         # and sort the index to make those lookups even faster
         hsnp_df.set_index("NETWORK_ID", inplace=True)
@@ -619,9 +729,8 @@ class MultiNetProcessor(StreetDataProcessor):
         # model accurately, these are not included in our output network dataset. Read the LVC table to weed out any
         # records in the LRS table that have a matching ID and SEQNR combination.
         fields = ["ID", "SEQNR"]
-        with arcpy.da.SearchCursor(self.in_data_object.lvc, fields) as cur:
-            # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
-            lvc_df = pd.DataFrame(cur, columns=fields, dtype=np.int64)
+        # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
+        lvc_df = self._read_input_table(self.in_data_object.lvc, fields, dtype=np.int64)
         # Add a field to use as a mask after joining
         lvc_df["DROP"] = True
         # Index the dataframe by ID and SEQNR for joining
@@ -631,8 +740,7 @@ class MultiNetProcessor(StreetDataProcessor):
         fields = ["ID", "SEQNR", "RESTRTYP", "VT", "RESTRVAL", "LIMIT", "UNIT_MEAS"]
         codes = [f"'{r}'" for r in restrtype_df.index.tolist()]
         where = f"RESTRTYP IN ({', '.join(codes)})"
-        with arcpy.da.SearchCursor(self.in_data_object.lrs, fields, where) as cur:
-            self.lrs_df = pd.DataFrame(cur, columns=fields)
+        self.lrs_df = self._read_input_table(self.in_data_object.lrs, fields, where)
         # Cast the ID field from its original double to an int64 for lookups and indexing
         self.lrs_df = self.lrs_df.astype({"ID": np.int64})
         self.lrs_df.set_index(["ID", "SEQNR"], inplace=True)
@@ -658,11 +766,11 @@ class MultiNetProcessor(StreetDataProcessor):
         self.unique_lrs_df.dropna(inplace=True, subset=["FieldNamePrefix", "FieldNameComponent", "FieldNameSuffix"])
         num_rows = self.unique_lrs_df.shape[0]
         if num_rows < orig_num_rows:
-            arcpy.AddWarning((
+            self._add_warning((
                 "Some records from the MultiNet Logistics LRS table had unsupported RESTRTYP, VT, or RESTRVAL field "
                 "values. These records have been ignored."
             ))
-        arcpy.AddMessage(f"{num_rows} MultiNet Logistics restrictions will be included in the network.")
+        self._add_message(f"{num_rows} MultiNet Logistics restrictions will be included in the network.")
 
         # Calculate the field and attribute names from the joined components
         self.unique_lrs_df["FieldName"] = self.unique_lrs_df["FieldNamePrefix"] + \
@@ -684,6 +792,7 @@ class MultiNetProcessor(StreetDataProcessor):
 
         # Index lrs_df for quick lookups
         self.lrs_df.set_index("ID", inplace=True)
+        self.lrs_df = compact_df(self.lrs_df, ["RESTRTYP", "FieldName"], "LRS")
 
     @timed_exec
     def _read_and_index_ltr(self):
@@ -691,9 +800,8 @@ class MultiNetProcessor(StreetDataProcessor):
         if not self.in_data_object.ltr:
             return None
         fields = ["ID", "PREFERRED", "RESTRICTED"]
-        with arcpy.da.SearchCursor(self.in_data_object.ltr, fields) as cur:
-            # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
-            ltr_df = pd.DataFrame(cur, columns=fields, dtype=np.int64)
+        # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
+        ltr_df = self._read_input_table(self.in_data_object.ltr, fields, dtype=np.int64)
         # Index the dataframe by ID for quick retrieval later, and sort the index to make those lookups even faster
         ltr_df.set_index("ID", inplace=True)
         ltr_df.sort_index(inplace=True)
@@ -704,13 +812,14 @@ class MultiNetProcessor(StreetDataProcessor):
         """Read in the streets table and index it for quick lookups."""
         self._add_message("Reading and indexing Streets table...")
         # Store street info in a dataframe for quick lookups
-        with arcpy.da.SearchCursor(self.streets, ["ID", "OID@", "F_JNCTID", "T_JNCTID"]) as cur:
-            self.streets_df = pd.DataFrame(cur, columns=["ID", "OID", "F_JNCTID", "T_JNCTID"])
+        fields = ["ID", "OID@", "F_JNCTID", "T_JNCTID"]
+        self._check_memory_budget(self.streets, fields)
+        self.streets_df = self.table_io.read_columns(self.streets, fields).rename(columns={"OID@": "OID"})
+        PROFILER.add_rows(rows_read=len(self.streets_df))
         # Cast the ID field from its original double to an int64 for lookups and indexing
         self.streets_df = self.streets_df.astype({"ID": np.int64})
         self.streets_df.set_index("ID", inplace=True)
-        # Add an empty field to store street geometries.  They'll be filled only as needed to conserve memory
-        self.streets_df["SHAPE"] = None
+        self.streets_df = compact_df(self.streets_df, name="Streets")
 
     @timed_exec
     def _populate_streets_fields(self):
@@ -725,701 +834,637 @@ class MultiNetProcessor(StreetDataProcessor):
         hsnp_df = self._read_and_index_historical_traffic()
         ltr_df = self._read_and_index_ltr()
 
-        # Subset the restrictions table to include only the restriction type we care about
-        r_df_streets_subset = self.r_df[self.r_df["RESTRTYP"] == "DF"]
+        # Read the street attributes needed to calculate the values of other fields
+        in_fields = ["ID", "TOLLRD"]
+        if self.include_historical_traffic:
+            in_fields += ["METERS", "KPH"]
+        self._check_memory_budget(self.streets, in_fields)
+        streets_df = self.table_io.read_columns(self.streets, in_fields)
+        PROFILER.add_rows(rows_read=len(streets_df))
+        # The ID fields are stored as doubles in the table because they're too large for 32-bit int fields in the gdb.
+        # Convert to an int64 for easy indexing and lookups.
+        streets_df = streets_df.astype({"ID": np.int64})
+        streets_df.set_index("ID", inplace=True)
+
+        # Calculate the values of all updated fields for all streets up front and copy them into the Streets table
+        out_df = self._calculate_streets_fields(streets_df, hsnp_df, ltr_df)
+        del streets_df
+        del hsnp_df
+        del ltr_df
+        self.table_io.update_rows(self.streets, "ID", out_df, np.int64, "Populating Streets fields...")
+
+    def _calculate_streets_fields(self, streets_df, hsnp_df, ltr_df):
+        """Calculate the values of the updated Streets fields for all streets at once.
+
+        The RS, HSNP, LTR, and LRS records are pivoted into one wide dataframe indexed by ID with a column for every
+        output field.
+
+        Args:
+            streets_df: Dataframe of input street attributes indexed by int64 ID
+            hsnp_df: Dataframe of historical traffic records indexed by int64 NETWORK_ID, or None if not used
+            ltr_df: Dataframe of logistics truck routes records indexed by int64 ID, or None if not used
+
+        Returns:
+            Dataframe of updated field values indexed by ID in the same order as streets_df
+        """
+        out_df = pd.DataFrame(index=streets_df.index)
 
-        # Build a list of fields to retrieve in the Streets NW table, including the ID, all the restriction value
-        # fields, and, optionally, historical traffic fields
-        fields = ["ID", "TOLLRD", "TOLLRDDIR"]
-        for restr_field in self.restriction_field_names:
-            fields += [f"FT_{restr_field}", f"TF_{restr_field}"]
+        # Calculate the value of the TOLLRDDIR field based on the value of TOLLRD
+        tollrd = streets_df["TOLLRD"]
+        out_df["TOLLRDDIR"] = np.select(
+            [tollrd.isin([11, 21]), tollrd.isin([12, 22]), tollrd.isin([13, 23])], ["B", "FT", "TF"], None)
+
+        # Populate the basic restrictions fields from the restriction records with the restriction type we care about
+        r_df_streets_subset = self.r_df[self.r_df["RESTRTYP"] == "DF"]
+        for vt in sorted(self.vt_field_map):
+            vt_df = r_df_streets_subset[r_df_streets_subset["VT"] == vt]
+            for prefix, dir_pos in [("FT_", [1, 2]), ("TF_", [1, 3])]:
+                restricted_ids = vt_df.index[vt_df["DIR_POS"].isin(dir_pos)]
+                out_df[f"{prefix}{self.vt_field_map[vt]}"] = np.where(out_df.index.isin(restricted_ids), "Y", None)
+        del r_df_streets_subset
+
+        # Populate the historical traffic fields
         if self.include_historical_traffic:
-            fields += ["METERS", "KPH"]
-            for trf_fld in self.historical_traffic_fields:
-                fields += [f"FT_{trf_fld}", f"TF_{trf_fld}", f"FT_{trf_fld}Minutes", f"TF_{trf_fld}Minutes"]
-        if self.include_logistics:
-            # Add logistics restriction fields if needed. This method actually adds the fields to the table.
-            fields += self.unique_lrs_df["FieldName"].tolist()
+            meters = streets_df["METERS"].to_numpy(dtype=float)
+            kph = streets_df["KPH"].to_numpy(dtype=float)
+            for prefix, val_dir in [("FT_", 2), ("TF_", 3)]:
+                # If there are multiple records for the same ID and direction, the last one wins
+                dir_hsnp_df = hsnp_df[hsnp_df["VAL_DIR"] == val_dir]
+                dir_hsnp_df = dir_hsnp_df[~dir_hsnp_df.index.duplicated(keep="last")].reindex(out_df.index)
+                for trf_fld, hsnp_fld in zip(self.historical_traffic_fields, ["SPWEEKDAY", "SPWEEKEND", "SPWEEK"]):
+                    speed = dir_hsnp_df[hsnp_fld]
+                    out_df[f"{prefix}{trf_fld}"] = speed
+                    # Calculate minutes based on the traffic speed, or on KPH if there was no traffic record
+                    out_df[f"{prefix}{trf_fld}Minutes"] = meters * 0.06 / np.where(
+                        speed.notna(), speed.to_numpy(dtype=float), kph)
+            del dir_hsnp_df
+
+        # Populate the logistics truck route restriction fields
         if self.in_data_object.ltr:
-            fields += self.ltr_fields
-        field_idxs = {field: fields.index(field) for field in fields}
-
-        def calc_tollrddir(row):
-            """Calculate the TOLLRDDIR field based on the value of TOLLRD."""
-            tollrd = row[field_idxs["TOLLRD"]]
-            if tollrd in [11, 21]:
-                row[field_idxs["TOLLRDDIR"]] = "B"
-            if tollrd in [12, 22]:
-                row[field_idxs["TOLLRDDIR"]] = "FT"
-            if tollrd in [13, 23]:
-                row[field_idxs["TOLLRDDIR"]] = "TF"
-            return row
-
-        def calc_minutes(trf_fld, meters, kph):
-            """Calculate minutes for the given traffic field based on meters or kph."""
-            if trf_fld is not None:
-                speed = trf_fld
-            else:
-                speed = kph
-            return meters * 0.06 / speed
-
-        def calc_restr_field(row, dir_pos, vt):
-            restr_field = self.vt_field_map[vt]
-            if dir_pos in [1, 2]:
-                row[field_idxs[f"FT_{restr_field}"]] = "Y"
-            if dir_pos in [1, 3]:
-                row[field_idxs[f"TF_{restr_field}"]] = "Y"
-            return row
-
-        def calc_basic_traffic_fields(row, hsnp_record):
-            """Update the basic traffic fields in the row."""
-            val_dir = hsnp_record['VAL_DIR']
-            if val_dir == 2:
-                row[field_idxs["FT_Weekday"]] = hsnp_record["SPWEEKDAY"]
-                row[field_idxs["FT_Weekend"]] = hsnp_record["SPWEEKEND"]
-                row[field_idxs["FT_AllWeek"]] = hsnp_record["SPWEEK"]
-            elif val_dir == 3:
-                row[field_idxs["TF_Weekday"]] = hsnp_record["SPWEEKDAY"]
-                row[field_idxs["TF_Weekend"]] = hsnp_record["SPWEEKEND"]
-                row[field_idxs["TF_AllWeek"]] = hsnp_record["SPWEEK"]
-            return row
-
-        def calc_traffic_minutes_fields(row):
-            """Calculate the FT_*Minutes and TF_*Minutes traffic fields."""
-            meters = row[field_idxs["METERS"]]
-            kph = row[field_idxs["KPH"]]
-            for trf_fld in self.historical_traffic_fields:
-                row[field_idxs[f"FT_{trf_fld}Minutes"]] = calc_minutes(
-                    row[field_idxs[f"FT_{trf_fld}"]], meters, kph)
-                row[field_idxs[f"TF_{trf_fld}Minutes"]] = calc_minutes(
-                    row[field_idxs[f"TF_{trf_fld}"]], meters, kph)
-            return row
-
-        def calc_ltr_fields(row, ltr_record):
-            preferred = ltr_record['PREFERRED']
-            restricted = ltr_record['RESTRICTED']
-            if preferred == 1:
-                row[field_idxs["NationalSTAARoute"]] = "Y"
-            elif preferred == 2:
-                row[field_idxs["NationalRouteAccess"]] = "Y"
-            elif preferred == 3:
-                row[field_idxs["DesignatedTruckRoute"]] = "Y"
-            elif preferred == 4:
-                row[field_idxs["TruckBypassRoad"]] = "Y"
-            if restricted == 1:
-                row[field_idxs["NoCommercialVehicles"]] = "Y"
-            elif restricted == 2:
-                row[field_idxs["ImmediateAccessOnly"]] = "Y"
-            elif restricted == 3:
-                row[field_idxs["TrucksRestricted"]] = "Y"
-            return row
-
-        def calc_logistics_restr_field(lrs_record):
-            """Determine the logistics restriction field being calculated and is value."""
-            restrtyp = lrs_record["RESTRTYP"]
-            value = None
-            if restrtyp in ["!A", "!B", "!C", "!D", "!E", "!F"]:
-                if lrs_record["UNIT_MEAS"] == 7:
-                    value = lrs_record["LIMIT"]
-                elif lrs_record["UNIT_MEAS"] == 3:
-                    value = lrs_record["LIMIT"] / 0.90718474
-            elif restrtyp in ["!G", "!H", "!I", "!J", "!K", "!L", "!M", "!N", "!O", "!P"]:
-                if lrs_record["UNIT_MEAS"] == 9:
-                    value = lrs_record["LIMIT"]
-                elif lrs_record["UNIT_MEAS"] == 8:
-                    value = lrs_record["LIMIT"] / 12
-                elif lrs_record["UNIT_MEAS"] == 5:
-                    value = lrs_record["LIMIT"] / 0.3048
-                elif lrs_record["UNIT_MEAS"] == 4:
-                    value = lrs_record["LIMIT"] / 30.48
-            elif restrtyp.startswith("@"):
-                value = "Y"
-
-            return value
-
-        # Iterate through the streets table and populate the TOLLRDDIR field, the restriction fields based on the values
-        # in the restrictions table and, optionally, the historical traffic fields based on the values in the historical
-        # traffic profiles table.
-        with arcpy.da.UpdateCursor(self.streets, fields) as cur:
-            for row in cur:
-                # Initialize the new row to be the same as the original
-                updated_row = list(row)
-
-                # Calculate the value of the TOLLRDDIR field based on the value of TOLLRD
-                updated_row = calc_tollrddir(updated_row)
-
-                # The ID fields are stored as doubles in the table because they're too large for 32-bit int fields in
-                # the gdb. convert to an int64 for easy retrieval from the associated pandas dataframe.
-                id = np.int64(row[0])
-
-                # Populate the basic restrictions fields
-                try:
-                    # Retrieve the restriction records for this ID
-                    subset_df = r_df_streets_subset.loc[id]
-                    # Loop through all records associated with this ID and update the appropriate restriction fields
-                    if isinstance(subset_df, pd.Series):
-                        # There was only one record with this ID, so pandas returns a series
-                        updated_row = calc_restr_field(updated_row, subset_df['DIR_POS'], subset_df["VT"])
-                    else:
-                        # There were multiple records with this ID, so pandas returns a dataframe.
-                        for _, record in subset_df.iterrows():
-                            updated_row = calc_restr_field(updated_row, record['DIR_POS'], record["VT"])
-                except KeyError:
-                    # There were no restriction records for this ID. Just skip it and move on.
-                    pass
-
-                # Populate the historical traffic fields
-                if self.include_historical_traffic:
-                    # Calculate the FT_ and TF_ fields
-                    try:
-                        # Retrieve the historical traffic records for this ID
-                        subset_df = hsnp_df.loc[id]
-                        # Loop through all records associated with this ID and update the appropriate traffic fields
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            updated_row = calc_basic_traffic_fields(updated_row, subset_df)
-                        else:
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                updated_row = calc_basic_traffic_fields(updated_row, record)
-                    except KeyError:
-                        # There were no historical traffic records for this ID. Just skip it and move on
-                        pass
-
-                    # Calculate the FT_*Minutes and TF_*Minutes traffic fields
-                    updated_row = calc_traffic_minutes_fields(updated_row)
-
-                # Populate the logistics truck route restriction fields
-                if self.in_data_object.ltr:
-                    try:
-                        # Retrieve the restriction records for this ID
-                        subset_df = ltr_df.loc[id]
-                        # Loop through the LTR records and update the appropriate rows
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            updated_row = calc_ltr_fields(updated_row, subset_df)
-                        else:
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                updated_row = calc_ltr_fields(updated_row, record)
-                    except KeyError:
-                        # There were no ltr restriction records for this ID. Just skip it and move on.
-                        pass
-
-                # Populate the MultiNet Logistics restriction fields
-                if self.include_logistics:
-                    try:
-                        # Retrieve the logistics lrs records for this ID
-                        subset_df = self.lrs_df.loc[id]
-                        # Loop through all records associated with this ID and update the appropriate logistics fields
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            field_name = subset_df["FieldName"]
-                            value = calc_logistics_restr_field(subset_df)
-                            if field_name and value:
-                                updated_row[field_idxs[field_name]] = value
-                        else:
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                field_name = record["FieldName"]
-                                value = calc_logistics_restr_field(record)
-                                if field_name and value:
-                                    updated_row[field_idxs[field_name]] = value
-                    except KeyError:
-                        # There were no logistics records for this ID. Just skip it and move on
-                        pass
-
-                # Update the row in the Streets table
-                cur.updateRow(updated_row)
+            for ltr_fld, value_fld, value in [
+                ("NationalSTAARoute", "PREFERRED", 1),
+                ("NationalRouteAccess", "PREFERRED", 2),
+                ("DesignatedTruckRoute", "PREFERRED", 3),
+                ("TruckBypassRoad", "PREFERRED", 4),
+                ("NoCommercialVehicles", "RESTRICTED", 1),
+                ("ImmediateAccessOnly", "RESTRICTED", 2),
+                ("TrucksRestricted", "RESTRICTED", 3)
+            ]:
+                out_df[ltr_fld] = np.where(out_df.index.isin(ltr_df.index[ltr_df[value_fld] == value]), "Y", None)
+
+        # Populate the MultiNet Logistics restriction fields
+        if self.include_logistics:
+            out_df = out_df.join(self._calculate_logistics_restr_fields())
+
+        return out_df
+
+    def _calculate_logistics_restr_fields(self):
+        """Calculate the MultiNet Logistics restriction field values for all streets from the LRS table.
+
+        Returns:
+            Dataframe of logistics restriction field values indexed by ID for streets having LRS records
+        """
+        assert self.lrs_df is not None
+        restrtyp = self.lrs_df["RESTRTYP"]
+        unit_meas = self.lrs_df["UNIT_MEAS"]
+        limit = self.lrs_df["LIMIT"].astype(float)
+        is_weight = restrtyp.isin(["!A", "!B", "!C", "!D", "!E", "!F"])
+        is_length = restrtyp.isin(["!G", "!H", "!I", "!J", "!K", "!L", "!M", "!N", "!O", "!P"])
+        value = pd.Series(
+            np.select(
+                [
+                    is_weight & (unit_meas == 7),
+                    is_weight & (unit_meas == 3),
+                    is_length & (unit_meas == 9),
+                    is_length & (unit_meas == 8),
+                    is_length & (unit_meas == 5),
+                    is_length & (unit_meas == 4)
+                ],
+                [limit, limit / 0.90718474, limit, limit / 12, limit / 0.3048, limit / 30.48],
+                np.nan
+            ),
+            index=self.lrs_df.index
+        ).astype(object)
+        value[restrtyp.str.startswith("@").fillna(False).astype(bool).to_numpy()] = "Y"
+        # Drop records with no value to set or whose RESTRTYP, VT, and RESTRVAL combination was not mapped to a field.
+        # If there are multiple records for the same ID and field, the last one wins.
+        lrs_values_df = pd.DataFrame({"FieldName": self.lrs_df["FieldName"], "Value": value})
+        lrs_values_df = lrs_values_df[
+            lrs_values_df["FieldName"].notna() & lrs_values_df["Value"].notna() & (lrs_values_df["Value"] != 0)]
+        lrs_values_df = lrs_values_df.reset_index().drop_duplicates(["ID", "FieldName"], keep="last")
+        return lrs_values_df.pivot(index="ID", columns="FieldName", values="Value").reindex(
+            columns=self.unique_lrs_df["FieldName"].tolist())
 
     @timed_exec
     def _generate_turn_features(self):
         """Generate the turn features and insert them into the turn feature class."""
         self._add_message("Populating turn feature class...")
         assert self.streets_df is not None
-        assert self.mp_df is not None
+        assert self.mp_index is not None
         assert self.r_df is not None
 
-        # Subset the restrictions table to include only the restriction type we care about
-        r_df_turns_subset = self.r_df[self.r_df["FEATTYP"].isin([2101, 2103])]
+        # Build the turn rows in worker processes (or serially if there is only one worker) and write them here
+        context, partitions = self._turn_worker_inputs()
+        with self.table_io.insert_cursor(self.turns, self._turn_fields()) as cur_t:
+            for _, turn_row in self._emit_worker_results(
+                map_partitions(self._build_turn_rows, context, partitions, self.num_workers), self.turns
+            ):
+                turn_row[0] = vertices_to_wkb(turn_row[0])
+                cur_t.insertRow(turn_row)
 
+    def _turn_fields(self):
+        """Return the turn feature class fields populated with the turn rows built by the workers."""
         # Create a list of turn fields based on the max turn edges and standard turn feature class schema
-        turn_fields = ["SHAPE@", "ID", "Edge1End"]
+        turn_fields = ["SHAPE@WKB", "ID", "Edge1End"]
         for idx in range(1, self.max_turn_edges + 1):
             turn_fields += [f"Edge{idx}FCID", f"Edge{idx}FID", f"Edge{idx}Pos"]
         # Add restriction fields
         turn_fields += self.restriction_field_names
-        restr_idxs = {name: self.restriction_field_names.index(name) for name in self.restriction_field_names}
+        return turn_fields
+
+    def _turn_worker_inputs(self):
+        """Return the shared context and the partitions of the turn records used by the workers building turns."""
+        # Read the turn records from the maneuver geometry table
+        where = f"FEATTYP IN ({', '.join([str(feattyp) for feattyp in [2101, 2103]])})"
+        fields = ["ID", "JNCTID"]
+        mn_df = self._limit_to_rebuilt_maneuvers(self._read_input_table(self.in_data_object.mn, fields, where))
+
+        context = self._worker_context()
+        context["mp_index"] = self.mp_index
+        # Subset the restrictions table to include only the restriction type we care about
+        context["r_index"] = GroupedIndex.from_df(
+            self.r_df[self.r_df["FEATTYP"].isin([2101, 2103])], columns=["RESTRTYP", "VT"])
+        context["vt_field_map"] = self.vt_field_map
+        context["restriction_field_names"] = self.restriction_field_names
+        context["restr_idxs"] = {name: idx for idx, name in enumerate(self.restriction_field_names)}
+        return context, partition_rows(mn_df, self.num_workers)
+
+    @staticmethod
+    def _build_turn_rows(context, mn_df):
+        """Build the turn feature rows for a partition of records from the maneuver geometry table.
+
+        This may run in a worker process, so it only uses the data passed in with the partition and the shared context.
+
+        Returns:
+            A list with a (row, warnings) tuple for each record. The first value of the row is an (N, 2) array of the
+            turn's vertices, and the row is None if the record is skipped.
+        """
+        # Work out the direction each edge is traversed for all the turns in the partition at once from the junctions
+        # at the ends of the streets. The first edge is reversed if its from junction is the turn's junction, and isn't
+        # if its to junction is. Otherwise, the direction of the first edge is determined from the second edge.
+        topology = context["streets_topology"]
+        mp_index = context["mp_index"]
+        starts, stops = mp_index.group_bounds(mn_df["ID"].to_numpy())
+        turn_edges = topology.sequence_edges(mp_index["TRPELID"], starts, stops, context["max_turn_edges"])
+        first_edges = np.maximum(turn_edges[:, 0], 0)
+        junction_nodes = topology.nodes(mn_df["JNCTID"].to_numpy())
+        known = (turn_edges[:, 0] >= 0) & (junction_nodes >= 0)
+        reverse_first = np.select([
+            known & (topology.from_nodes[first_edges] == junction_nodes),
+            known & (topology.to_nodes[first_edges] == junction_nodes)
+        ], [1, 0], -1)
+        reversed_edges, connected = topology.traverse(turn_edges, reverse_first)
+
+        results = []
+        for idx, (id_dbl, jnctid) in enumerate(zip(mn_df["ID"].tolist(), mn_df["JNCTID"].tolist())):
+            warnings = []
+            turn_row = MultiNetProcessor._build_turn_row(
+                context, id_dbl, jnctid, reversed_edges[idx], connected[idx], warnings)
+            results.append((turn_row, warnings))
+        return results
+
+    @staticmethod
+    def _build_turn_row(context, id_dbl, jnctid, reversed_edges, connected, warnings):
+        """Build the turn feature row for a record in the maneuver geometry table.
+
+        reversed_edges indicates which edges of the turn are traversed against their digitized direction, and connected
+        indicates whether adjacent edges share a junction.
+        """
+        streets_index = context["streets_index"]
+        max_turn_edges = context["max_turn_edges"]
+        vt_field_map = context["vt_field_map"]
+        restriction_field_names = context["restriction_field_names"]
+        restr_idxs = context["restr_idxs"]
 
         def calc_restr_field(restriction_values, restrtyp, vt):
             """Calculate restriction field values."""
-            restr_field = self.vt_field_map[vt]
+            restr_field = vt_field_map[vt]
             restriction_values[restr_idxs[restr_field]] = "Y"
             if restrtyp == "8I":
                 restriction_values[restr_idxs["AllVehicles_Restricted"]] = "Y"
             return restriction_values
 
-        # Open an insert cursor so we can add entries to the turn feature class. We will build the rows below.
-        with arcpy.da.InsertCursor(self.turns, turn_fields) as cur_t:
-
-            # Loop through the manuever geometry table and generate a turn feature for each record
-            where = f"FEATTYP IN ({', '.join([str(feattyp) for feattyp in [2101, 2103]])})"
-            turn_oid = 1
-            for row in arcpy.da.SearchCursor(self.in_data_object.mn, ["ID", "JNCTID"], where):
-                id_dbl = row[0]
-                # Cast the ID field to int64 for lookups and indexing
-                id = np.int64(id_dbl)
-                jnctid = row[1]
-
-                # Generate the values for the turn edge fields and create the turn geometry
-                edge_fields = []  # Store the Edge#FCID, Edge#FID, Edge#Pos fields to insert
-                edge1_end = "?"  # Default to ?, which indicates a data error. Will be overwritten below.
-                edge_geom = []  # Store the polyline geometry of the edges participating in the turn
-                num_edges = 0  # Count the number of edges participating
-                try:
-                    # Retrieve the turn records for this ID from the maneuver path table sorted by sequence
-                    # subset_df = self.grouped_mp_df.get_group(id).sort_values("SEQNR")
-                    subset_df = self.mp_df.loc[id]
-                except KeyError:
-                    # There were no records in the maneuver path table for this entry in the maneuver geometry feature
-                    # class. This is a data error. Just move on to the next one.
-                    arcpy.AddWarning((
-                        f"There were no records in the maneuver path table for ID {id_dbl}, which appears in the "
-                        "maneuver geometry feature class."
-                    ))
-                    continue
-                if isinstance(subset_df, pd.Series):
-                    # There was only one record with this ID, so pandas returns a series. This is invalid, as all turns
-                    # must have more than one edge.
-                    arcpy.AddWarning((
-                        f"The turn with {id_dbl} in the maneuver paths table has only one associated edge."
-                    ))
-                    continue
-                # Loop through all manuever path records associated with this ID and generate the edge fields
-                # Also query the streets table to get the edge geometry to build the geometry for the turn
-                valid = True
-                subset_df = subset_df.sort_values("SEQNR")
-                for _, record in subset_df.iterrows():
-                    if num_edges >= self.max_turn_edges:
-                        # This should technically never happen because the turn feature class is explicitly created to
-                        # allow the maximum number of edges found in the input data. However, check just to be safe.
-                        arcpy.AddWarning((
-                            f"The turn with {id_dbl} in the maneuver paths table has more associated edges than the "
-                            f"maximum allowed edges for a turn ({self.max_turn_edges}) and will be truncated."
-                        ))
-                        break
-                    street_id = record["TRPELID"]
-                    try:
-                        # Find the street record associated with this edge in the turn manuever path
-                        street = self.streets_df.loc[street_id]
-                    except KeyError:
-                        arcpy.AddWarning((
-                            f"The Streets table is missing an entry with ID {street_id}, which is used in the manuever "
-                            "path table."))
-                        valid = False
-                        break
-                    # Construct the edge fields for this segment
-                    edge_fields += [self.fc_id, street["OID"], self.edge_pos]
-                    num_edges += 1
-                    # Store the geometry for this segment
-                    edge_geom.append(self._get_street_geometry(street_id, street["OID"]))
-                    # For the first edge in the sequence, determine the value of the Edge1End field
-                    if num_edges == 1:
-                        if jnctid == street["F_JNCTID"]:
-                            edge1_end = "N"
-                        elif jnctid == street["T_JNCTID"]:
-                            edge1_end = "Y"
-                if not valid:
-                    # Something went wrong in constructing the turn. Skip it and move on.
-                    continue
-                # Add empty records for the remaining turn edge fields if this turn doesn't use the max available
-                for _ in range(self.max_turn_edges - num_edges):
-                    edge_fields += [None, None, None]
-
-                # Build turn geometry
-                turn_geom = self._build_turn_geometry(edge_geom, edge1_end, turn_oid)
-
-                # Generate the values for the restriction fields
-                # Initialize them all to None. We'll update them if relevant.
-                restriction_values = [None for _ in self.restriction_field_names]
-                try:
-                    # Populate the basic restrictions fields
-                    subset_df = r_df_turns_subset.loc[id]
-                    # Loop through all records associated with this ID and update the appropriate restriction fields
-                    if isinstance(subset_df, pd.Series):
-                        # There was only one record with this ID, so pandas returns a series
-                        restriction_values = calc_restr_field(
-                            restriction_values, subset_df['RESTRTYP'], subset_df["VT"])
-                    else:
-                        # There were multiple records with this ID, so pandas returns a dataframe.
-                        for _, record in subset_df.iterrows():
-                            restriction_values = calc_restr_field(
-                                restriction_values, record['RESTRTYP'], record["VT"])
-                except KeyError:
-                    # There were no records in the restrictions table for this ID. Just leave them as default.
-                    pass
-
-                # Construct the final row and insert it
-                turn_row = [turn_geom, id_dbl, edge1_end] + edge_fields + restriction_values
-                cur_t.insertRow(turn_row)
-                turn_oid += 1
+        # Cast the ID field to int64 for lookups and indexing
+        id = np.int64(id_dbl)
+
+        # Generate the values for the turn edge fields and create the turn geometry
+        edge_fields = []  # Store the Edge#FCID, Edge#FID, Edge#Pos fields to insert
+        edge1_end = "?"  # Default to ?, which indicates a data error. Will be overwritten below.
+        edge_geom = []  # Store the vertices of the edges participating in the turn
+        num_edges = 0  # Count the number of edges participating
+        # Retrieve the turn records for this ID from the maneuver path table sorted by sequence
+        street_ids = context["mp_index"].rows(id)["TRPELID"]
+        if len(street_ids) == 0:
+            # There were no records in the maneuver path table for this entry in the maneuver geometry feature
+            # class. This is a data error. Just move on to the next one.
+            warnings.append((
+                f"There were no records in the maneuver path table for ID {id_dbl}, which appears in the "
+                "maneuver geometry feature class."
+            ))
+            return None
+        if len(street_ids) == 1:
+            # There was only one record with this ID. This is invalid, as all turns must have more than one edge.
+            warnings.append((
+                f"The turn with {id_dbl} in the maneuver paths table has only one associated edge."
+            ))
+            return None
+
+        # For the first edge in the sequence, determine the value of the Edge1End field from which of its ends is at
+        # the turn's junction
+        if street_ids[0] in streets_index:
+            first_street = streets_index.first(street_ids[0])
+            if jnctid == first_street["F_JNCTID"]:
+                edge1_end = "N"
+            elif jnctid == first_street["T_JNCTID"]:
+                edge1_end = "Y"
+
+        # Loop through all manuever path records associated with this ID and generate the edge fields
+        # Also look up the street geometry to build the geometry for the turn
+        for street_id in street_ids:
+            if num_edges >= max_turn_edges:
+                # This should technically never happen because the turn feature class is explicitly created to
+                # allow the maximum number of edges found in the input data. However, check just to be safe.
+                warnings.append((
+                    f"The turn with {id_dbl} in the maneuver paths table has more associated edges than the "
+                    f"maximum allowed edges for a turn ({max_turn_edges}) and will be truncated."
+                ))
+                break
+            try:
+                # Find the street record associated with this edge in the turn manuever path
+                street = streets_index.first(street_id)
+            except KeyError:
+                warnings.append((
+                    f"The Streets table is missing an entry with ID {street_id}, which is used in the manuever "
+                    "path table."))
+                return None
+            # Store the geometry for this segment
+            vertices = MultiNetProcessor._get_street_vertices(context, street["OID"], warnings)
+            if vertices is None:
+                return None
+            edge_geom.append(vertices)
+            # Construct the edge fields for this segment
+            edge_fields += [context["fc_id"], street["OID"], context["edge_pos"]]
+            num_edges += 1
+        # Add empty records for the remaining turn edge fields if this turn doesn't use the max available
+        for _ in range(max_turn_edges - num_edges):
+            edge_fields += [None, None, None]
+
+        # Build turn geometry
+        turn_vertices = build_turn_vertices(edge_geom, reversed_edges)
+        if not connected:
+            warnings.append((
+                "Turn geometry may be incorrect for turn ObjectID {oid} because adjacent street segments used to "
+                "build the turn geometry do not share a junction."
+            ))
+
+        # Generate the values for the restriction fields
+        # Initialize them all to None. We'll update them if relevant.
+        restriction_values = [None for _ in restriction_field_names]
+        # Populate the basic restrictions fields. Loop through all records associated with this ID, if there are any,
+        # and update the appropriate restriction fields.
+        records = context["r_index"].rows(id)
+        for restrtyp, vt in zip(records["RESTRTYP"], records["VT"]):
+            restriction_values = calc_restr_field(restriction_values, restrtyp, vt)
+
+        # Construct the final row
+        return [turn_vertices, id_dbl, edge1_end] + edge_fields + restriction_values
 
     @timed_exec
     def _create_and_populate_road_forks(self):
         """Populate the road splits table."""
         self._add_message("Creating and populating road forks table...")
         assert self.streets_df is not None
-        assert self.mp_df is not None
+        assert self.mp_index is not None
 
         # Create the table
         road_splits_fields = self._create_road_forks_table()
 
-        # Open an insert cursor so we can add entries to the road splits table. We will build the rows below.
-        with arcpy.da.InsertCursor(self.road_splits, road_splits_fields) as cur_rs:
-
-            # Loop through the manuever geometry table and generate a turn feature for each record
-            for row in arcpy.da.SearchCursor(self.in_data_object.mn, ["ID", "JNCTID"], "FEATTYP = 9401"):
-                id_dbl = row[0]
-                # Cast the ID field to int64 for lookups and indexing
-                id = np.int64(id_dbl)
-                jnctid = row[1]
-
-                # Generate the values for the road fork fields
-                new_row = [id_dbl]
-                try:
-                    # Retrieve the turn records for this ID from the maneuver path table sorted by sequence
-                    subset_df = self.mp_df.loc[id]
-                except KeyError:
-                    # There were no records in the maneuver path table for this entry in the maneuver geometry feature
-                    # class. This is a data error. Just move on to the next one.
-                    arcpy.AddWarning((
-                        f"There were no records in the maneuver path table for ID {id_dbl}, which appears in the "
-                        "maneuver geometry feature class."
-                    ))
-                    continue
-                if isinstance(subset_df, pd.Series):
-                    # There was only one record with this ID, so pandas returns a series. This is invalid, as all
-                    # signposts must have at least three maneuvers.
-                    arcpy.AddWarning(f"The road fork maneuver path for ID {id_dbl} has too few maneuvers.")
-                    continue
-                # Loop through all manuever path records associated with this ID and generate the edge fields
-                # Also query the streets table to get the edge geometry to build the geometry for the turn
-                seqnr = []
-                subset_df = subset_df.sort_values("SEQNR")
-                valid = True
-                for _, record in subset_df.iterrows():
-                    if len(seqnr) >= self.max_road_splits:
-                        # This is a rare case where the data includes entries with MP.SEQNR=5 or more, or at least we
-                        # have more than four parts to the fork. These entries should be ignored, as we don't support
-                        # reporting 4-way (or more) forks. Truncate the road fork record and throw a warning.
-                        arcpy.AddWarning((
-                            f"The maneuver path with ID {id_dbl}, has more than {self.max_road_splits} parts. Because "
-                            f"the network dataset does not support more than {self.max_road_splits} parts, the road "
-                            "fork record will be truncated."
-                        ))
-                        break
-                    street_id = record["TRPELID"]
-                    seqnr.append(record["SEQNR"])
-                    try:
-                        # Find the street record associated with this edge in the road fork manuever path
-                        street = self.streets_df.loc[street_id]
-                    except KeyError:
-                        arcpy.AddWarning((
-                            f"The Streets table is missing an entry with ID {street_id}, which is used in the manuever "
-                            "path table."))
-                        valid = False
-                        break
-                    if jnctid == street["F_JNCTID"]:
-                        if len(seqnr) == 1:
-                            from_pos = 1
-                            to_pos = 0
-                        else:
-                            from_pos = 0
-                            to_pos = 1
-                    elif jnctid == street["T_JNCTID"]:
-                        if len(seqnr) == 1:
-                            from_pos = 0
-                            to_pos = 1
-                        else:
-                            from_pos = 1
-                            to_pos = 0
-                    else:
-                        arcpy.AddWarning((
-                            f"The maneuver geometry table's JNCTID field value {jnctid} for ID {id_dbl} does not "
-                            f"match F_JNCTID ({street['F_JNCTID']}) or T_JNCTID ({street['T_JNCTID']}) in the Streets "
-                            "table."
-                        ))
-                        valid = False
-                        break
-                    new_row += [self.fc_id, street["OID"], from_pos, to_pos]
-
-                if not valid:
-                    # Something went wrong in constructing the road fork. Skip it and move on.
-                    continue
+        # Build all the road fork rows at once and write them
+        forks_df, warnings = self._build_road_forks(self._road_fork_records())
+        for warning in warnings:
+            arcpy.AddWarning(warning)
+        self.table_io.insert_rows(self.road_splits, forks_df, road_splits_fields)
 
-                # Check that the fork had enough edges to be valid
-                if len(seqnr) < 3:
-                    arcpy.AddWarning(f"The road fork maneuver path for ID {id_dbl} has too few maneuvers.")
-                    continue
+    def _road_fork_records(self):
+        """Return the road fork records from the maneuver geometry table."""
+        fields = ["ID", "JNCTID"]
+        mn_df = self._read_input_table(self.in_data_object.mn, fields, "FEATTYP = 9401")
+        return self._limit_to_rebuilt_maneuvers(mn_df)
 
-                # Check that the SEQNR values were sequential integers starting at 1.
-                if seqnr != list(range(1, len(seqnr) + 1)):
-                    arcpy.AddWarning((
-                        f"The SEQNR values in the maneuver path table for ID {id_dbl} are not sequential integers "
-                        "starting at 1."
-                    ))
-                    continue
+    def _build_road_forks(self, mn_df):
+        """Build the road forks table rows for all the road fork records from the maneuver geometry table.
 
-                # Add empty records for the remaining road fork fields if this fork doesn't use the max available
-                for _ in range(self.max_road_splits - len(seqnr)):
-                    new_row += [None, None, None, None]
+        The edges of each road fork are the records for its ID in the maneuver path table in SEQNR order. The road forks
+        are built all at once with array operations rather than one at a time.
 
-                # Insert the road fork row
-                cur_rs.insertRow(new_row)
+        Returns:
+            A tuple of a dataframe of the road forks table rows in the order of mn_df and a list of warnings about the
+            road forks that were truncated or skipped
+        """
+        max_road_splits = self.max_road_splits
+        warnings = []
+        ids = mn_df["ID"].to_numpy()
+        jnctids = mn_df["JNCTID"].to_numpy(dtype=float)
+
+        # Explode the road forks into a (fork, part) row for each of their records in the maneuver path table, which are
+        # already sorted by SEQNR in the index, keeping only the records for the parts the road forks table supports
+        starts, stops = self.mp_index.group_bounds(ids)
+        num_records = stops - starts
+        num_edges = np.minimum(num_records, max_road_splits)
+        forks = np.repeat(np.arange(len(ids)), num_edges)
+        parts = np.arange(len(forks)) - np.repeat(np.cumsum(num_edges) - num_edges, num_edges)
+        mp_rows = starts[forks] + parts
+        parts_df = pd.DataFrame({"TRPELID": self.mp_index["TRPELID"][mp_rows]})
+
+        # Look up the ObjectID and junctions of the street of every part in one join
+        streets_df = self.streets_df[~self.streets_df.index.duplicated()]
+        parts_df = parts_df.join(streets_df[["OID", "F_JNCTID", "T_JNCTID"]], "TRPELID")
+        is_missing = parts_df["OID"].isna().to_numpy()
+        # The first edge leads into the junction of the road fork, and the others lead away from it
+        at_from = jnctids[forks] == parts_df["F_JNCTID"].to_numpy(dtype=float)
+        at_to = jnctids[forks] == parts_df["T_JNCTID"].to_numpy(dtype=float)
+        part_frm_pos = np.where(at_from, parts == 0, parts != 0).astype(float)
+
+        # Spread the parts into 2D arrays with a row for each road fork and a column for each part
+        shape = (len(ids), max_road_splits)
+        oids, frm_pos, seqnrs = np.full(shape, np.nan), np.full(shape, np.nan), np.full(shape, -1)
+        oids[forks, parts] = parts_df["OID"].to_numpy(dtype=float)
+        frm_pos[forks, parts] = part_frm_pos
+        seqnrs[forks, parts] = self.mp_index["SEQNR"][mp_rows]
+        # Find the first part of each road fork whose street is missing or doesn't touch the junction
+        is_bad = is_missing | ~(at_from | at_to)
+        first_bad = np.full(len(ids), max_road_splits)
+        np.minimum.at(first_bad, forks[is_bad], parts[is_bad])
+        bad_is_missing = np.zeros(shape, dtype=bool)
+        bad_is_missing[forks, parts] = is_missing
+
+        # Flag the road forks that have to be skipped, checking in the same order as the road forks would be built
+        skipped = np.zeros(len(ids), dtype=bool)
+
+        def flag(mask):
+            """Flag the road forks in the mask that haven't already been skipped and return the mask of those."""
+            mask = mask & ~skipped
+            skipped[mask] = True
+            return mask
+
+        no_records = flag(num_records == 0)
+        too_few = flag(num_records == 1)
+        has_bad = first_bad < max_road_splits
+        bad_missing = bad_is_missing[np.arange(len(ids)), np.minimum(first_bad, max_road_splits - 1)]
+        missing = flag(has_bad & bad_missing)
+        mismatch = flag(has_bad & ~bad_missing)
+        # This is a rare case where the data includes entries with MP.SEQNR=5 or more, or at least we have more than
+        # four parts to the fork. These entries should be ignored, as we don't support reporting 4-way (or more) forks.
+        # Truncate the road fork records and throw a warning.
+        truncated = (num_records > max_road_splits) & ~skipped
+        too_few |= flag(num_edges < 3)
+        # Check that the SEQNR values were sequential integers starting at 1.
+        not_sequential = flag(((seqnrs != np.arange(1, max_road_splits + 1)) & (seqnrs >= 0)).any(axis=1))
+
+        if no_records.any():
+            warnings.append((
+                f"There were no records in the maneuver path table for {no_records.sum()} IDs, which appear in the "
+                f"maneuver geometry feature class. ID: {summarize_ids(ids[no_records])}"
+            ))
+        if truncated.any():
+            warnings.append((
+                f"{truncated.sum()} maneuver paths have more than {max_road_splits} parts. Because the network "
+                f"dataset does not support more than {max_road_splits} parts, the road fork records will be "
+                f"truncated. ID: {summarize_ids(ids[truncated])}"
+            ))
+        if missing.any():
+            missing_ids = np.unique(parts_df.loc[is_missing & missing[forks], "TRPELID"].to_numpy())
+            warnings.append((
+                f"The Streets table is missing entries for {len(missing_ids)} IDs, which are used in the manuever "
+                f"path table, so {missing.sum()} road forks were skipped. Missing ID: {summarize_ids(missing_ids)}"
+            ))
+        if mismatch.any():
+            warnings.append((
+                f"The maneuver geometry table's JNCTID field values for {mismatch.sum()} road forks do not match "
+                f"F_JNCTID or T_JNCTID in the Streets table, so they were skipped. ID: {summarize_ids(ids[mismatch])}"
+            ))
+        if too_few.any():
+            warnings.append((
+                f"{too_few.sum()} road fork maneuver paths have too few maneuvers and were skipped. ID: "
+                f"{summarize_ids(ids[too_few])}"
+            ))
+        if not_sequential.any():
+            warnings.append((
+                f"The SEQNR values in the maneuver path table for {not_sequential.sum()} road forks are not "
+                f"sequential integers starting at 1, so they were skipped. ID: {summarize_ids(ids[not_sequential])}"
+            ))
+
+        valid = ~skipped
+        forks_df = road_forks_df(self.fc_id, oids[valid], frm_pos[valid], num_edges[valid])
+        forks_df.insert(0, "ID", ids[valid])
+        return forks_df, warnings
 
     @timed_exec
     def _populate_signposts_and_signposts_streets(self):
         """Populate the Signposts feature class."""
         self._add_message("Populating Signposts feature class and Signposts_Streets table...")
         assert self.streets_df is not None
+        assert self.sp_df is not None
+
+        # Build the text fields of all signposts at once, and build the geometry and Signposts_Streets rows in worker
+        # processes (or serially if there is only one worker) from partitions of the sp table with whole groups of
+        # records for each ID
+        context, partitions, sign_text, truncated_df = self._signpost_worker_inputs()
+        signpost_oids = np.zeros(len(sign_text), dtype=np.int64)
+
+        # Write the finished rows as they come back from the workers. The writer collects them and writes them in
+        # chunks, each in its own edit session because we're writing to more than one gdb item at once. If anything
+        # fails, the edits of the chunk being written are abandoned.
+        with SignpostWriter(
+            self.table_io, os.path.join(self.out_folder, self.gdb_name), self.signposts, self.signposts_streets,
+            self.max_signpost_branches
+        ) as writer:
+            for signpost_oid, (signpost_row, signposts_streets_rows) in self._emit_worker_results(
+                map_partitions(self._build_signpost_rows, context, partitions, self.num_workers), self.signposts
+            ):
+                signpost_vertices, signpost_num = signpost_row
+                writer.add(signpost_oid, signpost_vertices, sign_text[signpost_num].tolist(), signposts_streets_rows)
+                signpost_oids[signpost_num] = signpost_oid
+
+        self._warn_truncated_signposts(
+            truncated_df, signpost_oids,
+            "There were too many records in the sign info table for {count} IDs, which appear in the sign path table, "
+            "so their signposts were truncated. ID (signpost ObjectID):"
+        )
 
-        # Read the sp table into a dataframe
-        fields = ["ID", "TRPELID", "SEQNR"]
-        with arcpy.da.SearchCursor(self.in_data_object.sp, fields) as cur:
-            # Explicitly read it in using int64 to convert the double-based ID field for easy indexing and lookups
-            sp_df = pd.DataFrame(cur, columns=fields, dtype=np.int64)
-        # Group the sp_df by ID for quick lookups
-        grouped_sp_df = sp_df.groupby(["ID"], sort=True)
+    def _signpost_worker_inputs(self):
+        """Return the shared context and partitions used by the workers building signposts and the signpost text.
 
+        Returns:
+            A tuple of the shared context, the partitions of the sp table, and the signpost text and truncated signposts
+            as returned by _build_sign_text
+        """
         # Read the si table into a dataframe
         fields = ["ID", "INFOTYP", "TXTCONT", "TXTCONTLC", "CONTYP", "SEQNR", "DESTSEQ", "RNPART"]
-        with arcpy.da.SearchCursor(self.in_data_object.si, fields) as cur:
-            si_df = pd.DataFrame(cur, columns=fields)
-        # Cast the ID column from its original double to an explicit int64 so we can use it for indexing and lookups
-        si_df = si_df.astype({"ID": np.int64})
-        # Index the dataframe by ID for quick retrieval later, and sort the index to make those lookups even faster
-        si_df.set_index("ID", inplace=True)
-        si_df.sort_index(inplace=True)
-
-        def calc_si_fields(si_record, exit_name, toward_fields, branch_fields):
-            """Update signpost-related fields."""
-            info_typ = si_record["INFOTYP"]
-            txt_cont = si_record["TXTCONT"]
-            if info_typ == "4E":
-                exit_name = txt_cont
-            elif info_typ in ["9D", "4I"]:
-                lang = LNG_CODES.get(si_record["TXTCONTLC"], "")
-                toward_fields += [txt_cont, lang]
-            elif info_typ in ["6T", "RN"]:
-                lang = LNG_CODES.get(si_record["TXTCONTLC"], "")
-                if si_record["CONTYP"] == 2:
-                    toward_fields += [txt_cont, lang]
-                else:
-                    branch_fields += [txt_cont, None, lang]
-            return exit_name, toward_fields, branch_fields
-
-        try:
-            # Must open an edit session because we're writing to more than one gdb item at once.
-            edit = arcpy.da.Editor(os.path.join(self.out_folder, self.gdb_name))
-            # Set with_undo=False to enhance performance
-            # Set multiuser_mode=False to make it work on SDE (unversioned only)
-            edit.startEditing(with_undo=False, multiuser_mode=False)
-            edit.startOperation()
-
-            # Create a list of signposts fields
-            signpost_fields = ["SHAPE@", "ExitName"]
-            for i in range(self.max_signpost_branches):
-                signpost_fields += [f"Branch{i}", f"Branch{i}Dir", f"Branch{i}Lng"]
-            for i in range(self.max_signpost_branches):
-                signpost_fields += [f"Toward{i}", f"Toward{i}Lng"]
-            # Open an insert cursor so we can add entries to the signposts feature class. We will build the rows below.
-            with arcpy.da.InsertCursor(self.signposts, signpost_fields) as cur_sp:
-
-                # Open an insert cursor so we can add entries to the signposts_streets table. We will generate entries
-                # while building the signpost geometry from the streets based on records in the input signposts table.
-                si_fields = ["SignpostID", "Sequence", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"]
-                with arcpy.da.InsertCursor(self.signposts_streets, si_fields) as cur_si:
-
-                    # For each ID in the input sp table, grab the records and build the geometry
-                    signpost_oid = 1
-                    for id, group in grouped_sp_df:
-                        if isinstance(id, tuple):
-                            # In newer versions of pandas, groupby keys come back as tuples, so just get the first item
-                            # in the tuple
-                            id = id[0]
-                        exit_name = None
-                        branch_fields = []
-                        toward_fields = []
-
-                        # Get the records for this ID from the input si table to populate the text fields
-                        try:
-                            # Retrieve the records for this ID from the sign info table sorted by relevant fields
-                            subset_df = si_df.loc[id]
-                        except KeyError:
-                            # There were no records in the sign info table for this entry in the sign path table. This
-                            # is a data error. Just move on to the next one.
-                            arcpy.AddWarning((
-                                f"There were no records in the sign info table for ID {float(id)}, which appears in "
-                                "the sign path table."
-                            ))
-                            continue
-                        if isinstance(subset_df, pd.Series):
-                            # There was only one record with this ID, so pandas returns a series
-                            exit_name, toward_fields, branch_fields = calc_si_fields(
-                                subset_df, exit_name, toward_fields, branch_fields)
-                        else:
-                            subset_df = subset_df.sort_values(["SEQNR", "DESTSEQ", "RNPART"])
-                            # There were multiple records with this ID, so pandas returns a dataframe.
-                            for _, record in subset_df.iterrows():
-                                exit_name, toward_fields, branch_fields = calc_si_fields(
-                                    record, exit_name, toward_fields, branch_fields)
-
-                        # Truncate the record if we have too many branch and toward fields
-                        truncate = False
-                        if len(branch_fields) > 3 * self.max_signpost_branches:
-                            truncate = True
-                            branch_fields = branch_fields[:3 * self.max_signpost_branches]
-                        if len(toward_fields) > 2 * self.max_signpost_branches:
-                            truncate = True
-                            toward_fields = toward_fields[:2 * self.max_signpost_branches]
-                        if truncate:
-                            arcpy.AddWarning((
-                                f"There were too many records in the sign info table for ID {float(id)}, which appears "
-                                f"in the sign path table. The signpost (ObjectID {signpost_oid}) will be truncated."
-                            ))
-
-                        # Fill in remaining branch and toward fields with None if the record doesn't use all of them
-                        for _ in range(3 * self.max_signpost_branches - len(branch_fields)):
-                            branch_fields.append(None)
-                        for _ in range(2 * self.max_signpost_branches - len(toward_fields)):
-                            toward_fields.append(None)
-
-                        # Query the streets table to get the edge geometry and relevant fields to build the geometry
-                        # for the signpost and the fields in the signposts_streets table
-                        edge_info = []
-                        group.sort_values("SEQNR", inplace=True)
-                        valid = True
-                        for _, record in group.iterrows():
-                            street_id = record["TRPELID"]
-                            try:
-                                # Find the street record associated with this edge in the turn manuever path
-                                street = self.streets_df.loc[street_id]
-                            except KeyError:
-                                arcpy.AddWarning((
-                                    f"The Streets table is missing an entry with ID {street_id}, which is used in the "
-                                    "signpost table."))
-                                valid = False
-                                break
-                            # Store the geometry for this segment
-                            edge_info.append(
-                                (self._get_street_geometry(street_id, street["OID"]), record["SEQNR"], street["OID"]))
-                        if not valid:
-                            # Something went wrong in constructing the signpost. Skip it and move on.
-                            continue
-                        if len(edge_info) < 2:
-                            arcpy.AddWarning(f"The input signpost paths had fewer than two entries for ID {float(id)}.")
-                            continue
-
-                        # Build signpost geometry and populate the associated entries in the Signposts_Streets table
-                        signpost_geom = self._build_signpost_geometry(edge_info, signpost_oid, cur_si)
-
-                        # Construct the final signpost row and insert it
-                        signpost_row = [signpost_geom, exit_name] + branch_fields + toward_fields
-                        cur_sp.insertRow(signpost_row)
-                        signpost_oid += 1
-
-            # Stop the editing operation and save edits
-            edit.stopOperation()
-            edit.stopEditing(True)
-
-        # Deal with terrible problems
-        except Exception as ex:  # pylint:disable=broad-except
-            # Stop the editing operation and abandon changes
-            if 'edit' in locals():
-                if edit.isEditing:
-                    edit.stopOperation()
-                    edit.stopEditing(False)
-            # Then pass through the raised exception
-            raise ex
-
-    def _build_signpost_geometry(self, edge_info, signpost_oid, cur_si):
-        """Create the polyline geometry of a signpost from its component edge segments and add associated records to the
-        signposts_streets table.
-
-        edge_info is a list of tuples of (Street geometry, SEQNR, street OID)
+        si_df = self._read_input_table(self.in_data_object.si, fields)
+        si_df = si_df[si_df["ID"].isin(self.sp_df["ID"])]
+
+        # Number the signposts by ID
+        signpost_ids, signposts = np.unique(si_df["ID"].to_numpy(), return_inverse=True)
+        sign_text, truncated_df = self._build_sign_text(si_df.assign(Signpost=signposts), len(signpost_ids))
+        truncated_df.insert(1, "ID", signpost_ids[truncated_df["Signpost"]].astype(float))
+        # Identify the signpost of each sp record. IDs without any records in the si table are numbered -1.
+        sp_ids = self.sp_df["ID"].to_numpy()
+        pos = np.minimum(np.searchsorted(signpost_ids, sp_ids), max(len(signpost_ids) - 1, 0))
+        has_records = signpost_ids[pos] == sp_ids if len(signpost_ids) else np.zeros(len(sp_ids), dtype=bool)
+        sp_df = self.sp_df.assign(Signpost=np.where(has_records, pos, -1))
+        return self._worker_context(), partition_groups(sp_df, ["ID"], self.num_workers), sign_text, truncated_df
+
+    def _build_sign_text(self, si_df, num_signposts):
+        """Build the ExitName, Branch*, and Toward* fields of all signposts from the si records.
+
+        Args:
+            si_df: Dataframe of the si records with a Signpost column numbering the signposts from 0
+            num_signposts: Number of signposts
+
+        Returns:
+            A tuple of a 2D object array with a row for each signpost and a column for each Signposts field after the
+            shape, and a dataframe of the truncated signposts with a Signpost column
         """
-        first_row = [signpost_oid, edge_info[0][1], self.fc_id, edge_info[0][2]]
-        first_edge = edge_info[0][0]
-        second_edge = edge_info[1][0]
-        reverse_first = False
-        # Determine the correct direction of the first edge by matching it up with the second
-        if first_edge.firstPoint.equals(second_edge.firstPoint) or \
-                first_edge.firstPoint.equals(second_edge.lastPoint):
-            reverse_first = True
-
-        # Trim the first edge to the last 25% of the street feature
-        # Then initialize the signpost geometry with the first edge's truncated list of vertices
-        # Also append the appropriate values for the EdgeFrmPos and EdgeToPos fields
-        if reverse_first:
-            first_edge = first_edge.segmentAlongLine(0, 0.25, use_percentage=True)
-            first_row += [1, 0]
-            signpost_vertices = self._polyline_to_points(first_edge)
-            signpost_vertices.reverse()
-        else:
-            first_edge = first_edge.segmentAlongLine(0.75, 1, use_percentage=True)
-            first_row += [0, 1]
-            signpost_vertices = self._polyline_to_points(first_edge)
-
-        # Add the first row's record to the Signposts_Streets table
-        cur_si.insertRow(first_row)
-
-        # For the remaining edges, explode them to points and determine directionality by checking which end coincides
-        # with the geometry of the previous edge.
-        geom_error = False
-        for idx, edge_item in enumerate(edge_info[1:]):
-            new_row = [signpost_oid, edge_item[1], self.fc_id, edge_item[2]]
-            edge = edge_item[0]
-            if edge.firstPoint.equals(signpost_vertices[-1]):
-                # The edge is in the correct order already
-                reverse_edge = False
-            elif edge.lastPoint.equals(signpost_vertices[-1]):
-                # Reverse the order of the points for this edge
-                reverse_edge = True
-            else:
-                # The endpoints of adjacent segments don't match up at all. This is a data error.
-                # Don't fail the tool, just continue and build the geometry but indicate the problem with a warning.
-                reverse_edge = False
-                geom_error = True
-
-            if idx == len(edge_info) - 2:
-                # Do special handling of the last edge to trim the geometry to only the first 25%
-                if reverse_edge:
-                    edge = edge.segmentAlongLine(0.75, 1, use_percentage=True)
-                else:
-                    edge = edge.segmentAlongLine(0, 0.25, use_percentage=True)
-
-            edge_vertices = self._polyline_to_points(edge)
-            if reverse_edge:
-                edge_vertices.reverse()
-                new_row += [1, 0]
-            else:
-                new_row += [0, 1]
+        # Sort the records for each signpost by the order they appear on the sign
+        si_df = si_df.sort_values(["Signpost", "SEQNR", "DESTSEQ", "RNPART"], kind="stable")
+        info_types = si_df["INFOTYP"].to_numpy(dtype=object)
+
+        # The last exit name record for a signpost sets its exit name
+        exit_names = np.full(num_signposts, None, dtype=object)
+        exits_df = si_df[info_types == "4E"].drop_duplicates("Signpost", keep="last")
+        exit_names[exits_df["Signpost"].to_numpy()] = exits_df["TXTCONT"].to_numpy(dtype=object)
+
+        # Direction and place names are towards. Route numbers and street names are towards if their connection type is
+        # 2 and branches otherwise.
+        is_route = np.isin(info_types, ["6T", "RN"])
+        is_branch = is_route & (si_df["CONTYP"].to_numpy() != 2)
+        is_entry = is_route | np.isin(info_types, ["9D", "4I"])
+        entries_df = pd.DataFrame({
+            "Signpost": si_df["Signpost"].to_numpy()[is_entry],
+            "IsBranch": is_branch[is_entry],
+            "Text": si_df["TXTCONT"].to_numpy(dtype=object)[is_entry],
+            "Dir": None,
+            "Lng": si_df["TXTCONTLC"].map(LNG_CODES).fillna("").to_numpy(dtype=object)[is_entry]
+        })
+        text, truncated = pivot_sign_text(entries_df, num_signposts, self.max_signpost_branches)
+        truncated_df = pd.DataFrame({"Signpost": np.flatnonzero(truncated)})
+        return np.column_stack([exit_names, text]), truncated_df
 
-            # Append the vertices of this edge to our growing list to model the turn
-            signpost_vertices += edge_vertices
+    @staticmethod
+    def _build_signpost_rows(context, sp_df):
+        """Build the signpost geometry and Signposts_Streets rows for a partition of the sp table.
 
-            # Insert the record into the signposts_streets table
-            cur_si.insertRow(new_row)
+        This may run in a worker process, so it only uses the data passed in with the partition and the shared context.
 
-        if geom_error:
-            arcpy.AddWarning((
-                f"Signpost geometry may be incorrect for Signpost ObjectID {signpost_oid} because the geometry of "
-                "adjacent street segments used to build the signpost geometry did not have coincident endpoints."
+        Returns:
+            A list with a (row, warnings) tuple for each signpost ID. The row is a tuple of a list of an (N, 2) array of
+            the signpost's vertices and the signpost's number, and the list of Signposts_Streets rows without their
+            SignpostID value. The row is None if the signpost is skipped.
+        """
+        # Work out the direction each edge is traversed for all the signposts in the partition at once from the
+        # junctions at the ends of the streets, with the records for each signpost in SEQNR order
+        topology = context["streets_topology"]
+        sp_df = sp_df.sort_values(["ID", "SEQNR"], kind="stable")
+        ids = sp_df["ID"].to_numpy()
+        starts = np.flatnonzero(np.concatenate(([True], ids[1:] != ids[:-1])))
+        reversed_edges, connected = topology.traverse(
+            topology.sequence_edges(sp_df["TRPELID"].to_numpy(), starts, np.append(starts[1:], len(ids))))
+
+        results = []
+        # Group the sp_df by ID
+        for idx, (id, group) in enumerate(sp_df.groupby(["ID"], sort=True)):
+            if isinstance(id, tuple):
+                # In newer versions of pandas, groupby keys come back as tuples, so just get the first item in the tuple
+                id = id[0]
+            warnings = []
+            signpost_rows = MultiNetProcessor._build_signpost_row(
+                context, id, group, reversed_edges[idx], connected[idx], warnings)
+            results.append((signpost_rows, warnings))
+        return results
+
+    @staticmethod
+    def _build_signpost_row(context, id, group, reversed_edges, connected, warnings):
+        """Build the signpost geometry and Signposts_Streets rows for a signpost ID in the sp table.
+
+        The group's records are in SEQNR order. reversed_edges indicates which of their edges are traversed against
+        their digitized direction, and connected indicates whether adjacent edges share a junction.
+        """
+        streets_index = context["streets_index"]
+
+        signpost_num = group["Signpost"].iloc[0]
+        if signpost_num < 0:
+            # There were no records in the sign info table for this entry in the sign path table. This
+            # is a data error. Just move on to the next one.
+            warnings.append((
+                f"There were no records in the sign info table for ID {float(id)}, which appears in "
+                "the sign path table."
             ))
+            return None
+
+        # Look up the edge geometry and relevant fields to build the geometry for the signpost and the fields in the
+        # signposts_streets table
+        edge_info = []
+        for _, record in group.iterrows():
+            street_id = record["TRPELID"]
+            try:
+                # Find the street record associated with this edge in the turn manuever path
+                street = streets_index.first(street_id)
+            except KeyError:
+                warnings.append((
+                    f"The Streets table is missing an entry with ID {street_id}, which is used in the "
+                    "signpost table."))
+                return None
+            # Store the geometry for this segment
+            vertices = MultiNetProcessor._get_street_vertices(context, street["OID"], warnings)
+            if vertices is None:
+                return None
+            edge_info.append((vertices, record["SEQNR"], street["OID"]))
+        if len(edge_info) < 2:
+            warnings.append(f"The input signpost paths had fewer than two entries for ID {float(id)}.")
+            return None
 
-        # Generate a polyline from the ordered vertices
-        signpost_vertex_array = arcpy.Array(signpost_vertices)
-        return arcpy.Polyline(signpost_vertex_array, self.in_data_object.sr)
+        # Build signpost geometry and the associated entries in the Signposts_Streets table
+        signpost_vertices, signposts_streets_rows = MultiNetProcessor._build_signpost_geometry(
+            edge_info, reversed_edges, context["fc_id"])
+        if not connected:
+            warnings.append((
+                "Signpost geometry may be incorrect for Signpost ObjectID {oid} because adjacent street segments "
+                "used to build the signpost geometry do not share a junction."
+            ))
+
+        # The text fields were built for all signposts up front, so just identify the signpost for them
+        signpost_row = [signpost_vertices, signpost_num]
+        return signpost_row, signposts_streets_rows
+
+    @staticmethod
+    def _build_signpost_geometry(edge_info, reversed_edges, fc_id):
+        """Create the geometry of a signpost from its component edges and the associated Signposts_Streets rows.
+
+        edge_info is a list of tuples of (Street vertices, SEQNR, street OID), and reversed_edges is a sequence of
+        booleans indicating which edges are traversed against their digitized direction.
+
+        Returns:
+            An (N, 2) array of the signpost's vertices and a list of Signposts_Streets rows without their SignpostID
+            value
+        """
+        signpost_vertices = build_signpost_vertices([edge_item[0] for edge_item in edge_info], reversed_edges)
+        # Set the EdgeFrmPos and EdgeToPos fields based on the direction each edge is traversed
+        signposts_streets_rows = [
+            [seqnr, fc_id, oid] + ([1, 0] if reverse_edge else [0, 1])
+            for (_, seqnr, oid), reverse_edge in zip(edge_info, reversed_edges)
+        ]
+        return signpost_vertices, signposts_streets_rows
 
     @timed_exec
     def _create_and_build_nd(self):
@@ -0,0 +1,501 @@
+"""Benchmark the stages of the street data processing tools on synthetic datasets and detect performance regressions
+
+   By default, the benchmarks run the pure pandas and numpy stages of the HERE and MultiNet processors on synthetic
+   datasets generated in memory by synthetic_data.py, so they don't need arcpy or any input data. The input tables are
+   served from the in-memory dataframes instead of being read with cursors, and the output rows are built but not
+   written. The --full option instead writes the synthetic datasets to disk and runs the complete tools, which requires
+   arcpy.
+
+   Turns are also written to a local table and updated in place the way a delta run updates the turns of a previous
+   output, to compare the time spent building the turns with the time spent applying the changes, both when all the
+   turns are rebuilt and when only those referencing a changed street are.
+
+   The wall time, CPU time, peak memory, and rows read and written by each stage are appended to a JSON lines results
+   file, one record per stage, along with the git revision, the dataset size, and the versions of the main packages.
+   The --compare option compares the run with a baseline run from the results file and exits with status 1 if any
+   stage got significantly slower.
+
+   Examples:
+       python run_benchmarks.py --links 10000 100000 --repeat 3
+       python run_benchmarks.py --products here --links 1000000 --workers 4 --compare
+
+   Copyright 2025 Esri
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+       http://www.apache.org/licenses/LICENSE-2.0
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.'''
+"""
+import os
+import sys
+import json
+import uuid
+import platform
+import argparse
+import datetime
+import tempfile
+import subprocess
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import synthetic_data  # noqa: E402
+from helpers import PROFILER, UnitType, TimeZoneType, LocalTableIO, DeltaTableIO, StageCheckpoint, compact_df, \
+    map_partitions, arcpy  # noqa: E402
+from geometry import vertices_to_wkb  # noqa: E402
+from Process_HERENavstreetsShp import HereNavstreetsShpProcessor  # noqa: E402
+from Process_MultiNet import MultiNetProcessor  # noqa: E402
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_RESULTS_FILE = os.path.join(BENCHMARKS_DIR, "benchmark_results.jsonl")
+DEFAULT_LINKS = [10000, 100000]  # Default numbers of streets in the benchmarked datasets
+REGRESSION_THRESHOLD = 0.2  # Default fraction by which a stage must slow down to be reported as a regression
+MIN_REGRESSION_SECONDS = 0.05  # Stages must also slow down by at least this much, so timer noise isn't reported
+DEFAULT_DELTA_FRACTION = 0.01  # Default fraction of the streets whose geometry changes in the delta benchmarks
+
+
+class SyntheticTableIO(LocalTableIO):
+    """Serve a processor's input tables from the in-memory dataframes of a synthetic dataset instead of files."""
+
+    def __init__(self, tables):
+        """Initialize with a {table path: dataframe} dictionary of the input tables."""
+        super().__init__()
+        self.tables = tables
+
+    def _read_file(self, table):
+        """Return the in-memory dataframe of the table."""
+        return self.tables[table], self.oid_field
+
+
+class SilentProcessorMixin:
+    """Don't report progress messages during benchmarks."""
+
+    @staticmethod
+    def _add_message(msg):
+        """Ignore the message."""
+
+
+class BenchmarkHereProcessor(SilentProcessorMixin, HereNavstreetsShpProcessor):
+    """HERE processor reading its input tables from a synthetic dataset in memory."""
+
+
+class BenchmarkMultiNetProcessor(SilentProcessorMixin, MultiNetProcessor):
+    """MultiNet processor reading its input tables from a synthetic dataset in memory."""
+
+
+def _build_rows(processor, build_func, context, partitions):
+    """Build the output rows of a stage the way the tools do, but count them instead of writing them."""
+    num_rows = 0
+    for results in map_partitions(build_func, context, partitions, processor.num_workers):
+        for row, _ in results:
+            if row is None:
+                continue
+            geometry_row = row[0] if isinstance(row, tuple) else row
+            geometry_row[0] = vertices_to_wkb(geometry_row[0])
+            num_rows += 1
+    PROFILER.add_rows(rows_written=num_rows)
+    return num_rows
+
+
+def _build_turns_df(processor, context, partitions, fields):
+    """Build the turn rows the way the tools do and return them as a dataframe with a column for each turn field."""
+    rows = []
+    for results in map_partitions(processor._build_turn_rows, context, partitions, processor.num_workers):
+        for row, _ in results:
+            if row is not None:
+                row[0] = vertices_to_wkb(row[0])
+                rows.append(row)
+    return pd.DataFrame.from_records(rows, columns=fields)
+
+
+def benchmark_delta_turns(processor, read_turns_func, fields_func, delta_fraction, seed, work_folder):
+    """Benchmark updating the turns of a previous output in place in a delta run.
+
+    The turns are first written to a local table in full, like in a new run, which is the "write turns" stage. They're
+    then built again and applied to the table with a DeltaTableIO as if the geometry of a fraction of the streets had
+    changed, so the turns referencing those streets are rebuilt and the others are left alone. In the "delta turns"
+    stage, all the turns are built again, like in a delta run in which other input tables changed as well. In the
+    "delta turns limited" stage, only the turns referencing a changed street are, like in a delta run in which only the
+    streets changed. Both stages are split into building the turns and applying the changes, which compares them with
+    the rows in the table and writes only the ones that changed. Tables are written as Parquet files, which is faster
+    than writing to a geodatabase, so the write times are lower bounds of those of the tools.
+
+    Args:
+        processor: Benchmark processor whose streets were read
+        read_turns_func: Function reading the turn tables and returning the context and partitions of the turn workers
+        fields_func: Function returning the turn fields for the context
+        delta_fraction: Fraction of the streets whose geometry changes
+        seed: Seed of the random choice of the changed streets
+        work_folder: Folder in which the table is written
+    """
+    table = os.path.join(work_folder, "Benchmark.gdb", "RestrictedTurns")
+    table_io = LocalTableIO()
+    if os.path.exists(table + ".parquet"):
+        os.remove(table + ".parquet")
+    context, partitions = read_turns_func()
+    turns_df = _build_turns_df(processor, context, partitions, fields_func(context))
+    with PROFILER.stage("write turns"):
+        table_io.insert_rows(table, turns_df, fields_func(context))
+    del turns_df
+
+    reshaped = np.random.default_rng(seed).choice(
+        len(processor.streets_df), int(len(processor.streets_df) * delta_fraction), replace=False)
+    reshaped_oids = processor.streets_df["OID"].to_numpy()[reshaped]
+    for stage, rebuilt_street_ids in [
+        ("delta turns", None), ("delta turns limited", processor.streets_df.index.to_numpy()[reshaped])
+    ]:
+        processor.rebuilt_street_ids = rebuilt_street_ids
+        scoped_tables = None if rebuilt_street_ids is None else [table]
+        delta_table_io = DeltaTableIO(table_io, [table], reshaped_oids, scoped_tables=scoped_tables,
+                                      scope_oids=reshaped_oids)
+        with PROFILER.stage(stage):
+            with PROFILER.stage("build"):
+                context, partitions = read_turns_func()
+                turns_df = _build_turns_df(processor, context, partitions, fields_func(context))
+            delta_table_io.insert_rows(table, turns_df, fields_func(context))
+            delta_table_io.apply([table])
+            delta_table_io.close([table])
+        del turns_df
+    processor.rebuilt_street_ids = None
+
+
+def _count_rows_read(chunks):
+    """Pass through the dataframe chunks of a table read with pandas, adding their rows to the rows read."""
+    for chunk in chunks:
+        PROFILER.add_rows(rows_read=len(chunk))
+        yield chunk
+
+
+def _setup_processor(processor, network, tables, in_data):
+    """Prepare a benchmark processor as if the output Streets feature class had been created and populated.
+
+    The CSV tables of the dataset are written to the work folder, since the tools read those with pandas directly, and
+    the other tables are read from memory.
+    """
+    processor.table_io = SyntheticTableIO({})
+    for attr, df in tables.items():
+        path = getattr(in_data, attr)
+        if path.endswith(".csv"):
+            df.to_csv(path, index=False)
+        else:
+            processor.table_io.tables[path] = df
+    # All stages are pending, as in a new run, so the tables shared by several stages are kept for all of them
+    processor.checkpoint = StageCheckpoint(
+        os.path.join(processor.out_folder, "Benchmark_checkpoint.json"), processor._pipeline_stages(), {})
+    processor.fc_id = 1
+    processor.street_geometries = network.geometry_store(np.arange(1, network.num_links + 1))
+
+
+def benchmark_here(network, tables, num_workers, work_folder, delta_fraction=0, seed=0):
+    """Run the benchmarked stages of the HERE processor on a synthetic dataset in memory."""
+    in_data = synthetic_data.here_input_data(work_folder)
+    processor = BenchmarkHereProcessor(
+        work_folder, "Benchmark.gdb", in_data, UnitType.Imperial, TimeZoneType.NoTimeZone, build_network=False,
+        num_workers=num_workers)
+    _setup_processor(processor, network, tables, in_data)
+    streets_df = tables["streets"]
+    offsets, coords = network.link_vertices(np.arange(network.num_links))
+    meters = network.link_meters(offsets, coords)
+
+    with PROFILER.stage("speed profiles"):
+        h_fields = in_data.required_fields[in_data.historical_speed_profiles_table][1:]
+        spd_df = processor._read_speed_profiles(h_fields)
+        PROFILER.add_rows(rows_read=len(spd_df))
+        processor.spd_df = processor._index_speed_profiles(spd_df, h_fields)
+        del spd_df
+    with PROFILER.stage("historical traffic"):
+        streets_ids = np.unique(streets_df["LINK_ID"].to_numpy())
+        processor._spill_traffic_chunks(_count_rows_read(processor._read_link_ref_files(streets_ids)), work_folder)
+        processor.traff_store.close()
+        processor.traff_store = None
+    with PROFILER.stage("cndmod"):
+        processor.cndmod_df, processor.preferred_dir_df, processor.prohib_dir_df = \
+            processor._read_and_process_cndmod_tables()
+    with PROFILER.stage("streets fields"):
+        alt_streets_df = processor._read_and_index_alt_streets()
+        z_levels_df = processor._read_and_index_z_levels()
+        construction_links = processor._read_cdms_construction_links()
+        ufr_df = processor._read_cdms_usage_fee_links()
+        in_fields = ["LINK_ID", "CONTRACC", "SPEED_CAT", "ST_LANGCD", "ST_TYP_BEF", "ST_NM_BASE", "ST_TYP_AFT"]
+        in_streets_df = streets_df[in_fields].assign(Meters=meters).set_index("LINK_ID")
+        out_df = processor._calculate_streets_fields(
+            in_streets_df, alt_streets_df, z_levels_df, construction_links, ufr_df)
+        PROFILER.add_rows(rows_written=len(out_df))
+    del alt_streets_df, z_levels_df, construction_links, ufr_df, in_streets_df, out_df
+    processor.traff_speeds_df = None
+    processor.spd_df = None
+
+    # The output Streets are the input streets in order, so their ObjectIDs are the street indices + 1
+    processor.streets_df = compact_df(pd.DataFrame({
+        "OID": np.arange(1, network.num_links + 1),
+        "Meters": meters,
+        "REF_IN_ID": streets_df["REF_IN_ID"].to_numpy(),
+        "NREF_IN_ID": streets_df["NREF_IN_ID"].to_numpy()
+    }, index=pd.Index(streets_df["LINK_ID"].to_numpy(), name="LINK_ID")), name="Streets")
+    with PROFILER.stage("turns"):
+        processor._read_and_index_turn_tables()
+        context, partitions = processor._turn_worker_inputs()
+        _build_rows(processor, processor._build_turn_rows, context, partitions)
+    if delta_fraction:
+        def read_turns():
+            # The cdms records of each stage are handed out once, so they're read again each time
+            processor.cdms_dfs = None
+            processor._read_and_index_turn_tables()
+            return processor._turn_worker_inputs()
+        benchmark_delta_turns(processor, read_turns, processor._turn_fields, delta_fraction, seed, work_folder)
+    processor.cndmod_df = None
+    with PROFILER.stage("road forks"):
+        forks_df, _ = processor._build_road_forks(processor._road_fork_records())
+        PROFILER.add_rows(rows_written=len(forks_df))
+    with PROFILER.stage("signposts"):
+        processor._read_signs_table()
+        context, partitions, _, _ = processor._signpost_worker_inputs()
+        _build_rows(processor, processor._build_signpost_rows, context, partitions)
+
+
+def benchmark_multinet(network, tables, num_workers, work_folder, delta_fraction=0, seed=0):
+    """Run the benchmarked stages of the MultiNet processor on a synthetic dataset in memory.
+
+    The DailyProfiles table built from the HSPR table is only benchmarked with --full because it's populated directly
+    with a cursor.
+    """
+    in_data = synthetic_data.multinet_input_data(work_folder)
+    processor = BenchmarkMultiNetProcessor(
+        work_folder, "Benchmark.gdb", in_data, UnitType.Imperial, TimeZoneType.NoTimeZone, build_network=False,
+        num_workers=num_workers)
+    _setup_processor(processor, network, tables, in_data)
+    nw_df = tables["nw"]
+
+    with PROFILER.stage("lookup tables"):
+        processor._read_and_index_restrictions()
+        processor._read_and_index_maneuver_paths()
+        processor._read_and_index_logistics_tables()
+    with PROFILER.stage("streets fields"):
+        hsnp_df = processor._read_and_index_historical_traffic()
+        ltr_df = processor._read_and_index_ltr()
+        in_streets_df = nw_df[["ID", "TOLLRD", "METERS", "KPH"]].astype({"ID": np.int64}).set_index("ID")
+        out_df = processor._calculate_streets_fields(in_streets_df, hsnp_df, ltr_df)
+        PROFILER.add_rows(rows_written=len(out_df))
+    del hsnp_df, ltr_df, in_streets_df, out_df
+
+    # The output Streets are the input streets in order, so their ObjectIDs are the street indices + 1
+    processor.streets_df = compact_df(pd.DataFrame({
+        "OID": np.arange(1, network.num_links + 1),
+        "F_JNCTID": nw_df["F_JNCTID"].to_numpy(),
+        "T_JNCTID": nw_df["T_JNCTID"].to_numpy()
+    }, index=pd.Index(nw_df["ID"].to_numpy(dtype=np.int64), name="ID")), name="Streets")
+    with PROFILER.stage("turns"):
+        context, partitions = processor._turn_worker_inputs()
+        _build_rows(processor, processor._build_turn_rows, context, partitions)
+    if delta_fraction:
+        benchmark_delta_turns(
+            processor, processor._turn_worker_inputs, lambda context: processor._turn_fields(), delta_fraction, seed,
+            work_folder)
+    with PROFILER.stage("road forks"):
+        forks_df, _ = processor._build_road_forks(processor._road_fork_records())
+        PROFILER.add_rows(rows_written=len(forks_df))
+    with PROFILER.stage("signposts"):
+        processor._read_sign_paths_table()
+        context, partitions, _, _ = processor._signpost_worker_inputs()
+        _build_rows(processor, processor._build_signpost_rows, context, partitions)
+
+
+def run_stages(product, num_links, seed, num_workers, work_folder, delta_fraction=DEFAULT_DELTA_FRACTION):
+    """Benchmark the pure pandas and numpy stages of a tool on a synthetic dataset generated in memory.
+
+    Updating the turns in place is benchmarked with the designated fraction of the streets reshaped, unless it's 0.
+
+    Returns:
+        List of the stats of each stage as returned by RunProfiler.stages
+    """
+    network, tables = synthetic_data.load_dataset(product, num_links, seed)
+    benchmark_func = benchmark_here if product == "here" else benchmark_multinet
+    PROFILER.start()
+    try:
+        benchmark_func(network, tables, num_workers, work_folder, delta_fraction, seed)
+    finally:
+        PROFILER.stop()
+    return PROFILER.stages()
+
+
+def run_full(product, num_links, seed, num_workers, work_folder):
+    """Write a synthetic dataset to disk and run the complete tool on it with profiling turned on.
+
+    Returns:
+        List of the stats of each stage from the tool's profiling report
+    """
+    if arcpy is None:
+        raise RuntimeError("Running the complete tools with --full requires arcpy.")
+    data_folder = os.path.join(work_folder, f"{product}_{num_links}_{seed}")
+    in_data = synthetic_data.write_dataset(product, num_links, data_folder, seed)
+    out_folder = os.path.join(work_folder, "output")
+    os.makedirs(out_folder, exist_ok=True)
+    gdb_name = f"{product}_{num_links}_{uuid.uuid4().hex[:8]}"
+    processor_class = HereNavstreetsShpProcessor if product == "here" else MultiNetProcessor
+    processor = processor_class(
+        out_folder, gdb_name, in_data, UnitType.Imperial, TimeZoneType.NoTimeZone, build_network=False,
+        num_workers=num_workers, profile=True)
+    if product == "here":
+        processor.process_here_data()
+    else:
+        processor.process_multinet_data()
+    with open(processor.profile_report_base + ".json", encoding="utf-8") as f:
+        return json.load(f)["stages"]
+
+
+def _git_revision():
+    """Return the git revision of the repository the benchmarks are in, or None if it can't be determined."""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BENCHMARKS_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=BENCHMARKS_DIR, capture_output=True,
+            text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return revision + ("-dirty" if dirty else "")
+
+
+def load_results(results_file):
+    """Return a dataframe of the stage records in the results file, or an empty dataframe if there are none."""
+    if not os.path.exists(results_file):
+        return pd.DataFrame()
+    with open(results_file, encoding="utf-8") as f:
+        return pd.DataFrame([json.loads(line) for line in f if line.strip()])
+
+
+def compare_runs(results_df, run_id, baseline_run_id=None, threshold=REGRESSION_THRESHOLD):
+    """Compare the stage wall times of a run with those of a baseline run.
+
+    Stages are matched by product, number of streets, number of workers, and stage name. A stage is a regression if
+    it's slower than the baseline by more than the threshold fraction and by more than MIN_REGRESSION_SECONDS.
+
+    Args:
+        results_df: Dataframe of the records in the results file
+        run_id: ID of the run to compare
+        baseline_run_id: ID of the baseline run. If None, the latest earlier run of the same mode is used.
+        threshold: Fraction by which a stage must slow down to be a regression
+
+    Returns:
+        The baseline run ID and a dataframe of the compared stages, or None and None if there is no baseline
+    """
+    run_df = results_df[results_df["run_id"] == run_id]
+    if baseline_run_id is None:
+        earlier_df = results_df[
+            (results_df["mode"] == run_df["mode"].iloc[0]) & (results_df["created"] < run_df["created"].iloc[0])]
+        if earlier_df.empty:
+            return None, None
+        baseline_run_id = earlier_df.sort_values("created")["run_id"].iloc[-1]
+    baseline_df = results_df[results_df["run_id"] == baseline_run_id]
+    if baseline_df.empty:
+        return None, None
+    keys = ["product", "links", "workers", "stage"]
+    compare_df = run_df[keys + ["wall_seconds"]].merge(
+        baseline_df[keys + ["wall_seconds"]], on=keys, suffixes=("", "_baseline"))
+    compare_df["ratio"] = compare_df["wall_seconds"] / compare_df["wall_seconds_baseline"].replace(0, np.nan)
+    compare_df["regression"] = (compare_df["ratio"] > 1 + threshold) & (
+        compare_df["wall_seconds"] - compare_df["wall_seconds_baseline"] > MIN_REGRESSION_SECONDS)
+    return baseline_run_id, compare_df
+
+
+def main():
+    """Parse the command line arguments, run the benchmarks, and report the results."""
+    parser = argparse.ArgumentParser(description="Benchmark the street data processing tools on synthetic data.")
+    parser.add_argument(
+        "-p", "--products", nargs="+", choices=["here", "multinet"], default=["here", "multinet"],
+        help="Data products to benchmark.")
+    parser.add_argument(
+        "-n", "--links", nargs="+", type=int, default=DEFAULT_LINKS, help="Numbers of streets in the datasets.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of worker processes used by the tools.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic datasets.")
+    parser.add_argument(
+        "--delta-fraction", type=float, default=DEFAULT_DELTA_FRACTION,
+        help="Fraction of the streets reshaped when benchmarking a delta run's update of the turns. 0 skips it.")
+    parser.add_argument(
+        "--repeat", type=int, default=1, help="Number of times to run each benchmark, keeping the fastest time.")
+    parser.add_argument(
+        "--full", action="store_true", help="Write the datasets to disk and run the complete tools. Requires arcpy.")
+    parser.add_argument("--results-file", default=DEFAULT_RESULTS_FILE, help="JSON lines file to append results to.")
+    parser.add_argument("--no-save", action="store_true", help="Don't append the results to the results file.")
+    parser.add_argument(
+        "--compare", nargs="?", const="", metavar="BASELINE_RUN_ID",
+        help="Compare with a baseline run, by default the latest earlier run, and exit with status 1 on regressions.")
+    parser.add_argument(
+        "--threshold", type=float, default=REGRESSION_THRESHOLD,
+        help="Fraction by which a stage must slow down to be reported as a regression.")
+    parser.add_argument("--work-folder", help="Folder for temporary files. Defaults to a new temporary folder.")
+    args = parser.parse_args()
+
+    run_id = uuid.uuid4().hex[:12]
+    mode = "full" if args.full else "stages"
+    common = {
+        "run_id": run_id,
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "git_revision": _git_revision(),
+        "mode": mode,
+        "seed": args.seed,
+        "workers": args.workers,
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "platform": platform.platform()
+    }
+    records = []
+    with tempfile.TemporaryDirectory(dir=args.work_folder) as work_folder:
+        for product in args.products:
+            for num_links in args.links:
+                fastest = {}
+                for _ in range(max(1, args.repeat)):
+                    if args.full:
+                        run_stats = run_full(product, num_links, args.seed, args.workers, work_folder)
+                    else:
+                        run_stats = run_stages(
+                            product, num_links, args.seed, args.workers, work_folder, args.delta_fraction)
+                    for stats in run_stats:
+                        best = fastest.get(stats["stage"])
+                        if best is None or stats["wall_seconds"] < best["wall_seconds"]:
+                            fastest[stats["stage"]] = stats
+                for stats in fastest.values():
+                    records.append(dict(common, product=product, links=num_links, **{
+                        field: stats[field] for field in [
+                            "stage", "calls", "wall_seconds", "cpu_seconds", "peak_rss_delta_mb", "rows_read",
+                            "rows_written"]
+                    }))
+                    print(
+                        f"{product:<9}{num_links:>10}  {stats['stage']:<60}{stats['wall_seconds']:>9.3f} s"
+                        f"{stats['peak_rss_delta_mb']:>9.1f} MB")
+
+    if not args.no_save:
+        with open(args.results_file, "a", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+        print(f"Results of run {run_id} appended to {args.results_file}.")
+
+    if args.compare is None:
+        return 0
+    results_df = pd.concat([load_results(args.results_file), pd.DataFrame(records)]).drop_duplicates(
+        ["run_id", "product", "links", "stage"])
+    baseline_run_id, compare_df = compare_runs(results_df, run_id, args.compare or None, args.threshold)
+    if compare_df is None:
+        print("No baseline run was found to compare with.")
+        return 0
+    print(f"Compared with baseline run {baseline_run_id}:")
+    for record in compare_df.itertuples():
+        flag = "  REGRESSION" if record.regression else ""
+        print(
+            f"{record.product:<9}{record.links:>10}  {record.stage:<60}{record.wall_seconds_baseline:>9.3f} s ->"
+            f"{record.wall_seconds:>9.3f} s{flag}")
+    if compare_df["regression"].any():
+        print(f"{int(compare_df['regression'].sum())} stages are more than {args.threshold:.0%} slower.")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,917 @@
+"""Generate synthetic HERE NAVSTREETS and TomTom MultiNet datasets for benchmarking the street data processing tools
+
+   The datasets have the tables and fields the tools require and roughly the proportions of related records found in
+   real data. The streets form a jittered grid, and every attribute of a street and of the records related to it is
+   derived from a hash of the street's index, so any range of streets can be generated independently of the others.
+   This makes it possible to write datasets much larger than memory one chunk of streets at a time, and the same seed
+   always produces the same dataset.
+
+   Run this script to write a synthetic dataset to disk, for example:
+       python synthetic_data.py here --links 1000000 --out-folder C:\\Data\\SyntheticHERE
+   The feature classes and tables are written to a file geodatabase, which requires arcpy, and the SPD, link reference,
+   and TMC reference files are written as CSV files next to it. The benchmarks of the pure pandas and numpy stages use
+   the dataframes generated here directly and don't need arcpy.
+
+   Copyright 2025 Esri
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+       http://www.apache.org/licenses/LICENSE-2.0
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.'''
+"""
+import os
+import sys
+import math
+import struct
+import hashlib
+import argparse
+import itertools
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from helpers import CURDIR, StreetGeometryStore, insert_df_rows, arcpy  # noqa: E402
+from geometry import vertices_to_wkb  # noqa: E402
+from Process_HERENavstreetsShp import (  # noqa: E402
+    HereNavstreetsShpInputData, HistoricalTrafficConfigType, AR_FLDS, DAY_FIELDS)
+from Process_MultiNet import MultiNetInputData  # noqa: E402
+
+DEFAULT_CHUNK_SIZE = 500000  # Number of streets whose records are generated and written at a time
+GRID_SPACING = 0.001  # Degrees between adjacent junctions of the street grid, roughly 100 meters
+GRID_ORIGIN = (-100.0, 35.0)  # Longitude and latitude of the first junction
+GDB_NAME = "Synthetic.gdb"  # Name of the file gdb the feature classes and tables are written to
+TEXT_FIELD_LENGTH = 100  # Length of the text fields created when writing tables
+GEOMETRY_COLUMN = "SHAPE@WKB"  # Column holding the well-known binary geometry of feature class rows
+
+# Names of the tables of each dataset by their attribute names in HereNavstreetsShpInputData and MultiNetInputData.
+# Names ending in .csv are CSV files.
+HERE_TABLES = {
+    "streets": "Streets",
+    "alt_streets": "AltStreets",
+    "z_levels": "Zlevels",
+    "cdms": "Cdms",
+    "rdms": "Rdms",
+    "signs": "Signs",
+    "historical_speed_profiles_table": "SPD.csv",
+    "tmc_ref_table": "TMC_Ref.csv",
+    "traffic_table": "Traffic",
+    "link_ref_table_1_4": "LinkRef_FC1-4.csv",
+    "link_ref_table_5": "LinkRef_FC5.csv",
+    "cndmod_us_table": "CndModUS",
+    "cndmod_non_us_table": "CndModNonUS"
+}
+MULTINET_TABLES = {
+    "nw": "NW",
+    "mn": "MN",
+    "mp": "MP",
+    "si": "SI",
+    "sp": "SP",
+    "rs": "RS",
+    "hsnp": "HSNP",
+    "hspr": "HSPR",
+    "rd": "RD",
+    "ltr": "LTR",
+    "lrs": "LRS",
+    "lvc": "LVC"
+}
+GEOMETRY_TYPES = {"streets": "POLYLINE", "nw": "POLYLINE", "mn": "POINT"}  # Tables written as feature classes
+# Field types used when creating the fields of a table, by required field type or by the dtype kind of extra columns
+FIELD_TYPES = {
+    "Double": "DOUBLE", "Single": "FLOAT", "Integer": "LONG", "SmallInteger": "SHORT", "String": "TEXT",
+    "f": "DOUBLE", "i": "LONG", "u": "LONG", "b": "SHORT", "O": "TEXT"
+}
+
+STREET_NAMES = [
+    "MAIN", "OAK", "PINE", "MAPLE", "CEDAR", "ELM", "WASHINGTON", "LAKE", "HILL", "WALNUT", "SPRING", "NORTH",
+    "RIDGE", "CHURCH", "WILLOW", "MILL", "SUNSET", "RAILROAD", "JACKSON", "CHERRY", "HIGHLAND", "FRANKLIN", "PARK",
+    "LINCOLN", "MADISON", "MEADOW", "FOREST", "RIVER", "VALLEY", "JEFFERSON", "DOGWOOD", "SPRUCE", "HICKORY", "ASH"
+]
+STREET_TYPES = ["ST", "AVE", "RD", "DR", "LN", "BLVD", "WAY", "CT", "PL", "TRL"]
+FUNC_CLASS_WEIGHTS = [0.02, 0.04, 0.10, 0.18, 0.66]  # Proportions of streets in functional classes 1 to 5
+FUNC_CLASS_SPEED_CATS = {1: ["2", "3"], 2: ["3", "4"], 3: ["4", "5"], 4: ["5", "6"], 5: ["6", "7", "8"]}
+FUNC_CLASS_KPH = np.array([0, 110, 90, 70, 50, 30])  # Typical speed of streets by functional class
+# CndMod values of the transport restrictions the HERE tool uses
+HERE_PROHIBITED_VALS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "20", "21", "22", "23"]  # MOD_TYPE 39
+HERE_PREFERRED_VALS = ["1", "2", "3", "4", "5", "6", "7", "8", "9", "15", "16"]  # MOD_TYPE 49
+HERE_LIMIT_VALS = {  # {MOD_TYPE: (low, high) range of MOD_VAL}
+    41: (120, 600), 42: (10000, 80000), 43: (10000, 34000), 44: (240, 900), 45: (80, 130), 46: (1, 5), 48: (30, 66),
+    75: (1, 8), 81: (300, 500)
+}
+MULTINET_VTS = [0, 11, 12, 16, 17]  # Vehicle types of the restrictions the MultiNet tool uses
+MULTINET_SLOT_SECONDS = 300  # Seconds between the time slots of the MultiNet HSPR table
+
+# Base values of IDs, chosen to look like the IDs in real data
+HERE_LINK_ID_BASE = 700000000
+HERE_NODE_ID_BASE = 100000000
+HERE_SIGN_ID_BASE = 200000000
+MULTINET_ID_BASE = 12500000000000
+MULTINET_JUNCTION_ID_BASE = 15200000000000
+MULTINET_MANEUVER_ID_BASE = 16700000000000
+MULTINET_SIGN_ID_BASE = 18900000000000
+
+
+def _mix(values, salt):
+    """Return pseudorandom uint64 hashes of non-negative integer values using the SplitMix64 finalizer."""
+    with np.errstate(over="ignore"):
+        z = np.asarray(values, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15) + np.uint64(salt)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+class SyntheticNetwork:
+    """Street network laid out on a jittered grid whose attributes are derived from hashes of street indices.
+
+    Street i starts at junction i // 2 and leads east if i is even or north if i is odd, so every junction has up to two
+    outgoing streets. Streets leaving the last column of the grid lead north instead of east. Every random value is a
+    hash of an index and the name of the attribute it's for, so it doesn't depend on what else has been generated.
+    """
+
+    def __init__(self, num_links, seed=0):
+        """Initialize a network with the designated number of streets."""
+        self.num_links = int(num_links)
+        self.seed = seed
+        self.columns = max(2, math.ceil(math.sqrt(self.num_links / 2)))  # Number of junctions in each row of the grid
+        self._salts = {}
+
+    def _salt(self, name):
+        """Return the hash salt of the designated attribute name."""
+        if name not in self._salts:
+            digest = hashlib.md5(f"{self.seed}:{name}".encode("utf-8")).digest()
+            self._salts[name] = int.from_bytes(digest[:8], "little")
+        return self._salts[name]
+
+    def random(self, values, name):
+        """Return uniformly distributed floats in [0, 1) for the designated indices and attribute name."""
+        return (_mix(values, self._salt(name)) >> np.uint64(11)).astype(np.float64) / 2.0 ** 53
+
+    def integers(self, values, name, low, high):
+        """Return uniformly distributed integers in [low, high) for the designated indices and attribute name."""
+        return low + (_mix(values, self._salt(name)) % np.uint64(high - low)).astype(np.int64)
+
+    def choice(self, values, name, options, weights=None):
+        """Return one of the options for each of the designated indices, optionally weighted."""
+        options = np.asarray(options, dtype=object)
+        if weights is None:
+            return options[self.integers(values, name, 0, len(options))]
+        cum_weights = np.cumsum(weights) / np.sum(weights)
+        idxs = np.searchsorted(cum_weights, self.random(values, name), side="right")
+        return options[np.minimum(idxs, len(options) - 1)]
+
+    def select(self, values, name, probability):
+        """Return the subset of the designated indices selected with the designated probability."""
+        return values[self.random(values, name) < probability]
+
+    def link_nodes(self, links):
+        """Return arrays of the from and to junctions of the designated streets."""
+        links = np.asarray(links, dtype=np.int64)
+        from_nodes = links // 2
+        is_north = (links % 2 == 1) | (from_nodes % self.columns == self.columns - 1)
+        to_nodes = np.where(is_north, from_nodes + self.columns, from_nodes + 1)
+        return from_nodes, to_nodes
+
+    def next_links(self, links, name):
+        """Return a street leaving the end of each designated street, or -1 if it would be beyond the network."""
+        _, to_nodes = self.link_nodes(links)
+        next_links = 2 * to_nodes + self.integers(links, name, 0, 2)
+        return np.where(next_links < self.num_links, next_links, -1)
+
+    def node_xy(self, nodes):
+        """Return arrays of the longitude and latitude of the designated junctions."""
+        nodes = np.asarray(nodes, dtype=np.int64)
+        x = nodes % self.columns + (self.random(nodes, "jitter x") - 0.5) * 0.4
+        y = nodes // self.columns + (self.random(nodes, "jitter y") - 0.5) * 0.4
+        return x * GRID_SPACING + GRID_ORIGIN[0], y * GRID_SPACING + GRID_ORIGIN[1]
+
+    def func_class(self, links):
+        """Return the functional class from 1 to 5 of the designated streets."""
+        return self.choice(links, "func class", [1, 2, 3, 4, 5], FUNC_CLASS_WEIGHTS).astype(np.int64)
+
+    def names(self, links):
+        """Return arrays of the base name and type of the designated streets.
+
+        All the streets along a row or column of the grid share a name, like the streets of a real city.
+        """
+        from_nodes, to_nodes = self.link_nodes(links)
+        is_north = to_nodes - from_nodes != 1
+        line_key = np.where(is_north, from_nodes % self.columns, from_nodes // self.columns) * 2 + is_north
+        base = np.asarray(STREET_NAMES, dtype=object)[line_key % len(STREET_NAMES)]
+        number = line_key // len(STREET_NAMES)
+        base = np.where(number > 0, base + " " + number.astype(str).astype(object), base)
+        return base, self.choice(line_key, "street type", STREET_TYPES)
+
+    def link_vertices(self, links):
+        """Return the vertices of the designated streets.
+
+        Each street has 0 to 2 shape points between its ends, offset slightly from the straight line between them.
+
+        Returns:
+            An offsets array and an (N, 2) array of vertex coordinates, where the vertices of links[i] are
+            coords[offsets[i]:offsets[i + 1]], like in a StreetGeometryStore
+        """
+        links = np.asarray(links, dtype=np.int64)
+        from_nodes, to_nodes = self.link_nodes(links)
+        from_x, from_y = self.node_xy(from_nodes)
+        to_x, to_y = self.node_xy(to_nodes)
+        counts = self.integers(links, "shape points", 0, 3) + 2
+        offsets = np.concatenate(([0], np.cumsum(counts)))
+        vertex_links = np.repeat(np.arange(len(links)), counts)
+        vertex_idxs = np.arange(offsets[-1]) - offsets[vertex_links]
+        fraction = vertex_idxs / (counts[vertex_links] - 1)
+        is_inner = (vertex_idxs > 0) & (vertex_idxs < counts[vertex_links] - 1)
+        wobble = np.where(is_inner, self.random(links[vertex_links] * 4 + vertex_idxs, "wobble") - 0.5, 0.) * 0.1
+        dx = (to_x - from_x)[vertex_links]
+        dy = (to_y - from_y)[vertex_links]
+        coords = np.column_stack((
+            from_x[vertex_links] + fraction * dx - wobble * dy,
+            from_y[vertex_links] + fraction * dy + wobble * dx
+        ))
+        return offsets, coords
+
+    @staticmethod
+    def link_meters(offsets, coords):
+        """Return the approximate geodesic length in meters of each street with the designated vertices."""
+        segment_meters = np.hypot(
+            np.diff(coords[:, 0]) * 111320 * np.cos(np.radians(coords[:-1, 1])), np.diff(coords[:, 1]) * 110540)
+        cum_meters = np.concatenate(([0.], np.cumsum(segment_meters)))
+        return cum_meters[offsets[1:] - 1] - cum_meters[offsets[:-1]]
+
+    def link_wkbs(self, links):
+        """Return a list of the well-known binary polyline geometry of each of the designated streets."""
+        offsets, coords = self.link_vertices(links)
+        return [vertices_to_wkb(coords[start:stop]) for start, stop in zip(offsets[:-1], offsets[1:])]
+
+    def geometry_store(self, oids):
+        """Return a StreetGeometryStore of the streets with the designated ObjectIDs, which are street index + 1."""
+        oids = np.unique(np.asarray(oids, dtype=np.int64))
+        offsets, coords = self.link_vertices(oids - 1)
+        return StreetGeometryStore(oids, offsets.astype(np.int64), coords)
+
+
+def _repeat(network, values, name, low, high):
+    """Repeat each value a random number of times from low to high - 1.
+
+    Returns:
+        The repeated values and the 1-based sequence number of each repeat
+    """
+    counts = network.integers(values, name, low, high)
+    repeated = np.repeat(values, counts)
+    return repeated, np.arange(len(repeated)) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+
+
+def _directional_records(links, dir_travel):
+    """Return the streets with a record for each direction they can be traveled and whether each record is to-from.
+
+    Args:
+        links: Sorted array of streets
+        dir_travel: Array of the DIR_TRAVEL value (B, F, or T) of each street
+    """
+    rec_links = np.concatenate((links[dir_travel != "T"], links[dir_travel != "F"]))
+    is_to = np.concatenate((np.zeros((dir_travel != "T").sum(), bool), np.ones((dir_travel != "F").sum(), bool)))
+    order = np.argsort(rec_links, kind="stable")
+    return rec_links[order], is_to[order]
+
+
+def _maneuver_paths(network, links, name):
+    """Return the streets of a two or three street maneuver starting with each of the designated streets.
+
+    Maneuvers whose second street would be beyond the network are dropped, and about 10% of the rest have a third
+    street.
+
+    Returns:
+        Arrays of the first, second, and third streets of the maneuvers, where the third is -1 for two street maneuvers
+    """
+    second = network.next_links(links, f"{name} second")
+    links = links[second >= 0]
+    second = second[second >= 0]
+    third = np.where(network.random(links, f"{name} length") < 0.1, network.next_links(second, f"{name} third"), -1)
+    return links, second, third
+
+
+def _fork_paths(network, links):
+    """Return the streets of a road fork at the end of each of the designated streets with both branches in the network.
+
+    Returns:
+        Arrays of the streets entering the forks and of the two streets leaving them
+    """
+    _, to_nodes = network.link_nodes(links)
+    links = links[2 * to_nodes + 1 < network.num_links]
+    _, to_nodes = network.link_nodes(links)
+    return links, 2 * to_nodes, 2 * to_nodes + 1
+
+
+def _path_records(ids, paths):
+    """Return arrays of the ID, street, and 1-based sequence number of each street of the designated paths in order.
+
+    Args:
+        ids: Array of the ID of each path
+        paths: List of arrays of the street at each position of the paths, where -1 means the path is shorter
+    """
+    path_ids = np.tile(ids, len(paths))
+    path_links = np.concatenate(paths)
+    sequences = np.repeat(np.arange(1, len(paths) + 1), len(ids))
+    order = np.lexsort((sequences, np.tile(np.arange(len(ids)), len(paths))))
+    keep = path_links[order] >= 0
+    return path_ids[order][keep], path_links[order][keep], sequences[order][keep]
+
+
+def _speed_patterns(network, num_patterns, num_slots, name):
+    """Return an array of speeds in KPH with a row for each speed pattern and a column for each time slot of the day.
+
+    Speeds dip during the morning and evening rush hours by a different amount in each pattern, and about 5% of the
+    patterns are constant throughout the day.
+    """
+    patterns = np.arange(num_patterns)
+    free_flow = network.integers(patterns, f"{name} free flow", 20, 131).astype(float)
+    depth = network.random(patterns, f"{name} depth") * 0.6
+    depth[network.random(patterns, f"{name} constant") < 0.05] = 0
+    hours = np.arange(num_slots) * 24 / num_slots
+    rush = np.exp(-((hours - 8) / 1.2) ** 2) + np.exp(-((hours - 17.5) / 1.5) ** 2)
+    return np.maximum(np.round(free_flow[:, None] * (1 - depth[:, None] * rush[None, :])), 1)
+
+
+def num_speed_profiles(num_links):
+    """Return the number of speed profiles in the SPD or HSPR table of a dataset with the designated size."""
+    return int(np.clip(num_links // 500, 50, 10000))
+
+
+def here_input_data(folder=""):
+    """Return the HereNavstreetsShpInputData of a synthetic HERE dataset written to the designated folder.
+
+    The dataset uses link reference files for historical traffic, includes live traffic, and has both CndMod tables.
+    """
+    gdb = os.path.join(folder, GDB_NAME)
+    paths = {
+        attr: os.path.join(folder if name.endswith(".csv") else gdb, name) for attr, name in HERE_TABLES.items()
+    }
+    return HereNavstreetsShpInputData(
+        paths["streets"], paths["alt_streets"], paths["z_levels"], paths["cdms"], paths["rdms"], paths["signs"],
+        HistoricalTrafficConfigType.LinkReferenceFiles, True,
+        paths["historical_speed_profiles_table"], paths["tmc_ref_table"], paths["traffic_table"],
+        paths["link_ref_table_1_4"], paths["link_ref_table_5"], paths["cndmod_us_table"], paths["cndmod_non_us_table"]
+    )
+
+
+def multinet_input_data(folder=""):
+    """Return the MultiNetInputData of a synthetic MultiNet dataset written to the designated folder.
+
+    The dataset includes historical traffic, the RDS-TMC table, and the logistics tables.
+    """
+    gdb = os.path.join(folder, GDB_NAME)
+    paths = {attr: os.path.join(gdb, name) for attr, name in MULTINET_TABLES.items()}
+    return MultiNetInputData(
+        paths["nw"], paths["mn"], paths["mp"], paths["si"], paths["sp"], paths["rs"], True, True,
+        paths["hsnp"], paths["hspr"], paths["rd"], paths["ltr"], paths["lrs"], paths["lvc"]
+    )
+
+
+def here_speed_profiles(network):
+    """Return the SPD table of a synthetic HERE dataset with the absolute speed of each pattern in each time slice."""
+    in_data = here_input_data()
+    h_fields = in_data.required_fields[in_data.historical_speed_profiles_table][1:]
+    speeds = _speed_patterns(network, num_speed_profiles(network.num_links), len(h_fields), "SPD")
+    spd_df = pd.DataFrame(speeds.astype(np.int64), columns=h_fields)
+    spd_df.insert(0, "PATTERN_ID", np.arange(1, len(spd_df) + 1))
+    return spd_df
+
+
+def here_tables(network, start, stop, with_geometry=False):
+    """Return the records of a synthetic HERE dataset related to the streets with indices from start to stop.
+
+    Args:
+        network: SyntheticNetwork to generate records for
+        start: Index of the first street
+        stop: Index after the last street
+        with_geometry: Whether to add the well-known binary geometry of the streets in a SHAPE@WKB column
+
+    Returns:
+        Dictionary of {HereNavstreetsShpInputData attribute: dataframe} of all tables but the SPD table
+    """
+    links = np.arange(start, stop, dtype=np.int64)
+    from_nodes, to_nodes = network.link_nodes(links)
+    func_class = network.func_class(links)
+    base_names, street_types = network.names(links)
+    dir_travel = network.choice(links, "dir travel", ["B", "F", "T"], [0.8, 0.1, 0.1])
+    tables = {}
+
+    # Streets, including a couple of fields that aren't required by the tool but that are present in real data
+    speed_cat = np.empty(len(links), dtype=object)
+    for fc, speed_cats in FUNC_CLASS_SPEED_CATS.items():
+        speed_cat[func_class == fc] = network.choice(links[func_class == fc], "speed cat", speed_cats)
+    streets_df = pd.DataFrame({
+        "LINK_ID": HERE_LINK_ID_BASE + links,
+        "ST_NAME": base_names + " " + street_types,
+        "ST_TYP_BEF": "",
+        "ST_NM_BASE": base_names,
+        "ST_TYP_AFT": street_types,
+        "FUNC_CLASS": func_class,
+        "CONTRACC": np.where(func_class <= 2, "Y", "N").astype(object),
+        "SPEED_CAT": speed_cat,
+        "ST_LANGCD": network.choice(links, "language", ["ENG", "SPA", "FRE"], [0.9, 0.07, 0.03]),
+        "DIR_TRAVEL": dir_travel,
+        "REF_IN_ID": HERE_NODE_ID_BASE + from_nodes,
+        "NREF_IN_ID": HERE_NODE_ID_BASE + to_nodes
+    })
+    for field in ["AR_AUTO", "AR_BUS", "AR_TAXIS", "AR_TRUCKS", "AR_DELIV", "AR_EMERVEH", "AR_MOTOR"]:
+        streets_df[field] = network.choice(links, field, ["Y", "N"], [0.97, 0.03])
+    if with_geometry:
+        streets_df[GEOMETRY_COLUMN] = network.link_wkbs(links)
+    tables["streets"] = streets_df
+
+    # Alternate names for about 30% of streets, some of which are the same as the primary name
+    alt_links, alt_seq = _repeat(network, network.select(links, "alt", 0.3), "alt count", 1, 3)
+    alt_key = alt_links * 4 + alt_seq
+    is_same = network.random(alt_key, "alt same") < 0.2
+    alt_base = np.where(is_same, base_names[alt_links - start], network.choice(alt_key, "alt name", STREET_NAMES))
+    alt_type = np.where(is_same, street_types[alt_links - start], network.choice(alt_key, "alt type", STREET_TYPES))
+    tables["alt_streets"] = pd.DataFrame({
+        "LINK_ID": HERE_LINK_ID_BASE + alt_links,
+        "ST_TYP_BEF": "",
+        "ST_NM_BASE": alt_base,
+        "ST_TYP_AFT": alt_type,
+        "ST_NAME": alt_base + " " + alt_type,
+        "ST_LANGCD": network.choice(alt_key, "alt language", ["ENG", "SPA"], [0.9, 0.1]),
+        "ST_NM_PREF": "",
+        "ST_NM_SUFF": "",
+        "DIRONSIGN": "",
+        "EXPLICATBL": network.choice(alt_key, "explicatable", ["Y", "N"], [0.6, 0.4])
+    })
+
+    # Z-levels at both ends of every street, with about 1% of streets raised on bridges
+    z_level = np.where(network.random(links, "bridge") < 0.01, 1, 0)
+    num_points = np.diff(network.link_vertices(links)[0])
+    tables["z_levels"] = pd.DataFrame({
+        "LINK_ID": np.repeat(HERE_LINK_ID_BASE + links, 2),
+        "INTRSECT": "Y",
+        "POINT_NUM": np.column_stack((np.ones(len(links), dtype=np.int64), num_points)).ravel(),
+        "Z_LEVEL": np.repeat(z_level, 2)
+    })
+
+    # Conditions of several kinds, each with a COND_ID derived from the street it's on and its kind. Turn and road fork
+    # conditions have Rdms records for the streets after the first, and transport conditions have CndMod records.
+    cdms_dfs = []
+    rdms_dfs = []
+    cndmod_dfs = []
+
+    def add_conditions(cond_links, kind, cond_types, cond_type_weights=None, end_of_lk=""):
+        """Add Cdms records of the designated kind for the designated streets and return their COND_IDs."""
+        cond_ids = cond_links * 8 + kind + 1
+        cdms_df = pd.DataFrame({
+            "LINK_ID": HERE_LINK_ID_BASE + cond_links,
+            "COND_ID": cond_ids,
+            "COND_TYPE": network.choice(cond_ids, "cond type", cond_types, cond_type_weights).astype(np.int64),
+            "END_OF_LK": end_of_lk
+        })
+        for field in AR_FLDS:
+            cdms_df[field] = network.choice(cond_ids, field, ["Y", "N"], [0.8, 0.2])
+        cdms_dfs.append(cdms_df)
+        return cond_ids
+
+    def add_rdms(cond_ids, paths):
+        """Add Rdms records for the streets after the first of the designated conditions' paths."""
+        rdms_ids, rdms_links, rdms_seq = _path_records(cond_ids, paths)
+        rdms_dfs.append(pd.DataFrame({
+            "LINK_ID": HERE_LINK_ID_BASE + rdms_ids // 8,
+            "MAN_LINKID": HERE_LINK_ID_BASE + rdms_links,
+            "COND_ID": rdms_ids,
+            "SEQ_NUMBER": rdms_seq
+        }))
+
+    def add_cndmods(cond_ids):
+        """Add CndMod records describing a transport restriction for each of the designated conditions.
+
+        Each condition is a prohibited, preferred, or limit restriction and has a record saying which direction it
+        applies to. Some conditions also have records with modifiers the tool doesn't use.
+        """
+        kind = network.choice(cond_ids, "transport kind", ["prohibited", "preferred", "limit"], [0.35, 0.25, 0.4])
+        mod_ids, mod_seq = _repeat(network, cond_ids, "transport count", 1, 3)
+        mod_kind = kind[np.searchsorted(cond_ids, mod_ids)]
+        mod_key = mod_ids * 4 + mod_seq
+        mod_type = network.choice(mod_key, "limit type", list(HERE_LIMIT_VALS)).astype(np.int64)
+        mod_val = np.empty(len(mod_ids), dtype=object)
+        for limit_type, (low, high) in HERE_LIMIT_VALS.items():
+            is_type = mod_type == limit_type
+            mod_val[is_type] = network.integers(mod_key[is_type], "limit value", low, high).astype(str)
+        is_prohibited = mod_kind == "prohibited"
+        mod_type[is_prohibited] = 39
+        mod_val[is_prohibited] = network.choice(mod_key[is_prohibited], "prohibited", HERE_PROHIBITED_VALS)
+        is_preferred = mod_kind == "preferred"
+        mod_type[is_preferred] = 49
+        mod_val[is_preferred] = network.choice(mod_key[is_preferred], "preferred", HERE_PREFERRED_VALS)
+        unused_ids = network.select(cond_ids, "unused modifier", 0.2)
+        cndmod_dfs.append(pd.concat([
+            pd.DataFrame({"MOD_TYPE": mod_type, "MOD_VAL": mod_val, "COND_ID": mod_ids}),
+            pd.DataFrame({
+                "MOD_TYPE": np.where(kind == "preferred", 60, 38),
+                "MOD_VAL": network.choice(cond_ids, "transport direction", ["1", "2", "3"], [0.6, 0.2, 0.2]),
+                "COND_ID": cond_ids
+            }),
+            pd.DataFrame({"MOD_TYPE": 1, "MOD_VAL": "1", "COND_ID": unused_ids})
+        ], ignore_index=True))
+
+    # Roads closed for construction and toll roads, some of which have two toll conditions
+    add_conditions(network.select(links, "construction", 0.002), 0, [3])
+    toll_links = network.select(links, "toll", 0.02)
+    add_conditions(toll_links, 1, [12])
+    add_conditions(network.select(toll_links, "second toll", 0.2), 2, [12])
+    # Transport restrictions on streets
+    add_cndmods(add_conditions(network.select(links, "transport", 0.03), 3, [23, 25, 27]))
+    # Restricted turns, some of which are transport restrictions
+    first, second, third = _maneuver_paths(network, network.select(links, "turn", 0.04), "turn")
+    add_rdms(add_conditions(first, 4, [7, 4], [0.85, 0.15], "N"), [second, third])
+    first, second, third = _maneuver_paths(network, network.select(links, "transport turn", 0.01), "transport turn")
+    cond_ids = add_conditions(first, 5, [26], end_of_lk="N")
+    add_rdms(cond_ids, [second, third])
+    add_cndmods(cond_ids)
+    # Road forks
+    fork_links, branch1, branch2 = _fork_paths(network, network.select(links, "fork", 0.01))
+    add_rdms(add_conditions(fork_links, 6, [9], end_of_lk="N"), [branch1, branch2])
+    tables["cdms"] = pd.concat(cdms_dfs, ignore_index=True)
+    tables["rdms"] = pd.concat(rdms_dfs, ignore_index=True)
+    cndmod_df = pd.concat(cndmod_dfs, ignore_index=True)
+    is_us = network.random(cndmod_df["COND_ID"].to_numpy() // 8, "us") < 0.7
+    tables["cndmod_us_table"] = cndmod_df[is_us].reset_index(drop=True)
+    tables["cndmod_non_us_table"] = cndmod_df[~is_us].reset_index(drop=True)
+
+    # Signs with one to three records each for about 2% of streets
+    sign_links = network.select(links, "sign", 0.02)
+    dst_links = network.next_links(sign_links, "sign destination")
+    sign_links, dst_links = sign_links[dst_links >= 0], dst_links[dst_links >= 0]
+    sign_idxs, sign_seq = _repeat(network, sign_links, "sign count", 1, 4)
+    sign_links, dst_links = sign_idxs, dst_links[np.searchsorted(sign_links, sign_idxs)]
+    sign_key = sign_links * 4 + sign_seq
+    dst_names, dst_types = network.names(dst_links)
+    tables["signs"] = pd.DataFrame({
+        "SIGN_ID": HERE_SIGN_ID_BASE + sign_links,
+        "SEQ_NUM": sign_seq,
+        "EXIT_NUM": np.where(
+            network.random(sign_links, "exit") < 0.5, (sign_links % 300 + 1).astype(str).astype(object), ""),
+        "SRC_LINKID": HERE_LINK_ID_BASE + sign_links,
+        "DST_LINKID": HERE_LINK_ID_BASE + dst_links,
+        "LANG_CODE": network.choice(sign_key, "sign language", ["ENG", "SPA", "FRE"], [0.9, 0.07, 0.03]),
+        "BR_RTEID": network.choice(sign_key, "branch", ["", "I-95", "US-1", "SR-70"], [0.5, 0.2, 0.2, 0.1]),
+        "BR_RTEDIR": network.choice(sign_key, "branch direction", ["", "N", "S", "E", "W"]),
+        "SIGN_TEXT": dst_names + " " + dst_types,
+        "SIGN_TXTTP": network.choice(sign_key, "sign text type", ["B", "T", ""], [0.4, 0.5, 0.1]),
+        "TOW_RTEID": network.choice(sign_key, "toward", ["", "DOWNTOWN", "AIRPORT"], [0.7, 0.2, 0.1])
+    })
+
+    # Link reference records for about 85% of functional class 1-4 streets and 35% of functional class 5 streets in
+    # each direction they can be traveled. The weekdays of a record mostly share a pattern, and many functional class
+    # 5 records use the same pattern every day.
+    num_patterns = num_speed_profiles(network.num_links)
+    for attr, func_classes, probability, const_probability in [
+        ("link_ref_table_1_4", [1, 2, 3, 4], 0.85, 0.1), ("link_ref_table_5", [5], 0.35, 0.5)
+    ]:
+        lr_links = network.select(links[np.isin(func_class, func_classes)], f"{attr} link", probability)
+        lr_links, is_to = _directional_records(lr_links, dir_travel[lr_links - start])
+        lr_key = lr_links * 2 + is_to
+        lr_df = pd.DataFrame({
+            "LINK_PVID": HERE_LINK_ID_BASE + lr_links, "TRAVEL_DIRECTION": np.where(is_to, "T", "F").astype(object)})
+        weekday = network.integers(lr_key, "weekday pattern", 1, num_patterns + 1)
+        is_const = network.random(lr_key, "constant days") < const_probability
+        for day in DAY_FIELDS:
+            pattern = network.integers(lr_key, f"{day} pattern", 1, num_patterns + 1)
+            if day not in ["U", "S"]:
+                pattern = np.where(network.random(lr_key, f"{day} differs") < 0.2, pattern, weekday)
+            lr_df[day] = np.where(is_const, weekday, pattern)
+        tables[attr] = lr_df
+
+    # TMC codes for about 15% of streets, with a traffic record for each direction they can be traveled
+    tmc_links = network.select(links, "tmc", 0.15)
+    tmc_codes = (
+        (100 + tmc_links % 900).astype(str).astype(object) + network.choice(tmc_links, "tmc sign", ["+", "-"]) +
+        pd.Series(tmc_links // 900 % 100000).astype(str).str.zfill(5).to_numpy(dtype=object)
+    )
+    traffic_links, is_to = _directional_records(tmc_links, dir_travel[tmc_links - start])
+    tables["traffic_table"] = pd.DataFrame({
+        "LINK_ID": HERE_LINK_ID_BASE + traffic_links,
+        "TRAFFIC_CD": np.where(is_to, "-", "+").astype(object) + tmc_codes[np.searchsorted(tmc_links, traffic_links)]
+    })
+    tmc_ref_df = pd.DataFrame({"TMC": pd.Series(tmc_codes, dtype=object).str.replace("+", "P").str.replace("-", "N")})
+    for day in DAY_FIELDS:
+        tmc_ref_df[day] = network.integers(tmc_links, f"tmc {day} pattern", 1, num_patterns + 1)
+    tables["tmc_ref_table"] = tmc_ref_df
+    return tables
+
+
+def multinet_speed_profiles(network):
+    """Return the HSPR table of a synthetic MultiNet dataset with the relative speed of each profile in each time slot.
+
+    A few profiles are missing a time slot.
+    """
+    num_slots = 86400 // MULTINET_SLOT_SECONDS
+    speeds = _speed_patterns(network, num_speed_profiles(network.num_links), num_slots, "HSPR")
+    rel_sp = np.round(speeds / speeds.max(axis=1, keepdims=True) * 100, 1)
+    hspr_df = pd.DataFrame({
+        "PROFILE_ID": np.repeat(np.arange(1, len(speeds) + 1), num_slots),
+        "TIME_SLOT": np.tile(np.arange(num_slots) * MULTINET_SLOT_SECONDS, len(speeds)),
+        "REL_SP": rel_sp.ravel()
+    })
+    is_missing = network.random(np.arange(len(hspr_df)), "missing slot") < 0.01 / num_slots
+    return hspr_df[~is_missing].reset_index(drop=True)
+
+
+def multinet_tables(network, start, stop, with_geometry=False):
+    """Return the records of a synthetic MultiNet dataset related to the streets with indices from start to stop.
+
+    Args:
+        network: SyntheticNetwork to generate records for
+        start: Index of the first street
+        stop: Index after the last street
+        with_geometry: Whether to add the well-known binary geometry of the streets and maneuvers in a SHAPE@WKB column
+
+    Returns:
+        Dictionary of {MultiNetInputData attribute: dataframe} of all tables but the HSPR table
+    """
+    links = np.arange(start, stop, dtype=np.int64)
+    ids = (MULTINET_ID_BASE + links).astype(np.float64)
+    from_nodes, to_nodes = network.link_nodes(links)
+    func_class = network.func_class(links)
+    base_names, street_types = network.names(links)
+    offsets, coords = network.link_vertices(links)
+    meters = network.link_meters(offsets, coords)
+    kph = FUNC_CLASS_KPH[func_class]
+    tables = {}
+
+    # Network geometry
+    nw_df = pd.DataFrame({
+        "ID": ids,
+        "FEATTYP": 4110,
+        "F_JNCTID": (MULTINET_JUNCTION_ID_BASE + from_nodes).astype(np.float64),
+        "T_JNCTID": (MULTINET_JUNCTION_ID_BASE + to_nodes).astype(np.float64),
+        "PJ": 0,
+        "METERS": np.round(meters, 2),
+        "NET2CLASS": func_class + 1,
+        "NAME": base_names + " " + street_types,
+        "FOW": np.where(func_class == 1, 1, 3),
+        "FREEWAY": np.where(func_class == 1, 1, 0),
+        "BACKRD": 0,
+        "TOLLRD": network.choice(links, "toll", [0, 11, 12, 13, 21], [0.97, 0.015, 0.006, 0.006, 0.003]),
+        "RDCOND": 1,
+        "PRIVATERD": 0,
+        "CONSTATUS": "",
+        "ONEWAY": network.choice(links, "oneway", ["", "FT", "TF", "N"], [0.8, 0.09, 0.09, 0.02]),
+        "F_ELEV": 0,
+        "T_ELEV": 0,
+        "KPH": kph,
+        "MINUTES": (meters * 0.06 / kph).astype(np.float32),
+        "NTHRUTRAF": 0,
+        "ROUGHRD": 0
+    }).astype({"TOLLRD": np.int64})
+    if with_geometry:
+        nw_df[GEOMETRY_COLUMN] = [vertices_to_wkb(coords[s:e]) for s, e in zip(offsets[:-1], offsets[1:])]
+    tables["nw"] = nw_df
+
+    # Maneuvers, each with an ID derived from the street it starts on and its kind, at the junction at the end of that
+    # street. Prohibited and restricted turns have two or three streets, and road forks have three.
+    mn_dfs = []
+    mp_dfs = []
+
+    def add_maneuvers(maneuver_links, kind, feattyp, paths):
+        """Add MN and MP records of the designated kind for the paths starting with the designated streets."""
+        maneuver_ids = MULTINET_MANEUVER_ID_BASE + maneuver_links * 4 + kind
+        maneuver_nodes = network.link_nodes(maneuver_links)[1]
+        mn_df = pd.DataFrame({
+            "ID": maneuver_ids.astype(np.float64),
+            "JNCTID": (MULTINET_JUNCTION_ID_BASE + maneuver_nodes).astype(np.float64),
+            "FEATTYP": feattyp
+        })
+        if with_geometry:
+            x, y = network.node_xy(maneuver_nodes)
+            mn_df[GEOMETRY_COLUMN] = [struct.pack("<BIdd", 1, 1, px, py) for px, py in zip(x, y)]
+        mn_dfs.append(mn_df)
+        mp_ids, mp_links, mp_seq = _path_records(maneuver_ids, [maneuver_links] + paths)
+        mp_dfs.append(pd.DataFrame({
+            "ID": mp_ids.astype(np.float64),
+            "TRPELID": (MULTINET_ID_BASE + mp_links).astype(np.float64),
+            "SEQNR": mp_seq
+        }))
+        return maneuver_ids
+
+    turn_links, second, third = _maneuver_paths(network, network.select(links, "turn", 0.04), "turn")
+    is_restricted = network.random(turn_links, "turn type") < 0.3
+    add_maneuvers(turn_links[~is_restricted], 0, 2101, [second[~is_restricted], third[~is_restricted]])
+    restricted_ids = add_maneuvers(turn_links[is_restricted], 1, 2103, [second[is_restricted], third[is_restricted]])
+    fork_links, branch1, branch2 = _fork_paths(network, network.select(links, "fork", 0.01))
+    add_maneuvers(fork_links, 2, 9401, [branch1, branch2])
+    tables["mn"] = pd.concat(mn_dfs, ignore_index=True)
+    tables["mp"] = pd.concat(mp_dfs, ignore_index=True)
+
+    # Restrictions on about 5% of streets and on the restricted turns, including some for a vehicle type and a
+    # restriction type the tool doesn't use
+    rs_links = network.select(links, "restriction", 0.05)
+    rs_turn_ids, rs_turn_seq = _repeat(network, restricted_ids, "turn restriction count", 1, 3)
+    rs_turn_key = rs_turn_ids * 4 + rs_turn_seq
+    tables["rs"] = pd.concat([
+        pd.DataFrame({
+            "ID": ids[rs_links - start],
+            "FEATTYP": 4110,
+            "VT": network.choice(rs_links, "restriction vt", MULTINET_VTS + [24], [0.5, 0.15, 0.1, 0.1, 0.1, 0.05]),
+            "DIR_POS": network.choice(rs_links, "restriction dir", [1, 2, 3], [0.5, 0.25, 0.25]),
+            "RESTRTYP": network.choice(rs_links, "restriction type", ["DF", "SR"], [0.9, 0.1])
+        }),
+        pd.DataFrame({
+            "ID": rs_turn_ids.astype(np.float64),
+            "FEATTYP": 2103,
+            "VT": network.choice(rs_turn_key, "turn restriction vt", MULTINET_VTS),
+            "DIR_POS": 1,
+            "RESTRTYP": network.choice(rs_turn_key, "turn restriction type", ["8I", "DF"], [0.3, 0.7])
+        })
+    ], ignore_index=True).astype({"VT": np.int64, "DIR_POS": np.int64})
+
+    # Signs for about 2% of streets, with a path from the street to the next one and one to five sign info records
+    sign_links = network.select(links, "sign", 0.02)
+    dst_links = network.next_links(sign_links, "sign destination")
+    sign_links, dst_links = sign_links[dst_links >= 0], dst_links[dst_links >= 0]
+    sign_ids = MULTINET_SIGN_ID_BASE + sign_links
+    sp_ids, sp_links, sp_seq = _path_records(sign_ids, [sign_links, dst_links])
+    tables["sp"] = pd.DataFrame({
+        "ID": sp_ids.astype(np.float64),
+        "TRPELID": (MULTINET_ID_BASE + sp_links).astype(np.float64),
+        "SEQNR": sp_seq
+    })
+    si_ids, si_seq = _repeat(network, sign_ids, "sign info count", 1, 6)
+    dst_names, dst_types = network.names(dst_links[np.searchsorted(sign_ids, si_ids)])
+    si_key = si_ids * 8 + si_seq
+    info_type = network.choice(si_key, "info type", ["4E", "9D", "4I", "6T", "RN"], [0.15, 0.35, 0.1, 0.2, 0.2])
+    tables["si"] = pd.DataFrame({
+        "ID": si_ids.astype(np.float64),
+        "INFOTYP": info_type,
+        "TXTCONT": np.where(
+            info_type == "4E", (si_ids % 300 + 1).astype(str).astype(object), dst_names + " " + dst_types),
+        "TXTCONTLC": network.choice(si_key, "info language", ["ENG", "SPA", "FRE"], [0.9, 0.07, 0.03]),
+        "CONTYP": network.choice(si_key, "content type", [1, 2, 4], [0.5, 0.3, 0.2]).astype(np.int64),
+        "SEQNR": si_seq,
+        "DESTSEQ": network.integers(si_key, "destination sequence", 1, 3),
+        "RNPART": 1
+    })
+
+    # Historical traffic for about 60% of streets, with records for one or both directions
+    hsnp_links, hsnp_seq = _repeat(network, network.select(links, "hsnp", 0.6), "hsnp directions", 1, 3)
+    hsnp_key = hsnp_links * 4 + hsnp_seq
+    hsnp_kph = kph[hsnp_links - start]
+    hsnp_df = pd.DataFrame({
+        "NETWORK_ID": ids[hsnp_links - start],
+        "VAL_DIR": hsnp_seq + 1,
+        "SPFREEFLOW": np.where(network.random(hsnp_key, "free flow") < 0.02, 0, hsnp_kph),
+        "SPWEEKDAY": np.maximum(hsnp_kph - network.integers(hsnp_key, "weekday slowdown", 0, 15), 5),
+        "SPWEEKEND": np.maximum(hsnp_kph - network.integers(hsnp_key, "weekend slowdown", 0, 8), 5),
+        "SPWEEK": np.maximum(hsnp_kph - network.integers(hsnp_key, "week slowdown", 0, 12), 5)
+    })
+    num_profiles = num_speed_profiles(network.num_links)
+    for day in range(1, 8):
+        hsnp_df[f"PROFILE_{day}"] = network.integers(hsnp_key, f"profile {day}", 1, num_profiles + 1)
+    tables["hsnp"] = hsnp_df
+
+    # RDS-TMC codes for about 15% of streets
+    rd_links = network.select(links, "rd", 0.15)
+    tables["rd"] = pd.DataFrame({
+        "ID": ids[rd_links - start],
+        "RDSTMC": network.choice(rd_links, "rd direction", ["+", "-"]) + "C1" +
+        (100 + rd_links % 900).astype(str).astype(object) + network.choice(rd_links, "rd sign", ["P", "N"]) +
+        pd.Series(rd_links // 900 % 100000).astype(str).str.zfill(5).to_numpy(dtype=object)
+    })
+
+    # Logistics truck routes for about 5% of streets
+    ltr_links = network.select(links, "ltr", 0.05)
+    tables["ltr"] = pd.DataFrame({
+        "ID": ids[ltr_links - start],
+        "PREFERRED": network.integers(ltr_links, "preferred", 0, 5),
+        "RESTRICTED": network.integers(ltr_links, "restricted", 0, 4)
+    })
+
+    # Logistics restrictions for about 4% of streets, some with caveats in the LVC table and a few with a restriction
+    # type the tool doesn't support
+    restrtyp_codes = pd.read_csv(
+        os.path.join(CURDIR, "LogisticsAttributeLookupTables", "RESTRTYP.csv"))["RESTRTYP"].tolist()
+    vt_codes = pd.read_csv(os.path.join(CURDIR, "LogisticsAttributeLookupTables", "VT.csv"))["VT"].tolist()
+    lrs_links, lrs_seq = _repeat(network, network.select(links, "lrs", 0.04), "lrs count", 1, 4)
+    lrs_key = lrs_links * 4 + lrs_seq
+    restrtyp = network.choice(lrs_key, "lrs type", restrtyp_codes + ["#A"], [1] * len(restrtyp_codes) + [2])
+    is_weight = np.isin(restrtyp, ["!A", "!B", "!C", "!D", "!E", "!F"])
+    is_length = np.isin(restrtyp, ["!G", "!H", "!I", "!J", "!K", "!L", "!M", "!N", "!O", "!P"])
+    tables["lrs"] = pd.DataFrame({
+        "ID": ids[lrs_links - start],
+        "SEQNR": lrs_seq,
+        "RESTRTYP": restrtyp,
+        "VT": network.choice(lrs_key, "lrs vt", vt_codes).astype(np.int64),
+        "RESTRVAL": network.integers(lrs_key, "lrs value", 1, 5),
+        "LIMIT": np.select(
+            [is_weight, is_length],
+            [network.integers(lrs_key, "weight limit", 5, 40), network.integers(lrs_key, "length limit", 200, 2000)],
+            0
+        ).astype(np.float64),
+        "UNIT_MEAS": np.select(
+            [is_weight, is_length],
+            [network.choice(lrs_key, "weight unit", [7, 3]), network.choice(lrs_key, "length unit", [9, 8, 5, 4])],
+            0
+        ).astype(np.int64)
+    })
+    has_caveat = network.random(lrs_key, "lvc") < 0.1
+    tables["lvc"] = pd.DataFrame({"ID": ids[lrs_links[has_caveat] - start], "SEQNR": lrs_seq[has_caveat]})
+    return tables
+
+
+def generate_chunks(product, network, chunk_size=DEFAULT_CHUNK_SIZE, with_geometry=False):
+    """Yield the records of a synthetic dataset one chunk of streets at a time.
+
+    Args:
+        product: "here" or "multinet"
+        network: SyntheticNetwork to generate records for
+        chunk_size: Number of streets whose records are generated at a time
+        with_geometry: Whether to add the well-known binary geometry of the feature classes in a SHAPE@WKB column
+
+    Yields:
+        Dictionaries of {input data attribute: dataframe} of all tables but the speed profiles table, which is generated
+        separately by here_speed_profiles or multinet_speed_profiles
+    """
+    tables_func = here_tables if product == "here" else multinet_tables
+    for start in range(0, network.num_links, chunk_size):
+        yield tables_func(network, start, min(start + chunk_size, network.num_links), with_geometry)
+
+
+def load_dataset(product, num_links, seed=0):
+    """Generate a whole synthetic dataset in memory.
+
+    Returns:
+        The SyntheticNetwork and a dictionary of {input data attribute: dataframe} of all tables in the dataset
+    """
+    network = SyntheticNetwork(num_links, seed)
+    tables = next(generate_chunks(product, network, max(network.num_links, 1)))
+    if product == "here":
+        tables["historical_speed_profiles_table"] = here_speed_profiles(network)
+    else:
+        tables["hspr"] = multinet_speed_profiles(network)
+    return network, tables
+
+
+def _create_table(path, geometry_type, required_fields, df):
+    """Create a table in a file gdb with the required fields and a field for each other column of the dataframe."""
+    gdb, name = os.path.split(path)
+    if geometry_type:
+        arcpy.management.CreateFeatureclass(gdb, name, geometry_type, spatial_reference=arcpy.SpatialReference(4326))
+    else:
+        arcpy.management.CreateTable(gdb, name)
+    field_types = {field: FIELD_TYPES[field_type] for field, field_type in required_fields}
+    field_defs = []
+    for column in df.columns:
+        if column == GEOMETRY_COLUMN:
+            continue
+        field_type = field_types.get(column, FIELD_TYPES[df[column].dtype.kind])
+        field_defs.append([column, field_type, "", TEXT_FIELD_LENGTH] if field_type == "TEXT" else [column, field_type])
+    arcpy.management.AddFields(path, field_defs)
+
+
+def write_dataset(product, num_links, out_folder, seed=0, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Write a synthetic dataset to a file gdb and CSV files in the output folder one chunk of streets at a time.
+
+    Returns:
+        The HereNavstreetsShpInputData or MultiNetInputData describing the dataset that was written
+    """
+    if arcpy is None:
+        raise RuntimeError("Writing a synthetic dataset to a file gdb requires arcpy.")
+    os.makedirs(out_folder, exist_ok=True)
+    arcpy.management.CreateFileGDB(out_folder, GDB_NAME)
+    network = SyntheticNetwork(num_links, seed)
+    if product == "here":
+        in_data = here_input_data(out_folder)
+        profile_tables = {"historical_speed_profiles_table": here_speed_profiles(network)}
+    else:
+        in_data = multinet_input_data(out_folder)
+        profile_tables = {"hspr": multinet_speed_profiles(network)}
+
+    created = set()
+    for tables in itertools.chain([profile_tables], generate_chunks(product, network, chunk_size, True)):
+        for attr, df in tables.items():
+            path = getattr(in_data, attr)
+            if path.endswith(".csv"):
+                df.to_csv(path, mode="a" if attr in created else "w", header=attr not in created, index=False)
+            else:
+                if attr not in created:
+                    _create_table(path, GEOMETRY_TYPES.get(attr), in_data.required_fields[path], df)
+                insert_df_rows(path, df, list(df.columns))
+            created.add(attr)
+    return in_data
+
+
+def main():
+    """Parse the command line arguments and write a synthetic dataset."""
+    parser = argparse.ArgumentParser(description="Write a synthetic HERE or MultiNet dataset for benchmarking.")
+    parser.add_argument("product", choices=["here", "multinet"], help="Data product to generate.")
+    parser.add_argument("--links", type=int, default=100000, help="Number of streets in the dataset.")
+    parser.add_argument("--out-folder", required=True, help="Folder to write the dataset to.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random values in the dataset.")
+    parser.add_argument(
+        "--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Number of streets generated and written at a time.")
+    args = parser.parse_args()
+    write_dataset(args.product, args.links, args.out_folder, args.seed, args.chunk_size)
+    print(f"Wrote a synthetic {args.product} dataset with {args.links} streets to {args.out_folder}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Geometry functions for building turn and signpost shapes from street vertices
+
+   These functions work on (N, 2) float64 arrays of vertex coordinates and do not use arcpy, so they are fast and can
+   be used and tested anywhere numpy is available. A line is either an array of its vertices, or a list of arrays with
+   the vertices of each part of a multipart line. Only X and Y are used, since the turn and signpost feature classes
+   don't store Z or M values.
+
+   Copyright 2025 Esri
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+       http://www.apache.org/licenses/LICENSE-2.0
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+import struct
+import numpy as np
+
+TURN_EDGE_FRACTION = 0.3  # Fraction of the first and last edges of a turn included in the turn geometry
+SIGNPOST_EDGE_FRACTION = 0.25  # Fraction of the first and last edges of a signpost included in the signpost geometry
+
+
+def line_vertices(line):
+    """Return an (N, 2) array of all the vertices of a line and the indexes of the first vertex of each later part."""
+    if isinstance(line, np.ndarray):
+        return line, np.empty(0, dtype=np.int64)
+    parts = [part for part in line if len(part)]
+    if not parts:
+        return np.empty((0, 2), dtype=np.float64), np.empty(0, dtype=np.int64)
+    if len(parts) == 1:
+        return parts[0], np.empty(0, dtype=np.int64)
+    return np.concatenate(parts), np.cumsum([len(part) for part in parts[:-1]])
+
+
+def segment_along_line(line, start_fraction, end_fraction):
+    """Return the vertices of the part of a line between two fractions of its length.
+
+    This is equivalent to Polyline.segmentAlongLine(start_fraction, end_fraction, use_percentage=True) followed by
+    joining the parts of the result into a single sequence of vertices. The result starts and ends with the
+    interpolated points at the start and end positions and includes the original vertices in between. The parts of a
+    multipart line are measured one after another, so the gaps between them don't count towards its length.
+
+    Args:
+        line: (N, 2) array of the line's vertices, or a list of arrays with the vertices of each part
+        start_fraction: Start position along the line as a fraction of its length from 0 to 1
+        end_fraction: End position along the line as a fraction of its length from 0 to 1
+
+    Returns:
+        (M, 2) array of vertices
+    """
+    vertices, part_starts = line_vertices(line)
+    segment_lengths = np.hypot(*np.diff(vertices, axis=0).T)
+    segment_lengths[part_starts - 1] = 0  # Jumps from the end of one part to the start of the next one
+    cum_length = np.concatenate(([0.], np.cumsum(segment_lengths)))
+    start = start_fraction * cum_length[-1]
+    end = end_fraction * cum_length[-1]
+    endpoints = np.column_stack((
+        np.interp([start, end], cum_length, vertices[:, 0]),
+        np.interp([start, end], cum_length, vertices[:, 1])
+    ))
+    inner = vertices[(cum_length > start) & (cum_length < end)]
+    return np.concatenate((endpoints[:1], inner, endpoints[1:]))
+
+
+def build_turn_vertices(edge_vertices, reversed_edges):
+    """Build the vertices of a turn from the vertices of its component edges.
+
+    The turn starts with the end of the first edge nearest the turn, follows all edges in between in their entirety,
+    and ends with the start of the last edge.
+
+    Args:
+        edge_vertices: List of the lines of the edges in the turn in order
+        reversed_edges: Sequence of booleans indicating which edges are traversed against their digitized direction
+
+    Returns:
+        An (N, 2) array of the turn's vertices
+    """
+    return _join_edges(edge_vertices, reversed_edges, TURN_EDGE_FRACTION)
+
+
+def build_signpost_vertices(edge_vertices, reversed_edges):
+    """Build the vertices of a signpost from the vertices of its component edges.
+
+    The signpost starts with the last quarter of the first edge, follows all edges in between in their entirety, and
+    ends with the first quarter of the last edge.
+
+    Args:
+        edge_vertices: List of the lines of the edges in the signpost in order
+        reversed_edges: Sequence of booleans indicating which edges are traversed against their digitized direction
+
+    Returns:
+        An (N, 2) array of the signpost's vertices
+    """
+    return _join_edges(edge_vertices, reversed_edges, SIGNPOST_EDGE_FRACTION)
+
+
+def _join_edges(edge_vertices, reversed_edges, edge_fraction):
+    """Join the vertices of a sequence of edges, keeping only the designated fraction of the first and last edges."""
+    parts = []
+    last_idx = len(edge_vertices) - 1
+    for idx, (edge, reverse_edge) in enumerate(zip(edge_vertices, reversed_edges)):
+        if idx == 0:
+            # Trim the first edge to the fraction nearest the second edge
+            if reverse_edge:
+                edge = segment_along_line(edge, 0, edge_fraction)
+            else:
+                edge = segment_along_line(edge, 1 - edge_fraction, 1)
+        elif idx == last_idx:
+            # Trim the last edge to the fraction nearest the previous edge
+            if reverse_edge:
+                edge = segment_along_line(edge, 1 - edge_fraction, 1)
+            else:
+                edge = segment_along_line(edge, 0, edge_fraction)
+        else:
+            edge = line_vertices(edge)[0]
+        parts.append(edge[::-1] if reverse_edge else edge)
+    return np.concatenate(parts)
+
+
+def vertices_to_wkb(line):
+    """Return the well-known binary (WKB) representation of a line.
+
+    The result can be written to a cursor's SHAPE@WKB field, which is much faster than constructing an arcpy Polyline
+    from individual Point objects. A line with more than one part is written as a MultiLineString.
+    """
+    if not isinstance(line, np.ndarray):
+        parts = [part for part in line if len(part)]
+        if len(parts) != 1:
+            # Little-endian byte order marker, WKB MultiLineString geometry type, and number of parts followed by a
+            # LineString for each part
+            return struct.pack("<BII", 1, 5, len(parts)) + b"".join(vertices_to_wkb(part) for part in parts)
+        line = parts[0]
+    vertices = np.ascontiguousarray(line, dtype="<f8")
+    # Little-endian byte order marker, WKB LineString geometry type, and number of points followed by the coordinates
+    return struct.pack("<BII", 1, 2, len(vertices)) + vertices.tobytes()
+
+
+def _read_wkb_header(wkb, offset):
+    """Return the byte order, number of points, base geometry type, and coordinates per point of the WKB at offset.
+
+    Both ISO WKB, which adds 1000, 2000, or 3000 to the geometry type for Z, M, or ZM, and extended WKB, which sets the
+    high bits of the geometry type for Z and M, are supported. The number of points is the number of parts of a
+    MultiLineString.
+    """
+    byte_order = "<" if wkb[offset] == 1 else ">"
+    geometry_type, count = struct.unpack_from(byte_order + "II", wkb, offset + 1)
+    has_z = bool(geometry_type & 0x80000000) or (geometry_type & 0x0FFFFFFF) // 1000 in (1, 3)
+    has_m = bool(geometry_type & 0x40000000) or (geometry_type & 0x0FFFFFFF) // 1000 in (2, 3)
+    return byte_order, count, (geometry_type & 0x0FFFFFFF) % 1000, 2 + has_z + has_m
+
+
+def wkb_to_parts(wkb):
+    """Return a list of (N, 2) arrays of the vertices of each part of a line from its well-known binary representation.
+
+    Both LineStrings and MultiLineStrings are supported. Z and M values are dropped.
+    """
+    wkb = bytes(wkb)
+    _, num_parts, geometry_type, _ = _read_wkb_header(wkb, 0)
+    if geometry_type == 2:
+        num_parts = 1
+        offset = 0
+    elif geometry_type == 5:
+        offset = 9
+    else:
+        raise ValueError(f"Unsupported WKB geometry type {geometry_type}. Only lines are supported.")
+    parts = []
+    for _ in range(num_parts):
+        # Each part of a MultiLineString is a complete LineString with its own byte order and geometry type
+        byte_order, num_points, _, num_coords = _read_wkb_header(wkb, offset)
+        coords = np.frombuffer(wkb, dtype=byte_order + "f8", count=num_points * num_coords, offset=offset + 9)
+        parts.append(coords.reshape(-1, num_coords)[:, :2].astype(np.float64))
+        offset += 9 + num_points * num_coords * 8
+    return parts
+
+
+def wkb_to_vertices(wkb):
+    """Return an (N, 2) array of the vertices of a line from its well-known binary (WKB) representation.
+
+    The vertices of all the parts of a MultiLineString are returned in order as a single array, the same way arcpy
+    returns them when exploding a feature to points. Use wkb_to_parts to keep the parts apart.
+    """
+    return line_vertices(wkb_to_parts(wkb))[0]
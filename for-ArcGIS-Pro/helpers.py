@@ -12,22 +12,212 @@
    limitations under the License.'''
 """
 import os
+import re
+import ast
+import sys
+import csv
+import json
+import math
+import shutil
+import hashlib
+import struct
+import tempfile
 import time
 import datetime
 import functools
+import itertools
+import threading
+import contextlib
+import multiprocessing
+from concurrent import futures
 from enum import Enum
 from lxml import etree
 import psutil
+import numpy as np
 import pandas as pd
-import arcpy
-
-PRINT_TIMINGS = False  # Set to True to log timings for various methods (primarily for debugging and development)
+from geometry import line_vertices, vertices_to_wkb, wkb_to_parts
+try:
+    import arcpy
+except ImportError:
+    arcpy = None  # Only the calculations and LocalTableIO can run without arcpy, for example in the benchmarks
+try:
+    import pyarrow
+    from pyarrow import feather
+except ImportError:  # pyarrow is only needed for caching tables, spilling them to disk, and Parquet files
+    pyarrow = None
+    feather = None
+
+PROFILE_ENV_VAR = "STREET_DATA_PROCESSING_PROFILE"  # Environment variable that turns on profiling when set to 1
+PROFILE_SAMPLE_INTERVAL = 0.05  # Seconds between samples of the process's memory usage while profiling
+INSERT_BATCH_SIZE = 100000  # Default number of dataframe rows to convert and insert at a time when populating tables
+WORKER_PARTITION_SIZE = 20000  # Max number of input records or record groups processed in a single worker task
+TABLE_CACHE_SIZE_GB = 10  # Default size limit of the on-disk cache of input tables
+STRING_VALUE_NBYTES = 50  # Approximate memory used by a text value in a dataframe, not counting its characters
+PREFETCH_THREADS = 4  # Number of threads reading input tables ahead of the stages that need them
+OID_BATCH_SIZE = 1000  # Number of ObjectIDs listed in the where clause of each batch of rows copied or deleted
+DELTA_CHUNK_SIZE = 500000  # Number of ObjectIDs in each range of streets hashed at a time when comparing streets
+DELTA_MAX_CHANGED_FRACTION = 0.25  # Max fraction of streets changed for a delta run to update the previous output
+MAX_WARNING_IDS = 10  # Max number of IDs listed in a warning summarizing a problem found in many records
+SIGNPOST_COMMIT_SIZE = 50000  # Number of signposts written in each edit session when populating signposts
+MULTIPART_LENGTH_TOLERANCE = 1e-6  # Relative excess length of a street's exploded vertices that marks it multipart
+OID_COLUMN_PATTERN = re.compile(r"OID@?|\w*FID", re.IGNORECASE)  # Columns of ObjectIDs, which compact_df keeps int64
 
 CURDIR = os.path.dirname(os.path.abspath(__file__))
 
 
+class RunProfiler:
+    """Record the wall time, CPU time, peak memory, and rows read and written of each stage of a tool run.
+
+    Stages can be nested, for example to split a method into its reading, computing, and writing steps. Each stage is
+    identified by its path of enclosing stage names, the time and rows of a stage include those of the stages nested in
+    it, and repeated runs of the same stage are combined. The process's memory usage is sampled in a background thread
+    while profiling so the peak of each stage is captured even if it's brief. Stages can also run on other threads, like
+    prefetched reads, in which case they're nested only in the stages open on their own thread, and the CPU time of a
+    stage is that of the thread running it. Nothing is recorded unless profiling has been started, so the stages cost
+    almost nothing otherwise.
+
+    The report also lists the throughput of each stage and its average rows per call, which is the batch size of a
+    stage run once per batch, like each commit of a chunk of rows.
+    """
+
+    report_fields = [
+        "stage", "depth", "calls", "wall_seconds", "self_wall_seconds", "cpu_seconds", "start_rss_mb",
+        "peak_rss_delta_mb", "rows_read", "rows_written", "rows_per_call", "rows_per_second"
+    ]
+
+    def __init__(self):
+        """Initialize a profiler that isn't recording yet."""
+        self.enabled = False
+        self._process = psutil.Process()
+        self._lock = threading.Lock()
+        self._open_stages = {}  # {thread ID: stack of dictionaries with the running totals of the thread's stages}
+        self._stats = {}  # {stage path: dictionary of combined stats}, in the order the stages were first started
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+
+    def start(self):
+        """Discard any previous results and start recording stages."""
+        self._open_stages = {}
+        self._stats = {}
+        self.enabled = True
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(target=self._sample_memory, daemon=True)
+        self._sampler.start()
+
+    def stop(self):
+        """Stop recording stages."""
+        self.enabled = False
+        self._stop_sampling.set()
+        if self._sampler is not None:
+            self._sampler.join()
+            self._sampler = None
+
+    def _sample_memory(self):
+        """Update the peak memory usage of the running stages periodically until profiling stops."""
+        while not self._stop_sampling.wait(PROFILE_SAMPLE_INTERVAL):
+            self._update_peak_rss()
+
+    def _update_peak_rss(self):
+        """Update the peak memory usage of the running stages with the process's current memory usage."""
+        rss = self._process.memory_info().rss
+        with self._lock:
+            for stages in self._open_stages.values():
+                for stage in stages:
+                    stage["peak_rss"] = max(stage["peak_rss"], rss)
+        return rss
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Context manager that records the code run inside it as a stage with the designated name."""
+        if not self.enabled:
+            yield
+            return
+        rss = self._update_peak_rss()
+        with self._lock:
+            # Stages run on other threads, like prefetched reads, are nested in the stages open on their own thread
+            open_stages = self._open_stages.setdefault(threading.get_ident(), [])
+            parent = open_stages[-1] if open_stages else None
+            stage = {
+                "path": f"{parent['path']}/{name}" if parent else name,
+                "depth": len(open_stages),
+                "start_rss": rss, "peak_rss": rss, "rows_read": 0, "rows_written": 0, "child_wall": 0.0
+            }
+            self._stats.setdefault(stage["path"], None)
+            open_stages.append(stage)
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        try:
+            yield
+        finally:
+            wall = time.perf_counter() - wall0
+            cpu = time.thread_time() - cpu0
+            self._update_peak_rss()
+            with self._lock:
+                open_stages.remove(stage)
+                if parent is not None:
+                    parent["child_wall"] += wall
+                stats = self._stats[stage["path"]]
+                if stats is None:
+                    stats = self._stats[stage["path"]] = {
+                        "stage": stage["path"], "depth": stage["depth"], "calls": 0, "wall_seconds": 0.0,
+                        "self_wall_seconds": 0.0, "cpu_seconds": 0.0, "start_rss_mb": stage["start_rss"] / 1024 ** 2,
+                        "peak_rss_delta_mb": 0.0, "rows_read": 0, "rows_written": 0
+                    }
+                stats["calls"] += 1
+                stats["wall_seconds"] += wall
+                stats["self_wall_seconds"] += wall - stage["child_wall"]
+                stats["cpu_seconds"] += cpu
+                stats["peak_rss_delta_mb"] = max(
+                    stats["peak_rss_delta_mb"], (stage["peak_rss"] - stage["start_rss"]) / 1024 ** 2)
+                stats["rows_read"] += stage["rows_read"]
+                stats["rows_written"] += stage["rows_written"]
+
+    def add_rows(self, rows_read=0, rows_written=0):
+        """Add to the number of rows read and written by all the currently running stages of the calling thread."""
+        if not self.enabled:
+            return
+        with self._lock:
+            for stage in self._open_stages.get(threading.get_ident(), []):
+                stage["rows_read"] += rows_read
+                stage["rows_written"] += rows_written
+
+    def stages(self):
+        """Return a list of dictionaries with the combined stats of each finished stage, with times rounded to ms.
+
+        The throughput and average rows per call of a stage count the rows it read or wrote, whichever is more.
+        """
+        stages = [dict(stats) for stats in self._stats.values() if stats is not None]
+        for stats in stages:
+            num_rows = max(stats["rows_read"], stats["rows_written"])
+            stats["rows_per_call"] = round(num_rows / stats["calls"], 1)
+            stats["rows_per_second"] = round(num_rows / stats["wall_seconds"], 1) if stats["wall_seconds"] else 0.0
+            for field in ["wall_seconds", "self_wall_seconds", "cpu_seconds", "start_rss_mb", "peak_rss_delta_mb"]:
+                stats[field] = round(stats[field], 3)
+        return stages
+
+    def write_report(self, report_base):
+        """Write the recorded stages to a JSON file and a CSV file with the designated path and no extension.
+
+        Returns:
+            List of the report files written
+        """
+        stages = self.stages()
+        json_file = report_base + ".json"
+        with open(json_file, "w", encoding="utf-8") as f:
+            json.dump({"created": datetime.datetime.now().isoformat(timespec="seconds"), "stages": stages}, f, indent=2)
+        csv_file = report_base + ".csv"
+        with open(csv_file, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, self.report_fields)
+            writer.writeheader()
+            writer.writerows(stages)
+        return [json_file, csv_file]
+
+
+PROFILER = RunProfiler()  # Profiler shared by everything run in this process
+
+
 def timed_exec(func):
-    """Measure time in seconds to execute a function.
+    """Record the execution of a function as a stage in the profiling report if profiling is turned on.
 
     This function is meant to be used as a decorator on a function.
 
@@ -37,21 +227,263 @@ def timed_exec(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
         """Wrap the function to be run."""
-        # Using an inner function so the timing can happen directly around the function under test.
-        def inner_func():
-            t0 = time.time()
-            return_val = func(*args, **kwargs)
-            if PRINT_TIMINGS:
-                arcpy.AddMessage(f"Time to run {func.__name__}: {time.time() - t0}")
-                arcpy.AddMessage("System memory usage:")
-                arcpy.AddMessage(str(psutil.virtual_memory()))
-            return return_val
-
-        return inner_func()
+        with PROFILER.stage(func.__name__):
+            return func(*args, **kwargs)
 
     return wrapper
 
 
+def profiled_run(func):
+    """Profile a processor's main method and write the profiling report when it's done if profiling is turned on.
+
+    This function is meant to be used as a decorator on a StreetDataProcessor method. The report is written even if the
+    method fails, since that's often when it's most useful.
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        """Wrap the method to be run."""
+        if not self.profile:
+            return func(self, *args, **kwargs)
+        PROFILER.start()
+        try:
+            with PROFILER.stage(func.__name__):
+                return func(self, *args, **kwargs)
+        finally:
+            PROFILER.stop()
+            self._write_profile_report()
+
+    return wrapper
+
+
+def to_object_array(values):
+    """Convert a pandas Series or array to a numpy object array with missing values (NaN, NA, NaT) set to None.
+
+    Object arrays compare element by element using Python semantics, so None == None, which is what we want when
+    comparing text values read from cursors, and the values can be written directly to arcpy cursors.
+
+    Args:
+        values: pandas Series or array-like of values
+
+    Returns:
+        numpy object array
+    """
+    values = np.asarray(values, dtype=object).copy()
+    values[pd.isna(values)] = None
+    return values
+
+
+def summarize_ids(ids, max_ids=MAX_WARNING_IDS):
+    """Return a comma-separated list of IDs for a warning about many records, listing only the first max_ids IDs."""
+    ids = list(ids)
+    summary = ", ".join(str(id) for id in ids[:max_ids])
+    if len(ids) > max_ids:
+        summary += ", ..."
+    return summary
+
+
+def road_forks_df(fc_id, oids, frm_pos, num_edges):
+    """Return a dataframe of rows for the road forks table from arrays of the edges of each road fork.
+
+    Args:
+        fc_id: Feature class ID of the Streets feature class
+        oids: 2D array of the Streets ObjectIDs of each road fork's edges with a row for each road fork and a column for
+            each edge in order, starting with the edge entering the fork
+        frm_pos: 2D array of the EdgeFrmPos value of each edge in oids. The EdgeToPos value is 1 - EdgeFrmPos.
+        num_edges: Array of the number of edges of each road fork. Values in oids and frm_pos past those are ignored.
+
+    Returns:
+        Dataframe with the EdgeFCID, EdgeFID, EdgeFrmPos, EdgeToPos, Branch0FCID, ... columns of the road forks table,
+        which are null for the edges a road fork doesn't use
+    """
+    max_road_splits = oids.shape[1]
+    used = np.arange(max_road_splits) < np.asarray(num_edges)[:, np.newaxis]
+    columns = {}
+    for idx, prefix in enumerate(["Edge"] + [f"Branch{branch}" for branch in range(max_road_splits - 1)]):
+        columns[f"{prefix}FCID"] = pd.array(np.where(used[:, idx], fc_id, np.nan), dtype="Int64")
+        columns[f"{prefix}FID"] = pd.array(np.where(used[:, idx], oids[:, idx], np.nan), dtype="Int64")
+        columns[f"{prefix}FrmPos"] = np.where(used[:, idx], frm_pos[:, idx], np.nan)
+        columns[f"{prefix}ToPos"] = np.where(used[:, idx], 1 - frm_pos[:, idx], np.nan)
+    return pd.DataFrame(columns)
+
+
+def pivot_sign_text(entries_df, num_signposts, max_signpost_branches):
+    """Pivot the branch and toward text of signposts into the Branch* and Toward* fields of the Signposts feature class.
+
+    Args:
+        entries_df: Dataframe with a row for each branch or toward on a signpost, in the order they appear on the
+            signposts, with these columns:
+            Signpost: Number of the signpost, from 0 to num_signposts - 1
+            IsBranch: True for a branch and False for a toward
+            Text: Text of the branch or toward
+            Dir: Direction of the branch, which is ignored for towards
+            Lng: Language of the text
+        num_signposts: Number of signposts
+        max_signpost_branches: Number of Branch* and Toward* fields of each kind in the Signposts feature class
+
+    Returns:
+        A tuple of a 2D object array with a row for each signpost and a column for each of the Branch0, Branch0Dir,
+        Branch0Lng, Branch1, ..., Toward0, Toward0Lng, Toward1, ... fields, which are None where a signpost doesn't use
+        them, and a boolean array of the signposts with more branches or towards than fit, which are truncated
+    """
+    signposts = entries_df["Signpost"].to_numpy(dtype=np.int64)
+    is_branch = entries_df["IsBranch"].to_numpy(dtype=bool)
+    # Rank the branches and towards of each signpost in the order they appear and drop the ones that don't fit
+    rank = entries_df.groupby(["Signpost", "IsBranch"], sort=False).cumcount().to_numpy()
+    truncated = np.zeros(num_signposts, dtype=bool)
+    truncated[signposts[rank >= max_signpost_branches]] = True
+    keep = rank < max_signpost_branches
+
+    # Each branch uses three fields, and each toward uses two fields after all the branch fields
+    signposts = signposts[keep]
+    is_branch = is_branch[keep]
+    rank = rank[keep]
+    column = np.where(is_branch, 3 * rank, 3 * max_signpost_branches + 2 * rank)
+    text = np.full((num_signposts, 5 * max_signpost_branches), None, dtype=object)
+    text[signposts, column] = entries_df["Text"].to_numpy(dtype=object)[keep]
+    text[signposts[is_branch], column[is_branch] + 1] = entries_df["Dir"].to_numpy(dtype=object)[keep][is_branch]
+    text[signposts, column + np.where(is_branch, 2, 1)] = entries_df["Lng"].to_numpy(dtype=object)[keep]
+    return text, truncated
+
+
+def insert_df_rows(table, df, fields, columns=None, batch_size=INSERT_BATCH_SIZE):
+    """Insert the rows of a dataframe into a table using an InsertCursor.
+
+    Each column is converted to cursor-ready Python objects in one pass, with missing values (None, NaN, NA) written as
+    nulls, and rows are streamed to the cursor in batches to limit the memory used by the converted values. This is
+    much faster than building a row from each record returned by DataFrame.iterrows().
+
+    Args:
+        table: Catalog path to the table to insert rows into
+        df: Dataframe containing the rows to insert
+        fields: List of field names in the output table to populate
+        columns: Optional list of dataframe column names corresponding to each field in fields. If not specified, the
+            dataframe columns are assumed to have the same names as the output fields.
+        batch_size: Number of rows to convert and insert at a time
+
+    Returns:
+        The number of rows inserted
+    """
+    if columns is None:
+        columns = fields
+    if len(columns) != len(fields):
+        raise ValueError("The number of dataframe columns must match the number of output fields.")
+    num_rows = len(df)
+    with PROFILER.stage(f"write {os.path.basename(table)}"):
+        with arcpy.da.InsertCursor(table, fields) as cur:
+            for start in range(0, num_rows, batch_size):
+                batch_df = df.iloc[start:start + batch_size]
+                batch_values = [to_object_array(batch_df[column]).tolist() for column in columns]
+                for row in zip(*batch_values):
+                    cur.insertRow(row)
+        PROFILER.add_rows(rows_written=num_rows)
+    return num_rows
+
+
+def partition_rows(df, num_workers, max_partition_size=WORKER_PARTITION_SIZE):
+    """Split a dataframe into contiguous partitions of rows that can be processed independently.
+
+    Row order is preserved, so processing the partitions in order gives the same result as processing the whole
+    dataframe.
+
+    Args:
+        df: Dataframe to partition
+        num_workers: Number of worker processes that will process the partitions
+        max_partition_size: Maximum number of rows in a partition
+
+    Returns:
+        List of dataframes
+    """
+    bounds = _partition_bounds(len(df), num_workers, max_partition_size)
+    return [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def partition_groups(df, keys, num_workers, max_partition_size=WORKER_PARTITION_SIZE):
+    """Split a dataframe into partitions of whole groups of rows sharing the same key values.
+
+    The groups are ordered the same way DataFrame.groupby() iterates over them, and rows within a group keep their
+    original order, so iterating over the groups of each partition in turn is the same as iterating over the groups of
+    the whole dataframe. Rows with a missing key value are dropped, as they would be by groupby().
+
+    Args:
+        df: Dataframe to partition
+        keys: List of column names to group by
+        num_workers: Number of worker processes that will process the partitions
+        max_partition_size: Maximum number of groups in a partition
+
+    Returns:
+        List of dataframes
+    """
+    group_nums = df.groupby(keys, sort=True).ngroup().fillna(-1).to_numpy(dtype=np.int64)
+    order = np.argsort(group_nums, kind="stable")
+    order = order[group_nums[order] >= 0]
+    group_nums = group_nums[order]
+    df = df.iloc[order]
+    num_groups = int(group_nums[-1]) + 1 if len(group_nums) else 0
+    bounds = np.searchsorted(group_nums, _partition_bounds(num_groups, num_workers, max_partition_size))
+    return [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+def _partition_bounds(num_items, num_workers, max_partition_size):
+    """Return the boundaries of roughly equal-sized partitions of a sequence of items."""
+    if num_items == 0:
+        return np.zeros(1, dtype=np.int64)
+    # When using multiple workers, give each worker several partitions so the work stays balanced even if some
+    # partitions take longer than others.  Partition size is capped regardless so the finished rows for a partition
+    # don't take up too much memory before they're written.
+    num_partitions = max(num_workers * 4 if num_workers > 1 else 1, math.ceil(num_items / max_partition_size))
+    num_partitions = min(num_partitions, num_items)
+    return np.linspace(0, num_items, num_partitions + 1).round().astype(np.int64)
+
+
+_worker_shared = None  # Read-only data shared by all tasks run in a worker process
+
+
+def _init_worker(shared):
+    """Store data shared by all tasks when a worker process starts."""
+    global _worker_shared  # pylint:disable=global-statement
+    _worker_shared = shared
+
+
+def _run_worker_task(func, partition):
+    """Process a partition in a worker process."""
+    return func(_worker_shared, partition)
+
+
+def map_partitions(func, shared, partitions, num_workers):
+    """Apply func(shared, partition) to each partition and yield the results in partition order.
+
+    If num_workers is greater than 1, the partitions are processed in a pool of worker processes. The shared data is
+    sent to each worker once when it starts rather than with every partition. func must be a module-level function or
+    a static method so it can be sent to the workers. Otherwise, the partitions are processed one at a time in this
+    process.
+
+    Args:
+        func: Function that takes the shared data and a partition and returns the result for that partition
+        shared: Read-only data needed to process every partition
+        partitions: List of partitions to process
+        num_workers: Number of worker processes to use
+
+    Yields:
+        The result for each partition
+    """
+    if num_workers <= 1 or len(partitions) <= 1:
+        for partition in partitions:
+            yield func(shared, partition)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    if os.name == "nt" and os.path.basename(sys.executable).lower() not in ("python.exe", "pythonw.exe"):
+        # Inside ArcGIS Pro, sys.executable is the application itself, so workers have to be launched explicitly
+        # with the Python executable from Pro's Python environment.
+        context.set_executable(os.path.join(sys.exec_prefix, "pythonw.exe"))
+    with futures.ProcessPoolExecutor(
+        max_workers=min(num_workers, len(partitions)), mp_context=context,
+        initializer=_init_worker, initargs=(shared,)
+    ) as executor:
+        # executor.map returns the results in the order of the partitions regardless of which finishes first
+        yield from executor.map(_run_worker_task, itertools.repeat(func), partitions)
+
+
 class TimeZoneType(Enum):
     """Defines the time zone type to use."""
 
@@ -153,6 +585,2087 @@ class StreetInputData:
         return True
 
 
+class StreetGeometryStore:
+    """Compact store of street vertex coordinates keyed by ObjectID.
+
+    The vertices of all stored streets are held in a single (N, 2) float64 array, and each street's vertices occupy a
+    contiguous slice of it. This is far lighter than holding on to arcpy Polyline objects, and a street's vertices can
+    be retrieved without going back to the dataset. The indexes of the vertices where the parts of multipart streets
+    start are stored too, so the parts are measured separately when building turns and signposts. Only X and Y are
+    stored, since the turn and signpost feature classes don't have Z or M values.
+    """
+
+    def __init__(self, oids, offsets, coords, part_starts=None):
+        """Initialize the store from its component arrays."""
+        self.oids = oids  # Sorted int64 array of the ObjectIDs in the store
+        self.offsets = offsets  # The vertices of oids[i] are coords[offsets[i]:offsets[i + 1]]
+        self.coords = coords  # (N, 2) float64 array of vertex coordinates
+        # Sorted int64 array of the indexes in coords where each part of a multipart street after its first one starts
+        self.part_starts = np.empty(0, dtype=np.int64) if part_starts is None else part_starts
+
+    def __len__(self):
+        """Return the number of streets in the store."""
+        return len(self.oids)
+
+    @property
+    def nbytes(self):
+        """The memory used by the store's arrays."""
+        return self.oids.nbytes + self.offsets.nbytes + self.coords.nbytes + self.part_starts.nbytes
+
+    @classmethod
+    def from_vertices(cls, vertex_oids, coords, is_part_start=None):
+        """Build a store from the ObjectID and coordinates of each vertex, with the vertices of each feature in order.
+
+        is_part_start is an optional boolean array flagging the first vertex of each part of a multipart feature after
+        its first part.
+        """
+        # Make sure the vertices are ordered by ObjectID. A stable sort keeps each feature's vertices in order.
+        order = np.argsort(vertex_oids, kind="stable")
+        vertex_oids = np.asarray(vertex_oids, dtype=np.int64)[order]
+        stored_oids, starts = np.unique(vertex_oids, return_index=True)
+        offsets = np.append(starts, len(vertex_oids)).astype(np.int64)
+        part_starts = None if is_part_start is None else np.flatnonzero(is_part_start[order])
+        return cls(stored_oids, offsets, np.asarray(coords, dtype=np.float64)[order], part_starts)
+
+    @classmethod
+    def from_lines(cls, oids, lines):
+        """Build a store from a line for each of the designated features.
+
+        Each line is an (N, 2) array of vertices or a list of arrays with the vertices of each part.
+        """
+        return cls.from_vertices(*cls._line_arrays(oids, lines))
+
+    @staticmethod
+    def _line_arrays(oids, lines):
+        """Return the ObjectID, coordinates, and part start flag of each vertex of the lines of the features."""
+        oid_arrays = [np.empty(0, dtype=np.int64)]
+        coord_arrays = [np.empty((0, 2), dtype=np.float64)]
+        part_start_arrays = [np.empty(0, dtype=bool)]
+        for oid, line in zip(oids, lines):
+            vertices, part_starts = line_vertices(line)
+            oid_arrays.append(np.full(len(vertices), oid, dtype=np.int64))
+            coord_arrays.append(vertices)
+            part_start_arrays.append(np.isin(np.arange(len(vertices)), part_starts))
+        return np.concatenate(oid_arrays), np.concatenate(coord_arrays), np.concatenate(part_start_arrays)
+
+    @classmethod
+    def from_feature_class(cls, feature_class, oid_field, oids, chunk_size=500000):
+        """Read the vertices of the designated features from the feature class in one ordered bulk pass.
+
+        The features are read in ObjectID ranges of chunk_size so only the vertices of the requested features have to be
+        held in memory at once. Ranges that contain none of the requested ObjectIDs are skipped entirely.
+
+        Exploding features to points runs the parts of a multipart feature together, so the multipart features are
+        found by comparing their length with the length of their exploded vertices, which includes the jumps between
+        parts. Those are read again as WKB to get their parts.
+        """
+        oids = np.unique(np.asarray(oids, dtype=np.int64))
+        if oids.size == 0:
+            return cls(oids, np.zeros(1, dtype=np.int64), np.empty((0, 2), dtype=np.float64))
+
+        fields = ["OID@", "SHAPE@X", "SHAPE@Y"]
+        oid_chunks = []
+        coord_chunks = []
+        length_chunks = []
+        for chunk_idx in np.unique((oids - oids[0]) // chunk_size):
+            lower = int(oids[0]) + int(chunk_idx) * chunk_size
+            where = f"{oid_field} >= {lower} And {oid_field} < {lower + chunk_size}"
+            # explode_to_points returns one record per vertex with the vertices of each feature in order
+            vertex_array = arcpy.da.FeatureClassToNumPyArray(
+                feature_class, fields, where, skip_nulls=True, explode_to_points=True)
+            vertex_array = vertex_array[np.isin(vertex_array["OID@"], oids)]
+            oid_chunks.append(vertex_array["OID@"].astype(np.int64))
+            coord_chunks.append(np.column_stack((vertex_array["SHAPE@X"], vertex_array["SHAPE@Y"])))
+            length_array = arcpy.da.FeatureClassToNumPyArray(
+                feature_class, ["OID@", "SHAPE@LENGTH"], where, skip_nulls=True)
+            length_chunks.append(length_array[np.isin(length_array["OID@"], oids)])
+        store = cls.from_vertices(np.concatenate(oid_chunks), np.concatenate(coord_chunks))
+
+        lengths = np.concatenate(length_chunks)
+        lengths = pd.Series(lengths["SHAPE@LENGTH"], index=lengths["OID@"].astype(np.int64))
+        lengths = lengths[~lengths.index.duplicated()].reindex(store.oids).to_numpy()
+        multipart_oids = store.oids[store.exploded_lengths() > lengths * (1 + MULTIPART_LENGTH_TOLERANCE)]
+        if multipart_oids.size == 0:
+            return store
+        part_oids = []
+        part_lines = []
+        for where in oid_where_clauses(oid_field, multipart_oids):
+            with arcpy.da.SearchCursor(feature_class, ["OID@", "SHAPE@WKB"], where) as cur:
+                for oid, wkb in cur:
+                    part_oids.append(oid)
+                    part_lines.append(wkb_to_parts(wkb))
+        return store.replace_lines(part_oids, part_lines)
+
+    def exploded_lengths(self):
+        """Return an array of the length of each street measured along all its vertices, ignoring its parts."""
+        cum_length = np.concatenate(([0.], np.cumsum(np.hypot(*np.diff(self.coords, axis=0).T))))
+        return cum_length[self.offsets[1:] - 1] - cum_length[self.offsets[:-1]]
+
+    def replace_lines(self, oids, lines):
+        """Return a new store with the vertices of the designated features replaced by the lines.
+
+        Each line is an (N, 2) array of vertices or a list of arrays with the vertices of each part.
+        """
+        vertex_oids = np.repeat(self.oids, np.diff(self.offsets))
+        keep = ~np.isin(vertex_oids, np.asarray(oids, dtype=np.int64))
+        is_part_start = np.zeros(len(self.coords), dtype=bool)
+        is_part_start[self.part_starts] = True
+        line_oids, line_coords, line_part_starts = StreetGeometryStore._line_arrays(oids, lines)
+        return StreetGeometryStore.from_vertices(
+            np.concatenate((vertex_oids[keep], line_oids)), np.concatenate((self.coords[keep], line_coords)),
+            np.concatenate((is_part_start[keep], line_part_starts)))
+
+    def vertices(self, oid):
+        """Return the line of the designated street, or None if it isn't in the store.
+
+        The line is an (N, 2) array of the street's vertices, or a list of arrays with the vertices of each part of a
+        multipart street, which the functions in the geometry module accept interchangeably.
+        """
+        idx = np.searchsorted(self.oids, oid)
+        if idx >= len(self.oids) or self.oids[idx] != oid:
+            return None
+        start, stop = self.offsets[idx], self.offsets[idx + 1]
+        vertices = self.coords[start:stop]
+        first_part, last_part = np.searchsorted(self.part_starts, [start, stop])
+        if first_part == last_part:
+            return vertices
+        return np.split(vertices, self.part_starts[first_part:last_part] - start)
+
+
+def _table_fingerprint(table):
+    """Return a JSON-serializable value that changes when the designated input table changes.
+
+    Files on disk (CSVs and shapefiles) are identified by their size and modification time, which is cheap to check.
+    Tables in a geodatabase don't have a reliable modification time, so their row count is used instead.
+    """
+    if os.path.isfile(table):
+        files = [table]
+        if table.lower().endswith(".shp"):
+            # Shapefile attributes are stored in a separate dbf file
+            files.append(os.path.splitext(table)[0] + ".dbf")
+        return [[os.path.getsize(f), os.path.getmtime(f)] for f in files if os.path.exists(f)]
+    return int(arcpy.management.GetCount(table).getOutput(0))
+
+
+class StageCheckpoint:
+    """Manifest recording the stages of a processing run that have completed so a failed run can be resumed.
+
+    The manifest is a JSON file stored next to the output geodatabase. It records a fingerprint of the inputs and
+    settings of the run and, for each completed stage, when it finished and the row counts of the tables it wrote. The
+    stages run in a fixed order and each one builds on the ones before it, so a run can only be resumed from the first
+    stage that didn't complete. That stage and all stages after it are run again.
+    """
+
+    version = 1  # Incremented if the manifest format or the stages change in a way older manifests can't be reused
+
+    def __init__(self, manifest_file, stages, fingerprint):
+        """Initialize an empty checkpoint for a run with the designated stages in execution order."""
+        self.manifest_file = manifest_file
+        self.stages = stages
+        # Round-trip the fingerprint through JSON so it compares equal to the one loaded from a manifest
+        self.fingerprint = json.loads(json.dumps(fingerprint))
+        self.completed = {}  # {stage name: {"finished": ISO timestamp, "row_counts": {table: row count}}}
+
+    def load(self):
+        """Load the stages completed by a previous run with the same inputs and settings.
+
+        Returns:
+            bool: True if the previous run can be resumed; False if not, in which case an error is added
+        """
+        if not os.path.exists(self.manifest_file):
+            arcpy.AddError(f"The previous run can't be resumed because {self.manifest_file} does not exist.")
+            return False
+        with open(self.manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != self.version:
+            arcpy.AddError(
+                f"The previous run can't be resumed because {self.manifest_file} was written by a different version "
+                "of this tool.")
+            return False
+        prev_fingerprint = manifest.get("fingerprint", {})
+        changed = [
+            key for key in sorted(set(prev_fingerprint) | set(self.fingerprint))
+            if prev_fingerprint.get(key) != self.fingerprint.get(key)
+        ]
+        if changed:
+            arcpy.AddError((
+                "The previous run can't be resumed because the following inputs or settings have changed since it "
+                f"started: {', '.join(changed)}"))
+            return False
+
+        # Keep the completed stages up to the first one that didn't complete or whose outputs have since changed
+        prev_stages = manifest.get("stages", {})
+        for stage in self.stages:
+            record = prev_stages.get(stage)
+            if record is None:
+                break
+            changed_tables = [
+                table for table, row_count in record["row_counts"].items()
+                if not arcpy.Exists(table) or int(arcpy.management.GetCount(table).getOutput(0)) != row_count
+            ]
+            if changed_tables:
+                arcpy.AddWarning((
+                    f"The outputs of the {stage} stage have changed since the previous run and will be recreated: "
+                    f"{', '.join(changed_tables)}"))
+                break
+            self.completed[stage] = record
+        if self.completed:
+            arcpy.AddMessage(f"Resuming the previous run. Completed stages: {', '.join(self.completed)}")
+        return True
+
+    def is_pending(self, *stages):
+        """Return whether any of the designated stages still has to run."""
+        return any(stage in self.stages and stage not in self.completed for stage in stages)
+
+    def complete(self, stage, tables=None, changes=None):
+        """Record the designated stage as completed along with the row counts of the tables it wrote.
+
+        In a delta run, changes is a dictionary of {table: {change type: row count}} of the changes the stage made to
+        the outputs of the previous run, which is recorded too.
+        """
+        self.completed[stage] = {
+            "finished": datetime.datetime.now().isoformat(timespec="seconds"),
+            "row_counts": {table: int(arcpy.management.GetCount(table).getOutput(0)) for table in tables or []}
+        }
+        if changes:
+            self.completed[stage]["changes"] = changes
+        self.save()
+
+    def save(self):
+        """Write the manifest to disk."""
+        manifest = {"version": self.version, "fingerprint": self.fingerprint, "stages": self.completed}
+        # Write to a temporary file first so a failure partway through can't leave a corrupt manifest behind
+        temp_file = self.manifest_file + ".tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(temp_file, self.manifest_file)
+
+
+def read_table_to_df(table, fields, where_clause=None, dtype=None):
+    """Read the designated fields of a table into a dataframe with a column for each field.
+
+    Args:
+        table: Catalog path to the table or feature class
+        fields: List of fields to read
+        where_clause: Optional where clause limiting the rows read
+        dtype: Optional dtype to force for all columns
+
+    Returns:
+        pandas DataFrame
+    """
+    with arcpy.da.SearchCursor(table, fields, where_clause) as cur:
+        return pd.DataFrame(cur, columns=fields, dtype=dtype)
+
+
+def _table_source_stamp(table):
+    """Return the total size and latest modification time of the files storing a table, or None if not available.
+
+    A table in a file geodatabase isn't a file of its own, so the files of the entire geodatabase are used. This is
+    conservative, since any change to the geodatabase is treated as a change to all of its tables, but it's cheap and
+    reliable. Enterprise geodatabase tables can change without any change on disk, so they have no source stamp.
+    """
+    if not isinstance(table, str):
+        return None
+    path = os.path.abspath(table)
+    if any(part.lower().endswith(".sde") for part in path.split(os.sep)):
+        return None
+    # Walk up from a feature class or table in a geodatabase or feature dataset to the geodatabase folder
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    if os.path.isdir(path):
+        # Skip lock files, which come and go while the geodatabase is being read
+        files = [os.path.join(path, f) for f in os.listdir(path) if not f.endswith(".lock")]
+    else:
+        files = [path]
+        if path.lower().endswith(".shp"):
+            # Shapefile attributes are stored in a separate dbf file
+            files.append(os.path.splitext(path)[0] + ".dbf")
+    stats = [os.stat(f) for f in files if os.path.isfile(f)]
+    if not stats:
+        return None
+    return [sum(st.st_size for st in stats), max(st.st_mtime for st in stats)]
+
+
+class TableCache:
+    """Persistent on-disk cache of input tables read into dataframes.
+
+    Reading the large vendor tables through a cursor is slow, and the same vendor release is often processed more than
+    once, for example to create Imperial and Metric variants of a network. Each dataframe read from an input table is
+    stored in the cache folder in the Feather columnar format, keyed by the table's path, size, and modification time
+    and the fields, where clause, and dtype used to read it, so a later read of the same unchanged data is loaded
+    straight from the cache. When the files in the cache exceed the size limit, the least recently used ones are
+    deleted.
+    """
+
+    version = 1  # Incremented if the way tables are read into dataframes changes so old cache files aren't reused
+
+    def __init__(self, cache_folder, max_bytes=TABLE_CACHE_SIZE_GB * 1024 ** 3, table_io=None):
+        """Initialize the cache in the designated folder, which is created if it doesn't exist."""
+        self.cache_folder = cache_folder
+        self.max_bytes = max_bytes
+        self.table_io = table_io or ArcpyTableIO()  # TableIO used to read tables that aren't in the cache
+        os.makedirs(self.cache_folder, exist_ok=True)
+
+    def _cache_file(self, table, fields, where_clause, dtype):
+        """Return the cache file for the designated read, or None if the table can't be cached."""
+        source_stamp = _table_source_stamp(table)
+        if source_stamp is None:
+            return None
+        key = json.dumps([
+            self.version, os.path.normcase(os.path.abspath(table)), source_stamp, list(fields), where_clause,
+            None if dtype is None else np.dtype(dtype).str
+        ])
+        return os.path.join(self.cache_folder, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".feather")
+
+    def read(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of a table into a dataframe, from the cache if possible.
+
+        The arguments and return value are the same as for TableIO.read_columns.
+        """
+        cache_file = self._cache_file(table, fields, where_clause, dtype)
+        if cache_file is None:
+            return self.table_io.read_columns(table, fields, where_clause, dtype)
+        if os.path.exists(cache_file):
+            try:
+                df = pd.read_feather(cache_file)
+                # Update the modification time to mark the file as recently used
+                os.utime(cache_file)
+                return df
+            except Exception:  # pylint:disable=broad-except
+                # The file is corrupt or unreadable. Just read the table again and overwrite it.
+                pass
+
+        df = self.table_io.read_columns(table, fields, where_clause, dtype)
+        if self.max_bytes <= 0:
+            # Nothing fits in a cache without room, so don't write the table and clear out the files of earlier runs
+            self._evict()
+            return df
+        # Write to a temporary file first so another process can't read a partially written file
+        temp_file = f"{cache_file}.{os.getpid()}.tmp"
+        try:
+            df.to_feather(temp_file)
+            os.replace(temp_file, cache_file)
+        except Exception as ex:  # pylint:disable=broad-except
+            if arcpy is not None:
+                arcpy.AddMessage(f"Unable to cache table {table}. {ex}")
+            if os.path.exists(temp_file):
+                os.remove(temp_file)
+        self._evict()
+        return df
+
+    def _evict(self):
+        """Delete the least recently used cache files until the cache fits within its size limit."""
+        cache_files = []
+        for entry in os.scandir(self.cache_folder):
+            if entry.is_file() and entry.name.endswith(".feather"):
+                st = entry.stat()
+                cache_files.append((st.st_mtime, st.st_size, entry.path))
+        total_bytes = sum(size for _, size, _ in cache_files)
+        for _, size, path in sorted(cache_files):
+            if total_bytes <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+                total_bytes -= size
+            except OSError:
+                # Another process may be reading it or already deleted it
+                pass
+
+
+class TablePrefetcher:
+    """Run functions that read and index independent input tables on a thread pool ahead of the stages that need them.
+
+    Reading the input tables is mostly waiting on disk or network I/O, during which cursors and the CSV reader release
+    the GIL, so several reads can run at once and can overlap with the geoprocessing tools the pipeline runs meanwhile.
+    The stage that needs a function's result waits for it with result(). A function that wasn't submitted is just run
+    when its result is requested, so the stage doesn't have to know whether it was prefetched.
+
+    GP messages are only added reliably from the main thread, so the messages and warnings added by a function running
+    on the thread pool are held and added when its result is requested.
+    """
+
+    _local = threading.local()  # Holds the messages of the function running on each thread
+
+    def __init__(self, num_threads=PREFETCH_THREADS):
+        """Initialize the prefetcher. The thread pool is started when the first function is submitted."""
+        self.num_threads = num_threads
+        self._executor = None
+        self._futures = {}  # {function name: Future}
+
+    def submit(self, func):
+        """Start running a function that takes no arguments on the thread pool."""
+        if self._executor is None:
+            self._executor = futures.ThreadPoolExecutor(self.num_threads, thread_name_prefix="Prefetch")
+        self._futures[func.__name__] = self._executor.submit(self._run, func)
+
+    @classmethod
+    def _run(cls, func):
+        """Run the function on a thread pool thread and return its result and the messages it added."""
+        cls._local.messages = []
+        try:
+            with PROFILER.stage("prefetch"):
+                return func(), cls._local.messages
+        finally:
+            cls._local.messages = None
+
+    @classmethod
+    def defer_message(cls, msg, warning=False):
+        """Hold a message added by a function running on the thread pool, or return False if not on the thread pool."""
+        messages = getattr(cls._local, "messages", None)
+        if messages is None:
+            return False
+        messages.append((msg, warning))
+        return True
+
+    def result(self, func):
+        """Return the result of a submitted function when it's done, or run the function now if it wasn't submitted.
+
+        Exceptions raised by the function are raised here.
+        """
+        future = self._futures.pop(func.__name__, None)
+        if future is None:
+            return func()
+        with PROFILER.stage(f"wait for {func.__name__}"):
+            result, messages = future.result()
+        for msg, warning in messages:
+            if warning:
+                arcpy.AddWarning(msg)
+            else:
+                arcpy.AddMessage(msg)
+        return result
+
+    def shutdown(self):
+        """Cancel the functions that haven't started, wait for the running ones, and stop the thread pool."""
+        for future in self._futures.values():
+            future.cancel()
+        self._futures = {}
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+class MemoryBudgetError(MemoryError):
+    """Raised when reading a table would likely make the tool use more memory than the configured budget."""
+
+
+def df_nbytes(df):
+    """Return the memory used by a dataframe, including its index and the contents of text columns."""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+def compact_df(df, categorical_columns=None, name=None):
+    """Reduce the memory used by a dataframe by converting its columns and index to more compact dtypes.
+
+    Integer columns and single-level indexes are downcast to int32 if all their values fit, except ObjectID columns
+    like OID and EdgeFID matching OID_COLUMN_PATTERN, which stay int64. ObjectIDs are offset when rows are appended to
+    existing tables in delta runs and when shards are merged, which could overflow an int32, while the other integer
+    columns and indexes, like link IDs and codes, are only compared and used as lookup keys. Columns in
+    categorical_columns, which should hold a small number of distinct values like Y/N flags, type codes, or field
+    names, are converted to categoricals, which store each value as a small integer code. The values themselves don't
+    change, so comparisons, lookups, and joins work the same as before.
+
+    Args:
+        df: Dataframe to compact
+        categorical_columns: Optional list of columns to convert to categoricals
+        name: Optional name of the dataframe used for logging the memory saved when profiling
+
+    Returns:
+        The compacted dataframe
+    """
+    nbytes_before = df_nbytes(df) if PROFILER.enabled else 0
+    categorical_columns = categorical_columns or []
+    new_dtypes = {}
+    for column in df.columns:
+        if column in categorical_columns:
+            if not isinstance(df[column].dtype, pd.CategoricalDtype):
+                new_dtypes[column] = "category"
+        elif not OID_COLUMN_PATTERN.fullmatch(str(column)) and _fits_int32(df[column]):
+            new_dtypes[column] = np.int32
+    if new_dtypes:
+        df = df.astype(new_dtypes)
+    if not isinstance(df.index, pd.MultiIndex) and _fits_int32(df.index):
+        df.index = df.index.astype(np.int32)
+    if PROFILER.enabled and arcpy is not None:
+        msg = (
+            f"Compacted {name or 'dataframe'} from {nbytes_before / 1024 ** 2:.1f} MB to "
+            f"{df_nbytes(df) / 1024 ** 2:.1f} MB. Process memory usage: "
+            f"{psutil.Process().memory_info().rss / 1024 ** 2:.1f} MB"
+        )
+        if not TablePrefetcher.defer_message(msg):
+            arcpy.AddMessage(msg)
+    return df
+
+
+def _fits_int32(values):
+    """Return whether values is a wider-than-int32 integer column or index whose values all fit in an int32."""
+    if not pd.api.types.is_integer_dtype(values.dtype) or isinstance(values.dtype, pd.api.extensions.ExtensionDtype):
+        return False
+    if values.dtype.itemsize <= 4:
+        return False
+    info = np.iinfo(np.int32)
+    return len(values) == 0 or (values.min() >= info.min and values.max() <= info.max)
+
+
+def estimate_table_nbytes(table, fields, where_clause=None):
+    """Estimate the memory used by a dataframe read from the designated fields of a table before it is compacted.
+
+    Each numeric value is assumed to take 8 bytes and each text value the full length of its field plus the overhead of
+    a Python string, so this is usually an overestimate.
+    """
+    text_field_lengths = {
+        field.name.upper(): field.length for field in arcpy.ListFields(table) if field.type == "String"
+    }
+    row_nbytes = 8  # Index
+    for field in fields:
+        if field.upper() in text_field_lengths:
+            row_nbytes += STRING_VALUE_NBYTES + text_field_lengths[field.upper()]
+        else:
+            row_nbytes += 8
+    if where_clause:
+        with arcpy.EnvManager(overwriteOutput=True):
+            view = arcpy.management.MakeTableView(table, "Memory budget view", where_clause).getOutput(0)
+        num_rows = int(arcpy.management.GetCount(view).getOutput(0))
+        arcpy.management.Delete(view)
+    else:
+        num_rows = int(arcpy.management.GetCount(table).getOutput(0))
+    return num_rows * row_nbytes
+
+
+def where_clause_mask(df, where_clause):
+    """Return a boolean array of the dataframe rows matching a simple SQL where clause.
+
+    Only the kinds of where clauses used by the tools are supported: comparisons of a field to a literal value with =,
+    <>, >, >=, <, or <=, and IN lists, combined with And. Field names are matched case-insensitively.
+    """
+    columns = {column.upper(): column for column in df.columns}
+    mask = np.ones(len(df), dtype=bool)
+    for condition in re.split(r"\s+and\s+", where_clause.strip(), flags=re.IGNORECASE):
+        match = re.fullmatch(r"(\w+)\s*(=|<>|>=|<=|>|<|\s+in\s+)\s*(.+)", condition.strip(), flags=re.IGNORECASE)
+        if not match or match.group(1).upper() not in columns:
+            raise ValueError(f"Unsupported where clause: {where_clause}")
+        values = df[columns[match.group(1).upper()]]
+        operator = match.group(2).strip().upper()
+        value = ast.literal_eval(match.group(3))
+        if operator == "IN":
+            condition_mask = values.isin(value if isinstance(value, tuple) else (value,))
+        else:
+            condition_mask = {
+                "=": values.__eq__, "<>": values.__ne__, ">": values.__gt__, ">=": values.__ge__, "<": values.__lt__,
+                "<=": values.__le__
+            }[operator](value)
+        mask &= condition_mask.to_numpy(dtype=bool, na_value=False)
+    return mask
+
+
+class TableIO:
+    """Interface for reading and writing the tables processed by the tools.
+
+    All reads and writes of input and output tables go through one of these, so the calculations don't depend on where
+    the tables are stored. ArcpyTableIO works with anything arcpy can open and is what the tools use. LocalTableIO works
+    with DBF, shapefile, CSV, and Parquet files without arcpy, so the heavy calculations can also run on machines
+    without ArcGIS Pro.
+
+    Tables are identified by their catalog paths. The special OID@ and SHAPE@WKB fields have the same meaning as in
+    arcpy cursors.
+    """
+
+    def read_columns(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of a table into a dataframe with a column for each field.
+
+        Args:
+            table: Catalog path to the table or feature class
+            fields: List of fields to read
+            where_clause: Optional where clause limiting the rows read
+            dtype: Optional dtype to force for all columns
+
+        Returns:
+            pandas DataFrame
+        """
+        raise NotImplementedError
+
+    def read_vertices(self, feature_class, oid_field, oids):
+        """Return a StreetGeometryStore with the vertices of the designated features of a line feature class."""
+        raise NotImplementedError
+
+    def list_fields(self, table):
+        """Return the names of the editable fields of a table, not including its ObjectID and geometry fields."""
+        raise NotImplementedError
+
+    def estimate_nbytes(self, table, fields, where_clause=None):
+        """Estimate the memory used by a dataframe read from the designated fields of a table."""
+        raise NotImplementedError
+
+    def insert_rows(self, table, df, fields, columns=None, batch_size=INSERT_BATCH_SIZE):
+        """Insert the rows of a dataframe into a table.
+
+        The arguments and return value are the same as for insert_df_rows.
+        """
+        raise NotImplementedError
+
+    def insert_cursor(self, table, fields):
+        """Return a context manager with an insertRow method for inserting rows into a table one at a time.
+
+        Like in arcpy insert cursors, insertRow returns the ObjectID of the inserted row.
+        """
+        raise NotImplementedError
+
+    def delete_rows(self, table, oids):
+        """Delete the rows with the designated ObjectIDs from a table.
+
+        Returns:
+            The number of rows deleted
+        """
+        raise NotImplementedError
+
+    def copy_rows(self, in_table, out_table, fields, oids):
+        """Copy the rows with the designated ObjectIDs from one table to another.
+
+        Args:
+            in_table: Catalog path to the table to copy rows from
+            out_table: Catalog path to the table to copy them to
+            fields: List of fields to copy, which must exist in both tables. The SHAPE@ field copies the geometry.
+            oids: ObjectIDs of the rows in in_table to copy
+
+        Returns:
+            The number of rows copied
+        """
+        raise NotImplementedError
+
+    @contextlib.contextmanager
+    def edit_session(self, workspace):
+        """Context manager for writing to more than one table in the workspace at once.
+
+        Edits are saved if the code run inside it succeeds and abandoned if it raises an exception.
+        """
+        yield
+
+    def update_rows(self, table, key_field, values_df, key_type=None, progressor_label=None):
+        """Copy field values from a dataframe into the matching rows of a table.
+
+        Args:
+            table: Catalog path to the table to update
+            key_field: Name of the field in the table whose values match the dataframe's index
+            values_df: Dataframe indexed by key field values with a column for every field to update
+            key_type: Optional function to convert key field values read from the table to match the dataframe's index
+            progressor_label: Optional label to show in the step progressor
+
+        Returns:
+            The number of rows updated
+        """
+        raise NotImplementedError
+
+    def close(self, tables):
+        """Finish writing the designated tables, which can still be read and written afterwards.
+
+        Rows written with arcpy cursors are stored as they're written, so there's nothing to do by default.
+        """
+
+
+class ArcpyTableIO(TableIO):
+    """Read and write tables with arcpy cursors."""
+
+    def read_columns(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of a table into a dataframe with a search cursor."""
+        return read_table_to_df(table, fields, where_clause, dtype)
+
+    def read_vertices(self, feature_class, oid_field, oids):
+        """Return a StreetGeometryStore with the vertices of the designated features read in bulk."""
+        return StreetGeometryStore.from_feature_class(feature_class, oid_field, oids)
+
+    def list_fields(self, table):
+        """Return the names of the editable fields of a table, not including its geometry field.
+
+        Read-only fields like Shape_Length and GlobalID are left out since they can't be inserted and their values
+        differ between tables with the same rows.
+        """
+        return [field.name for field in arcpy.ListFields(table) if field.editable and field.type != "Geometry"]
+
+    def estimate_nbytes(self, table, fields, where_clause=None):
+        """Estimate the memory used by a dataframe read from the table from its field lengths and row count."""
+        return estimate_table_nbytes(table, fields, where_clause)
+
+    def insert_rows(self, table, df, fields, columns=None, batch_size=INSERT_BATCH_SIZE):
+        """Insert the rows of a dataframe into a table with an insert cursor."""
+        return insert_df_rows(table, df, fields, columns, batch_size)
+
+    def insert_cursor(self, table, fields):
+        """Return an arcpy insert cursor on the table."""
+        return arcpy.da.InsertCursor(table, fields)
+
+    def delete_rows(self, table, oids):
+        """Delete the rows with the designated ObjectIDs from a table with update cursors."""
+        num_deleted = 0
+        with PROFILER.stage(f"delete {os.path.basename(table)}"):
+            for where_clause in oid_where_clauses(arcpy.Describe(table).oidFieldName, oids):
+                with arcpy.da.UpdateCursor(table, ["OID@"], where_clause) as cur:
+                    for _ in cur:
+                        cur.deleteRow()
+                        num_deleted += 1
+            PROFILER.add_rows(rows_written=num_deleted)
+        return num_deleted
+
+    def copy_rows(self, in_table, out_table, fields, oids):
+        """Copy rows from one table to another with search and insert cursors."""
+        num_copied = 0
+        with PROFILER.stage(f"copy {os.path.basename(in_table)}"):
+            with arcpy.da.InsertCursor(out_table, fields) as out_cur:
+                for where_clause in oid_where_clauses(arcpy.Describe(in_table).oidFieldName, oids):
+                    with arcpy.da.SearchCursor(in_table, fields, where_clause) as in_cur:
+                        for row in in_cur:
+                            out_cur.insertRow(row)
+                            num_copied += 1
+            PROFILER.add_rows(rows_read=num_copied, rows_written=num_copied)
+        return num_copied
+
+    @contextlib.contextmanager
+    def edit_session(self, workspace):
+        """Write to the workspace in an edit session with a single edit operation."""
+        edit = arcpy.da.Editor(workspace)
+        # Set with_undo=False to enhance performance
+        # Set multiuser_mode=False to make it work on SDE (unversioned only)
+        edit.startEditing(with_undo=False, multiuser_mode=False)
+        edit.startOperation()
+        try:
+            yield
+        except Exception:
+            # Stop the editing operation and abandon changes, then pass through the raised exception
+            if edit.isEditing:
+                edit.stopOperation()
+                edit.stopEditing(False)
+            raise
+        # Stop the editing operation and save edits
+        edit.stopOperation()
+        edit.stopEditing(True)
+
+    def update_rows(self, table, key_field, values_df, key_type=None, progressor_label=None):
+        """Copy field values from a dataframe into the matching rows of a table with an update cursor."""
+        # Convert each column to a list of cursor-ready values and keep track of each key's position
+        out_fields = values_df.columns.tolist()
+        out_values = [to_object_array(values_df[field]).tolist() for field in out_fields]
+        key_idx = {key: i for i, key in enumerate(values_df.index.tolist())}  # {key: position in out_values}
+
+        # Iterate through the table and copy the values into each row
+        current_row_num = 0
+        num_updated = 0
+        if progressor_label:
+            arcpy.SetProgressor("step", progressor_label, 0, len(key_idx), 1)
+        with PROFILER.stage(f"update {os.path.basename(table)}"):
+            with arcpy.da.UpdateCursor(table, [key_field] + out_fields) as cur:
+                for row in cur:
+                    current_row_num += 1
+                    if progressor_label:
+                        arcpy.SetProgressorPosition(current_row_num)
+                    idx = key_idx.get(row[0] if key_type is None else key_type(row[0]))
+                    if idx is None:
+                        # Confidence check. All rows should have been included in the dataframe.
+                        continue
+                    cur.updateRow([row[0]] + [values[idx] for values in out_values])
+                    num_updated += 1
+            PROFILER.add_rows(rows_read=current_row_num, rows_written=num_updated)
+        if progressor_label:
+            arcpy.ResetProgressor()
+        return num_updated
+
+
+class _LocalInsertCursor:
+    """Insert cursor that collects rows in memory and appends them to a local table when it's closed."""
+
+    def __init__(self, table_io, table, fields):
+        """Initialize the cursor for the designated table and fields."""
+        self.table_io = table_io
+        self.table = table
+        self.fields = fields
+        self.rows = []
+        self.first_oid = None  # ObjectID the first row will get when the rows are appended
+
+    def insertRow(self, row):  # pylint:disable=invalid-name
+        """Add a row with a value for each field and return the ObjectID it will get.
+
+        Named like the arcpy method so the two are interchangeable.
+        """
+        if self.first_oid is None:
+            self.first_oid = self.table_io.next_oid(self.table)
+        self.rows.append(tuple(row))
+        return self.first_oid + len(self.rows) - 1
+
+    def __enter__(self):
+        """Return the cursor."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Append the collected rows to the table unless an exception was raised."""
+        if exc_type is None:
+            self.table_io.insert_rows(
+                self.table, pd.DataFrame.from_records(self.rows, columns=self.fields), self.fields)
+        self.rows = []
+        self.first_oid = None
+
+
+class LocalTableIO(TableIO):
+    """Read and write tables stored as local files, without arcpy.
+
+    Input tables can be DBF files, shapefiles, CSV files, or Parquet files, identified by their file extension. Output
+    tables are written as Parquet files, so a table with the catalog path C:\\Data\\Output.gdb\\Streets is written to
+    C:\\Data\\Output.gdb\\Streets.parquet. Rows inserted into an output table are numbered in an OBJECTID field, and
+    line geometry is stored as WKB in a Shape field.
+
+    Rows appended to an output table that already has a file are written to a part file next to it, like
+    Streets.part1.parquet, so appending doesn't rewrite the rows already stored. Reads include the rows of the parts,
+    and closing the table compacts them into the table's file. Deleting or updating rows rewrites the table's file
+    along with its parts.
+
+    Shapefiles and DBF files have no nulls, so blank text values are read as None and blank numbers as NaN. The
+    ObjectIDs of shapefile and DBF records start at 0, like the FID field arcpy reads from a shapefile, and those of CSV
+    and Parquet files without an OBJECTID field start at 1.
+    """
+
+    oid_field = "OBJECTID"  # Field storing the ObjectIDs of output tables
+    shape_field = "Shape"  # Field storing the WKB geometry of output tables
+    read_extensions = (".dbf", ".shp", ".csv", ".parquet")
+
+    def __init__(self):
+        """Initialize the table I/O."""
+        self._next_oids = {}  # {path: ObjectID the next row appended to the output table gets}
+
+    def _path(self, table):
+        """Return the path of the file storing a table."""
+        if os.path.splitext(table)[1].lower() in self.read_extensions:
+            return table
+        return table + ".parquet"
+
+    def _table_parts(self, path):
+        """Return the part files of the rows appended to an output table since it was last compacted, in order.
+
+        If the table's file was deleted, like when a stage is run again, its parts are deleted with it.
+        """
+        stem = os.path.splitext(path)[0]
+        folder = os.path.dirname(os.path.abspath(path))
+        part_pattern = re.compile(re.escape(os.path.basename(stem)) + r"\.part(\d+)\.parquet")
+        names = os.listdir(folder) if os.path.isdir(folder) else []
+        part_numbers = sorted(int(match.group(1)) for match in map(part_pattern.fullmatch, names) if match)
+        parts = [f"{stem}.part{number}.parquet" for number in part_numbers]
+        if os.path.exists(path):
+            return parts
+        for part_file in parts:
+            os.remove(part_file)
+        self._next_oids.pop(path, None)
+        return []
+
+    def _write_file(self, path, df):
+        """Write all the rows of an output table to its file, replacing its part files."""
+        parts = self._table_parts(path)
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        df.to_parquet(path, index=False)
+        for part_file in parts:
+            os.remove(part_file)
+
+    def _read_file(self, table):
+        """Read all the records of a table into a dataframe with the table's own field names and ObjectIDs."""
+        path = self._path(table)
+        ext = os.path.splitext(path)[1].lower()
+        if ext in (".dbf", ".shp"):
+            df = read_dbf(os.path.splitext(path)[0] + ".dbf")
+            df["FID"] = np.arange(len(df), dtype=np.int64)
+            return df, "FID"
+        if ext == ".csv":
+            df = pd.read_csv(path)
+        else:
+            if feather is None:
+                raise ImportError("Reading and writing Parquet files requires the pyarrow Python package.")
+            df = pd.read_parquet(path)
+            parts = self._table_parts(path)
+            if parts:
+                # Convert the combined rows the way writing them to a single file does, so the dtypes and nulls read
+                # don't depend on whether the table was compacted
+                df = pd.concat([df] + [pd.read_parquet(part_file) for part_file in parts], ignore_index=True)
+                df = pyarrow.Table.from_pandas(df, preserve_index=False).to_pandas()
+        if self.oid_field not in df.columns:
+            df[self.oid_field] = np.arange(1, len(df) + 1, dtype=np.int64)
+        return df, self.oid_field
+
+    def read_columns(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of a local table into a dataframe.
+
+        Field names are matched case-insensitively. The OID@ field reads the table's ObjectIDs, and the SHAPE@WKB field
+        reads the geometry of output tables.
+        """
+        df, oid_field = self._read_file(table)
+        if where_clause:
+            df = df[where_clause_mask(df, where_clause)]
+        columns = {column.upper(): column for column in df.columns}
+        columns["OID@"] = oid_field
+        columns["SHAPE@WKB"] = columns.get(self.shape_field.upper())
+        missing_fields = [field for field in fields if columns.get(field.upper()) is None]
+        if missing_fields:
+            raise KeyError(f"Table {table} does not have the fields {', '.join(missing_fields)}.")
+        out_df = pd.DataFrame({field: df[columns[field.upper()]].to_numpy() for field in fields}, columns=fields)
+        if dtype is not None:
+            out_df = out_df.astype(dtype)
+        return out_df
+
+    def read_vertices(self, feature_class, oid_field, oids):
+        """Return a StreetGeometryStore with the vertices of the designated features of a shapefile or output table."""
+        oids = np.unique(np.asarray(oids, dtype=np.int64))
+        path = self._path(feature_class)
+        if path.lower().endswith(".shp"):
+            feature_oids, offsets, coords, part_starts = read_shapefile_vertices(path)
+            vertex_oids = np.repeat(feature_oids, np.diff(offsets))
+            # Keep the vertices of the requested features
+            requested = np.isin(vertex_oids, oids)
+            is_part_start = np.isin(np.arange(len(coords)), part_starts)
+            return StreetGeometryStore.from_vertices(
+                vertex_oids[requested], coords[requested], is_part_start[requested])
+        df = self.read_columns(feature_class, ["OID@", "SHAPE@WKB"])
+        df = df[df["SHAPE@WKB"].notna() & df["OID@"].isin(oids)]
+        return StreetGeometryStore.from_lines(
+            df["OID@"].to_numpy(dtype=np.int64), [wkb_to_parts(wkb) for wkb in df["SHAPE@WKB"]])
+
+    def list_fields(self, table):
+        """Return the names of the fields of a local table, not including its ObjectID and Shape fields."""
+        df, oid_field = self._read_file(table)
+        return [column for column in df.columns if column not in (oid_field, self.shape_field)]
+
+    def estimate_nbytes(self, table, fields, where_clause=None):
+        """Estimate the memory used by a dataframe read from the table as the size of the file storing it.
+
+        This is a rough estimate, since it doesn't account for the fields that aren't read, the rows filtered out, or
+        the compression of Parquet files.
+        """
+        path = self._path(table)
+        if path.lower().endswith(".shp"):
+            path = os.path.splitext(path)[0] + ".dbf"
+        if not os.path.exists(path):
+            return 0
+        return os.path.getsize(path) + sum(os.path.getsize(part_file) for part_file in self._table_parts(path))
+
+    def insert_rows(self, table, df, fields, columns=None, batch_size=INSERT_BATCH_SIZE):
+        """Append the rows of a dataframe to an output table stored as a Parquet file.
+
+        The rows are written to a new part file if the table already has a file, so the cost doesn't grow with the
+        number of rows already in the table.
+        """
+        if columns is None:
+            columns = fields
+        if len(columns) != len(fields):
+            raise ValueError("The number of dataframe columns must match the number of output fields.")
+        if feather is None:
+            raise ImportError("Reading and writing Parquet files requires the pyarrow Python package.")
+        path = self._path(table)
+        with PROFILER.stage(f"write {os.path.basename(table)}"):
+            out_df = pd.DataFrame({
+                self.shape_field if field.upper() == "SHAPE@WKB" else field: df[column].to_numpy()
+                for field, column in zip(fields, columns)
+            })
+            first_oid = self.next_oid(table)
+            out_df.insert(0, self.oid_field, np.arange(first_oid, first_oid + len(out_df), dtype=np.int64))
+            if os.path.exists(path):
+                part_file = f"{os.path.splitext(path)[0]}.part{len(self._table_parts(path)) + 1}.parquet"
+                out_df.to_parquet(part_file, index=False)
+            else:
+                self._write_file(path, out_df)
+            self._next_oids[path] = first_oid + len(out_df)
+            PROFILER.add_rows(rows_written=len(df))
+        return len(df)
+
+    def insert_cursor(self, table, fields):
+        """Return a cursor that appends the inserted rows to the output table when it's closed."""
+        return _LocalInsertCursor(self, table, fields)
+
+    def next_oid(self, table):
+        """Return the ObjectID the next row appended to an output table stored as a Parquet file will get.
+
+        It's read from the table's files the first time and tracked as rows are appended after that.
+        """
+        path = self._path(table)
+        parts = self._table_parts(path)
+        if path not in self._next_oids:
+            max_oids = [
+                pd.read_parquet(table_file, columns=[self.oid_field])[self.oid_field].max()
+                for table_file in ([path] + parts if os.path.exists(path) else [])
+            ]
+            max_oids = [oid for oid in max_oids if pd.notna(oid)]
+            self._next_oids[path] = int(max(max_oids)) + 1 if max_oids else 1
+        return self._next_oids[path]
+
+    def delete_rows(self, table, oids):
+        """Delete the rows with the designated ObjectIDs from an output table stored as a Parquet file."""
+        path = self._path(table)
+        with PROFILER.stage(f"delete {os.path.basename(table)}"):
+            df, _ = self._read_file(table)
+            deleted = df[self.oid_field].isin(np.asarray(oids, dtype=np.int64)).to_numpy()
+            num_deleted = int(deleted.sum())
+            if num_deleted:
+                self._write_file(path, df[~deleted])
+                # The next ObjectID is read from the rewritten file again, so it's one more than the largest one left
+                self._next_oids.pop(path, None)
+            PROFILER.add_rows(rows_written=num_deleted)
+        return num_deleted
+
+    def copy_rows(self, in_table, out_table, fields, oids):
+        """Copy rows from a local table to an output table stored as a Parquet file.
+
+        The SHAPE@ field copies the line geometry of shapefiles and output tables.
+        """
+        attr_fields = [field for field in fields if field.upper() != "SHAPE@"]
+        df = self.read_columns(in_table, ["OID@"] + attr_fields)
+        df = df[df["OID@"].isin(np.asarray(oids, dtype=np.int64))]
+        out_fields = ["SHAPE@WKB" if field.upper() == "SHAPE@" else field for field in fields]
+        if "SHAPE@WKB" in out_fields:
+            store = self.read_vertices(in_table, "OID@", df["OID@"])
+            wkbs = []
+            for oid in df["OID@"]:
+                vertices = store.vertices(oid)
+                wkbs.append(None if vertices is None else vertices_to_wkb(vertices))
+            df["SHAPE@WKB"] = wkbs
+        return self.insert_rows(out_table, df, out_fields)
+
+    def update_rows(self, table, key_field, values_df, key_type=None, progressor_label=None):
+        """Copy field values from a dataframe into the matching rows of an output table stored as a Parquet file."""
+        path = self._path(table)
+        with PROFILER.stage(f"update {os.path.basename(table)}"):
+            df, _ = self._read_file(table)
+            keys = df[key_field] if key_type is None else df[key_field].map(key_type)
+            idxs = values_df.index.get_indexer(keys)
+            matched = idxs >= 0
+            for field in values_df.columns:
+                values = df[field].to_numpy(dtype=object) if field in df.columns else np.full(len(df), None, object)
+                values[matched] = to_object_array(values_df[field])[idxs[matched]]
+                df[field] = pd.Series(values).infer_objects()
+            self._write_file(path, df)
+            num_updated = int(matched.sum())
+            PROFILER.add_rows(rows_read=len(df), rows_written=num_updated)
+        return num_updated
+
+    def close(self, tables):
+        """Compact the part files of the designated output tables into the tables' files."""
+        for table in tables:
+            path = self._path(table)
+            if not self._table_parts(path):
+                continue
+            with PROFILER.stage(f"compact {os.path.basename(table)}"):
+                df, _ = self._read_file(table)
+                self._write_file(path, df)
+
+
+def read_dbf(dbf_file, encoding=None):
+    """Read all the records of a dBASE (DBF) file, like the attribute table of a shapefile, into a dataframe.
+
+    Numeric fields are read as int64 if they have no decimals and no blank values and as float64 otherwise, blank text
+    values are read as None, and date fields are read as datetimes. Deleted records are skipped.
+
+    Args:
+        dbf_file: Path to the DBF file
+        encoding: Encoding of the text values. If not specified, the encoding in the shapefile's .cpg file is used if
+            there is one, and UTF-8 otherwise.
+
+    Returns:
+        pandas DataFrame
+    """
+    if encoding is None:
+        cpg_file = os.path.splitext(dbf_file)[0] + ".cpg"
+        encoding = "utf-8"
+        if os.path.exists(cpg_file):
+            with open(cpg_file, encoding="ascii") as f:
+                encoding = f.read().strip() or encoding
+    with open(dbf_file, "rb") as f:
+        num_records, header_size, record_size = struct.unpack("<4xIHH20x", f.read(32))
+        field_defs = []  # (name, type, length, decimal count)
+        offset = 1  # Each record starts with a deletion flag
+        while True:
+            descriptor = f.read(32)
+            if not descriptor or descriptor[0] == 0x0D:
+                break
+            name = descriptor[:11].split(b"\x00")[0].decode("ascii")
+            field_defs.append((name, chr(descriptor[11]), descriptor[16], descriptor[17], offset))
+            offset += descriptor[16]
+        f.seek(header_size)
+        data = np.frombuffer(f.read(num_records * record_size), dtype=np.uint8)
+    records = data[:(len(data) // record_size) * record_size].reshape(-1, record_size)
+    records = records[records[:, 0] != ord("*")]
+    columns = {}
+    for name, field_type, length, decimals, offset in field_defs:
+        raw_values = np.char.strip(
+            np.ascontiguousarray(records[:, offset:offset + length]).view(f"S{length}").ravel(), b" \x00")
+        if field_type in ("N", "F"):
+            values = pd.to_numeric(pd.Series(np.char.decode(raw_values, "ascii")), errors="coerce").to_numpy()
+            if decimals == 0 and not np.isnan(values).any():
+                values = values.astype(np.int64)
+        elif field_type == "D":
+            values = pd.to_datetime(np.char.decode(raw_values, "ascii"), format="%Y%m%d", errors="coerce").to_numpy()
+        else:
+            values = np.char.decode(raw_values, encoding, errors="replace").astype(object)
+            values[values == ""] = None
+        columns[name] = values
+    return pd.DataFrame(columns, columns=[field_def[0] for field_def in field_defs])
+
+
+def read_shapefile_vertices(shp_file):
+    """Read the vertices of all the features in a polyline shapefile.
+
+    The vertices of all the parts of a multipart feature are returned in order as a single sequence, the same way arcpy
+    returns them when exploding a feature to points, along with the indexes where its parts after the first one start.
+    Z and M values are ignored.
+
+    Returns:
+        An int64 array of the ObjectIDs (FIDs) of the features with geometry, an int64 array of offsets such that the
+        vertices of the ith feature are coords[offsets[i]:offsets[i + 1]], an (N, 2) float64 array of coordinates, and
+        an int64 array of the indexes in coords where each part of a multipart feature after its first one starts
+    """
+    with open(shp_file, "rb") as f:
+        data = f.read()
+    oids = []
+    counts = []
+    coord_chunks = []
+    part_start_chunks = []
+    num_vertices = 0
+    pos = 100  # Skip the file header
+    while pos + 8 <= len(data):
+        # Record headers are big-endian with the content length in 16-bit words
+        record_num, content_length = struct.unpack_from(">ii", data, pos)
+        content_pos = pos + 8
+        pos = content_pos + content_length * 2
+        shape_type, = struct.unpack_from("<i", data, content_pos)
+        if shape_type == 0:
+            # Null shape
+            continue
+        if shape_type not in (3, 13, 23):
+            raise ValueError(f"Shapefile {shp_file} has shape type {shape_type}, but only polylines are supported.")
+        num_parts, num_points = struct.unpack_from("<ii", data, content_pos + 36)
+        points_pos = content_pos + 44 + num_parts * 4
+        # The index of the first point of each part follows the number of points
+        parts = np.frombuffer(data, dtype="<i4", count=num_parts, offset=content_pos + 44).astype(np.int64)
+        part_start_chunks.append(parts[parts > 0] + num_vertices)
+        oids.append(record_num - 1)
+        counts.append(num_points)
+        num_vertices += num_points
+        coord_chunks.append(np.frombuffer(data, dtype="<f8", count=num_points * 2, offset=points_pos).reshape(-1, 2))
+    offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+    coords = np.concatenate(coord_chunks).astype(np.float64) if coord_chunks else np.empty((0, 2), dtype=np.float64)
+    part_starts = np.concatenate(part_start_chunks) if part_start_chunks else np.empty(0, dtype=np.int64)
+    return np.array(oids, dtype=np.int64), offsets, coords, part_starts
+
+
+def oid_where_clauses(oid_field, oids, batch_size=OID_BATCH_SIZE):
+    """Yield where clauses selecting the designated ObjectIDs of a table a batch at a time."""
+    oids = np.unique(np.asarray(oids, dtype=np.int64))
+    for start in range(0, len(oids), batch_size):
+        yield f"{oid_field} IN ({', '.join(str(oid) for oid in oids[start:start + batch_size])})"
+
+
+def comparable_values(values):
+    """Convert field values to strings that are equal if the values are equal once they're stored in a table.
+
+    Values written in a delta run are compared with the values already stored in the output of the previous run, which
+    may have a different type after the round trip through the table. Whole numbers compare equal whatever their type,
+    other numbers are compared at single precision since FLOAT fields store them that way, and nulls, NaNs, and empty
+    strings all compare equal.
+
+    Args:
+        values: pandas Series or array-like of values
+
+    Returns:
+        numpy object array of strings
+    """
+    values = pd.Series(values).reset_index(drop=True)
+    if pd.api.types.is_bool_dtype(values):
+        values = values.astype(object)
+    if pd.api.types.is_numeric_dtype(values):
+        numbers = values.astype(np.float64)
+    else:
+        numbers = pd.to_numeric(values, errors="coerce")
+    is_number = numbers.notna().to_numpy()
+    whole = is_number & (numbers % 1 == 0).to_numpy()
+    fraction = is_number & ~whole
+    out = ("s" + values.astype(str)).to_numpy(dtype=object)
+    out[whole] = ("i" + numbers[whole].astype(np.int64).astype(str)).to_numpy()
+    out[fraction] = ("f" + numbers[fraction].astype(np.float32).astype(str)).to_numpy()
+    out[(values.isna() | (values.astype(str) == "")).to_numpy()] = "n"
+    return out
+
+
+def hash_rows(df):
+    """Return an array with a hash of each row of a dataframe that is equal for rows whose values compare equal.
+
+    Values are compared the same way as by comparable_values.
+    """
+    comparable_df = pd.DataFrame({column: comparable_values(df[column]) for column in df.columns}, index=df.index)
+    return pd.util.hash_pandas_object(comparable_df, index=False).to_numpy(dtype=np.uint64)
+
+
+def hash_vertices(store, oids, resolution=0):
+    """Return an array with a hash of the vertices of each designated feature in a StreetGeometryStore.
+
+    Coordinates are snapped to multiples of the resolution, normally the XY resolution of the spatial reference of the
+    feature class they're stored in, so the same line read from two feature classes hashes the same. Where the parts of
+    multipart features start is included in the hash. Features with no geometry get a hash of 0.
+    """
+    coords = store.coords
+    if resolution:
+        coords = np.round(coords / resolution).astype(np.int64)
+    else:
+        coords = coords + 0.0  # Make -0.0 and 0.0 hash the same
+    counts = np.diff(store.offsets)
+    positions = np.arange(len(coords)) - np.repeat(store.offsets[:-1], counts)
+    is_part_start = np.zeros(len(coords), dtype=bool)
+    is_part_start[store.part_starts] = True
+    vertex_hashes = pd.util.hash_pandas_object(
+        pd.DataFrame({"x": coords[:, 0], "y": coords[:, 1], "position": positions, "part_start": is_part_start}),
+        index=False
+    ).to_numpy(dtype=np.uint64)
+    # Sum the hashes of each feature's vertices. Overflow wraps around, which is fine for a hash.
+    feature_hashes = np.zeros(len(store), dtype=np.uint64)
+    nonempty = counts > 0
+    if nonempty.any():
+        feature_hashes[nonempty] = np.add.reduceat(vertex_hashes, store.offsets[:-1][nonempty])
+    hashes = np.zeros(len(oids), dtype=np.uint64)
+    oids = np.asarray(oids, dtype=np.int64)
+    idxs = np.minimum(np.searchsorted(store.oids, oids), max(len(store) - 1, 0))
+    found = (store.oids[idxs] == oids) if len(store) else np.zeros(len(oids), dtype=bool)
+    hashes[found] = feature_hashes[idxs[found]]
+    return hashes
+
+
+def _occurrences(hashes):
+    """Return the number of times each hash occurred earlier in the array."""
+    return pd.Series(hashes).groupby(hashes).cumcount().to_numpy()
+
+
+def _match_rows(table_hashes, new_hashes):
+    """Return the position of the equal table row paired with each new row, or -1 if it has none.
+
+    Rows with equal hashes are paired one to one, so if a table has two equal rows and only one equal new row is
+    written, one of the table rows is unmatched.
+    """
+    table_keys = pd.MultiIndex.from_arrays([table_hashes, _occurrences(table_hashes)])
+    new_keys = pd.MultiIndex.from_arrays([new_hashes, _occurrences(new_hashes)])
+    return table_keys.get_indexer(new_keys)
+
+
+def combine_child_hashes(parent_hashes, parent_oids, child_hashes, child_parent_oids):
+    """Return the hashes of parent rows combined with the hashes of their child rows in order.
+
+    Args:
+        parent_hashes: Array with a hash of each parent row, like the ones returned by hash_rows
+        parent_oids: ObjectIDs of the parent rows
+        child_hashes: Array with a hash of each child row, in order
+        child_parent_oids: ObjectID of the parent row of each child row
+
+    Returns:
+        numpy uint64 array
+    """
+    child_parent_oids = np.asarray(child_parent_oids)
+    positions = pd.Series(child_parent_oids).groupby(child_parent_oids).cumcount().to_numpy()
+    child_hashes = pd.util.hash_pandas_object(
+        pd.DataFrame({"hash": child_hashes, "position": positions}), index=False
+    ).to_numpy(dtype=np.uint64)
+    children_hashes = np.zeros(len(parent_hashes), dtype=np.uint64)
+    idxs = pd.Index(parent_oids).get_indexer(child_parent_oids)
+    np.add.at(children_hashes, idxs[idxs >= 0], child_hashes[idxs >= 0])
+    return pd.util.hash_pandas_object(
+        pd.DataFrame({"row": parent_hashes, "children": children_hashes}), index=False
+    ).to_numpy(dtype=np.uint64)
+
+
+def insert_with_children(table_io, table, fields, df, parent_keys, child, child_fields, child_df, link_field):
+    """Insert parent rows along with their child rows linked to the ObjectIDs the parent rows get.
+
+    Args:
+        table_io: TableIO used to insert the rows
+        table: Catalog path to the parent table
+        fields: List of fields of the parent table to populate from the dataframe columns with the same names
+        df: Dataframe of parent rows
+        parent_keys: Key of each parent row that its child rows have in the link field, like its ObjectID in the table
+            the rows were read from
+        child: Catalog path to the child table
+        child_fields: List of fields of the child table to populate, including the link field
+        child_df: Dataframe of child rows, inserted in order
+        link_field: Field of the child table storing the ObjectID of the parent row
+
+    Returns:
+        numpy int64 array of the ObjectIDs of the inserted parent rows
+    """
+    link_idx = child_fields.index(link_field)
+    child_rows = list(zip(*[to_object_array(child_df[field]).tolist() for field in child_fields]))
+    child_row_idxs = child_df.reset_index(drop=True).groupby(link_field, sort=False).indices
+    oids = []
+    with table_io.insert_cursor(table, fields) as cur, table_io.insert_cursor(child, child_fields) as child_cur:
+        rows = zip(*[to_object_array(df[field]).tolist() for field in fields])
+        for parent_key, row in zip(parent_keys, rows):
+            oid = cur.insertRow(row)
+            oids.append(oid)
+            for idx in child_row_idxs.get(parent_key, []):
+                child_row = list(child_rows[idx])
+                child_row[link_idx] = oid
+                child_cur.insertRow(child_row)
+    return np.asarray(oids, dtype=np.int64)
+
+
+class StreetsDelta:
+    """Changes to the input streets since a previous run, found by comparing the streets with the same ID.
+
+    A street whose geometry or end node IDs changed is replaced by deleting it from the previous Streets and copying it
+    again from the input, so it gets a new ObjectID, and rows of other tables that reference the ObjectIDs of the
+    replaced and deleted streets have to be rebuilt along with their geometry, which the end nodes orient. A street
+    whose other attributes changed is updated in place and keeps its ObjectID, so the rows referencing it are only
+    rewritten if their own values change.
+    """
+
+    def __init__(self, previous_df, input_df, fields):
+        """Compare the streets of the previous output with the input streets.
+
+        Args:
+            previous_df: Dataframe of the previous output streets with OID, ID, Hash, and GeometryHash columns, where
+                Hash is a hash of the street's attributes and geometry and GeometryHash a hash of its geometry and
+                end node IDs
+            input_df: Dataframe of the input streets with the same columns. Only the first input street with each ID is
+                used, since duplicates are deleted from the output.
+            fields: Fields of the input streets that are copied to the output and were included in the hashes
+        """
+        self.fields = fields
+        previous_df = previous_df.drop_duplicates("ID").set_index("ID")
+        input_df = input_df.drop_duplicates("ID").set_index("ID")
+        common_ids = previous_df.index.intersection(input_df.index)
+        changed = previous_df.loc[common_ids, "Hash"].to_numpy() != input_df.loc[common_ids, "Hash"].to_numpy()
+        reshaped = previous_df.loc[common_ids, "GeometryHash"].to_numpy() != \
+            input_df.loc[common_ids, "GeometryHash"].to_numpy()
+        self.inserted_ids = input_df.index.difference(previous_df.index).to_numpy()
+        self.updated_ids = common_ids[changed].to_numpy()
+        # Updated streets whose geometry or end nodes changed
+        self.reshaped_ids = common_ids[changed & reshaped].to_numpy()
+        self.deleted_ids = previous_df.index.difference(input_df.index).to_numpy()
+        # ObjectIDs of the input streets to copy to the output
+        self.input_oids = input_df.loc[np.concatenate((self.inserted_ids, self.reshaped_ids)), "OID"].to_numpy()
+        # ObjectIDs of the input streets whose attributes are copied to the streets updated in place
+        self.in_place_ids = common_ids[changed & ~reshaped].to_numpy()
+        self.in_place_input_oids = input_df.loc[self.in_place_ids, "OID"].to_numpy()
+        # ObjectIDs of the previous output streets that are updated in place
+        self.in_place_oids = previous_df.loc[self.in_place_ids, "OID"].to_numpy()
+        # ObjectIDs of the previous output streets that are deleted or replaced
+        self.replaced_oids = previous_df.loc[np.concatenate((self.reshaped_ids, self.deleted_ids)), "OID"].to_numpy()
+        self.num_previous = len(previous_df)
+        self.max_previous_oid = int(previous_df["OID"].max()) if len(previous_df) else 0
+
+    @property
+    def changed_ids(self):
+        """IDs of the streets that were inserted, updated, or deleted."""
+        return np.concatenate((self.inserted_ids, self.updated_ids, self.deleted_ids))
+
+    @property
+    def changed_fraction(self):
+        """Number of changed streets as a fraction of the number of streets in the previous output."""
+        return len(self.changed_ids) / max(self.num_previous, 1)
+
+
+class _DeltaInsertCursor:
+    """Insert cursor that collects the rows written to a table in a delta run until the table's changes are applied."""
+
+    def __init__(self, delta_table_io, table, fields):
+        """Initialize the cursor for the designated table and fields."""
+        self.delta_table_io = delta_table_io
+        self.table = table
+        self.fields = fields
+        self.rows = []
+        # Rows are numbered in the order they're collected for the table, starting at 1
+        self.first_oid = delta_table_io.num_collected(table) + 1
+
+    def insertRow(self, row):  # pylint:disable=invalid-name
+        """Collect a row and return its provisional ObjectID.
+
+        Named like the arcpy method so the two are interchangeable. The provisional ObjectIDs of parent rows can be
+        stored in their child rows, which are linked to the actual ObjectIDs of the parent rows when they're inserted.
+        """
+        self.rows.append(tuple(row))
+        return self.first_oid + len(self.rows) - 1
+
+    def __enter__(self):
+        """Return the cursor."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Collect the rows unless an exception was raised."""
+        if exc_type is None:
+            self.delta_table_io.collect(
+                self.table, self.fields, pd.DataFrame.from_records(self.rows, columns=self.fields))
+        self.rows = []
+
+
+class DeltaTableIO(TableIO):
+    """TableIO for a delta run, which updates the outputs of a previous run in place instead of writing them again.
+
+    Rows written to the tables updated in place are collected instead of being inserted. When the stage writing them
+    completes, apply() compares them with the rows already in the tables, leaves the rows found in both alone, and only
+    deletes the remaining previous rows and inserts the remaining new rows. Updates only write the rows whose values
+    changed. Everything else goes straight to the wrapped TableIO.
+
+    Rows are compared by all their fields except their geometry, which is derived from the streets they reference. Rows
+    referencing a street that was replaced or deleted are always rebuilt, so their geometry is too. For the scoped
+    tables, only the rows referencing one of the scope ObjectIDs are rebuilt, so only those are compared, and the
+    other rows are left alone.
+
+    The ObjectIDs returned by the collecting cursors are provisional, numbered in the order the rows are collected for
+    each table starting at 1. Once a table's changes are applied, final_oids() returns the ObjectID each collected row
+    ended up with, which is that of the equal row left alone or that of the row inserted for it.
+    """
+
+    def __init__(self, table_io, tables, replaced_oids, linked_tables=None, workspace=None, scoped_tables=None,
+                 scope_oids=None):
+        """Initialize the TableIO.
+
+        Args:
+            table_io: TableIO used for the actual reads and writes
+            tables: Catalog paths of the output tables updated in place
+            replaced_oids: ObjectIDs of the streets of the previous output that were replaced or deleted. Rows with one
+                of them in a field whose name ends in FID, like EdgeFID or Edge1FID, are always rebuilt.
+            linked_tables: Optional dictionary of {child table: (parent table, field)} for tables whose rows belong to a
+                row of a parent table whose ObjectID is stored in the field. Parent rows are compared along with their
+                child rows, in order.
+            workspace: Workspace edited when applying the changes to a parent table and its child table at once
+            scoped_tables: Optional catalog paths of the tables whose rows are only rebuilt where they reference one of
+                the scope ObjectIDs in a field whose name ends in FID, or whose child rows do
+            scope_oids: ObjectIDs of the streets of the previous output whose rows are rebuilt in the scoped tables
+        """
+        self.table_io = table_io
+        self.tables = set(tables)
+        self.replaced_oids = np.asarray(replaced_oids, dtype=np.int64)
+        self.linked_tables = linked_tables or {}
+        self.workspace = workspace
+        self.scoped_tables = set(scoped_tables or [])
+        self.scope_oids = np.asarray(scope_oids if scope_oids is not None else [], dtype=np.int64)
+        self.collected = {}  # {table: (fields, list of dataframes of collected rows)}
+        self.changes = {}  # {table: {change type: row count}} of the changes not yet returned by apply()
+        self.applied_oids = {}  # {table: array of the final ObjectID of each collected row by provisional ObjectID}
+
+    def read_columns(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of a table into a dataframe with the wrapped TableIO."""
+        return self.table_io.read_columns(table, fields, where_clause, dtype)
+
+    def read_vertices(self, feature_class, oid_field, oids):
+        """Return a StreetGeometryStore with the vertices of the designated features read with the wrapped TableIO."""
+        return self.table_io.read_vertices(feature_class, oid_field, oids)
+
+    def list_fields(self, table):
+        """Return the names of the fields of a table with the wrapped TableIO."""
+        return self.table_io.list_fields(table)
+
+    def estimate_nbytes(self, table, fields, where_clause=None):
+        """Estimate the memory used by a dataframe read from the table with the wrapped TableIO."""
+        return self.table_io.estimate_nbytes(table, fields, where_clause)
+
+    def insert_rows(self, table, df, fields, columns=None, batch_size=INSERT_BATCH_SIZE):
+        """Collect the rows of a dataframe if the table is updated in place, or insert them otherwise."""
+        if table not in self.tables:
+            return self.table_io.insert_rows(table, df, fields, columns, batch_size)
+        if columns is None:
+            columns = fields
+        if len(columns) != len(fields):
+            raise ValueError("The number of dataframe columns must match the number of output fields.")
+        self.collect(
+            table, fields, pd.DataFrame({field: df[column].to_numpy() for field, column in zip(fields, columns)}))
+        return len(df)
+
+    def insert_cursor(self, table, fields):
+        """Return a cursor collecting the rows if the table is updated in place, or an insert cursor otherwise."""
+        if table not in self.tables:
+            return self.table_io.insert_cursor(table, fields)
+        return _DeltaInsertCursor(self, table, fields)
+
+    def edit_session(self, workspace):
+        """Context manager for writing to more than one table in the workspace at once with the wrapped TableIO."""
+        return self.table_io.edit_session(workspace)
+
+    def delete_rows(self, table, oids):
+        """Delete the rows with the designated ObjectIDs from a table with the wrapped TableIO."""
+        return self.table_io.delete_rows(table, oids)
+
+    def close(self, tables):
+        """Finish writing the designated tables with the wrapped TableIO."""
+        self.table_io.close(tables)
+
+    def copy_rows(self, in_table, out_table, fields, oids):
+        """Copy rows from one table to another with the wrapped TableIO."""
+        return self.table_io.copy_rows(in_table, out_table, fields, oids)
+
+    def update_rows(self, table, key_field, values_df, key_type=None, progressor_label=None):
+        """Copy field values from a dataframe into the matching rows of a table.
+
+        If the table is updated in place, only the rows with at least one changed value are updated.
+        """
+        if table not in self.tables:
+            return self.table_io.update_rows(table, key_field, values_df, key_type, progressor_label)
+        table_df = self.table_io.read_columns(table, [key_field] + values_df.columns.tolist())
+        keys = table_df[key_field] if key_type is None else table_df[key_field].map(key_type)
+        idxs = values_df.index.get_indexer(keys)
+        matched = idxs >= 0
+        changed = np.zeros(len(values_df), dtype=bool)
+        for field in values_df.columns:
+            changed[idxs[matched]] |= \
+                comparable_values(table_df[field])[matched] != comparable_values(values_df[field])[idxs[matched]]
+        num_updated = 0
+        if changed.any():
+            num_updated = self.table_io.update_rows(table, key_field, values_df[changed], key_type, progressor_label)
+        self.record_changes(table, updated=num_updated)
+        return num_updated
+
+    def num_collected(self, table):
+        """Return the number of rows collected for a table so far."""
+        return sum(len(df) for df in self.collected.get(table, (None, []))[1])
+
+    def collect(self, table, fields, df):
+        """Collect rows written to a table until its changes are applied."""
+        collected_fields, dfs = self.collected.setdefault(table, (list(fields), []))
+        if list(fields) != collected_fields:
+            raise ValueError(f"Rows written to {table} in a delta run must all have the same fields.")
+        dfs.append(df)
+
+    def _take_collected(self, table):
+        """Return the fields and a dataframe of the rows collected for a table, and stop collecting them."""
+        fields, dfs = self.collected.pop(table)
+        return fields, pd.concat(dfs, ignore_index=True)
+
+    def record_changes(self, table, **counts):
+        """Add to the counts of the rows of a table changed in a delta run, by type of change."""
+        table_changes = self.changes.setdefault(table, {})
+        for change, count in counts.items():
+            table_changes[change] = table_changes.get(change, 0) + int(count)
+
+    def apply(self, tables):
+        """Apply the differences between the rows collected for the designated tables and the rows already in them.
+
+        Returns:
+            Dictionary of {table: {change type: row count}} of all the changes made to the tables since the last call
+        """
+        for table in tables:
+            if table in self.collected and table not in self.linked_tables:
+                with PROFILER.stage(f"apply {os.path.basename(table)}"):
+                    self._apply_table(table)
+        return {table: self.changes.pop(table) for table in tables if table in self.changes}
+
+    def final_oids(self, table, oids):
+        """Return the ObjectIDs that rows collected for a table have in the table after its changes were applied.
+
+        Args:
+            table: Catalog path to the table
+            oids: Provisional ObjectIDs of the rows returned by the cursor that collected them
+
+        Returns:
+            numpy int64 array
+        """
+        return self.applied_oids[table][np.asarray(oids, dtype=np.int64) - 1]
+
+    @staticmethod
+    def _references(df, fields, oids):
+        """Return a mask of the rows of a dataframe referencing one of the designated streets in a FID field."""
+        references = np.zeros(len(df), dtype=bool)
+        for field in fields:
+            if field.upper().endswith("FID"):
+                references |= df[field].isin(oids).to_numpy()
+        return references
+
+    def _apply_table(self, table):
+        """Apply the differences between the rows collected for a table, and its child table if any, and its rows."""
+        fields, new_df = self._take_collected(table)
+        compare_fields = [field for field in fields if not field.upper().startswith("SHAPE@")]
+        table_df = self.table_io.read_columns(table, ["OID@"] + compare_fields)
+        child = next((child for child, (parent, _) in self.linked_tables.items() if parent == table), None)
+        if child is not None:
+            link_field = self.linked_tables[child][1]
+            child_fields, new_child_df = self._take_collected(child)
+            child_compare_fields = [
+                field for field in child_fields if field != link_field and not field.upper().startswith("SHAPE@")]
+            table_child_df = self.table_io.read_columns(child, ["OID@", link_field] + child_compare_fields)
+        if table in self.scoped_tables:
+            # Only the rows referencing a street in the scope were rebuilt, so the other rows are left alone
+            in_scope = self._references(table_df, compare_fields, self.scope_oids)
+            if child is not None:
+                scoped_parents = table_child_df.loc[
+                    self._references(table_child_df, child_compare_fields, self.scope_oids), link_field]
+                in_scope |= table_df["OID@"].isin(scoped_parents).to_numpy()
+                table_child_df = table_child_df[table_child_df[link_field].isin(table_df.loc[in_scope, "OID@"])]
+            table_df = table_df[in_scope]
+
+        table_hashes = hash_rows(table_df[compare_fields])
+        new_hashes = hash_rows(new_df[compare_fields])
+        rebuilt = self._references(table_df, compare_fields, self.replaced_oids)
+        if child is not None:
+            table_hashes = combine_child_hashes(
+                table_hashes, table_df["OID@"], hash_rows(table_child_df[child_compare_fields]),
+                table_child_df[link_field])
+            new_hashes = combine_child_hashes(
+                new_hashes, np.arange(1, len(new_df) + 1), hash_rows(new_child_df[child_compare_fields]),
+                new_child_df[link_field])
+            rebuilt_parents = table_child_df.loc[
+                self._references(table_child_df, child_compare_fields, self.replaced_oids), link_field]
+            rebuilt |= table_df["OID@"].isin(rebuilt_parents).to_numpy()
+
+        # Pair the collected rows with equal rows already in the table. Those are left alone.
+        kept_idxs = np.flatnonzero(~rebuilt)
+        matches = _match_rows(table_hashes[~rebuilt], new_hashes)
+        new_unmatched = matches < 0
+        matched_idxs = kept_idxs[matches[~new_unmatched]]
+        table_unmatched = np.ones(len(table_df), dtype=bool)
+        table_unmatched[matched_idxs] = False
+        delete_oids = table_df.loc[table_unmatched, "OID@"].to_numpy()
+        insert_df = new_df[new_unmatched]
+        if child is None:
+            self.table_io.delete_rows(table, delete_oids)
+            inserted_oids = self._insert_rows(table, insert_df, fields)
+        else:
+            delete_child_oids = table_child_df.loc[table_child_df[link_field].isin(delete_oids), "OID@"].to_numpy()
+            insert_child_df = new_child_df[new_child_df[link_field].isin(np.flatnonzero(new_unmatched) + 1)]
+            with self.table_io.edit_session(self.workspace):
+                self.table_io.delete_rows(child, delete_child_oids)
+                self.table_io.delete_rows(table, delete_oids)
+                # The provisional ObjectID of each collected row is its index plus one
+                inserted_oids = insert_with_children(
+                    self.table_io, table, fields, insert_df, insert_df.index + 1, child, child_fields, insert_child_df,
+                    link_field)
+            self.record_changes(child, inserted=len(insert_child_df), deleted=len(delete_child_oids))
+        self.record_changes(table, inserted=len(insert_df), deleted=len(delete_oids))
+        final_oids = np.zeros(len(new_df), dtype=np.int64)
+        final_oids[~new_unmatched] = table_df["OID@"].to_numpy()[matched_idxs]
+        final_oids[new_unmatched] = inserted_oids
+        self.applied_oids[table] = final_oids
+
+    def _insert_rows(self, table, df, fields):
+        """Insert the rows of a dataframe with the wrapped TableIO and return the ObjectIDs they get."""
+        oids = []
+        with self.table_io.insert_cursor(table, fields) as cur:
+            for start in range(0, len(df), INSERT_BATCH_SIZE):
+                batch_df = df.iloc[start:start + INSERT_BATCH_SIZE]
+                for row in zip(*[to_object_array(batch_df[field]).tolist() for field in fields]):
+                    oids.append(cur.insertRow(row))
+        return np.asarray(oids, dtype=np.int64)
+
+
+class SignpostWriter:
+    """Write signposts and their Signposts_Streets rows in chunks, each saved in its own edit session.
+
+    The two tables are written at once, so they have to be edited in an edit session. Rather than keeping a single
+    session open for the whole stage, rows are collected in memory and written a chunk of signposts at a time, each
+    chunk in its own edit session with bulk inserts. This keeps memory use bounded, and a failure late in a run abandons
+    only the chunk being written. The stage is rerun from scratch when resuming a failed run, so the chunks written
+    before the failure are deleted then. Each chunk is recorded as a call of the "commit signposts" profiling stage, so
+    the report shows the number of commits, the rows written per commit, and the throughput.
+    """
+
+    def __init__(self, table_io, workspace, signposts, signposts_streets, max_signpost_branches,
+                 commit_size=SIGNPOST_COMMIT_SIZE):
+        """Initialize the writer.
+
+        Args:
+            table_io: TableIO used to write the rows
+            workspace: Workspace containing the tables, which is edited in an edit session for each chunk
+            signposts: Catalog path to the Signposts feature class
+            signposts_streets: Catalog path to the Signposts_Streets table
+            max_signpost_branches: Number of Branch* and Toward* fields of each kind in the Signposts feature class
+            commit_size: Number of signposts written in each edit session
+        """
+        self.table_io = table_io
+        self.workspace = workspace
+        self.signposts = signposts
+        self.signposts_streets = signposts_streets
+        self.commit_size = commit_size
+        self.signpost_fields = ["SHAPE@WKB", "ExitName"]
+        for i in range(max_signpost_branches):
+            self.signpost_fields += [f"Branch{i}", f"Branch{i}Dir", f"Branch{i}Lng"]
+        for i in range(max_signpost_branches):
+            self.signpost_fields += [f"Toward{i}", f"Toward{i}Lng"]
+        self.signposts_streets_fields = ["SignpostID", "Sequence", "EdgeFCID", "EdgeFID", "EdgeFrmPos", "EdgeToPos"]
+        self.signpost_rows = []  # List of (vertices, other field values) tuples of the signposts not yet written
+        self.signposts_streets_rows = []  # List of Signposts_Streets rows not yet written
+        self.num_commits = 0
+
+    def add(self, signpost_oid, signpost_vertices, signpost_values, signposts_streets_rows):
+        """Add a signpost and its Signposts_Streets rows, writing the chunk of signposts collected so far if it's full.
+
+        Args:
+            signpost_oid: ObjectID the signpost will get, which is stored in the SignpostID field of its
+                Signposts_Streets rows
+            signpost_vertices: (N, 2) array of the signpost's vertices, which is converted to WKB when it's written
+            signpost_values: List of the signpost's values for the Signposts fields after the shape
+            signposts_streets_rows: List of the signpost's Signposts_Streets rows without their SignpostID value
+        """
+        self.signpost_rows.append((signpost_vertices, signpost_values))
+        self.signposts_streets_rows += [[signpost_oid] + row for row in signposts_streets_rows]
+        if len(self.signpost_rows) >= self.commit_size:
+            self.flush()
+
+    def flush(self):
+        """Write the collected rows in an edit session and save the edits."""
+        if not self.signpost_rows:
+            return
+        with PROFILER.stage("commit signposts"):
+            signposts_df = pd.DataFrame.from_records(
+                [[vertices_to_wkb(vertices)] + values for vertices, values in self.signpost_rows],
+                columns=self.signpost_fields
+            )
+            signposts_streets_df = pd.DataFrame.from_records(
+                self.signposts_streets_rows, columns=self.signposts_streets_fields)
+            with self.table_io.edit_session(self.workspace):
+                self.table_io.insert_rows(self.signposts, signposts_df, self.signpost_fields)
+                self.table_io.insert_rows(self.signposts_streets, signposts_streets_df, self.signposts_streets_fields)
+        self.num_commits += 1
+        self.signpost_rows = []
+        self.signposts_streets_rows = []
+
+    def __enter__(self):
+        """Return the writer."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the remaining rows unless an exception was raised, in which case they're discarded."""
+        if exc_type is None:
+            self.flush()
+        self.signpost_rows = []
+        self.signposts_streets_rows = []
+
+
+def isin_sorted(values, sorted_values):
+    """Return a boolean array indicating which values are in a sorted array of unique values.
+
+    This is a binary search of the sorted array, so unlike np.isin or Series.isin, nothing has to be hashed or sorted
+    again each time it's called with the same sorted_values, which makes it cheap for filtering many chunks of a table.
+    """
+    values = np.asarray(values)
+    if len(sorted_values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    idxs = np.searchsorted(sorted_values, values)
+    return sorted_values[np.minimum(idxs, len(sorted_values) - 1)] == values
+
+
+class GroupedIndex:
+    """Read-only index of the rows of a table grouped by an integer key, for quick lookups of the rows with a key.
+
+    The rows are stably sorted by key and each column is stored as a NumPy array in that order. The sorted unique keys
+    and the offsets of the first row of each key's group in the column arrays make up a compressed sparse row (CSR)
+    layout, so looking up a key is a binary search of the keys, and its rows are a slice of each column array, which is
+    a view rather than a copy. Unlike looking up a key in a dataframe with .loc, which returns a Series or a DataFrame
+    depending on how many rows have the key, a lookup always returns the same type, and it's many times faster. The
+    index is also much smaller to pickle than a dataframe when sending it to worker processes.
+    """
+
+    def __init__(self, keys, offsets, columns):
+        """Initialize the index from its sorted unique int64 keys, group offsets, and dictionary of column arrays."""
+        self.keys = keys
+        self.offsets = offsets
+        self.columns = columns
+        self.num_rows = int(offsets[-1])
+
+    @classmethod
+    def from_df(cls, df, key=None, columns=None, sort_by=None):
+        """Build an index of the rows of a dataframe.
+
+        Args:
+            df: Dataframe to index
+            key: Integer key column to group the rows by, or None to group them by the dataframe's index
+            columns: Optional list of the columns to include in the index. All columns other than the key are included
+                by default.
+            sort_by: Optional list of columns to stably sort the rows with the same key by. Otherwise, rows with the
+                same key stay in the order they appear in the dataframe.
+
+        Returns:
+            The GroupedIndex
+        """
+        keys = (df.index if key is None else df[key]).to_numpy().astype(np.int64)
+        if columns is None:
+            columns = [column for column in df.columns if column != key]
+        # np.lexsort is stable and sorts by the last key first
+        sort_keys = [df[column].to_numpy() for column in reversed(sort_by or [])]
+        order = np.lexsort(sort_keys + [keys]) if sort_keys else np.argsort(keys, kind="stable")
+        keys = keys[order]
+        starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1]))) if len(keys) else np.array([], int)
+        return cls(
+            keys[starts],
+            np.append(starts, len(keys)).astype(np.int64),
+            {column: df[column].to_numpy()[order] for column in columns}
+        )
+
+    def __len__(self):
+        """Return the number of distinct keys."""
+        return len(self.keys)
+
+    def __contains__(self, key):
+        """Return whether any rows have the key."""
+        return self._position(key) >= 0
+
+    def __getitem__(self, column):
+        """Return the array of values of a column for all rows sorted by key."""
+        return self.columns[column]
+
+    def row_keys(self):
+        """Return the array of the key of each row, in the order of the column arrays."""
+        return np.repeat(self.keys, np.diff(self.offsets))
+
+    def _position(self, key):
+        """Return the position of the key in the sorted keys, or -1 if no rows have the key."""
+        idx = np.searchsorted(self.keys, key)
+        if idx < len(self.keys) and self.keys[idx] == key:
+            return idx
+        return -1
+
+    def group(self, key):
+        """Return the slice of the column arrays holding the rows with the key, which is empty if there are none."""
+        idx = self._position(key)
+        if idx < 0:
+            return slice(0, 0)
+        return slice(self.offsets[idx], self.offsets[idx + 1])
+
+    def group_bounds(self, keys):
+        """Return arrays of the start and stop of the slices of the column arrays holding the rows with each key.
+
+        This is the vectorized version of group(). The slices of keys with no rows are empty.
+        """
+        keys = np.asarray(keys).astype(np.int64)
+        if len(self.keys) == 0:
+            return np.zeros(len(keys), dtype=np.int64), np.zeros(len(keys), dtype=np.int64)
+        idxs = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        found = self.keys[idxs] == keys
+        return np.where(found, self.offsets[idxs], 0), np.where(found, self.offsets[idxs + 1], 0)
+
+    def rows(self, key):
+        """Return a dictionary of arrays of the values of each column for the rows with the key.
+
+        The arrays are views of the index's arrays, so they're cheap to get, and they're empty if no rows have the key.
+        """
+        rows = self.group(key)
+        return {column: values[rows] for column, values in self.columns.items()}
+
+    def first(self, key):
+        """Return a dictionary of the column values of the first row with the key, raising KeyError if there is none.
+
+        This is a replacement for looking up a row in a dataframe with a unique index using .loc.
+        """
+        idx = self._position(key)
+        if idx < 0:
+            raise KeyError(key)
+        row = self.offsets[idx]
+        return {column: values[row] for column, values in self.columns.items()}
+
+
+class StreetTopology:
+    """Read-only node-edge adjacency of the streets, for working out how sequences of streets connect.
+
+    Each street is an edge, numbered by its position in the streets sorted by ID, and the junctions at the ends of the
+    streets are the nodes, numbered from 0. The from and to node of each edge are stored in arrays, and the edges
+    incident to each node are stored in a compressed sparse row (CSR) layout, so the edges incident to node n are
+    node_edges[node_offsets[n]:node_offsets[n + 1]]. Working out the direction each street in a turn or signpost is
+    traversed is then a comparison of node numbers, which is much cheaper than comparing the endpoints of the streets'
+    geometry, and disconnected sequences are found before any geometry is read.
+    """
+
+    def __init__(self, edge_ids, from_nodes, to_nodes, node_ids):
+        """Initialize the topology from the sorted unique int64 street IDs and the from and to node of each edge.
+
+        Nodes are numbered by their position in node_ids, the sorted unique junction IDs, and a node of -1 means it's
+        unknown and doesn't connect to anything.
+        """
+        self.edge_ids = edge_ids
+        self.from_nodes = from_nodes
+        self.to_nodes = to_nodes
+        self.node_ids = node_ids
+        num_nodes = len(node_ids)
+        # Sort the ends of the edges by node to get the edges incident to each node
+        ends = np.concatenate((from_nodes, to_nodes))
+        edges = np.tile(np.arange(len(edge_ids), dtype=np.int64), 2)
+        known = ends >= 0
+        order = np.argsort(ends[known], kind="stable")
+        self.node_edges = edges[known][order]
+        self.node_offsets = np.searchsorted(ends[known][order], np.arange(num_nodes + 1)).astype(np.int64)
+
+    @classmethod
+    def from_df(cls, streets_df, from_field, to_field):
+        """Build the topology of the streets in a dataframe.
+
+        Args:
+            streets_df: Dataframe of the streets indexed by integer street ID. If an ID appears more than once, only its
+                first street is included.
+            from_field: Column with the ID of the junction at the start of each street
+            to_field: Column with the ID of the junction at the end of each street. Missing junction IDs don't connect
+                to anything.
+
+        Returns:
+            The StreetTopology
+        """
+        ids = streets_df.index.to_numpy().astype(np.int64)
+        order = np.argsort(ids, kind="stable")
+        ids = ids[order]
+        first = np.concatenate(([True], ids[1:] != ids[:-1])) if len(ids) else np.array([], dtype=bool)
+        order = order[first]
+        junction_ids = np.concatenate([
+            streets_df[field].to_numpy(dtype=float, na_value=np.nan)[order] for field in (from_field, to_field)])
+        known = ~np.isnan(junction_ids)
+        unique_ids, nodes = np.unique(junction_ids[known], return_inverse=True)
+        end_nodes = np.full(len(junction_ids), -1, dtype=np.int64)
+        end_nodes[known] = nodes
+        return cls(ids[first], end_nodes[:len(order)], end_nodes[len(order):], unique_ids)
+
+    def __len__(self):
+        """Return the number of edges."""
+        return len(self.edge_ids)
+
+    def edges(self, ids):
+        """Return an array of the edge numbers of the streets with the designated IDs, which are -1 for missing IDs."""
+        ids = np.asarray(ids).astype(np.int64)
+        if len(self.edge_ids) == 0:
+            return np.full(ids.shape, -1, dtype=np.int64)
+        idxs = np.minimum(np.searchsorted(self.edge_ids, ids), len(self.edge_ids) - 1)
+        return np.where(self.edge_ids[idxs] == ids, idxs, -1)
+
+    def nodes(self, junction_ids):
+        """Return an array of the node numbers of the designated junction IDs, which are -1 for missing IDs."""
+        junction_ids = np.asarray(junction_ids, dtype=float)
+        if len(self.node_ids) == 0:
+            return np.full(junction_ids.shape, -1, dtype=np.int64)
+        idxs = np.minimum(np.searchsorted(self.node_ids, junction_ids), len(self.node_ids) - 1)
+        return np.where(self.node_ids[idxs] == junction_ids, idxs, -1)
+
+    def sequence_edges(self, ids, starts, stops, max_edges=None):
+        """Return a 2D array of the edge numbers of sequences of streets for traverse().
+
+        Args:
+            ids: Array of the IDs of the streets in all the sequences
+            starts: Array of the start of the slice of ids holding each sequence
+            stops: Array of the stop of the slice of ids holding each sequence
+            max_edges: Optional number of columns. Longer sequences are truncated. Defaults to the longest sequence.
+
+        Returns:
+            A 2D array with a row for each sequence padded with -1, like the edge numbers returned by edges()
+        """
+        lengths = np.asarray(stops) - np.asarray(starts)
+        if max_edges is None:
+            max_edges = int(lengths.max(initial=0))
+        lengths = np.minimum(lengths, max_edges)
+        edges = np.full((len(lengths), max_edges), -1, dtype=np.int64)
+        positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        edges[np.repeat(np.arange(len(lengths)), lengths), positions] = self.edges(
+            np.asarray(ids)[np.repeat(starts, lengths) + positions])
+        return edges
+
+    def incident_edges(self, node):
+        """Return an array of the edges incident to a node, which is a view of the index's array."""
+        return self.node_edges[self.node_offsets[node]:self.node_offsets[node + 1]]
+
+    def traverse(self, edges, reverse_first=None):
+        """Work out the direction each edge in sequences of edges is traversed and whether the sequences are connected.
+
+        Each edge after the first is entered at the node where the previous edge is left, so it's reversed if that's
+        its to node. If an edge doesn't touch that node, its sequence isn't connected, and the edge is assumed to be
+        traversed in its digitized direction.
+
+        Args:
+            edges: 2D array of edge numbers with a row for each sequence of edges in order. Rows shorter than the others
+                are padded with -1.
+            reverse_first: Optional array with a value for each sequence of 1 if its first edge is traversed against
+                its digitized direction, 0 if it isn't, or -1 if that's unknown, in which case the first edge is
+                reversed if its from node is one of the second edge's nodes. All values are -1 by default.
+
+        Returns:
+            A 2D boolean array indicating which edges are traversed against their digitized direction, and a boolean
+            array indicating which sequences are connected
+        """
+        edges = np.asarray(edges, dtype=np.int64)
+        num_sequences, max_edges = edges.shape
+        used = edges >= 0
+        from_nodes = np.where(used, self.from_nodes[np.maximum(edges, 0)], -1)
+        to_nodes = np.where(used, self.to_nodes[np.maximum(edges, 0)], -1)
+        reversed_edges = np.zeros(edges.shape, dtype=bool)
+        connected = np.ones(num_sequences, dtype=bool)
+        if max_edges == 0:
+            return reversed_edges, connected
+
+        if reverse_first is None:
+            reverse_first = np.full(num_sequences, -1)
+        reverse_first = np.asarray(reverse_first)
+        touches_second = np.zeros(num_sequences, dtype=bool)
+        if max_edges > 1:
+            touches_second = (from_nodes[:, 0] >= 0) & (
+                (from_nodes[:, 0] == from_nodes[:, 1]) | (from_nodes[:, 0] == to_nodes[:, 1]))
+        reversed_edges[:, 0] = np.where(reverse_first < 0, touches_second, reverse_first == 1)
+        exit_nodes = np.where(reversed_edges[:, 0], from_nodes[:, 0], to_nodes[:, 0])
+        # Follow all the sequences one position at a time
+        for idx in range(1, max_edges):
+            forward = (exit_nodes >= 0) & (from_nodes[:, idx] == exit_nodes)
+            backward = ~forward & (exit_nodes >= 0) & (to_nodes[:, idx] == exit_nodes)
+            connected &= ~used[:, idx] | forward | backward
+            reversed_edges[:, idx] = used[:, idx] & backward
+            exit_nodes = np.where(
+                used[:, idx], np.where(backward, from_nodes[:, idx], to_nodes[:, idx]), exit_nodes)
+        return reversed_edges, connected
+
+
+class SortedSpillStore:
+    """Temporary store of dataframe chunks sorted by an integer key column and spilled to disk to bound memory use.
+
+    Each appended chunk is stably sorted by the key and written to an uncompressed Feather file in a temporary folder.
+    The files are memory-mapped when read back, so only the rows actually being used are loaded into memory. Rows are
+    read back in ranges of key values, which makes it possible to process a table much larger than memory in key order
+    one range at a time. If pyarrow isn't available, the chunks are just held in memory.
+    """
+
+    def __init__(self, key, folder=None):
+        """Initialize an empty store sorted by the designated key column, spilling to a subfolder of folder."""
+        self.key = key
+        self.num_rows = 0
+        self._chunks = []  # Memory-mapped pyarrow Tables, or dataframes if not spilling to disk
+        self._chunk_keys = []  # Sorted key values of each chunk
+        self.spill_folder = None
+        if feather is not None:
+            self.spill_folder = tempfile.mkdtemp(prefix="SDPTSpill_", dir=folder)
+
+    def append(self, df):
+        """Add a chunk of rows to the store."""
+        if df.empty:
+            return
+        df = df.sort_values(self.key, kind="stable", ignore_index=True)
+        if self.spill_folder is None:
+            self._chunks.append(df)
+            self._chunk_keys.append(df[self.key].to_numpy())
+        else:
+            spill_file = os.path.join(self.spill_folder, f"chunk{len(self._chunks)}.feather")
+            feather.write_feather(df, spill_file, compression="uncompressed")
+            table = feather.read_table(spill_file, memory_map=True)
+            self._chunks.append(table)
+            self._chunk_keys.append(table.column(self.key).to_numpy())
+        self.num_rows += len(df)
+
+    def _read_rows(self, chunk_idx, start, stop):
+        """Return rows start to stop of the designated chunk as a dataframe."""
+        chunk = self._chunks[chunk_idx]
+        if isinstance(chunk, pd.DataFrame):
+            return chunk.iloc[start:stop]
+        return chunk.slice(start, stop - start).to_pandas()
+
+    def partitions(self, boundaries):
+        """Yield the rows in each range of key values between consecutive boundaries as a dataframe.
+
+        The ranges are (-inf, boundaries[0]), [boundaries[0], boundaries[1]), ..., [boundaries[-1], inf), so every row
+        falls in exactly one of them. Empty ranges are skipped. Within a range, rows are in the order they were appended
+        to the store, so stably sorting each yielded dataframe and processing them in order is equivalent to stably
+        sorting the whole table.
+        """
+        cuts = [
+            np.concatenate(([0], np.searchsorted(keys, boundaries), [len(keys)])) for keys in self._chunk_keys
+        ]
+        for range_idx in range(len(boundaries) + 1):
+            dfs = [
+                self._read_rows(chunk_idx, chunk_cuts[range_idx], chunk_cuts[range_idx + 1])
+                for chunk_idx, chunk_cuts in enumerate(cuts) if chunk_cuts[range_idx + 1] > chunk_cuts[range_idx]
+            ]
+            if dfs:
+                yield pd.concat(dfs, ignore_index=True)
+
+    def close(self):
+        """Release the stored chunks and delete the spill files."""
+        self._chunks = []
+        self._chunk_keys = []
+        if self.spill_folder is not None:
+            shutil.rmtree(self.spill_folder, ignore_errors=True)
+            self.spill_folder = None
+
+
 class StreetDataProcessor:
     """Parent class with variables and helper methods applicable to all street data processing classes."""
 
@@ -160,7 +2673,10 @@ class StreetDataProcessor:
         self, data_product: DataProductType, out_folder: str, gdb_name: str, in_data_object, unit_type: UnitType,
         include_historical_traffic: bool,
         time_zone_type: TimeZoneType, time_zone_name: str = "", in_time_zone_table=None,
-        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True
+        time_zone_ft_field: str = None, time_zone_tf_field: str = None, build_network: bool = True,
+        num_workers: int = 1, resume: bool = False, table_cache_folder: str = None,
+        table_cache_size_gb: float = TABLE_CACHE_SIZE_GB, memory_budget_gb: float = None, profile: bool = False,
+        table_io: TableIO = None, previous_gdb: str = None
     ):
         """Initialize a class to process MultiNet data into a network dataset."""
         self.data_product = data_product
@@ -175,6 +2691,30 @@ class StreetDataProcessor:
         self.time_zone_ft_field = time_zone_ft_field
         self.time_zone_tf_field = time_zone_tf_field
         self.build_network = build_network
+        self.num_workers = max(1, num_workers)  # Number of worker processes for turns, road forks, and signposts
+        self.resume = resume  # Resume a previous run that failed partway through instead of starting over
+        # Reads input tables on a thread pool ahead of the stages that need them
+        self.prefetcher = TablePrefetcher()
+        # TableIO used for all reads and writes of input and output tables
+        self.table_io = table_io or ArcpyTableIO()
+        # Persistent cache of input tables read into dataframes, if enabled
+        self.table_cache = None
+        if table_cache_folder:
+            if feather is None:
+                arcpy.AddWarning("Input tables will not be cached because the pyarrow Python package is not installed.")
+            else:
+                self.table_cache = TableCache(table_cache_folder, table_cache_size_gb * 1024 ** 3, self.table_io)
+        # Max memory in bytes the tool may use when reading input tables, or None for no limit
+        self.memory_budget = memory_budget_gb * 1024 ** 3 if memory_budget_gb else None
+        # Write a report of the time, memory, and rows read and written by each stage of the run
+        self.profile = profile or os.environ.get(PROFILE_ENV_VAR, "0") not in ("", "0")
+        # Output gdb of a previous run with the previous release of the data to update in place instead of rebuilding
+        self.previous_gdb = previous_gdb
+        self.streets_delta = None  # StreetsDelta with the changed streets if this is a delta run
+        # IDs of the streets whose turns, road forks, and signposts are rebuilt in a delta run, or None to rebuild all
+        self.rebuilt_street_ids = None
+        # Warnings naming the ObjectIDs of rows written in a delta run, which are added when the stage completes
+        self.deferred_warnings = []
 
         self.out_folder = out_folder
         self.gdb_name = gdb_name
@@ -196,26 +2736,42 @@ class StreetDataProcessor:
         self.streets_tmc = os.path.join(self.out_folder, self.gdb_name, "Streets_TMC")
         self.time_zone_table = os.path.join(self.out_folder, self.gdb_name, "TimeZones")
         self.network = os.path.join(self.feature_dataset, "Routing_ND")
+        # The checkpoint manifest is stored next to the output gdb so it isn't affected by anything done to the gdb
+        self.checkpoint_file = os.path.join(self.out_folder, os.path.splitext(self.gdb_name)[0] + "_checkpoint.json")
+        self.checkpoint = None  # StageCheckpoint tracking the completed stages of the run, initialized in validation
+        # The profiling report is also written next to the output gdb, as a JSON file and a CSV file with this base name
+        self.profile_report_base = os.path.join(self.out_folder, os.path.splitext(self.gdb_name)[0] + "_profile")
+        # The changes a delta run made to the previous output are also written next to the output gdb
+        self.delta_report_file = os.path.join(self.out_folder, os.path.splitext(self.gdb_name)[0] + "_delta.json")
 
         # Global variables hard-coded or initialized later
         self.streets_oid_field = None  # OID field name of the output streets feature class
         if self.data_product is DataProductType.TomTomMultinet:
             self.streets_id_field_name = "ID"
             self.id_field_type = "DOUBLE"
+            self.junction_fields = ("F_JNCTID", "T_JNCTID")  # Fields with the junction IDs at the ends of streets
         elif self.data_product is DataProductType.HereNavStreetsShp:
             self.streets_id_field_name = "LINK_ID"
             self.id_field_type = "LONG"
+            self.junction_fields = ("REF_IN_ID", "NREF_IN_ID")  # Fields with the node IDs at the ends of streets
         self.fc_id = None  # Streets feature class dataset ID used in Edge#FCID fields
         self.max_turn_edges = None  # Maximum number of edges participating in a turn
         self.max_road_splits = 4  # Max allowed road split edges
         self.max_signpost_branches = 10  # Number of signpost branches
         self.edge_pos = 0.5  # Edge#Pos field values in turns are intentionally hard-coded
         self.streets_df = None  # Dataframe of output streets indexed by ID for quick lookups
+        self.streets_index = None  # GroupedIndex of streets_df shared with the workers for per-street lookups
+        self.streets_topology = None  # StreetTopology of streets_df shared with the workers for edge directions
+        self.street_geometries = None  # StreetGeometryStore of prefetched street vertices
         self.intermediate_outputs = []
 
     @timed_exec
     def _create_feature_dataset(self):
-        """Create the output geodatabase and feature dataset."""
+        """Create the output geodatabase and feature dataset, or copy the previous output in a delta run."""
+        if self.streets_delta is not None:
+            self._add_message(f"Copying the previous output {self.previous_gdb} to update it...")
+            arcpy.management.Copy(self.previous_gdb, os.path.join(self.out_folder, self.gdb_name))
+            return
         self._add_message(f"Creating output geodatabase and feature dataset at {self.feature_dataset}...")
         arcpy.management.CreateFileGDB(self.out_folder, self.gdb_name)
         arcpy.management.CreateFeatureDataset(
@@ -233,8 +2789,11 @@ class StreetDataProcessor:
         if not os.path.exists(self.out_folder):
             arcpy.AddError(f"Output folder {self.out_folder} does not exist.")
             return False
-        if os.path.exists(os.path.join(self.out_folder, self.gdb_name)):
-            arcpy.AddError(f"Output geodatabase {os.path.join(self.out_folder, self.gdb_name)} already exists.")
+        gdb_exists = os.path.exists(os.path.join(self.out_folder, self.gdb_name))
+        if gdb_exists and not self.resume:
+            arcpy.AddError((
+                f"Output geodatabase {os.path.join(self.out_folder, self.gdb_name)} already exists. To continue a "
+                "previous run that failed, use the resume option."))
             return False
 
         # Make sure the license is available.
@@ -248,9 +2807,385 @@ class StreetDataProcessor:
         if not self.in_data_object.validate_data():
             return False
 
+        # Set up the checkpoint manifest. If a previous run is being resumed, pick up where it left off. If the gdb
+        # doesn't exist, there's nothing to resume, so just start from the beginning.
+        self.checkpoint = StageCheckpoint(self.checkpoint_file, self._pipeline_stages(), self._checkpoint_fingerprint())
+        if gdb_exists and not self.checkpoint.load():
+            return False
+
         arcpy.AddMessage("Inputs validated successfully.")
         return True
 
+    def _pipeline_stages(self):
+        """Return the names of the checkpointed stages of the processing run in the order they run."""
+        raise NotImplementedError
+
+    def _checkpoint_settings(self):
+        """Return the settings that affect the output. A run can't be resumed with different settings."""
+        return {
+            "data_product": self.data_product.name,
+            "unit_type": self.unit_type.name,
+            "include_historical_traffic": bool(self.include_historical_traffic),
+            "time_zone_type": self.time_zone_type.name,
+            "time_zone_name": self.time_zone_name or "",
+            "time_zone_ft_field": self.time_zone_ft_field or "",
+            "time_zone_tf_field": self.time_zone_tf_field or "",
+            "build_network": bool(self.build_network),
+            "previous_gdb": self.previous_gdb or ""
+        }
+
+    def _checkpoint_fingerprint(self):
+        """Return a fingerprint of the inputs and settings of the run to store in the checkpoint manifest."""
+        fingerprint = {f"setting {name}": value for name, value in self._checkpoint_settings().items()}
+        tables = [t for t in self.in_data_object.required_fields if t]
+        if self.in_time_zone_table:
+            tables.append(self.in_time_zone_table)
+        for table in tables:
+            fingerprint[f"input {table}"] = _table_fingerprint(table)
+        return fingerprint
+
+    def _stage_pending(self, *stages):
+        """Return whether any of the designated stages still has to run in this run."""
+        return self.checkpoint.is_pending(*stages)
+
+    def _begin_stage(self, stage, outputs=None):
+        """Determine whether the designated stage has to run and prepare for it if so.
+
+        If the stage was completed in a previous run, it's skipped. Otherwise, any of the stage's outputs left behind by
+        a previous attempt that failed partway through are deleted so the stage can start fresh.
+
+        Returns:
+            bool: True if the stage should be run
+        """
+        if not self._stage_pending(stage):
+            arcpy.AddMessage(f"Skipping the {stage} stage, which was completed in a previous run.")
+            return False
+        for output in outputs or []:
+            # In a delta run, the tables updated in place are kept, and the stage just writes what changed
+            if self._reuse_previous_output(output):
+                continue
+            if arcpy.Exists(output):
+                arcpy.management.Delete(output)
+        return True
+
+    def _complete_stage(self, stage, tables=None):
+        """Record the designated stage as completed in the checkpoint manifest.
+
+        In a delta run, the changes to the tables the stage updated in place are applied first. The stage's tables are
+        then closed, which compacts the ones written with a LocalTableIO.
+        """
+        changes = None
+        if self.streets_delta is not None:
+            changes = self.table_io.apply(tables or [])
+            for table, oids, message_func in self.deferred_warnings:
+                arcpy.AddWarning(message_func(self.table_io.final_oids(table, oids)))
+            self.deferred_warnings = []
+        self.table_io.close(tables or [])
+        self.checkpoint.complete(stage, tables, changes)
+
+    def _delta_tables(self):
+        """Return the output tables a delta run updates in place instead of recreating."""
+        return [
+            self.streets, self.turns, self.road_splits, self.signposts, self.signposts_streets, self.streets_profiles,
+            self.streets_tmc
+        ]
+
+    def _reuse_previous_output(self, table):
+        """Return whether the table is updated in place by a delta run and already exists, so it isn't recreated."""
+        return self.streets_delta is not None and table in self._delta_tables() and arcpy.Exists(table)
+
+    def _input_streets(self):
+        """Return the input streets feature class and a where clause selecting the streets copied to the output."""
+        raise NotImplementedError
+
+    @timed_exec
+    def _prepare_delta_run(self):
+        """Find the streets that changed since the previous run and set up the run to update its output in place.
+
+        If the previous output can't be updated, or so many streets changed that rebuilding the output is about as
+        fast, a warning is added and the output is rebuilt from scratch.
+        """
+        self._add_message("Comparing the input streets with the previous output...")
+        reason = self._previous_output_mismatch()
+        delta = None
+        if reason is None:
+            try:
+                delta = self._diff_streets()
+            except Exception as ex:  # pylint:disable=broad-except
+                reason = f"The streets could not be compared. {ex}"
+        if delta is not None and delta.changed_fraction > DELTA_MAX_CHANGED_FRACTION:
+            reason = (
+                f"{delta.changed_fraction:.0%} of the streets changed since the previous run, which is more than the "
+                f"{DELTA_MAX_CHANGED_FRACTION:.0%} that can be updated efficiently.")
+        if reason is not None:
+            arcpy.AddWarning(f"The output will be rebuilt instead of updating the previous output. {reason}")
+            return
+
+        self.streets_delta = delta
+        # If none of the other input tables changed either, only the turns, road forks, and signposts referencing a
+        # changed street can change, so only those are rebuilt and compared with the previous rows
+        scoped_tables = None
+        if self._only_streets_changed():
+            self.rebuilt_street_ids = delta.changed_ids
+            scoped_tables = [self.turns, self.road_splits, self.signposts]
+        self.table_io = DeltaTableIO(
+            self.table_io, self._delta_tables(), delta.replaced_oids,
+            {self.signposts_streets: (self.signposts, "SignpostID")}, os.path.join(self.out_folder, self.gdb_name),
+            scoped_tables, np.concatenate((delta.replaced_oids, delta.in_place_oids))
+        )
+        arcpy.AddMessage((
+            f"Updating the previous output with {len(delta.inserted_ids)} new, {len(delta.updated_ids)} changed, and "
+            f"{len(delta.deleted_ids)} deleted streets."))
+        if self.rebuilt_street_ids is not None:
+            arcpy.AddMessage((
+                "The other input tables did not change since the previous run, so only the turns, road forks, and "
+                "signposts referencing a changed street will be rebuilt."))
+
+    def _previous_manifest_file(self):
+        """Return the path to the checkpoint manifest of the previous run of a delta run."""
+        return os.path.splitext(self.previous_gdb)[0] + "_checkpoint.json"
+
+    def _only_streets_changed(self):
+        """Return whether the input streets are the only input table that changed since the previous run.
+
+        The tables are compared by the fingerprints recorded in the checkpoint manifests of the two runs, so a file that
+        was rewritten with the same contents counts as changed. Tables in a geodatabase always count as changed, since
+        their fingerprint is only their row count, which doesn't change when rows are edited.
+        """
+        with open(self._previous_manifest_file(), "r", encoding="utf-8") as f:
+            prev_fingerprint = json.load(f).get("fingerprint", {})
+        streets_key = f"input {self._input_streets()[0]}"
+        for key, value in self.checkpoint.fingerprint.items():
+            if not key.startswith("input ") or key == streets_key:
+                continue
+            # Files are fingerprinted by a list of the size and modification time of each of their files
+            if not isinstance(value, list) or prev_fingerprint.get(key) != value:
+                return False
+        return True
+
+    def _limit_to_changed_streets(self, df, group_field, id_fields):
+        """Return the turn, road fork, or signpost records rebuilt in this run.
+
+        Args:
+            df: Dataframe of the records
+            group_field: Field grouping the records of each turn, road fork, or signpost, or None if each record
+                describes one
+            id_fields: Fields of the records holding the IDs of the streets they reference
+
+        Returns:
+            The records of the groups referencing a changed street in a delta run limited to those, or all the records
+        """
+        if self.rebuilt_street_ids is None:
+            return df
+        references = df[id_fields].isin(self.rebuilt_street_ids).any(axis=1)
+        if group_field is not None:
+            references = df[group_field].isin(df.loc[references, group_field])
+        return df[references.to_numpy()]
+
+    def _previous_output_mismatch(self):
+        """Return the reason the output of the previous run can't be updated in a delta run, or None if it can."""
+        out_gdb = os.path.join(self.out_folder, self.gdb_name)
+        if os.path.normcase(os.path.abspath(self.previous_gdb)) == os.path.normcase(os.path.abspath(out_gdb)):
+            return "The previous output geodatabase is the same as the output geodatabase."
+        if not arcpy.Exists(os.path.join(self.previous_gdb, "Routing", "Streets")):
+            return f"{self.previous_gdb} does not have a Routing\\Streets feature class."
+        manifest_file = self._previous_manifest_file()
+        if not os.path.exists(manifest_file):
+            return f"The checkpoint manifest {manifest_file} of the previous run does not exist."
+        with open(manifest_file, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != StageCheckpoint.version:
+            return f"{manifest_file} was written by a different version of this tool."
+        incomplete = [stage for stage in self._pipeline_stages() if stage not in manifest.get("stages", {})]
+        if incomplete:
+            return f"The previous run did not complete these stages: {', '.join(incomplete)}"
+        # The settings have to match, except for the ones that don't affect the tables updated in place
+        prev_fingerprint = manifest.get("fingerprint", {})
+        changed = [
+            key[len("setting "):] for key, value in self.checkpoint.fingerprint.items()
+            if key.startswith("setting ") and key not in ("setting previous_gdb", "setting build_network")
+            and prev_fingerprint.get(key) != value
+        ]
+        if changed:
+            return f"The following settings are different from the previous run: {', '.join(changed)}"
+        return None
+
+    def _diff_streets(self):
+        """Compare the input streets with the streets of the previous output by ID and attribute and geometry hash."""
+        previous_streets = os.path.join(self.previous_gdb, "Routing", "Streets")
+        in_streets, where_clause = self._input_streets()
+        previous_fields = {field.name.upper() for field in arcpy.ListFields(previous_streets)}
+        fields = [
+            field.name for field in arcpy.ListFields(in_streets)
+            if field.type not in ("OID", "Geometry") and field.name.upper() in previous_fields
+        ]
+        # Hash the geometry at the resolution it's stored with in the output so the two can be compared
+        resolution = arcpy.Describe(previous_streets).spatialReference.XYResolution
+        if not resolution or np.isnan(resolution):
+            resolution = 0
+        return StreetsDelta(
+            self._hash_streets(previous_streets, fields, None, resolution),
+            self._hash_streets(in_streets, fields, where_clause, resolution),
+            fields
+        )
+
+    def _hash_streets(self, streets, fields, where_clause, resolution):
+        """Return a dataframe with the OID, ID, and Hash and GeometryHash hashes of each street.
+
+        Hash is a hash of the street's attributes and geometry, and GeometryHash is a hash of its geometry and the IDs
+        of the nodes at its ends. The turns and signposts built from a street depend on both, since the end nodes
+        determine which way the street is traversed. The streets are read in ranges of ObjectIDs so only the attributes
+        and vertices of one range are in memory at once.
+        """
+        oid_field = arcpy.Describe(streets).oidFieldName
+        oids = self.table_io.read_columns(streets, ["OID@"], where_clause)["OID@"].to_numpy(dtype=np.int64)
+        hash_dfs = [pd.DataFrame({
+            "OID": np.empty(0, dtype=np.int64), "ID": np.empty(0, dtype=np.int64), "Hash": np.empty(0, dtype=np.uint64),
+            "GeometryHash": np.empty(0, dtype=np.uint64)
+        })]
+        lower_bounds = range(int(oids.min()), int(oids.max()) + 1, DELTA_CHUNK_SIZE) if len(oids) else []
+        for lower in lower_bounds:
+            chunk_where = f"{oid_field} >= {lower} And {oid_field} < {lower + DELTA_CHUNK_SIZE}"
+            if where_clause:
+                chunk_where = f"{where_clause} And {chunk_where}"
+            df = self.table_io.read_columns(streets, ["OID@"] + fields, chunk_where)
+            if df.empty:
+                continue
+            chunk_oids = df["OID@"].to_numpy(dtype=np.int64)
+            store = self.table_io.read_vertices(streets, oid_field, chunk_oids)
+            vertex_hashes = hash_vertices(store, chunk_oids, resolution)
+            hashes = pd.util.hash_pandas_object(pd.DataFrame({
+                "attributes": hash_rows(df[fields]),
+                "geometry": vertex_hashes
+            }), index=False).to_numpy(dtype=np.uint64)
+            geometry_hashes = pd.util.hash_pandas_object(pd.DataFrame({
+                "junctions": hash_rows(df[list(self.junction_fields)]),
+                "geometry": vertex_hashes
+            }), index=False).to_numpy(dtype=np.uint64)
+            hash_dfs.append(pd.DataFrame({
+                "OID": chunk_oids,
+                "ID": df[self.streets_id_field_name].to_numpy(dtype=np.int64),
+                "Hash": hashes,
+                "GeometryHash": geometry_hashes
+            }))
+        return pd.concat(hash_dfs, ignore_index=True)
+
+    @timed_exec
+    def _apply_streets_delta(self):
+        """Update the Streets copied from the previous output with the streets that changed since the previous run.
+
+        Streets whose geometry or end nodes changed are deleted and copied again from the input along with the new
+        streets, so they get new ObjectIDs, and deleted streets are removed. This also replaces any copies left behind
+        by a previous attempt. Streets whose other attributes changed are updated in place, so they keep their
+        ObjectIDs, and the rows of the other tables referencing them don't have to be rebuilt.
+        """
+        self._add_message("Updating Streets with the changed streets...")
+        delta = self.streets_delta
+        self._describe_streets()
+        ids_df = self.table_io.read_columns(self.streets, ["OID@", self.streets_id_field_name])
+        replaced_ids = np.concatenate((delta.inserted_ids, delta.reshaped_ids, delta.deleted_ids))
+        replaced = ids_df[self.streets_id_field_name].astype(np.int64).isin(replaced_ids).to_numpy()
+        self.table_io.delete_rows(self.streets, ids_df.loc[replaced, "OID@"])
+        in_streets = self._input_streets()[0]
+        self.table_io.copy_rows(in_streets, self.streets, ["SHAPE@"] + delta.fields, delta.input_oids)
+        if len(delta.in_place_ids):
+            in_oid_field = arcpy.Describe(in_streets).oidFieldName
+            values_df = pd.concat([
+                self.table_io.read_columns(in_streets, delta.fields, where_clause)
+                for where_clause in oid_where_clauses(in_oid_field, delta.in_place_input_oids)
+            ])
+            values_df.index = values_df.pop(self.streets_id_field_name).astype(np.int64)
+            self.table_io.update_rows(self.streets, self.streets_id_field_name, values_df, int)
+        self.table_io.record_changes(
+            self.streets, inserted=len(delta.inserted_ids), replaced=len(delta.reshaped_ids),
+            deleted=len(delta.deleted_ids))
+
+    def _streets_added_in_run(self):
+        """Return the Streets, or in a delta run a layer with only the streets added by the run."""
+        if self.streets_delta is None:
+            return self.streets
+        with arcpy.EnvManager(overwriteOutput=True):
+            return arcpy.management.MakeFeatureLayer(
+                self.streets, "Added streets", f"{self.streets_oid_field} > {self.streets_delta.max_previous_oid}"
+            ).getOutput(0)
+
+    def _report_delta(self):
+        """Report the changes a delta run made to the previous output and write them to a JSON file."""
+        if self.streets_delta is None:
+            return
+        changes = {}
+        for record in self.checkpoint.completed.values():
+            for table, table_changes in record.get("changes", {}).items():
+                name_changes = changes.setdefault(os.path.basename(table), {})
+                for change, count in table_changes.items():
+                    name_changes[change] = name_changes.get(change, 0) + count
+        lines = [
+            f"{name}: {', '.join(f'{count} {change}' for change, count in name_changes.items())}"
+            for name, name_changes in changes.items()
+        ]
+        arcpy.AddMessage("Rows changed in the previous output:\n" + "\n".join(lines))
+        try:
+            with open(self.delta_report_file, "w", encoding="utf-8") as f:
+                json.dump({"previous_gdb": self.previous_gdb, "changes": changes}, f, indent=2)
+        except OSError as ex:
+            arcpy.AddWarning(f"Unable to write the report of the changes. {ex}")
+            return
+        self._add_message(f"Report of the changes written to {self.delta_report_file}.")
+
+    def _read_input_table(self, table, fields, where_clause=None, dtype=None):
+        """Read the designated fields of an input table into a dataframe, using the table cache if enabled.
+
+        The arguments and return value are the same as for TableIO.read_columns.
+        """
+        self._check_memory_budget(table, fields, where_clause)
+        with PROFILER.stage(f"read {os.path.basename(table)}"):
+            if self.table_cache is not None:
+                df = self.table_cache.read(table, fields, where_clause, dtype)
+            else:
+                df = self.table_io.read_columns(table, fields, where_clause, dtype)
+            PROFILER.add_rows(rows_read=len(df))
+        return df
+
+    def _prefetch(self, func):
+        """Start running a function that reads and indexes input tables on the prefetch thread pool.
+
+        The stage that needs the function's result gets it with self.prefetcher.result(func). Prefetched tables are held
+        in memory until they're needed, so nothing is prefetched when a memory budget is set, and the function just
+        runs when its result is requested.
+        """
+        if not self.memory_budget:
+            self.prefetcher.submit(func)
+
+    def _check_memory_budget(self, table, fields, where_clause=None):
+        """Raise a MemoryBudgetError if reading the designated table would likely exceed the memory budget."""
+        if not self.memory_budget:
+            return
+        current_nbytes = psutil.Process().memory_info().rss
+        projected_nbytes = current_nbytes + self.table_io.estimate_nbytes(table, fields, where_clause)
+        if projected_nbytes > self.memory_budget:
+            raise MemoryBudgetError((
+                f"Reading the {os.path.basename(table)} table is projected to increase the tool's memory usage from "
+                f"{current_nbytes / 1024 ** 3:.1f} GB to {projected_nbytes / 1024 ** 3:.1f} GB, which exceeds the "
+                f"memory budget of {self.memory_budget / 1024 ** 3:.1f} GB. Increase the memory budget or free up "
+                "memory, and run the tool again with the resume option to continue from this point."
+            ))
+
+    def _write_profile_report(self):
+        """Write the profiling report of the run next to the output gdb."""
+        try:
+            report_files = PROFILER.write_report(self.profile_report_base)
+        except OSError as ex:
+            arcpy.AddWarning(f"Unable to write the profiling report. {ex}")
+            return
+        self._add_message(f"Profiling report written to {' and '.join(report_files)}.")
+
+    def _describe_streets(self):
+        """Update the dataset ID and ObjectID field name of the output Streets feature class."""
+        # The fc_id is used to relate back to this Streets feature class in Edge#FCID fields
+        desc = arcpy.Describe(self.streets)
+        self.fc_id = desc.DSID
+        self.streets_oid_field = desc.oidFieldName
+
     @timed_exec
     def _spatially_sort_streets(self):
         """Spatially sort the input streets feature class."""
@@ -283,8 +3218,7 @@ class StreetDataProcessor:
         assert self.streets_oid_field is not None
         # Duplicate street features occur along tile boundaries.
         # Use Pandas to identify duplicate ID values and associated OIDs to delete.
-        with arcpy.da.SearchCursor(self.streets, ["OID@", id_field_name]) as cur:
-            id_df = pd.DataFrame(cur, columns=["OID", id_field_name])
+        id_df = self.table_io.read_columns(self.streets, ["OID@", id_field_name]).rename(columns={"OID@": "OID"})
         duplicate_streets = id_df[id_df.duplicated(subset=id_field_name)]["OID"].to_list()
         del id_df
         # If there are any duplicates, delete them.
@@ -310,7 +3244,7 @@ class StreetDataProcessor:
             assert self.time_zone_name
             arcpy.management.CreateTable(os.path.dirname(self.time_zone_table), os.path.basename(self.time_zone_table))
             arcpy.management.AddField(self.time_zone_table, "MSTIMEZONE", "TEXT", field_length=len(self.time_zone_name))
-            with arcpy.da.InsertCursor(self.time_zone_table, ["MSTIMEZONE"]) as cur:
+            with self.table_io.insert_cursor(self.time_zone_table, ["MSTIMEZONE"]) as cur:
                 cur.insertRow((self.time_zone_name,))
             return
 
@@ -354,7 +3288,6 @@ class StreetDataProcessor:
     @timed_exec
     def _create_streets_tmc_table(self):
         """Create the Streets_TMC table with the correct schema and return the field names."""
-        arcpy.management.CreateTable(os.path.dirname(self.streets_tmc), os.path.basename(self.streets_tmc))
         field_defs = [
             [self.streets_id_field_name, self.id_field_type],  # ID or LINK_ID
             ["TMC", "TEXT", "TMC", 9],
@@ -363,7 +3296,9 @@ class StreetDataProcessor:
             ["EdgeFrmPos", "DOUBLE"],
             ["EdgeToPos", "DOUBLE"]
         ]
-        arcpy.management.AddFields(self.streets_tmc, field_defs)
+        if not self._reuse_previous_output(self.streets_tmc):
+            arcpy.management.CreateTable(os.path.dirname(self.streets_tmc), os.path.basename(self.streets_tmc))
+            arcpy.management.AddFields(self.streets_tmc, field_defs)
         return [f[0] for f in field_defs]
 
     def _create_string_field_map(self, field_name, field_type, field_length=1):
@@ -377,31 +3312,18 @@ class StreetDataProcessor:
         """
         return f';{field_name} "{field_name}" true true false {field_length} {field_type} 0 0,First,#'
 
-    @staticmethod
-    def _polyline_to_points(polyline):
-        """Return an ordered list of point objects from the polyline geometry."""
-        array = arcpy.Array()
-        parts = polyline.getPart()
-        for part in parts:
-            array.extend(part)
-        points = []
-        for _ in range(array.count):
-            points.append(array.next())
-        return points
-
-    def _reverse_polyline(self, polyline):
-        """Reverse a polyline."""
-        vertices = self._polyline_to_points(polyline)
-        vertices.reverse()
-        return vertices
-        # vertex_array = arcpy.Array(vertices)
-        # return vertex_array
-        # return arcpy.Polyline(vertex_array, self.in_data_object.sr)
-
     @timed_exec
     def _create_turn_fc(self, restriction_field_names, addl_turn_field_defs=None):
         """Create the turn feature class and add necessary fields."""
         assert self.max_turn_edges is not None
+        if self._reuse_previous_output(self.turns):
+            # Make room for turns with more edges than the previous output had. Otherwise, fill the extra edge fields of
+            # the existing turns with nulls.
+            num_edges = len(arcpy.ListFields(self.turns, "Edge*FCID"))
+            if self.max_turn_edges > num_edges:
+                arcpy.na.IncreaseMaximumEdges(self.turns, self.max_turn_edges)
+            self.max_turn_edges = max(self.max_turn_edges, num_edges)
+            return
         self._add_message("Creating turn feature class...")
         arcpy.na.CreateTurnFeatureClass(self.feature_dataset, os.path.basename(self.turns), self.max_turn_edges)
         # Add additional fields
@@ -419,84 +3341,103 @@ class StreetDataProcessor:
             field_defs += addl_turn_field_defs
         arcpy.management.AddFields(self.turns, field_defs)
 
-    def _get_street_geometry(self, street_id, oid):
-        """Return the geometry of the designated street feature."""
-        # Check to see if the geometry for this street is already stored
-        geom = self.streets_df.at[street_id, "SHAPE"]
-        if geom is None:
-            # If it's not stored already, get it from the dataset and store it in case it gets queried again
-            with arcpy.da.SearchCursor(self.streets, ["SHAPE@"], f"{self.streets_oid_field} = {oid}") as cur:
-                geom = next(cur)[0]
-            self.streets_df.at[street_id, "SHAPE"] = geom
-        return geom
-
-    def _build_turn_geometry(self, edge_segments, edge1_end, turn_oid):
-        """Create the polyline geometry of a turn from its component edge segments."""
-        # Get the starting edge and determine its direction based on the edge1_end field value
-        first_edge = edge_segments[0]
-        reverse_first = edge1_end == "N"
-        if edge1_end == "?":
-            # Handle the data error case where the edge direction couldn't be determined by checking if one end matches
-            # one of the ends of the second edge
-            second_edge = edge_segments[1]
-            if first_edge.firstPoint.equals(second_edge.firstPoint) or \
-                    first_edge.firstPoint.equals(second_edge.lastPoint):
-                reverse_first = True
-
-        # Trim the first edge to the last 30% of the street feature
-        if reverse_first:
-            first_edge = first_edge.segmentAlongLine(0, 0.3, use_percentage=True)
+    @timed_exec
+    def _prefetch_street_geometry(self, street_ids):
+        """Read the geometry of the designated streets in one bulk pass and store their vertices for quick lookups.
+
+        Turns and signposts are built from the geometry of the streets they reference. Reading all of those streets up
+        front is drastically faster than opening a cursor for each street as it's encountered.
+        """
+        assert self.streets_df is not None
+        self._add_message("Reading street geometry for turns and signposts...")
+        # Translate street IDs to ObjectIDs. IDs missing from Streets are ignored here and reported where they're used.
+        oids = self.streets_df.loc[self.streets_df.index.isin(street_ids), "OID"].to_numpy()
+        self.street_geometries = self.table_io.read_vertices(self.streets, self.streets_oid_field, oids)
+
+    def _worker_context(self):
+        """Return the read-only data shared by all worker tasks building turns, road forks, or signposts."""
+        assert self.streets_df is not None
+        if self.streets_index is None:
+            self.streets_index = GroupedIndex.from_df(self.streets_df)
+        if self.streets_topology is None:
+            self.streets_topology = StreetTopology.from_df(self.streets_df, *self.junction_fields)
+        return {
+            "streets_index": self.streets_index,
+            "streets_topology": self.streets_topology,
+            "street_geometries": self.street_geometries,
+            "fc_id": self.fc_id,
+            "edge_pos": self.edge_pos,
+            "max_turn_edges": self.max_turn_edges
+        }
+
+    @staticmethod
+    def _get_street_vertices(context, oid, warnings):
+        """Return the prefetched vertices of the designated street, or None with a warning if it has no geometry."""
+        vertices = context["street_geometries"].vertices(oid)
+        if vertices is None:
+            warnings.append(f"The Streets feature with ObjectID {oid} has no geometry.")
+        return vertices
+
+    def _emit_worker_results(self, partition_results, table):
+        """Yield the finished rows from worker results in order along with the ObjectID each row will be assigned.
+
+        Warnings reported by the workers are added as the rows are consumed, so they are interleaved with the rows in
+        the same order as if everything had been processed serially. Any {oid} placeholder in a warning is filled in
+        with the ObjectID of the row it refers to in the designated table.
+        """
+        oid = 1
+        for results in partition_results:
+            for row, warnings in results:
+                for warning in warnings:
+                    if "{oid}" in warning:
+                        self._warn_with_oids(table, [oid], lambda oids, warning=warning: warning.format(oid=oids[0]))
+                    else:
+                        arcpy.AddWarning(warning)
+                if row is not None:
+                    yield oid, row
+                    oid += 1
+        PROFILER.add_rows(rows_written=oid - 1)
+
+    def _warn_with_oids(self, table, oids, message_func):
+        """Add a warning naming the ObjectIDs of rows written to a table.
+
+        In a delta run, the rows written to a table updated in place only have provisional ObjectIDs until the stage
+        completes and its changes are applied, so the warning is added then, with the ObjectIDs the rows end up with.
+
+        Args:
+            table: Catalog path to the table the rows were written to
+            oids: ObjectIDs returned when the rows were written
+            message_func: Function returning the warning given the array of the ObjectIDs of the rows in the table
+        """
+        if isinstance(self.table_io, DeltaTableIO) and table in self.table_io.tables:
+            self.deferred_warnings.append((table, np.asarray(oids, dtype=np.int64), message_func))
         else:
-            first_edge = first_edge.segmentAlongLine(0.7, 1, use_percentage=True)
-
-        # Convert the now-trimmed first edge to points and reverse them if needed
-        turn_vertices = self._polyline_to_points(first_edge)
-        if reverse_first:
-            turn_vertices.reverse()
-
-        # For the remaining edges, explode them to points and determine directionality by checking which end coincides
-        # with the geometry of the previous edge.
-        geom_error = False
-        for idx, edge in enumerate(edge_segments[1:]):
-            if edge.firstPoint.equals(turn_vertices[-1]):
-                # The edge is in the correct order already
-                reverse_edge = False
-            elif edge.lastPoint.equals(turn_vertices[-1]):
-                # Reverse the order of the points for this edge
-                reverse_edge = True
-            else:
-                # The endpoints of adjacent segments don't match up at all. This is a data error.
-                # Don't fail the tool, just continue and build the geometry but indicate the problem with a warning.
-                reverse_edge = False
-                geom_error = True
-
-            if idx == len(edge_segments) - 2:
-                # Do special handling of the last edge to trim the geometry to only the first 30%
-                if reverse_edge:
-                    edge = edge.segmentAlongLine(0.7, 1, use_percentage=True)
-                else:
-                    edge = edge.segmentAlongLine(0, 0.3, use_percentage=True)
-
-            edge_vertices = self._polyline_to_points(edge)
-            if reverse_edge:
-                edge_vertices.reverse()
-            # Append the vertices of this edge to our growing list to model the turn
-            turn_vertices += edge_vertices
-
-        if geom_error:
-            arcpy.AddWarning((
-                f"Turn geometry may be incorrect for turn ObjectID {turn_oid} because the geometry of adjacent street "
-                "segments used to build the turn geometry did not have coincident endpoints."
-            ))
+            arcpy.AddWarning(message_func(np.asarray(oids, dtype=np.int64)))
+
+    def _warn_truncated_signposts(self, truncated_df, signpost_oids, message):
+        """Add one warning listing the signposts that were written with truncated Branch* or Toward* fields.
 
-        # Generate a polyline from the ordered vertices
-        turn_vertex_array = arcpy.Array(turn_vertices)
-        return arcpy.Polyline(turn_vertex_array, self.in_data_object.sr)
+        Args:
+            truncated_df: Dataframe of the truncated signposts with a Signpost column with the number of each signpost
+                and an ID column with the ID of the input records to list in the warning
+            signpost_oids: Array of the ObjectID of each signpost by number, which is 0 if the signpost was skipped
+            message: Start of the warning, with a {count} placeholder for the number of truncated signposts, which is
+                followed by the ID and ObjectID of each truncated signpost
+        """
+        oids = signpost_oids[truncated_df["Signpost"].to_numpy(dtype=np.int64)]
+        written = oids > 0
+        if not written.any():
+            return
+        ids = truncated_df["ID"].to_numpy()[written]
+        self._warn_with_oids(
+            self.signposts, oids[written],
+            lambda final_oids: message.format(count=written.sum()) + " " +
+            summarize_ids(f"{id} ({oid})" for id, oid in zip(ids, final_oids))
+        )
 
     @timed_exec
     def _create_road_forks_table(self):
         """Create the road forks table Streets_RoadSplits with the correct schema and return a list of field names."""
-        arcpy.management.CreateTable(os.path.dirname(self.road_splits), os.path.basename(self.road_splits))
         # Schema for the road forks table:
         # https://pro.arcgis.com/en/pro-app/latest/tool-reference/data-management/add-fields.htm
         field_defs = []
@@ -521,12 +3462,16 @@ class StreetDataProcessor:
             ["Branch2FrmPos", "DOUBLE"],
             ["Branch2ToPos", "DOUBLE"]
         ]
-        arcpy.management.AddFields(self.road_splits, field_defs)
+        if not self._reuse_previous_output(self.road_splits):
+            arcpy.management.CreateTable(os.path.dirname(self.road_splits), os.path.basename(self.road_splits))
+            arcpy.management.AddFields(self.road_splits, field_defs)
         return [f[0] for f in field_defs]
 
     @timed_exec
     def _create_signposts_fc(self):
         """Create the Signposts feature class with correct schema."""
+        if self._reuse_previous_output(self.signposts):
+            return
         self._add_message("Creating Signposts feature class...")
         arcpy.management.CreateFeatureclass(
             os.path.dirname(self.signposts), os.path.basename(self.signposts),
@@ -550,6 +3495,8 @@ class StreetDataProcessor:
     @timed_exec
     def _create_signposts_streets_table(self):
         """Create the Signposts_Streets table with correct schema."""
+        if self._reuse_previous_output(self.signposts_streets):
+            return
         self._add_message("Creating Signposts_Streets table...")
         arcpy.management.CreateTable(os.path.dirname(self.signposts_streets), os.path.basename(self.signposts_streets))
         # Schema for the Signposts_Streets table:
@@ -567,14 +3514,21 @@ class StreetDataProcessor:
     def _add_attribute_indices(self):
         """Add attribute indices on the outputs."""
         self._add_message("Adding attribute indices...")
-        # Road forks
-        arcpy.management.AddIndex(self.road_splits, ["EdgeFCID"], "EdgeFCIDIdx")
-        arcpy.management.AddIndex(self.road_splits, ["EdgeFID"], "EdgeFIDIdx")
-        # Signpost_Streets
-        arcpy.management.AddIndex(self.signposts_streets, ["SignpostID"], "SignpostIDIdx")
-        arcpy.management.AddIndex(self.signposts_streets, ["Sequence"], "SequenceIdx")
-        arcpy.management.AddIndex(self.signposts_streets, ["EdgeFCID"], "EdgeFCIDIdx")
-        arcpy.management.AddIndex(self.signposts_streets, ["EdgeFID"], "EdgeFIDIdx")
+        indices = [
+            # Road forks
+            (self.road_splits, "EdgeFCID", "EdgeFCIDIdx"),
+            (self.road_splits, "EdgeFID", "EdgeFIDIdx"),
+            # Signpost_Streets
+            (self.signposts_streets, "SignpostID", "SignpostIDIdx"),
+            (self.signposts_streets, "Sequence", "SequenceIdx"),
+            (self.signposts_streets, "EdgeFCID", "EdgeFCIDIdx"),
+            (self.signposts_streets, "EdgeFID", "EdgeFIDIdx")
+        ]
+        for table, field, index_name in indices:
+            # Skip indices already added by a previous run that failed partway through
+            if index_name in [index.name for index in arcpy.ListIndexes(table)]:
+                continue
+            arcpy.management.AddIndex(table, [field], index_name)
 
     def _update_nd_template_with_time_zone(self, in_template, out_template):
         """Update the network dataset template dynamically to include the time zone attribute and its evaluators."""
@@ -688,5 +3642,13 @@ class StreetDataProcessor:
     @staticmethod
     def _add_message(msg):
         """Add a GP message and update the progressor."""
+        if TablePrefetcher.defer_message(msg):
+            return
         arcpy.AddMessage(msg)
         arcpy.SetProgressorLabel(msg)
+
+    @staticmethod
+    def _add_warning(msg):
+        """Add a GP warning."""
+        if not TablePrefetcher.defer_message(msg, warning=True):
+            arcpy.AddWarning(msg)
@@ -0,0 +1,190 @@
+"""Unit tests of the geometry functions used to build turn and signpost shapes
+
+   The tests don't need arcpy. If arcpy is available, the results of segment_along_line are also compared with
+   Polyline.segmentAlongLine. Run them from the for-ArcGIS-Pro folder with:
+       python -m unittest discover tests
+
+   Copyright 2025 Esri
+   Licensed under the Apache License, Version 2.0 (the "License");
+   you may not use this file except in compliance with the License.
+   You may obtain a copy of the License at
+       http://www.apache.org/licenses/LICENSE-2.0
+   Unless required by applicable law or agreed to in writing, software
+   distributed under the License is distributed on an "AS IS" BASIS,
+   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+   See the License for the specific language governing permissions and
+   limitations under the License.
+"""
+import os
+import sys
+import struct
+import unittest
+import numpy as np
+try:
+    import arcpy
+except ImportError:
+    arcpy = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from geometry import segment_along_line, build_turn_vertices, build_signpost_vertices, vertices_to_wkb, \
+    wkb_to_parts, wkb_to_vertices  # noqa: E402
+
+
+def line(*points):
+    """Return an (N, 2) float64 array of the designated points."""
+    return np.array(points, dtype=np.float64)
+
+
+class TestSegmentAlongLine(unittest.TestCase):
+    """Tests of trimming a line to a fraction of its length."""
+
+    def test_interpolates_ends_and_keeps_inner_vertices(self):
+        """The ends are interpolated and the vertices between them are kept."""
+        vertices = line((0, 0), (1, 0), (2, 0), (10, 0))
+        np.testing.assert_allclose(segment_along_line(vertices, 0, 0.3), line((0, 0), (1, 0), (2, 0), (3, 0)))
+        np.testing.assert_allclose(segment_along_line(vertices, 0.7, 1), line((7, 0), (10, 0)))
+        np.testing.assert_allclose(segment_along_line(vertices, 0, 1), vertices)
+
+    def test_measures_along_bends(self):
+        """Positions are measured along the line, not in a straight line from its start."""
+        vertices = line((0, 0), (0, 3), (4, 3))
+        np.testing.assert_allclose(segment_along_line(vertices, 0.5, 1), line((0.5, 3), (4, 3)))
+
+    def test_vertex_at_the_trim_position_isnt_repeated(self):
+        """A vertex exactly at a trim position is only included once, as the interpolated end."""
+        vertices = line((0, 0), (3, 0), (10, 0))
+        np.testing.assert_allclose(segment_along_line(vertices, 0, 0.3), line((0, 0), (3, 0)))
+
+    def test_zero_length_line(self):
+        """A line whose vertices are all the same point is trimmed to that point."""
+        np.testing.assert_allclose(segment_along_line(line((2, 2), (2, 2)), 0.7, 1), line((2, 2), (2, 2)))
+        np.testing.assert_allclose(segment_along_line(line((2, 2)), 0, 0.3), line((2, 2), (2, 2)))
+
+    def test_repeated_vertices(self):
+        """Repeated vertices don't add to the length or produce invalid coordinates."""
+        vertices = line((0, 0), (0, 0), (10, 0), (10, 0))
+        np.testing.assert_allclose(segment_along_line(vertices, 0, 0.3), line((0, 0), (3, 0)))
+        np.testing.assert_allclose(segment_along_line(vertices, 0.7, 1), line((7, 0), (10, 0)))
+
+    def test_multipart_gaps_arent_measured(self):
+        """The parts of a multipart line are measured without the gap between them, like Polyline.segmentAlongLine."""
+        parts = [line((0, 0), (10, 0)), line((100, 0), (110, 0))]
+        np.testing.assert_allclose(segment_along_line(parts, 0, 0.25), line((0, 0), (5, 0)))
+        np.testing.assert_allclose(segment_along_line(parts, 0.75, 1), line((105, 0), (110, 0)))
+        # A segment spanning the gap includes the end of the first part and the start of the second part
+        np.testing.assert_allclose(
+            segment_along_line(parts, 0.25, 0.75), line((5, 0), (10, 0), (100, 0), (105, 0)))
+
+    def test_single_part_list(self):
+        """A line given as a list with one part is the same as the part's array."""
+        vertices = line((0, 0), (0, 3), (4, 3))
+        np.testing.assert_allclose(segment_along_line([vertices], 0.2, 0.9), segment_along_line(vertices, 0.2, 0.9))
+
+    @unittest.skipIf(arcpy is None, "arcpy is not available")
+    def test_matches_arcpy(self):
+        """The results match Polyline.segmentAlongLine with use_percentage=True."""
+        sr = arcpy.SpatialReference(3857)
+        lines = [
+            [line((0, 0), (1, 0), (2, 0), (10, 0))],
+            [line((0, 0), (0, 3), (4, 3), (4, 7.5))],
+            [line((0, 0), (10, 0)), line((100, 0), (110, 0), (110, 20))],
+        ]
+        for parts in lines:
+            polyline = arcpy.Polyline(
+                arcpy.Array([arcpy.Array([arcpy.Point(*vertex) for vertex in part]) for part in parts]), sr)
+            for start, end in [(0, 0.3), (0.7, 1), (0, 0.25), (0.75, 1), (0.2, 0.9)]:
+                segment = polyline.segmentAlongLine(start, end, use_percentage=True)
+                expected = [[point.X, point.Y] for part in segment for point in part]
+                np.testing.assert_allclose(segment_along_line(parts, start, end), expected, atol=1e-6)
+
+
+class TestJoinEdges(unittest.TestCase):
+    """Tests of building turn and signpost vertices from their edges."""
+
+    def test_two_edge_turn(self):
+        """A turn has the last 30% of its first edge and the first 30% of its last edge."""
+        edges = [line((0, 0), (10, 0)), line((10, 0), (10, 10))]
+        np.testing.assert_allclose(
+            build_turn_vertices(edges, [False, False]), line((7, 0), (10, 0), (10, 0), (10, 3)))
+
+    def test_reversed_first_and_last_edges(self):
+        """Reversed first and last edges are trimmed at the ends nearest the turn and traversed backwards."""
+        edges = [line((10, 0), (0, 0)), line((10, 10), (10, 0))]
+        np.testing.assert_allclose(
+            build_turn_vertices(edges, [True, True]), line((7, 0), (10, 0), (10, 0), (10, 3)))
+
+    def test_middle_edges_are_kept_whole(self):
+        """Edges between the first and last edges are included in their entirety, reversed if needed."""
+        edges = [line((0, 0), (4, 0)), line((4, 4), (4, 2), (4, 0)), line((4, 4), (8, 4))]
+        np.testing.assert_allclose(
+            build_signpost_vertices(edges, [False, True, False]),
+            line((3, 0), (4, 0), (4, 0), (4, 2), (4, 4), (4, 4), (5, 4)))
+
+    def test_degenerate_edges(self):
+        """Zero-length edges and edges with repeated vertices give finite vertices."""
+        edges = [line((10, 0), (10, 0)), line((10, 0), (10, 0), (10, 10))]
+        vertices = build_turn_vertices(edges, [False, False])
+        self.assertTrue(np.isfinite(vertices).all())
+        np.testing.assert_allclose(vertices, line((10, 0), (10, 0), (10, 0), (10, 3)))
+
+    def test_multipart_edge(self):
+        """A multipart edge is trimmed along its parts and joined into one run of vertices."""
+        edges = [[line((0, 0), (2, 0)), line((5, 0), (10, 0))], line((10, 0), (10, 10))]
+        np.testing.assert_allclose(
+            build_turn_vertices(edges, [False, False]), line((7.9, 0), (10, 0), (10, 0), (10, 3)))
+
+
+class TestWkb(unittest.TestCase):
+    """Tests of converting lines to and from well-known binary."""
+
+    def test_linestring_round_trip(self):
+        """A line is written as a little-endian LineString and read back unchanged."""
+        vertices = line((1.5, 2), (3, -4), (5, 6.25))
+        wkb = vertices_to_wkb(vertices)
+        self.assertEqual(struct.unpack_from("<BII", wkb), (1, 2, 3))
+        np.testing.assert_array_equal(wkb_to_vertices(wkb), vertices)
+
+    def test_multilinestring_round_trip(self):
+        """A multipart line is written as a MultiLineString and its parts are read back unchanged."""
+        parts = [line((0, 0), (10, 0)), line((100, 0), (110, 0), (110, 5))]
+        wkb = vertices_to_wkb(parts)
+        self.assertEqual(struct.unpack_from("<BII", wkb), (1, 5, 2))
+        read_parts = wkb_to_parts(wkb)
+        self.assertEqual(len(read_parts), 2)
+        for read_part, part in zip(read_parts, parts):
+            np.testing.assert_array_equal(read_part, part)
+        np.testing.assert_array_equal(wkb_to_vertices(wkb), np.concatenate(parts))
+
+    def test_single_part_list_is_a_linestring(self):
+        """A line given as a list with one part is written as a LineString."""
+        self.assertEqual(struct.unpack_from("<BII", vertices_to_wkb([line((0, 0), (1, 1))])), (1, 2, 2))
+
+    def test_big_endian(self):
+        """Big-endian LineStrings and MultiLineStrings are read, including parts with a different byte order."""
+        vertices = line((1, 2), (3, 4))
+        wkb = struct.pack(">BII", 0, 2, 2) + vertices.astype(">f8").tobytes()
+        np.testing.assert_array_equal(wkb_to_vertices(wkb), vertices)
+        multi_wkb = struct.pack(">BII", 0, 5, 2) + wkb + vertices_to_wkb(vertices + 10)
+        parts = wkb_to_parts(multi_wkb)
+        np.testing.assert_array_equal(parts[0], vertices)
+        np.testing.assert_array_equal(parts[1], vertices + 10)
+
+    def test_z_and_m_values_are_dropped(self):
+        """Z and M values are dropped from ISO and extended WKB."""
+        xyz = line((1, 2, 3), (4, 5, 6))
+        xyzm = line((1, 2, 3, 4), (5, 6, 7, 8))
+        iso_z = struct.pack("<BII", 1, 1002, 2) + xyz.tobytes()
+        extended_z = struct.pack("<BII", 1, 0x80000002, 2) + xyz.tobytes()
+        iso_zm = struct.pack("<BII", 1, 3005, 1) + struct.pack("<BII", 1, 3002, 2) + xyzm.tobytes()
+        np.testing.assert_array_equal(wkb_to_vertices(iso_z), line((1, 2), (4, 5)))
+        np.testing.assert_array_equal(wkb_to_vertices(extended_z), line((1, 2), (4, 5)))
+        np.testing.assert_array_equal(wkb_to_vertices(iso_zm), line((1, 2), (5, 6)))
+
+    def test_unsupported_geometry_type(self):
+        """Geometry types other than lines raise a ValueError."""
+        with self.assertRaises(ValueError):
+            wkb_to_vertices(struct.pack("<BI", 1, 1) + line((1, 2)).tobytes())
+
+
+if __name__ == "__main__":
+    unittest.main()